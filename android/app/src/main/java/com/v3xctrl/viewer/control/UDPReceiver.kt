@@ -102,6 +102,11 @@ class UDPReceiver(
     private var lastValidTimestamp: Double = 0.0
     private val pendingCommands = ConcurrentHashMap<String, (Boolean) -> Unit>()
 
+    // Last telemetry keyframe, deltas are applied on top of it
+    private var telemetryKeyframe: Long? = null
+    private var telemetryKeyframeValues: Map<String, Any> = emptyMap()
+    private var telemetryKeyframeRequestedFor: Long? = null
+
     // Track the last address we received messages from (for sending responses)
     @Volatile private var lastPeerAddress: InetAddress? = null
     @Volatile private var lastPeerPort: Int = 0
@@ -260,6 +265,9 @@ class UDPReceiver(
         isConnected = false
         receivedPeerInfo = false
         lastValidTimestamp = 0.0
+        telemetryKeyframe = null
+        telemetryKeyframeValues = emptyMap()
+        telemetryKeyframeRequestedFor = null
         viewerState?.isControlConnected = false
     }
 
@@ -369,8 +377,26 @@ class UDPReceiver(
     }
 
     private fun handleTelemetry(telemetry: Telemetry) {
-        Log.d(TAG, "Telemetry: ${formatTelemetryValues(telemetry.values)}")
-        viewerState?.updateFromTelemetry(telemetry.values)
+        val values = when {
+            telemetry.keyframe != null -> {
+                telemetryKeyframe = telemetry.keyframe
+                telemetryKeyframeValues = telemetry.values
+                telemetry.values
+            }
+            telemetry.base == null -> telemetry.values
+            telemetry.base == telemetryKeyframe -> Telemetry.merge(telemetryKeyframeValues, telemetry.values)
+            else -> {
+                // Keyframe unknown, e.g. after reconnecting - ask for one
+                if (telemetryKeyframeRequestedFor != telemetry.base) {
+                    telemetryKeyframeRequestedFor = telemetry.base
+                    sendCommand(Command("telemetry", mapOf("action" to "keyframe"))) { }
+                }
+                return
+            }
+        }
+
+        Log.d(TAG, "Telemetry: ${formatTelemetryValues(values)}")
+        viewerState?.updateFromTelemetry(values)
     }
 
     private fun handleLatency(latency: Latency) {
@@ -104,6 +104,7 @@ abstract class Message(
                         "t" -> messageType = unpacker.unpackString()
                         "d" -> timestamp = unpacker.unpackDouble()
                         "p" -> payload = unpackMap(unpacker)
+                        else -> unpacker.skipValue()
                     }
                 }
                 unpacker.close()
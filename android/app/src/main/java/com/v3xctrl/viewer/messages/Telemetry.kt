@@ -2,8 +2,14 @@ package com.v3xctrl.viewer.messages
 
 import org.msgpack.core.MessageBufferPacker
 
+/**
+ * Telemetry is either a keyframe holding all values, or a delta holding only
+ * the values that differ from the keyframe it is based on.
+ */
 class Telemetry(
     val values: Map<String, Any> = emptyMap(),
+    val keyframe: Long? = null,
+    val base: Long? = null,
     timestamp: Double = System.currentTimeMillis() / 1000.0
 ) : Message(timestamp) {
 
@@ -13,17 +19,47 @@ class Telemetry(
         @Suppress("UNCHECKED_CAST")
         fun fromPayload(payload: Map<String, Any>, timestamp: Double) = Telemetry(
             values = payload["v"] as? Map<String, Any> ?: emptyMap(),
+            keyframe = (payload["k"] as? Number)?.toLong(),
+            base = (payload["b"] as? Number)?.toLong(),
             timestamp = timestamp
         )
+
+        /**
+         * Recursively apply a delta onto its keyframe values.
+         */
+        @Suppress("UNCHECKED_CAST")
+        fun merge(base: Map<String, Any>, delta: Map<String, Any>): Map<String, Any> {
+            val merged = base.toMutableMap()
+            for ((key, value) in delta) {
+                val previous = merged[key]
+                merged[key] = if (value is Map<*, *> && previous is Map<*, *>) {
+                    merge(previous as Map<String, Any>, value as Map<String, Any>)
+                } else {
+                    value
+                }
+            }
+
+            return merged
+        }
     }
 
     override fun packPayload(packer: MessageBufferPacker) {
-        packer.packMapHeader(1)
+        packer.packMapHeader(1 + (if (keyframe != null) 1 else 0) + (if (base != null) 1 else 0))
         packer.packString("v")
         packMap(packer, values)
+
+        keyframe?.let {
+            packer.packString("k")
+            packer.packLong(it)
+        }
+
+        base?.let {
+            packer.packString("b")
+            packer.packLong(it)
+        }
     }
 
     override fun toString(): String {
-        return "Telemetry(values=$values, timestamp=$timestamp)"
+        return "Telemetry(values=$values, keyframe=$keyframe, base=$base, timestamp=$timestamp)"
     }
 }
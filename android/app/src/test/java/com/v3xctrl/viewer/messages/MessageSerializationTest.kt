@@ -134,6 +134,17 @@ class MessageSerializationTest {
     assertEquals(7000.0, timestamp, 0.001)
   }
 
+  @Test
+  fun telemetryDeltaMerge() {
+    val keyframe = mapOf<String, Any>("svc" to 1L, "bat" to mapOf("vol" to 3700L, "wrn" to 0L))
+    val delta = mapOf<String, Any>("bat" to mapOf("vol" to 3650L))
+
+    val merged = Telemetry.merge(keyframe, delta)
+
+    assertEquals(1L, merged["svc"])
+    assertEquals(mapOf("vol" to 3650L, "wrn" to 0L), merged["bat"])
+  }
+
   @Test
   fun commandSerialization() {
     val (type, payload, timestamp) = unpackMessage(
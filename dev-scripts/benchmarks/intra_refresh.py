@@ -0,0 +1,61 @@
+"""
+Periodic IDR against intra refresh.
+
+Streams the same source once with an IDR every I-frame period and once with
+a rolling intra refresh over the same period, then compares how evenly the
+data is spread over the frames and what that does to latency. The per frame
+size spread is what the network has to absorb, the largest frames are what
+the UDP queue and pacer have to drain.
+
+    PYTHONPATH=src python dev-scripts/benchmarks/intra_refresh.py --encoder x264
+"""
+
+import argparse
+import logging
+import statistics
+
+from pipeline import percentile, run_streamer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Intra refresh benchmark")
+    parser.add_argument("--encoder", default="x264", help="Encoder with intra refresh support (default: x264)")
+    parser.add_argument("--file-src", default=None, help="Stream a file instead of the test pattern")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per mode (default: 10)")
+    parser.add_argument("--i-frame-period", type=int, default=15, help="I-frame period (default: 15)")
+    parser.add_argument("--bitrate", type=int, default=1800000, help="Bitrate in bit/s (default: 1800000)")
+    parser.add_argument("--log", default="WARNING", help="Logging level (default: WARNING)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log.upper(), format="%(asctime)s - %(levelname)s - %(message)s")
+
+    print("mode            frames   mean B  stdev B    p99 B    max B  max/mean  total p50  total p99")
+    for label, intra_refresh in (("periodic IDR", False), ("intra refresh", True)):
+        result = run_streamer(
+            {
+                "encoder": args.encoder,
+                "test_pattern": args.file_src is None,
+                "file_src": args.file_src,
+                "bitrate": args.bitrate,
+                "h264_i_frame_period": args.i_frame_period,
+                "intra_refresh": intra_refresh,
+            },
+            args.duration,
+        )
+
+        sizes = result["keyframes"] + result["frames"]
+        if len(sizes) < 2:
+            print(f"{label:14s} not enough frames")
+            continue
+
+        mean = statistics.fmean(sizes)
+        total = result["latency"]["total"]
+        print(
+            f"{label:14s} {len(sizes):7d} {mean:8.0f} {statistics.stdev(sizes):8.0f} "
+            f"{percentile(sizes, 99):8d} {max(sizes):8d} {max(sizes) / mean:9.1f} "
+            f"{total[50]:8.2f}ms {total[99]:8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Headless run of the full streamer pipeline with a software encoder.
+
+Streams the test pattern (or a file) through the same pipeline the vehicle
+uses, including SEI timestamps, QP handling and the pipeline timer, into a
+local UDP socket and reports per stage latency, the encoded frame size
+distribution and the CPU time used. Needs GStreamer with x264enc or
+openh264enc, no camera or hardware encoder.
+
+    PYTHONPATH=src python dev-scripts/benchmarks/pipeline.py --encoder x264
+    PYTHONPATH=src python dev-scripts/benchmarks/pipeline.py --file-src clip.mp4
+"""
+
+import argparse
+import logging
+import os
+import resource
+import socket
+import tempfile
+import threading
+import time
+from typing import Any
+
+from gi.repository import GLib
+
+from v3xctrl_gst.EncoderRegistry import EncoderRegistry
+from v3xctrl_gst.Streamer import Streamer
+
+
+class UdpCounter:
+    """Receives the RTP stream and counts what arrives."""
+
+    def __init__(self) -> None:
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.2)
+        self.port = self.sock.getsockname()[1]
+        self.packets = 0
+        self.bytes = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        buffer = bytearray(65536)
+        while self._running:
+            try:
+                size = self.sock.recv_into(buffer)
+            except TimeoutError:
+                continue
+
+            self.packets += 1
+            self.bytes += size
+
+    def stop(self) -> None:
+        self._running = False
+        self._thread.join()
+        self.sock.close()
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: list[int], p: int) -> int:
+    values = sorted(values)
+    return values[min(len(values) - 1, len(values) * p // 100)] if values else 0
+
+
+def read_frame_trace(path: str) -> tuple[list[int], list[int]]:
+    """Keyframe and delta frame sizes from a streamer frame trace."""
+    keyframes: list[int] = []
+    frames: list[int] = []
+    with open(path) as f:
+        for line in f:
+            keyframe, size, _ = line.split(",")
+            (keyframes if keyframe == "1" else frames).append(int(size))
+
+    return keyframes, frames
+
+
+def run_streamer(settings: dict[str, Any], duration: float) -> dict[str, Any]:
+    """
+    Stream for `duration` seconds with the given settings.
+
+    Returns wall and CPU time, the received data, the encoded frame sizes
+    and the per stage latency percentiles.
+    """
+    receiver = UdpCounter()
+
+    with tempfile.TemporaryDirectory() as directory:
+        trace = os.path.join(directory, "frames.csv")
+        streamer = Streamer(
+            host="127.0.0.1",
+            port=receiver.port,
+            bind_port=free_port(),
+            settings={**settings, "timing_enabled": True, "frame_trace": trace},
+            control_socket=os.path.join(directory, "control.sock"),
+        )
+
+        GLib.timeout_add(int(duration * 1000), lambda: streamer.loop.quit() if streamer.loop else False)
+
+        usage_before = resource.getrusage(resource.RUSAGE_SELF)
+        started = time.monotonic()
+        streamer.run()
+        elapsed = time.monotonic() - started
+        usage_after = resource.getrusage(resource.RUSAGE_SELF)
+
+        receiver.stop()
+        keyframes, frames = read_frame_trace(trace)
+
+    return {
+        "elapsed": elapsed,
+        "user": usage_after.ru_utime - usage_before.ru_utime,
+        "system": usage_after.ru_stime - usage_before.ru_stime,
+        "packets": receiver.packets,
+        "bytes": receiver.bytes,
+        "keyframes": keyframes,
+        "frames": frames,
+        "latency": {stage: streamer.timer.percentiles(stage) for stage in streamer.timer.STAGES},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless pipeline benchmark")
+    parser.add_argument(
+        "--encoder", default="x264", choices=EncoderRegistry.list_encoders(), help="Encoder (default: x264)"
+    )
+    parser.add_argument("--file-src", default=None, help="Stream a file instead of the test pattern")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to stream (default: 10)")
+    parser.add_argument("--width", type=int, default=1280, help="Width (default: 1280)")
+    parser.add_argument("--height", type=int, default=720, help="Height (default: 720)")
+    parser.add_argument("--framerate", type=int, default=30, help="Framerate (default: 30)")
+    parser.add_argument("--bitrate", type=int, default=1800000, help="Bitrate in bit/s (default: 1800000)")
+    parser.add_argument("--qp-control", action="store_true", help="Enable QP control")
+    parser.add_argument("--intra-refresh", action="store_true", help="Intra refresh instead of periodic IDR")
+    parser.add_argument("--log", default="WARNING", help="Logging level (default: WARNING)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log.upper(), format="%(asctime)s - %(levelname)s - %(message)s")
+
+    result = run_streamer(
+        {
+            "encoder": args.encoder,
+            "test_pattern": args.file_src is None,
+            "file_src": args.file_src,
+            "width": args.width,
+            "height": args.height,
+            "framerate": args.framerate,
+            "bitrate": args.bitrate,
+            "qp_control": args.qp_control,
+            "intra_refresh": args.intra_refresh,
+        },
+        args.duration,
+    )
+
+    elapsed = result["elapsed"]
+    keyframes = result["keyframes"]
+    frames = result["frames"]
+    user = result["user"]
+    system = result["system"]
+    count = len(keyframes) + len(frames)
+
+    print(f"encoder {args.encoder}, {args.width}x{args.height}@{args.framerate}, {elapsed:.1f}s")
+    print(f"frames  {count} ({count / elapsed:.1f} fps), {len(keyframes)} keyframes")
+    print(f"network {result['packets']} packets, {result['bytes'] * 8 / elapsed / 1000:.0f} kbit/s")
+    print(f"cpu     user {user:.2f}s  system {system:.2f}s  ({(user + system) / elapsed * 100:.0f}% of one core)")
+
+    print()
+    print("stage        p50 ms   p95 ms   p99 ms")
+    for stage, values in result["latency"].items():
+        print(f"{stage:10s} {values[50]:8.2f} {values[95]:8.2f} {values[99]:8.2f}")
+
+    print()
+    print("frame size     p50 B    p95 B    p99 B      max B")
+    for label, sizes in (("keyframe", keyframes), ("delta", frames)):
+        print(
+            f"{label:10s} {percentile(sizes, 50):9d} {percentile(sizes, 95):8d} "
+            f"{percentile(sizes, 99):8d} {max(sizes, default=0):10d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Per frame cost of the viewer's SEI timestamp extraction.
+
+Compares the previous approach (copy the mapped buffer, search the whole
+frame for start codes, then try length prefixes) with the bounded scan that
+stops at the first slice.
+
+    PYTHONPATH=src python dev-scripts/benchmarks/sei_scan.py
+"""
+
+import argparse
+import struct
+import timeit
+
+from v3xctrl_helper import build_sei_nal, detect_framing, parse_sei_nal
+from v3xctrl_helper.sei import START_CODE, _try_parse_sei
+
+
+def parse_full_scan(data: bytes) -> int | None:
+    """The unbounded parser as it was before the scan was limited."""
+    pos = data.find(START_CODE)
+    while pos != -1:
+        result = _try_parse_sei(data, pos + 4)
+        if result is not None:
+            return result
+
+        pos = data.find(START_CODE, pos + 4)
+
+    pos = 0
+    while pos + 4 < len(data):
+        nal_len = struct.unpack(">I", data[pos : pos + 4])[0]
+        nal_start = pos + 4
+
+        if nal_len == 0 or nal_start + nal_len > len(data):
+            break
+
+        result = _try_parse_sei(data, nal_start)
+        if result is not None:
+            return result
+
+        pos = nal_start + nal_len
+
+    return None
+
+
+def make_frame(size: int, with_sei: bool) -> bytes:
+    sps = START_CODE + b"\x67\x42\xc0\x1f" + b"\x8c" * 12
+    pps = START_CODE + b"\x68\xce\x3c\x80"
+    sei = build_sei_nal(1_740_000_000_000_000) if with_sei else b""
+
+    # Slice data with the occasional emulation prevention pattern
+    slice_data = (b"\x9a\x00\x00\x03\x01" + bytes(range(1, 60))) * (size // 64 + 1)
+    return sei + sps + pps + START_CODE + b"\x65" + slice_data[:size]
+
+
+def measure(frame: bytes, number: int) -> tuple[float, float]:
+    """Seconds per frame before and after."""
+    view = memoryview(frame)
+    framing = detect_framing(view)
+
+    assert parse_full_scan(frame) == parse_sei_nal(view, framing)
+
+    before = timeit.timeit(lambda: parse_full_scan(bytes(view)), number=number)
+    after = timeit.timeit(lambda: parse_sei_nal(view, framing), number=number)
+
+    return before / number, after / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SEI extraction benchmark")
+    parser.add_argument("--size", type=int, default=25000, help="Frame size in bytes (default: 25000)")
+    parser.add_argument("--number", type=int, default=20000, help="Iterations per measurement (default: 20000)")
+    args = parser.parse_args()
+
+    for with_sei in (True, False):
+        frame = make_frame(args.size, with_sei)
+        before, after = measure(frame, args.number)
+
+        label = "with SEI" if with_sei else "without SEI"
+        print(
+            f"{label:12s} {len(frame):6d} bytes  "
+            f"before {before * 1e6:7.2f} us  "
+            f"after {after * 1e6:7.2f} us  "
+            f"({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Throughput of the TCP framing readers and writers.
+
+Streams length-prefixed frames of a fixed size over a local TCP connection
+and reads them with recv_message (two exact reads per frame) and with the
+buffered FrameReader (one recv_into per batch of frames).
+
+The writers are compared by sending bursts of frames, like the packets of one
+video frame, with send_message (one sendmsg per frame) and with FrameWriter
+(one sendmsg per burst).
+
+    PYTHONPATH=src python dev-scripts/benchmarks/tcp_framing.py
+    PYTHONPATH=src python dev-scripts/benchmarks/tcp_framing.py --size 1200 --count 200000
+    PYTHONPATH=src python dev-scripts/benchmarks/tcp_framing.py --burst 32
+"""
+
+import argparse
+import socket
+import struct
+import threading
+import time
+from collections.abc import Callable
+
+from v3xctrl_tcp import FrameReader, FrameWriter, recv_message, send_message
+from v3xctrl_tcp.framing import HEADER_FORMAT
+
+
+def connected_pair() -> tuple[socket.socket, socket.socket]:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+
+        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client.connect(server.getsockname())
+        peer, _ = server.accept()
+
+    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return client, peer
+
+
+def send_frames(sock: socket.socket, size: int, count: int) -> None:
+    """Send in large chunks so the sender is never the bottleneck."""
+    frame = struct.pack(HEADER_FORMAT, size) + bytes(size)
+    per_chunk = max(1, 256 * 1024 // len(frame))
+    chunk = frame * per_chunk
+
+    sent = 0
+    while sent + per_chunk <= count:
+        sock.sendall(chunk)
+        sent += per_chunk
+    sock.sendall(frame * (count - sent))
+    sock.close()
+
+
+def read_recv_message(sock: socket.socket) -> int:
+    frames = 0
+    while recv_message(sock) is not None:
+        frames += 1
+
+    return frames
+
+
+def read_frame_reader(sock: socket.socket) -> int:
+    frames = 0
+    for _ in FrameReader(sock):
+        frames += 1
+
+    return frames
+
+
+def write_send_message(sock: socket.socket, size: int, count: int, burst: int) -> None:
+    payload = bytes(size)
+    for _ in range(count):
+        send_message(sock, payload)
+    sock.close()
+
+
+def write_frame_writer(sock: socket.socket, size: int, count: int, burst: int) -> None:
+    payload = bytes(size)
+    writer = FrameWriter(sock)
+    for sent in range(count):
+        writer.add(payload)
+        if (sent + 1) % burst == 0:
+            writer.flush()
+    writer.flush()
+    sock.close()
+
+
+def measure(
+    read: Callable[[socket.socket], int],
+    size: int,
+    count: int,
+    write: Callable[..., None] | None = None,
+    burst: int = 1,
+) -> float:
+    """Seconds to transfer `count` frames."""
+    sender, receiver = connected_pair()
+    if write is None:
+        thread = threading.Thread(target=send_frames, args=(sender, size, count))
+    else:
+        thread = threading.Thread(target=write, args=(sender, size, count, burst))
+
+    started = time.perf_counter()
+    thread.start()
+    frames = read(receiver)
+    elapsed = time.perf_counter() - started
+
+    thread.join()
+    receiver.close()
+    assert frames == count, f"received {frames} of {count} frames"
+
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TCP framing reader benchmark")
+    parser.add_argument("--count", type=int, default=100000, help="Frames per run (default: 100000)")
+    parser.add_argument(
+        "--size", type=int, nargs="+", default=[100, 1400, 8000], help="Frame sizes (default: 100 1400 8000)"
+    )
+    parser.add_argument("--burst", type=int, default=16, help="Frames per FrameWriter batch (default: 16)")
+    args = parser.parse_args()
+
+    print("Readers")
+    for size in args.size:
+        before = measure(read_recv_message, size, args.count)
+        after = measure(read_frame_reader, size, args.count)
+
+        megabytes = size * args.count / 1e6
+        print(
+            f"{size:6d} bytes  "
+            f"recv_message {args.count / before:9.0f} frames/s {megabytes / before:7.1f} MB/s  "
+            f"FrameReader {args.count / after:9.0f} frames/s {megabytes / after:7.1f} MB/s  "
+            f"({before / after:.1f}x)"
+        )
+
+    print(f"Writers, bursts of {args.burst} frames")
+    for size in args.size:
+        before = measure(read_frame_reader, size, args.count, write_send_message, args.burst)
+        after = measure(read_frame_reader, size, args.count, write_frame_writer, args.burst)
+
+        megabytes = size * args.count / 1e6
+        print(
+            f"{size:6d} bytes  "
+            f"send_message {args.count / before:9.0f} frames/s {megabytes / before:7.1f} MB/s  "
+            f"FrameWriter {args.count / after:9.0f} frames/s {megabytes / after:7.1f} MB/s  "
+            f"({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
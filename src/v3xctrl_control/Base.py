@@ -1,6 +1,10 @@
 """
 Base class for Server AND Client - disregard the name, they share more
 than you might think.
+
+Both run a small state machine driven by timer events (SYN retries, heartbeat
+due, no-message timeout). Instead of polling, the state machine sleeps until
+the next of those timers is due or until it is woken up by a state change.
 """
 
 import logging
@@ -19,6 +23,7 @@ from v3xctrl_helper import (
 
 from .handler_types import Handler, T
 from .message import Heartbeat, Message
+from .SequenceTracker import SequenceStats
 from .State import State
 
 if TYPE_CHECKING:
@@ -35,8 +40,12 @@ class InitializationError(Exception):
 
 
 class Base(threading.Thread, ABC):
+    # Upper bound for sleeping between two state machine runs
     STATE_CHECK_INTERVAL_MS = 1000
 
+    # Lower bound, prevents spinning when a timer is due right now
+    MIN_WAIT_MS = 1
+
     def __init__(self) -> None:
         super().__init__(daemon=True)
 
@@ -52,6 +61,7 @@ class Base(threading.Thread, ABC):
         self.started.clear()
 
         self.state = State.WAITING
+        self._wakeup = threading.Event()
 
         # The server timeout should be longer than on the client. This way
         # it is possible to recover a lost connection
@@ -106,12 +116,43 @@ class Base(threading.Thread, ABC):
         if now - self.last_sent_timestamp > self.last_sent_timeout:
             self.send(Heartbeat())
 
+    def heartbeat_due_in(self) -> float:
+        """Seconds until the next heartbeat is due."""
+        return self.last_sent_timestamp + self.last_sent_timeout - time.time()
+
+    def timeout_due_in(self) -> float:
+        """Seconds until the connection is considered timed out."""
+        return self.last_message_timestamp + self.no_message_timeout - time.monotonic()
+
+    def wake(self) -> None:
+        """Interrupt the state machine waiting for its next timer event."""
+        self._wakeup.set()
+
+    def wait_for_event(self, timeout: float | None) -> None:
+        """
+        Sleep until the next timer event is due (timeout in seconds, None if
+        there is none) or until woken up - whichever comes first.
+        """
+        max_wait = self.STATE_CHECK_INTERVAL_MS / 1000
+        if timeout is None or timeout > max_wait:
+            timeout = max_wait
+
+        self._wakeup.wait(max(timeout, self.MIN_WAIT_MS / 1000))
+        self._wakeup.clear()
+
     def get_last_address(self) -> Address | None:
         if len(self.message_history) > 0:
             return self.message_history[-1][1]
 
         return None
 
+    def get_sequence_stats(self) -> SequenceStats:
+        """Rolling loss/reorder statistics of incoming messages, all channels combined."""
+        if self.message_handler is None:
+            return SequenceStats()
+
+        return SequenceStats.combine(self.message_handler.get_sequence_stats().values())
+
     def check_timeout(self) -> None:
         if self.state == State.CONNECTED:
             elapsed = time.monotonic() - self.last_message_timestamp
@@ -132,6 +173,7 @@ class Base(threading.Thread, ABC):
     def handle_state_change(self, new_state: State) -> None:
         logger.debug(f"State changed from '{self.state}' to '{new_state}'")
         self.state = new_state
+        self.wake()
 
         for current_state, handlers in self.state_handlers.items():
             if current_state == new_state:
@@ -10,6 +10,9 @@ sequentially:
 3. DISCONNECTED: For some reason the connection has been deemed disconnected.
   Either the client is no longer reaching the server or has not received
   messages from the server for a certain amount of time.
+
+Between state machine runs the client sleeps until the next SYN, heartbeat or
+timeout is due, so the failsafe triggers right at its deadline.
 """
 
 import socket
@@ -114,18 +117,22 @@ class Client(Base):
     def run(self) -> None:
         self.running.set()
         while self.running.is_set():
+            timeout: float | None = 0
             if self.state == State.DISCONNECTED:
                 self.re_initialize()
                 self.handle_state_change(State.WAITING)
 
             elif self.state == State.WAITING:
                 self._send_syn()
+                timeout = self.last_syn + self.SYN_INTERVAL - time.time()
 
             elif self.state == State.CONNECTED:
                 self.check_timeout()
                 self.heartbeat()
+                timeout = min(self.timeout_due_in(), self.heartbeat_due_in())
 
-            time.sleep(0.005)
+            if self.running.is_set():
+                self.wait_for_event(timeout)
 
     def stop(self) -> None:
         assert self.message_handler is not None
@@ -139,6 +146,7 @@ class Client(Base):
         self.transmitter.join()
 
         self.running.clear()
+        self.wake()
 
         self.socket.close()
 
@@ -15,6 +15,7 @@ from v3xctrl_helper import Address
 
 from .handler_types import Handler, T
 from .message import Message
+from .SequenceTracker import SequenceStats
 from .UDPReceiver import UDPReceiver
 
 
@@ -47,6 +48,9 @@ class MessageHandler(threading.Thread):
     def reset(self) -> None:
         self.rx.reset()
 
+    def get_sequence_stats(self) -> dict[str, SequenceStats]:
+        return self.rx.get_sequence_stats()
+
     def run(self) -> None:
         self.started.set()
 
@@ -0,0 +1,239 @@
+"""
+Path MTU discovery over the control channel.
+
+Video and control take the same way to the viewer (directly or through the
+relay), so the largest control datagram that makes it through is also the
+largest RTP packet that does. MtuProbe messages are padded to the size under
+test and sent with the don't fragment bit set, the viewer acknowledges every
+probe it receives. A binary search between MIN_SIZE and MAX_SIZE takes about
+eight round trips.
+
+While searching, the socket is switched to IP_PMTUDISC_PROBE: DF is set and
+the kernel neither fragments locally nor rejects sizes based on a path MTU it
+cached earlier, so only what actually reaches the viewer counts. Regular
+control messages are far smaller than any path MTU and are not affected. The
+relay forwards probes the same way, so in relay mode both legs are measured.
+
+Loss on a path that fragments (or silently drops DF packets that are too
+large) is very uneven: the large video packets are lost while the small
+control messages pass. If the viewer keeps asking for keyframes while the
+control channel is clean, the path probably changed and the search is run
+again.
+"""
+
+import errno
+import logging
+import socket
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+from v3xctrl_helper import Address
+
+from .Client import Client
+from .message import MtuProbe, MtuProbeAck
+
+logger = logging.getLogger(__name__)
+
+# Linux socket options, not exposed by the socket module
+IP_MTU_DISCOVER = 10
+IP_PMTUDISC_PROBE = 3
+
+
+class PathMtuDiscovery:
+    # UDP payload of 576 and 1500 byte IPv4 packets
+    MIN_SIZE = 548
+    MAX_SIZE = 1472
+
+    # The search stops once the remaining range is smaller than this
+    PRECISION = 8
+
+    # Probes per size before it is considered too large, one might just get lost
+    ATTEMPTS = 2
+
+    # Keyframe requests within LOSS_WINDOW seconds that trigger a new search,
+    # as long as the control channel loss stays at or below MAX_CONTROL_LOSS
+    LOSS_EVENTS = 3
+    LOSS_WINDOW = 10.0
+    MAX_CONTROL_LOSS = 1.0
+
+    # Minimum seconds between two searches
+    SEARCH_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        client: Client,
+        on_result: Callable[[int], None],
+        probe_timeout: float = 0.5,
+    ) -> None:
+        """
+        Args:
+            client: Connected control client, probes go to its server address
+            on_result: Called with the largest UDP payload size that passed
+            probe_timeout: Seconds to wait for a probe to be acknowledged
+        """
+        self.client = client
+        self.on_result = on_result
+        self.probe_timeout = probe_timeout
+
+        self.path_mtu: int | None = None
+        self.searches = 0
+
+        self._lock = threading.Lock()
+        self._acked = threading.Event()
+        self._probe_id = 0
+        self._thread: threading.Thread | None = None
+        self._last_search = -self.SEARCH_INTERVAL
+
+        self._loss_events: deque[float] = deque()
+        self._control_loss = 0.0
+
+    @property
+    def searching(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """
+        Search in the background, at most once every SEARCH_INTERVAL seconds.
+
+        Returns:
+            True if a search was started
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.searching or now - self._last_search < self.SEARCH_INTERVAL:
+                return False
+
+            self._last_search = now
+            self._thread = threading.Thread(target=self._run, name="PathMtuDiscovery", daemon=True)
+            self._thread.start()
+
+        return True
+
+    def join(self, timeout: float | None = None) -> None:
+        if self._thread:
+            self._thread.join(timeout)
+
+    def ack_handler(self, message: MtuProbeAck, addr: Address) -> None:
+        with self._lock:
+            if message.probe_id == self._probe_id:
+                self._acked.set()
+
+    def on_control_loss(self, loss: float | None) -> None:
+        """Loss in percent the viewer sees on the control channel."""
+        if loss is not None:
+            self._control_loss = loss
+
+    def on_keyframe_request(self) -> bool:
+        """
+        The viewer lost video packets, search again if that happens repeatedly
+        while the control channel is fine.
+
+        Returns:
+            True if a search was started
+        """
+        now = time.monotonic()
+        self._loss_events.append(now)
+        while self._loss_events[0] < now - self.LOSS_WINDOW:
+            self._loss_events.popleft()
+
+        if len(self._loss_events) < self.LOSS_EVENTS or self._control_loss > self.MAX_CONTROL_LOSS:
+            return False
+
+        self._loss_events.clear()
+        return self.start()
+
+    def discover(self) -> int | None:
+        """
+        Binary search for the largest UDP payload that passes unfragmented.
+
+        Returns:
+            Size in bytes, None if not even MIN_SIZE made it through (viewer
+            not answering probes or connection lost)
+        """
+        sock = self.client.socket
+        if sock is None:
+            return None
+
+        previous = self._set_pmtu_discover(sock, IP_PMTUDISC_PROBE)
+        try:
+            if not self._probe(sock, self.MIN_SIZE):
+                return None
+
+            if self._probe(sock, self.MAX_SIZE):
+                return self.MAX_SIZE
+
+            low, high = self.MIN_SIZE, self.MAX_SIZE
+            while high - low > self.PRECISION:
+                size = (low + high) // 2
+                if self._probe(sock, size):
+                    low = size
+                else:
+                    high = size
+
+            return low
+
+        finally:
+            if previous is not None:
+                self._set_pmtu_discover(sock, previous)
+
+    def _run(self) -> None:
+        self.searches += 1
+        started = time.monotonic()
+        size = self.discover()
+        if size is None:
+            logger.warning("Path MTU discovery failed, probes were not acknowledged")
+            return
+
+        logger.info(f"Path MTU: {size} bytes UDP payload ({time.monotonic() - started:.1f}s)")
+        if size != self.path_mtu:
+            self.path_mtu = size
+            self.on_result(size)
+
+    def _probe(self, sock: socket.socket, size: int) -> bool:
+        for _ in range(self.ATTEMPTS):
+            with self._lock:
+                self._probe_id += 1
+                probe_id = self._probe_id
+                self._acked.clear()
+
+            try:
+                sock.sendto(self._build_probe(probe_id, size), self.client.server_address)
+            except OSError as e:
+                # Larger than the MTU of the outgoing interface
+                if e.errno != errno.EMSGSIZE:
+                    logger.debug(f"Failed to send MTU probe: {e}")
+                return False
+
+            if self._acked.wait(self.probe_timeout):
+                return True
+
+        return False
+
+    @staticmethod
+    def _build_probe(probe_id: int, size: int) -> bytes:
+        """Probe serialized to exactly `size` bytes."""
+        padding = 0
+        data = MtuProbe(probe_id).to_bytes()
+
+        # The msgpack length prefix of the padding grows with its size
+        for _ in range(3):
+            padding = max(0, padding + size - len(data))
+            data = MtuProbe(probe_id, bytes(padding)).to_bytes()
+            if len(data) == size:
+                break
+
+        return data
+
+    @staticmethod
+    def _set_pmtu_discover(sock: socket.socket, mode: int) -> int | None:
+        """Set the path MTU discovery mode, returns the previous one."""
+        try:
+            previous = sock.getsockopt(socket.IPPROTO_IP, IP_MTU_DISCOVER)
+            sock.setsockopt(socket.IPPROTO_IP, IP_MTU_DISCOVER, mode)
+        except OSError as e:
+            logger.debug(f"Can not set path MTU discovery mode: {e}")
+            return None
+
+        return previous
@@ -0,0 +1,138 @@
+"""
+Track sequence numbers of a single channel on the receiving side.
+
+The transmitter stamps every outgoing message with a monotonic sequence number
+per message type (channel). On the receiving end this allows to tell apart:
+
+- Loss: sequence numbers that never arrived
+- Reordering: sequence numbers that arrived after a newer one
+- Duplicates: sequence numbers that arrived more than once
+
+Unlike wall-clock timestamps, sequence numbers are not affected by clock jumps
+on either end.
+
+All statistics are rolling over the last WINDOW sequence numbers. Received
+sequence numbers are kept in a ring indexed by `sequence % WINDOW`, a slot is
+only considered "received" if it holds exactly the sequence number in question,
+so stale slots never need to be cleared.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+@dataclass
+class SequenceStats:
+    """Rolling sequence statistics for one or more channels."""
+
+    expected: int = 0
+    lost: int = 0
+    reordered: int = 0
+    duplicates: int = 0
+    max_burst: int = 0
+
+    @property
+    def loss_percent(self) -> float:
+        if self.expected == 0:
+            return 0.0
+
+        return self.lost / self.expected * 100
+
+    @property
+    def reorder_percent(self) -> float:
+        if self.expected == 0:
+            return 0.0
+
+        return self.reordered / self.expected * 100
+
+    @classmethod
+    def combine(cls, stats: Iterable["SequenceStats"]) -> "SequenceStats":
+        """Merge statistics of multiple channels into one."""
+        combined = cls()
+        for item in stats:
+            combined.expected += item.expected
+            combined.lost += item.lost
+            combined.reordered += item.reordered
+            combined.duplicates += item.duplicates
+            combined.max_burst = max(combined.max_burst, item.max_burst)
+
+        return combined
+
+
+class SequenceTracker:
+    WINDOW = 256
+
+    def __init__(self, window: int = WINDOW) -> None:
+        self._window = window
+
+        self._received: list[int | None] = [None] * window
+        self._reordered: list[int | None] = [None] * window
+        self._duplicates: deque[int] = deque(maxlen=window)
+
+        self._first: int | None = None
+        self._highest: int | None = None
+
+    def track(self, sequence: int) -> bool:
+        """
+        Register a received sequence number.
+
+        Returns True if this is the newest sequence number seen on the
+        channel, False for late (reordered) or duplicate arrivals.
+        """
+        if self._highest is None or sequence > self._highest:
+            if self._first is None:
+                self._first = sequence
+            self._highest = sequence
+            self._received[sequence % self._window] = sequence
+
+            return True
+
+        if self._highest - sequence >= self._window:
+            # Too old to be a late arrival, the sender most likely restarted
+            # its counter - start over.
+            self.reset()
+            return self.track(sequence)
+
+        slot = sequence % self._window
+        if self._received[slot] == sequence:
+            self._duplicates.append(sequence)
+        else:
+            self._received[slot] = sequence
+            self._reordered[slot] = sequence
+
+        return False
+
+    def stats(self) -> SequenceStats:
+        if self._highest is None or self._first is None:
+            return SequenceStats()
+
+        low = max(self._first, self._highest - self._window + 1)
+
+        while self._duplicates and self._duplicates[0] < low:
+            self._duplicates.popleft()
+
+        stats = SequenceStats(expected=self._highest - low + 1, duplicates=len(self._duplicates))
+
+        burst = 0
+        for sequence in range(low, self._highest + 1):
+            slot = sequence % self._window
+            if self._received[slot] != sequence:
+                stats.lost += 1
+                burst += 1
+                stats.max_burst = max(stats.max_burst, burst)
+            else:
+                burst = 0
+
+            if self._reordered[slot] == sequence:
+                stats.reordered += 1
+
+        return stats
+
+    def reset(self) -> None:
+        self._received = [None] * self._window
+        self._reordered = [None] * self._window
+        self._duplicates.clear()
+
+        self._first = None
+        self._highest = None
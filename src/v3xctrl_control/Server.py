@@ -1,14 +1,16 @@
+import heapq
+import itertools
 import logging
+import math
 import socket
 import threading
 import time
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
 
 from v3xctrl_helper import Address
 
 from .Base import Base
-from .message import Ack, Command, CommandAck, Message, Syn
+from .message import Ack, Command, CommandAck, Message, MtuProbe, MtuProbeAck, Syn
 from .MessageHandler import MessageHandler
 from .State import State
 from .UDPTransmitter import UDPTransmitter
@@ -16,11 +18,19 @@ from .UDPTransmitter import UDPTransmitter
 logger = logging.getLogger(__name__)
 
 
+# Retry schedule entry: (due, order, command_id, command, attempts_left, delay, deadline)
+CommandRetry = tuple[float, int, str, Command, int, float, float]
+
+
 class Server(Base):
-    MAX_WORKERS = 10
     COMMAND_DELAY = 0.2
+    # Multiplier for the delay after every retry, 1.0 keeps the delay constant
+    COMMAND_BACKOFF = 1.0
+    COMMAND_MAX_DELAY = 1.0
 
-    def __init__(self, port: int, ttl_ms: int = 100, control_buffer_capacity: int = 1) -> None:
+    def __init__(
+        self, port: int, ttl_ms: int = 100, control_buffer_capacity: int = 1, control_redundancy: int = 0
+    ) -> None:
         super().__init__()
 
         self.port = port
@@ -30,19 +40,28 @@ class Server(Base):
         self.socket.bind(("0.0.0.0", self.port))
         self.socket.settimeout(1)
 
-        self.transmitter = UDPTransmitter(self.socket, ttl_ms, control_buffer_capacity)
+        self.transmitter = UDPTransmitter(self.socket, ttl_ms, control_buffer_capacity, control_redundancy)
         self.message_handler = MessageHandler(self.socket)
 
         self.pending_commands: dict[str, Callable[[bool], None] | None] = {}
         self.pending_lock = threading.Lock()
 
-        self.thread_pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix=f"Server-{port}")
+        # Command retries are driven by a single thread sleeping until the
+        # earliest deadline in the heap.
+        self._command_condition = threading.Condition(self.pending_lock)
+        self._command_schedule: list[CommandRetry] = []
+        self._command_order = itertools.count()
+        self._command_thread: threading.Thread | None = None
+        self._commands_closed = False
 
     def syn_handler(self, message: Syn, addr: Address) -> None:
         super()._send(Ack(), addr)
         if self.state == State.WAITING:
             self.handle_state_change(State.CONNECTED)
 
+    def mtu_probe_handler(self, message: MtuProbe, addr: Address) -> None:
+        super()._send(MtuProbeAck(message.probe_id), addr)
+
     def send(self, message: Message) -> None:
         addr = self.get_last_address()
         if addr:
@@ -57,53 +76,129 @@ class Server(Base):
         command_id = message.get_command_id()
         with self.pending_lock:
             callback = self.pending_commands.pop(command_id, None)
-            if callback:
-                callback(True)
+
+        # Pending retries of this command are dropped by the scheduler
+        if callback:
+            callback(True)
 
     def send_command(
-        self, command: Command, callback: Callable[[bool], None] | None = None, max_retries: int = 10
+        self,
+        command: Command,
+        callback: Callable[[bool], None] | None = None,
+        max_retries: int = 10,
+        timeout: float | None = None,
     ) -> None:
-        """Sends a command up to max_retries or until answer is received."""
+        """
+        Sends a command up to max_retries or until answer is received.
+
+        Retries are COMMAND_DELAY apart, growing by COMMAND_BACKOFF up to
+        COMMAND_MAX_DELAY if backoff is enabled. The command fails right after
+        the last attempt. If timeout (in seconds) is given, the command fails
+        once it is exceeded, even if retries are left. The callback is invoked
+        exactly once: with True when the command has been acknowledged, with
+        False otherwise.
+        """
         command_id = command.get_command_id()
+        now = time.monotonic()
+        deadline = now + timeout if timeout is not None else math.inf
+
+        with self._command_condition:
+            if not self._commands_closed:
+                self.pending_commands[command_id] = callback
+                self._schedule_command(
+                    (now, next(self._command_order), command_id, command, max_retries, self.COMMAND_DELAY, deadline)
+                )
+
+                if self._command_thread is None:
+                    self._command_thread = threading.Thread(
+                        target=self._command_loop, name=f"Server-{self.port}-commands", daemon=True
+                    )
+                    self._command_thread.start()
+
+                return
+
+        # Server is shut down, notify failure right away
+        if callback:
+            callback(False)
+
+    def _schedule_command(self, entry: CommandRetry) -> None:
+        """Has to be called with the pending lock held."""
+        heapq.heappush(self._command_schedule, entry)
+        self._command_condition.notify()
+
+    def _command_loop(self) -> None:
+        while True:
+            with self._command_condition:
+                while not self._commands_closed:
+                    if self._command_schedule:
+                        wait = self._command_schedule[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._command_condition.wait(wait)
+                    else:
+                        self._command_condition.wait()
+
+                if self._commands_closed:
+                    return
+
+                _, _, command_id, command, attempts_left, delay, deadline = heapq.heappop(self._command_schedule)
+
+                # Acknowledged in the meantime
+                if command_id not in self.pending_commands:
+                    continue
+
+                expired = attempts_left <= 0 or time.monotonic() >= deadline
+                callback = self.pending_commands.pop(command_id) if expired else None
+
+            if expired:
+                if callback:
+                    callback(False)
+                continue
 
-        def retry_task() -> None:
             try:
-                for attempt in range(max_retries):
-                    with self.pending_lock:
-                        if command_id not in self.pending_commands:
-                            return
-
-                    self.send(command)
-
-                    # Do not sleep after last attempt
-                    if attempt < max_retries - 1:
-                        time.sleep(self.COMMAND_DELAY)
-
-                # Timeout - no ACK received
-                with self.pending_lock:
-                    if command_id in self.pending_commands:
-                        del self.pending_commands[command_id]
-                        if callback:
-                            callback(False)
+                self.send(command)
             except Exception as e:
-                logger.error(f"Error in command retry task: {e}")
+                logger.error(f"Error sending command: {e}")
                 with self.pending_lock:
-                    self.pending_commands.pop(command_id, None)
+                    callback = self.pending_commands.pop(command_id, None)
                 if callback:
                     callback(False)
+                continue
+
+            due = min(time.monotonic() + delay, deadline)
+            next_delay = min(delay * self.COMMAND_BACKOFF, self.COMMAND_MAX_DELAY)
+            with self._command_condition:
+                if command_id not in self.pending_commands:
+                    continue
+
+                if attempts_left > 1:
+                    self._schedule_command(
+                        (due, next(self._command_order), command_id, command, attempts_left - 1, next_delay, deadline)
+                    )
+                    continue
+
+                # No waiting for an ACK after the last attempt
+                callback = self.pending_commands.pop(command_id)
 
-        with self.pending_lock:
-            self.pending_commands[command_id] = callback
-
-        try:
-            self.thread_pool.submit(retry_task)
-        except RuntimeError:
-            # Thread pool is shut down, clean up and notify failure
-            with self.pending_lock:
-                self.pending_commands.pop(command_id, None)
             if callback:
                 callback(False)
 
+    def _stop_commands(self) -> None:
+        """Stop the command scheduler and notify all pending commands about shutdown."""
+        with self._command_condition:
+            self._commands_closed = True
+            self._command_schedule.clear()
+            callbacks = list(self.pending_commands.values())
+            self.pending_commands.clear()
+            self._command_condition.notify()
+
+        for callback in callbacks:
+            if callback:
+                callback(False)
+
+        if self._command_thread is not None and self._command_thread is not threading.current_thread():
+            self._command_thread.join()
+
     def run(self) -> None:
         assert self.transmitter is not None
         assert self.message_handler is not None
@@ -121,24 +216,31 @@ class Server(Base):
         # Class specific Handlers
         self.message_handler.add_handler(Syn, self.syn_handler)
         self.message_handler.add_handler(CommandAck, self.command_ack_handler)
+        self.message_handler.add_handler(MtuProbe, self.mtu_probe_handler)
 
         self.running.set()
         while self.running.is_set():
+            # Nothing is due while waiting for a SYN, the state change wakes us
+            timeout: float | None = None
             if self.state == State.DISCONNECTED:
                 self.message_handler.reset()
                 self.handle_state_change(State.WAITING)
+                timeout = 0
 
             elif self.state == State.WAITING:
                 pass
 
             elif self.state == State.SPECTATING:
                 self.heartbeat()
+                timeout = self.heartbeat_due_in()
 
             elif self.state == State.CONNECTED:
                 self.check_timeout()
                 self.heartbeat()
+                timeout = min(self.timeout_due_in(), self.heartbeat_due_in())
 
-            time.sleep(self.STATE_CHECK_INTERVAL_MS / 1000)
+            if self.running.is_set():
+                self.wait_for_event(timeout)
 
     def stop(self) -> None:
         assert self.message_handler is not None
@@ -149,13 +251,6 @@ class Server(Base):
             # Wait for the setup to be done before tearing everything down
             self.running.wait()
 
-            # Notify all pending commands about shutdown
-            with self.pending_lock:
-                for callback in self.pending_commands.values():
-                    if callback:
-                        callback(False)
-                self.pending_commands.clear()
-
             self.started.clear()
 
             self.message_handler.stop()
@@ -165,8 +260,9 @@ class Server(Base):
             self.transmitter.join()
 
             self.running.clear()
+            self.wake()
 
-        self.thread_pool.shutdown(wait=False)
+        self._stop_commands()
         self.socket.close()
 
     def update_ttl(self, ttl_ms: int) -> None:
@@ -2,26 +2,43 @@
 This class collects telemetry data, all fetching of telemetry data should happen
 here.
 
-The only public interface is the get_telemetry() method.
+The main public interface is the get_telemetry() method. Statistics that are
+not collected here, but by the control channel, are handed in via
+update_link().
+
+Every source is polled at its own rate by a TelemetryScheduler, so a slow
+source does not hold back the others. wait_for_update() allows to publish
+fresh values the moment they arrive. Values of a source that stopped updating
+are reported as unknown instead of repeating the last ones.
 """
 
 import logging
 import threading
-import time
 from collections.abc import Callable
 from dataclasses import asdict
 from typing import Any, TypeVar
 
 from atlib import AIR780EU
 
-from v3xctrl_telemetry import BatteryInfo, CellInfo, GpsProtocol, LocationInfo, SignalInfo, TelemetryPayload
+from v3xctrl_telemetry import (
+    BatteryInfo,
+    CellInfo,
+    GpsFixType,
+    GpsProtocol,
+    LocationInfo,
+    SignalInfo,
+    TelemetryPayload,
+)
 from v3xctrl_telemetry.BatteryTelemetry import BatteryTelemetry
 from v3xctrl_telemetry.GpsTelemetry import GpsTelemetry
 from v3xctrl_telemetry.GstTelemetry import GstTelemetry
 from v3xctrl_telemetry.ServiceTelemetry import ServiceTelemetry
+from v3xctrl_telemetry.TelemetryScheduler import SourceStats, TelemetryScheduler
 from v3xctrl_telemetry.UBXGpsTelemetry import UBXGpsTelemetry
 from v3xctrl_telemetry.VideoCoreTelemetry import VideoCoreTelemetry
 
+from .SequenceTracker import SequenceStats
+
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
@@ -43,16 +60,20 @@ class Telemetry(threading.Thread):
         gps_rate_hz: int = 5,
         gps_protocol: GpsProtocol = GpsProtocol.UBLOX,
         interval: float = 1.0,
+        on_update: Callable[[str], None] | None = None,
     ) -> None:
         super().__init__(daemon=True)
 
         self._modem_path = modem_path
         self._interval = interval
+        self._on_update = on_update
+        self._updated = threading.Event()
         self.payload = TelemetryPayload(
             sig=SignalInfo(), cell=CellInfo(), loc=LocationInfo(), bat=BatteryInfo(), svc=0, vc=0, gst=0
         )
 
         self._running = threading.Event()
+        self._stopped = threading.Event()
         self._lock = threading.Lock()
 
         self._modem: AIR780EU | None = None
@@ -79,27 +100,82 @@ class Telemetry(threading.Thread):
         self._videocore = self._init_component("VideoCore", VideoCoreTelemetry)
         self._gst = self._init_component("GST", GstTelemetry)
 
+        # Signal and cell share the modem's serial port, so they are one source
+        self._scheduler = TelemetryScheduler(self._source_updated)
+        self._scheduler.add("modem", self._update_modem, interval, timeout=2 * interval)
+        if self._gps:
+            self._scheduler.add("gps", self._update_gps, 1 / gps_rate_hz, timeout=interval)
+        if self._battery:
+            self._scheduler.add("battery", self._update_battery, interval)
+        if self._services:
+            self._scheduler.add("services", self._update_services, interval)
+        if self._videocore:
+            self._scheduler.add("videocore", self._update_videocore, interval)
+        if self._gst:
+            self._scheduler.add("gst", self._update_gst, interval)
+
     def get_telemetry(self) -> dict[str, Any]:
+        stale = self._scheduler.stale_sources()
         with self._lock:
-            return asdict(self.payload)
+            telemetry = asdict(self.payload)
 
-    def run(self) -> None:
-        self._running.set()
-        while self._running.is_set():
-            if self._modem_available():
-                self._update_signal()
-                self._update_cell()
+        for name in stale:
+            telemetry.update(self._unknown_values(name))
 
-            self._update_gps()
-            self._update_battery()
-            self._update_services()
-            self._update_videocore()
-            self._update_gst()
+        return telemetry
+
+    def update_link(self, stats: SequenceStats) -> None:
+        with self._lock:
+            self.payload.net.loss = round(stats.loss_percent, 1)
+            self.payload.net.reo = round(stats.reorder_percent, 1)
+            self.payload.net.dup = stats.duplicates
+            self.payload.net.bst = stats.max_burst
 
-            time.sleep(self._interval)
+    def get_source_stats(self) -> dict[str, SourceStats]:
+        """Per source update latency and failure counts."""
+        return self._scheduler.get_stats()
+
+    def wait_for_update(self, timeout: float | None = None) -> bool:
+        """
+        Block until any source published fresh values since the last call.
+        Returns False on timeout.
+        """
+        updated = self._updated.wait(timeout)
+        self._updated.clear()
+
+        return updated
+
+    def run(self) -> None:
+        self._running.set()
+        self._scheduler.start()
+        self._stopped.wait()
+        self._scheduler.stop(timeout=self._interval)
 
     def stop(self) -> None:
         self._running.clear()
+        self._stopped.set()
+
+    def _source_updated(self, name: str) -> None:
+        self._updated.set()
+        if self._on_update:
+            self._on_update(name)
+
+    def _unknown_values(self, name: str) -> dict[str, Any]:
+        """Payload fields of a stale source, set to their unknown values."""
+        if name == "modem":
+            return {"sig": asdict(SignalInfo()), "cell": asdict(CellInfo())}
+        if name == "gps":
+            return {"loc": asdict(LocationInfo(fix_type=GpsFixType.NO_FIX))}
+        if name == "battery":
+            return {"bat": asdict(BatteryInfo())}
+        if name == "services":
+            return {"svc": 0}
+        if name == "videocore":
+            return {"vc": 0}
+        if name == "gst":
+            return {"gst": 0}
+
+        return {}
 
     def _init_component(self, name: str, factory: Callable[[], T]) -> T | None:
         try:
@@ -163,43 +239,58 @@ class Telemetry(threading.Thread):
             self.payload.cell.id = "?"
             self.payload.cell.band = "?"
 
-    def _update_signal(self) -> None:
+    def _update_modem(self) -> bool:
+        if not self._modem_available():
+            return False
+
+        signal = self._update_signal()
+        cell = self._update_cell()
+
+        return signal and cell
+
+    def _update_signal(self) -> bool:
         if self._modem is None:
-            return
+            return False
         try:
             signal_quality = self._modem.get_signal_quality()
             with self._lock:
                 self.payload.sig.rsrq = signal_quality.rsrq
                 self.payload.sig.rsrp = signal_quality.rsrp
+            return True
         except Exception as e:
             self._set_signal_unknown()
             logger.debug("Failed to fetch signal information: %s", e)
             self._modem = None
+            return False
 
-    def _update_cell(self) -> None:
+    def _update_cell(self) -> bool:
         if self._modem is None:
-            return
+            return False
         try:
             band = self._modem.get_active_band()
             cell_id = self._modem.get_cell_location()[3]
             with self._lock:
                 self.payload.cell.id = cell_id
                 self.payload.cell.band = band
+            return True
         except Exception as e:
             self._set_cell_unknown()
             logger.debug("Failed to fetch cell information: %s", e)
             self._modem = None
+            return False
 
-    def _update_gps(self) -> None:
+    def _update_gps(self) -> bool:
         if self._gps:
             try:
                 self._gps.update()
                 with self._lock:
                     self.payload.loc = self._gps.get_state()
+                return True
             except Exception as e:
                 logger.debug("Failed to update GPS telemetry: %s", e)
+        return False
 
-    def _update_battery(self) -> None:
+    def _update_battery(self) -> bool:
         if self._battery:
             self._battery.update()
             state = self._battery.get_state()
@@ -209,36 +300,44 @@ class Telemetry(threading.Thread):
                 self.payload.bat.pct = state.percentage
                 self.payload.bat.wrn = state.warning
                 self.payload.bat.cur = state.current
+            return True
+        return False
 
-    def _update_services(self) -> None:
+    def _update_services(self) -> bool:
         if self._services:
             try:
                 self._services.update()
                 with self._lock:
                     self.payload.svc = self._services.get_byte()
+                return True
             except Exception as e:
                 logger.debug("Failed to update service telemetry: %s", e)
                 with self._lock:
                     self.payload.svc = 0
+        return False
 
-    def _update_videocore(self) -> None:
+    def _update_videocore(self) -> bool:
         if self._videocore:
             try:
                 self._videocore.update()
                 with self._lock:
                     self.payload.vc = self._videocore.get_byte()
+                return True
             except Exception as e:
                 logger.debug("Failed to update VideoCore telemetry: %s", e)
                 with self._lock:
                     self.payload.vc = 0
+        return False
 
-    def _update_gst(self) -> None:
+    def _update_gst(self) -> bool:
         if self._gst:
             try:
                 self._gst.update()
                 with self._lock:
                     self.payload.gst = self._gst.get_byte()
+                return True
             except Exception as e:
                 logger.debug("Failed to update GST telemetry: %s", e)
                 with self._lock:
                     self.payload.gst = 0
+        return False
@@ -0,0 +1,58 @@
+"""
+Delta encoding of telemetry values.
+
+Most telemetry values (cell, services, VideoCore, battery warning) rarely
+change, so only a keyframe every KEYFRAME_INTERVAL seconds carries all values.
+Messages in between only carry the values that differ from the last keyframe.
+
+Deltas are always relative to the keyframe and never to the previous delta,
+so a lost delta does not corrupt the state on the receiving end. A lost
+keyframe is recovered by the next one, or earlier by the receiver requesting
+one via request_keyframe().
+"""
+
+import itertools
+import threading
+import time
+from typing import Any
+
+from v3xctrl_helper import dict_delta
+
+from .message import Telemetry
+
+
+class TelemetryEncoder:
+    KEYFRAME_INTERVAL = 10.0
+
+    def __init__(self, keyframe_interval: float = KEYFRAME_INTERVAL) -> None:
+        self._keyframe_interval = keyframe_interval
+
+        self._keyframe_ids = itertools.count()
+        self._keyframe_id: int | None = None
+        self._keyframe_values: dict[str, Any] = {}
+        self._keyframe_timestamp: float = 0
+
+        self._keyframe_requested = True
+        self._lock = threading.Lock()
+
+    def encode(self, values: dict[str, Any]) -> Telemetry:
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._keyframe_requested
+                or self._keyframe_id is None
+                or now - self._keyframe_timestamp >= self._keyframe_interval
+            ):
+                self._keyframe_requested = False
+                self._keyframe_id = next(self._keyframe_ids)
+                self._keyframe_values = values
+                self._keyframe_timestamp = now
+
+                return Telemetry(values, k=self._keyframe_id)
+
+            return Telemetry(dict_delta(self._keyframe_values, values), b=self._keyframe_id)
+
+    def request_keyframe(self) -> None:
+        """Send a keyframe with the next message."""
+        with self._lock:
+            self._keyframe_requested = True
@@ -4,9 +4,14 @@ Receive UDP packets and forward them to handler.
 The receiver only forwards valid packets. For a packet to be considered
 valid the following conditions must be met:
 - The data must be of a Message subtype
-- The timestamp must be higher than the last received timestamp
+- The sequence number must be higher than the last received sequence number
+  of the same message type. Peers not sending sequence numbers fall back to
+  the timestamp being higher than the last received timestamp.
 - Validate host (optional)
 
+Sequence numbers are also used to keep rolling loss, reorder and duplicate
+statistics per message type, see SequenceTracker.
+
 NOTE: The kernel avoids buildup by dropping older UDP packets when new ones
       arrive faster than the application can process them. Since we are only
       interested in the most recent data, this behavior is beneficial and does
@@ -29,9 +34,12 @@ from .message import (
     CommandAck,
     Latency,
     Message,
+    MtuProbe,
+    MtuProbeAck,
     PeerInfo,
     Syn,
 )
+from .SequenceTracker import SequenceStats, SequenceTracker
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +68,9 @@ class UDPReceiver(threading.Thread):
         self.last_valid_timestamp: float = 0
         self.last_valid_now: float | None = None
 
+        self._sequence_trackers: dict[str, SequenceTracker] = {}
+        self._sequence_lock = threading.Lock()
+
         self._should_validate_timestamp = should_validate_timestamp
         self._should_validate_host = False
         self._expected_host: str | None = None
@@ -78,25 +89,31 @@ class UDPReceiver(threading.Thread):
             logger.warning(f"Skipping message from wrong host: {addr[0]}")
             return False
 
-        # By default all Messages are order critical, we exempt this ones since
-        # order does not matter, we need them processed in any case
-        if isinstance(message, Command | CommandAck | Latency):
-            return True
-
-        # Reset timestamps on Syn or Ack
+        # Reset timestamps and sequence numbers on Syn or Ack
         if isinstance(message, Syn | Ack):
             logger.debug("Resetting timestamps...")
             self.reset()
             return True
 
+        is_newest = self._track_sequence(message)
+
+        # By default all Messages are order critical, we exempt this ones since
+        # order does not matter, we need them processed in any case
+        if isinstance(message, Command | CommandAck | Latency | MtuProbe | MtuProbeAck):
+            return True
+
         """
-        Check timestamps for every packet where we are only interested in the
+        Check order for every packet where we are only interested in the
         newest version. This is a catchall, but will effectively catch:
         - Telemetry
         - Control
         """
-        if message.timestamp < self.last_valid_timestamp:
-            logger.debug(f"Skipping out of order message: {message.type}")
+        if is_newest is None:
+            if message.timestamp < self.last_valid_timestamp:
+                logger.debug(f"Skipping out of order message: {message.type}")
+                return False
+        elif not is_newest:
+            logger.debug(f"Skipping out of order message: {message.type} #{message.sequence}")
             return False
 
         """
@@ -117,6 +134,32 @@ class UDPReceiver(threading.Thread):
         self.last_valid_timestamp = 0
         self.last_valid_now = None
 
+        with self._sequence_lock:
+            self._sequence_trackers.clear()
+
+    def get_sequence_stats(self) -> dict[str, SequenceStats]:
+        """Rolling sequence statistics by message type."""
+        with self._sequence_lock:
+            return {channel: tracker.stats() for channel, tracker in self._sequence_trackers.items()}
+
+    def _track_sequence(self, message: Message) -> bool | None:
+        """
+        Track the messages sequence number on its channel.
+
+        Returns None if the message carries no sequence number, otherwise
+        whether it is the newest message on its channel.
+        """
+        if message.sequence is None:
+            return None
+
+        with self._sequence_lock:
+            tracker = self._sequence_trackers.get(message.type)
+            if tracker is None:
+                tracker = SequenceTracker()
+                self._sequence_trackers[message.type] = tracker
+
+            return tracker.track(message.sequence)
+
     def run(self) -> None:
         self._running.set()
         self._worker_thread.start()
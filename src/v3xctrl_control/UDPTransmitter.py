@@ -4,6 +4,15 @@ Transmit UDP packets that are being added to the queue.
 Uses asyncio under the hood for the actual sending. There is no sanity checking
 happening, as long as a valid UDP packet is added to the queue, it will be sent.
 
+Messages added via `add_message` or `set_control_message` are stamped with a
+monotonic sequence number per message type right before serialization. The
+receiving end uses those to order messages and to detect loss.
+
+With `control_redundancy` set, the last control message is sent again up to
+that many times, `CONTROL_RESEND_INTERVAL` apart, as long as no newer control
+message is buffered. Every resend gets a fresh sequence number, so the receiver
+applies it when the original was lost and discards nothing as a duplicate.
+
 Since asyncio is used, its not enough to just run this Class, but instead you
 also need to trigger starting of the task:
 
@@ -17,6 +26,7 @@ tx.join()
 
 import asyncio
 import concurrent.futures
+import itertools
 import logging
 import socket
 import threading
@@ -33,7 +43,15 @@ logger = logging.getLogger(__name__)
 
 
 class UDPTransmitter(threading.Thread):
-    def __init__(self, sock: socket.socket, ttl_ms: int = 1000, control_buffer_capacity: int = 1) -> None:
+    CONTROL_RESEND_INTERVAL = 0.01
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        ttl_ms: int = 1000,
+        control_buffer_capacity: int = 1,
+        control_redundancy: int = 0,
+    ) -> None:
         super().__init__(daemon=True)
 
         self.socket = sock
@@ -45,6 +63,14 @@ class UDPTransmitter(threading.Thread):
         self._last_control_drop_timestamp: float = 0
         self._last_send_failure_timestamp: float = 0
 
+        self._control_redundancy = max(0, control_redundancy)
+        self._resend_message: tuple[Message, Address] | None = None
+        self._resends_left = 0
+        self._next_resend_at: float = 0
+
+        self._sequences: dict[str, itertools.count[int]] = {}
+        self._sequence_lock = threading.Lock()
+
         self.loop = asyncio.new_event_loop()
         self.task: concurrent.futures.Future[None] | None = None
 
@@ -55,6 +81,7 @@ class UDPTransmitter(threading.Thread):
 
     def add_message(self, message: Message, addr: Address) -> None:
         """Convenience function to add a message to the regular queue."""
+        self._assign_sequence(message)
         packet = UDPPacket(message.to_bytes(), addr[0], addr[1])
         self.add(packet)
 
@@ -63,6 +90,7 @@ class UDPTransmitter(threading.Thread):
 
     def set_control_message(self, message: Message, addr: Address) -> None:
         """Set a control message in the bounded buffer, evicting the oldest if full."""
+        self._assign_sequence(message)
         packet = UDPPacket(message.to_bytes(), addr[0], addr[1])
         with self._control_lock:
             if len(self._control_buffer) == self._control_buffer.maxlen:
@@ -70,6 +98,36 @@ class UDPTransmitter(threading.Thread):
                 logger.debug("Evicting oldest control message from buffer")
             self._control_buffer.append(packet)
 
+            if self._control_redundancy:
+                self._resend_message = (message, addr)
+                self._resends_left = self._control_redundancy
+                self._next_resend_at = time.monotonic() + self.CONTROL_RESEND_INTERVAL
+
+    def _take_control_resend(self) -> UDPPacket | None:
+        """Return a re-sequenced copy of the last control message if a resend is due."""
+        with self._control_lock:
+            if self._resend_message is None or self._resends_left == 0:
+                return None
+
+            if time.monotonic() < self._next_resend_at:
+                return None
+
+            self._resends_left -= 1
+            self._next_resend_at = time.monotonic() + self.CONTROL_RESEND_INTERVAL
+            message, addr = self._resend_message
+
+        self._assign_sequence(message)
+        return UDPPacket(message.to_bytes(), addr[0], addr[1])
+
+    def _assign_sequence(self, message: Message) -> None:
+        with self._sequence_lock:
+            counter = self._sequences.get(message.type)
+            if counter is None:
+                counter = itertools.count()
+                self._sequences[message.type] = counter
+
+            message.sequence = next(counter)
+
     def get_control_buffer_size(self) -> int:
         with self._control_lock:
             return len(self._control_buffer)
@@ -115,6 +173,10 @@ class UDPTransmitter(threading.Thread):
                     if self._control_buffer:
                         control_packet = self._control_buffer.popleft()
 
+                # Nothing new to send, repeat the last control state instead
+                if control_packet is None:
+                    control_packet = self._take_control_resend()
+
                 if control_packet:
                     self._send_packet(control_packet)
                     sent_anything = True
@@ -1,7 +1,10 @@
 from .Client import Client
 from .MessageHandler import MessageHandler
+from .PathMtuDiscovery import PathMtuDiscovery
+from .SequenceTracker import SequenceStats, SequenceTracker
 from .Server import Server
 from .State import State
+from .TelemetryEncoder import TelemetryEncoder
 from .UDPPacket import UDPPacket
 from .UDPReceiver import UDPReceiver
 from .UDPTransmitter import UDPTransmitter
@@ -9,8 +12,12 @@ from .UDPTransmitter import UDPTransmitter
 __all__ = [
     "Client",
     "MessageHandler",
+    "PathMtuDiscovery",
+    "SequenceStats",
+    "SequenceTracker",
     "Server",
     "State",
+    "TelemetryEncoder",
     "UDPPacket",
     "UDPReceiver",
     "UDPTransmitter",
@@ -20,13 +20,13 @@ from concurrent.futures import ThreadPoolExecutor
 
 from rpi_servo_pwm import HardwarePWM
 
-from v3xctrl_control import Client, State
+from v3xctrl_control import Client, PathMtuDiscovery, State, TelemetryEncoder
 from v3xctrl_control.message import (
     Command,
     Control,
     Latency,
+    MtuProbeAck,
     PeerAnnouncement,
-    Telemetry,
 )
 from v3xctrl_control.Telemetry import Telemetry as TelemetryHandler
 from v3xctrl_gst import ControlClient
@@ -85,6 +85,11 @@ parser.add_argument(
     default=None,
     help="Relay session ID (enables relay TCP mode with PeerAnnouncement handshake)",
 )
+parser.add_argument(
+    "--mtu-discovery",
+    action="store_true",
+    help="Probe the path MTU and size the video packets accordingly, UDP transport only (default: False)",
+)
 parser.add_argument(
     "--failsafe-ms", type=int, default=500, help="Timeout in milliseconds to trigger failsafe (default: 500)"
 )
@@ -121,6 +126,18 @@ parser.add_argument(
     choices=["ublox", "nmea", "modem"],
     help="GPS module protocol (default: ublox)",
 )
+parser.add_argument(
+    "--telemetry-rate-hz",
+    type=float,
+    default=1.0,
+    help="Maximum rate telemetry is sent at, as soon as new values are available (default: 1.0)",
+)
+parser.add_argument(
+    "--telemetry-keyframe-interval",
+    type=float,
+    default=10.0,
+    help="Seconds between telemetry keyframes, delta encoded in between (default: 10.0)",
+)
 
 
 args = parser.parse_args()
@@ -210,6 +227,7 @@ telemetry = TelemetryHandler(
     gps_protocol=GpsProtocol(args.gps_protocol),
 )
 telemetry.start()
+telemetry_encoder = TelemetryEncoder(args.telemetry_keyframe_interval)
 
 video_control = ControlClient()
 executor = ThreadPoolExecutor(max_workers=2)
@@ -269,7 +287,16 @@ def control_handler(message: Control, address: Address) -> None:
 
 
 def latency_handler(message: Latency, address: Address) -> None:
-    client.send(Latency(st=time.time(), timestamp=message.timestamp))
+    now = time.time()
+    client.send(Latency(st=now, timestamp=message.timestamp))
+
+    # RTT and video loss are measured by the viewer, both cover the path the
+    # video takes. Older viewers send neither.
+    if message.rtt is not None or message.video_loss is not None:
+        executor.submit(video_control.network_feedback, message.rtt, message.video_loss)
+
+    if mtu_discovery:
+        mtu_discovery.on_control_loss(message.loss)
 
 
 def command_handler(command: Command, address: Address) -> None:
@@ -312,6 +339,25 @@ def command_handler(command: Command, address: Address) -> None:
             steering_center = calculate_steering_center()
             subprocess.Popen(["sudo", "v3xctrl-settings", "set", ".control.steering.trim", str(steering_trim)])
 
+        case "video":
+            parameters = command.get_parameters()
+            if parameters.get("action") == "keyframe":
+                executor.submit(video_control.request_keyframe)
+                if mtu_discovery:
+                    mtu_discovery.on_keyframe_request()
+            elif parameters.get("action") == "reconfigure":
+                executor.submit(
+                    video_control.reconfigure,
+                    parameters.get("width"),
+                    parameters.get("height"),
+                    parameters.get("framerate"),
+                )
+
+        case "telemetry":
+            parameters = command.get_parameters()
+            if parameters.get("action") == "keyframe":
+                telemetry_encoder.request_keyframe()
+
         case "shutdown":
             subprocess.Popen(["sudo", "poweroff"])
 
@@ -334,8 +380,13 @@ def disconnect_handler() -> None:
 
 
 def connect_handler() -> None:
+    # The viewer might have lost its telemetry state, start over with a keyframe
+    telemetry_encoder.request_keyframe()
     logger.info("Connected")
 
+    if mtu_discovery:
+        mtu_discovery.start()
+
 
 def signal_handler(sig: int, frame: types.FrameType | None) -> None:
     global running
@@ -397,6 +448,18 @@ if args.transport == Transport.TCP:
 
 client = Client(HOST, PORT, BIND_PORT, failsafe_ms, bind_address=bind_address)
 
+
+def apply_path_mtu(mtu: int) -> None:
+    # The probed size is the UDP payload, which is what the payloader MTU covers
+    executor.submit(video_control.apply_property, "payloader", "mtu", mtu)
+
+
+# Over TCP packets are segmented by the tunnel, there is nothing to probe
+mtu_discovery = None
+if args.mtu_discovery and args.transport == Transport.UDP:
+    mtu_discovery = PathMtuDiscovery(client, apply_path_mtu)
+    client.subscribe(MtuProbeAck, mtu_discovery.ack_handler)
+
 # Subscribe to messages received from the server
 client.subscribe(Control, control_handler)
 client.subscribe(Latency, latency_handler)
@@ -412,15 +475,27 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 # Telemetry update loop
+telemetry_interval = 1 / args.telemetry_rate_hz
+last_stats_log = time.monotonic()
 try:
     while running:
+        start = time.monotonic()
+
         # Only send telemetry if connected
         if client.state == State.CONNECTED:
+            telemetry.update_link(client.get_sequence_stats())
             telemetry_data = telemetry.get_telemetry()
-            telemetry_message = Telemetry(telemetry_data)
+            telemetry_message = telemetry_encoder.encode(telemetry_data)
             client.send(telemetry_message)
 
-        time.sleep(1)
+        if start - last_stats_log >= 60:
+            last_stats_log = start
+            for name, stats in telemetry.get_source_stats().items():
+                logger.debug(f"Telemetry source {name}: {stats}")
+
+        # Send as soon as fresh values arrive, but at most telemetry_rate_hz
+        time.sleep(max(0.0, telemetry_interval - (time.monotonic() - start)))
+        telemetry.wait_for_update(timeout=1)
 
 except Exception as e:
     logger.error(f"An error occurred: {e}")
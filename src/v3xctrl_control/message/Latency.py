@@ -22,11 +22,35 @@ class Latency(Message):
 
     When st is None, the message is a request from the viewer.
     When st is set, it is the streamer's response.
+
+    Requests may carry network feedback measured by the viewer:
+        - ls: Loss in percent of control messages from the streamer
+        - rt: RTT in ms of the previous round trip
+        - vl: Loss in percent of video packets since the previous request
+
+    The streamer drives its bitrate control with rt and vl, both describe the
+    path the video takes.
     """
 
-    def __init__(self, st: float | None = None, timestamp: float | None = None) -> None:
+    def __init__(
+        self,
+        st: float | None = None,
+        ls: float | None = None,
+        rt: float | None = None,
+        vl: float | None = None,
+        timestamp: float | None = None,
+    ) -> None:
         payload: dict[str, float] = {}
         if st is not None:
             payload["st"] = st
+        if ls is not None:
+            payload["ls"] = ls
+        if rt is not None:
+            payload["rt"] = rt
+        if vl is not None:
+            payload["vl"] = vl
         super().__init__(payload, timestamp)
         self.streamer_timestamp = st
+        self.loss = ls
+        self.rtt = rt
+        self.video_loss = vl
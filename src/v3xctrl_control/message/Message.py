@@ -6,7 +6,7 @@ only part the devs need to interact with, so this should not be too confusing.
 
 import abc
 import time
-from typing import Any, ClassVar, TypedDict, cast
+from typing import Any, ClassVar, NotRequired, TypedDict, cast
 
 import msgpack
 
@@ -15,6 +15,7 @@ class MessageDict(TypedDict):
     t: str
     p: dict[str, object]
     d: float
+    s: NotRequired[int]
 
 
 class Message(abc.ABC):  # noqa: B024
@@ -31,6 +32,10 @@ class Message(abc.ABC):  # noqa: B024
         self.timestamp = time.time() if timestamp is None else timestamp
         self.payload = payload
 
+        # Per-channel sequence number, assigned by the transmitter right before
+        # the message is serialized. Peers that do not send one leave it unset.
+        self.sequence: int | None = None
+
     def to_bytes(self) -> bytes:
         """Serialize the message to bytes using msgpack."""
         msg: MessageDict = {
@@ -38,6 +43,9 @@ class Message(abc.ABC):  # noqa: B024
             "p": self.payload,
             "d": self.timestamp,
         }
+        if self.sequence is not None:
+            msg["s"] = self.sequence
+
         result: bytes = msgpack.packb(msg)  # type: ignore[no-untyped-call]
         return result
 
@@ -49,11 +57,13 @@ class Message(abc.ABC):  # noqa: B024
             msg_type: str = msg["t"]
             timestamp = msg["d"]
             payload = msg["p"]
+            sequence = msg.get("s")
         except (KeyError, TypeError, msgpack.exceptions.ExtraData) as e:
             raise ValueError("Malformed message payload") from e
 
         if msg_type in cls._registry:
             instance: Message = cls._registry[msg_type](**payload, timestamp=timestamp)
+            instance.sequence = sequence
             return instance
         else:
             raise ValueError(f"Unknown message type: {msg_type}")
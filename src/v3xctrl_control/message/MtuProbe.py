@@ -0,0 +1,16 @@
+from .Message import Message
+
+
+class MtuProbe(Message):
+    """
+    Path MTU probe, padded (z) to the datagram size under test.
+
+    The viewer answers every probe it receives with an MtuProbeAck carrying
+    the same id (i). A probe that is not answered did not fit through the path.
+    """
+
+    def __init__(self, i: int, z: bytes = b"", timestamp: float | None = None) -> None:
+        super().__init__({"i": i, "z": z}, timestamp)
+
+        self.probe_id = i
+        self.padding = z
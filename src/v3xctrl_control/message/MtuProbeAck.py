@@ -0,0 +1,10 @@
+from .Message import Message
+
+
+class MtuProbeAck(Message):
+    """Acknowledgment message for an MtuProbe."""
+
+    def __init__(self, i: int, timestamp: float | None = None) -> None:
+        super().__init__({"i": i}, timestamp)
+
+        self.probe_id = i
@@ -4,14 +4,37 @@ from .Message import Message
 
 
 class Telemetry(Message):
-    """Message type for telemetry data."""
+    """
+    Message type for telemetry data.
 
-    def __init__(self, v: dict[str, Any] | None = None, timestamp: float | None = None) -> None:
+    Telemetry is either sent as a keyframe (k) holding all values, or as a
+    delta (b) holding only the values that differ from the keyframe it is
+    based on. Messages without either are full, standalone values.
+    """
+
+    def __init__(
+        self,
+        v: dict[str, Any] | None = None,
+        k: int | None = None,
+        b: int | None = None,
+        timestamp: float | None = None,
+    ) -> None:
         if v is None:
             v = {}
-        super().__init__({"v": v}, timestamp)
+
+        payload: dict[str, Any] = {"v": v}
+        if k is not None:
+            payload["k"] = k
+        if b is not None:
+            payload["b"] = b
+        super().__init__(payload, timestamp)
 
         self.values = v
+        self.keyframe = k
+        self.base = b
 
     def get_values(self) -> dict[str, Any]:
         return self.values
+
+    def is_delta(self) -> bool:
+        return self.base is not None
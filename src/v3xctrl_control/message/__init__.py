@@ -8,6 +8,8 @@ from .Error import Error
 from .Heartbeat import Heartbeat
 from .Latency import Latency
 from .Message import Message
+from .MtuProbe import MtuProbe
+from .MtuProbeAck import MtuProbeAck
 from .PeerAnnouncement import PeerAnnouncement
 from .PeerInfo import PeerInfo
 from .Syn import Syn
@@ -25,6 +27,8 @@ __all__ = [
     "Heartbeat",
     "Latency",
     "Message",
+    "MtuProbe",
+    "MtuProbeAck",
     "PeerAnnouncement",
     "PeerInfo",
     "Syn",
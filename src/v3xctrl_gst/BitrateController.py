@@ -0,0 +1,187 @@
+"""
+Network adaptive encoder bitrate.
+
+Combines three congestion signals:
+
+- UDP queue overruns: frames can not be pushed out fast enough
+- Queuing delay: the viewer measures the RTT of its latency checks, the
+  round trip includes the streamer to viewer direction the video takes.
+  Subtracting the minimum over a window leaves the delay added by queues
+  building up on the path.
+- Video packet loss reported by the viewer's jitterbuffer
+
+On congestion the bitrate is decreased multiplicatively, once the network has
+been quiet for a while it is probed upwards again in small additive steps
+(AIMD). All decisions are logged with their reason to help tuning.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BitrateController:
+    def __init__(
+        self,
+        apply: Callable[[int], None],
+        bitrate: int,
+        min_bitrate: int,
+        max_bitrate: int,
+        decrease_factor: float = 0.85,
+        increase_step: int = 100_000,
+        loss_threshold: float = 2.0,
+        delay_threshold_ms: float = 40.0,
+        hold_time: float = 3.0,
+        reaction_time: float = 2.0,
+        delay_window: int = 60,
+        delay_smoothing: float = 0.3,
+    ) -> None:
+        """
+        Args:
+            apply: Called with the new bitrate in bit/s
+            bitrate: Initial bitrate in bit/s
+            min_bitrate: Lower bound in bit/s
+            max_bitrate: Upper bound in bit/s
+            decrease_factor: Bitrate multiplier on congestion
+            increase_step: Bitrate increase per update in bit/s when probing
+            loss_threshold: Reported loss in percent considered congestion
+            delay_threshold_ms: Queuing delay considered congestion
+            hold_time: Seconds without congestion before probing upwards
+            reaction_time: Seconds for a decrease to show in loss and delay,
+                those signals are averaged and lag behind
+            delay_window: Number of delay samples to find the base delay in
+            delay_smoothing: Weight of the latest delay sample
+        """
+        self._apply = apply
+        self.min_bitrate = min_bitrate
+        self.max_bitrate = max_bitrate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.loss_threshold = loss_threshold
+        self.delay_threshold_ms = delay_threshold_ms
+        self.hold_time = hold_time
+        self.reaction_time = reaction_time
+        self.delay_smoothing = delay_smoothing
+
+        self._bitrate = self._clamp(bitrate)
+
+        self._delays: deque[float] = deque(maxlen=delay_window)
+        self._smoothed_delay: float | None = None
+        self._loss = 0.0
+        self._overruns = 0
+        self._overrun_lock = threading.Lock()
+
+        self._last_congestion = time.monotonic()
+        self._last_decrease: float | None = None
+        self._decreases = 0
+        self._increases = 0
+
+    @property
+    def bitrate(self) -> int:
+        return self._bitrate
+
+    @property
+    def queuing_delay_ms(self) -> float:
+        if self._smoothed_delay is None or not self._delays:
+            return 0.0
+
+        return max(0.0, self._smoothed_delay - min(self._delays))
+
+    def on_overrun(self) -> None:
+        """Count a UDP queue overrun, called on the streaming thread."""
+        with self._overrun_lock:
+            self._overruns += 1
+
+    def on_feedback(self, delay_ms: float | None = None, loss: float | None = None) -> None:
+        """
+        Network feedback from the viewer.
+
+        Args:
+            delay_ms: RTT sample measured by the viewer
+            loss: Video packet loss in percent as seen by the viewer
+        """
+        if delay_ms is not None:
+            self._delays.append(delay_ms)
+            if self._smoothed_delay is None:
+                self._smoothed_delay = delay_ms
+            else:
+                self._smoothed_delay += (delay_ms - self._smoothed_delay) * self.delay_smoothing
+
+        if loss is not None:
+            self._loss = loss
+
+    def update(self) -> bool:
+        """
+        Decide on the bitrate, call periodically.
+
+        Returns:
+            True if the bitrate was changed
+        """
+        now = time.monotonic()
+        reacting = self._last_decrease is not None and now - self._last_decrease < self.reaction_time
+        with self._overrun_lock:
+            overruns = self._overruns
+            self._overruns = 0
+
+        reason = self._congestion_reason(reacting, overruns)
+
+        if reason:
+            self._last_congestion = now
+            self._last_decrease = now
+            return self._set_bitrate(int(self._bitrate * self.decrease_factor), reason)
+
+        if not reacting and now - self._last_congestion >= self.hold_time:
+            return self._set_bitrate(self._bitrate + self.increase_step, "probing")
+
+        return False
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "bitrate": self._bitrate,
+            "queuing_delay_ms": round(self.queuing_delay_ms, 1),
+            "loss": self._loss,
+            "decreases": self._decreases,
+            "increases": self._increases,
+        }
+
+    def _congestion_reason(self, reacting: bool, overruns: int) -> str | None:
+        if overruns:
+            return f"{overruns} queue overruns"
+
+        # Give the previous decrease time to take effect
+        if reacting:
+            return None
+
+        if self._loss > self.loss_threshold:
+            return f"{self._loss:.1f}% loss"
+
+        delay = self.queuing_delay_ms
+        if delay > self.delay_threshold_ms:
+            return f"{delay:.0f}ms queuing delay"
+
+        return None
+
+    def _set_bitrate(self, bitrate: int, reason: str) -> bool:
+        bitrate = self._clamp(bitrate)
+        if bitrate == self._bitrate:
+            return False
+
+        logger.info(f"Bitrate {self._bitrate // 1000} -> {bitrate // 1000} kbit/s ({reason})")
+
+        if bitrate < self._bitrate:
+            self._decreases += 1
+        else:
+            self._increases += 1
+
+        self._bitrate = bitrate
+        self._apply(bitrate)
+
+        return True
+
+    def _clamp(self, bitrate: int) -> int:
+        return max(self.min_bitrate, min(self.max_bitrate, bitrate))
@@ -9,8 +9,17 @@ class ActionType(StrEnum):
     LIST = "list"
     GET = "get"
     SET = "set"
+    APPLY = "apply"
+    APPLY_STATUS = "apply_status"
     RECORDING = "recording"
     STATS = "stats"
+    FEEDBACK = "feedback"
+    KEYFRAME = "keyframe"
+    RECONFIGURE = "reconfigure"
+
+
+# Video format values a reconfigure command may change
+RECONFIGURE_KEYS = ("width", "height", "framerate")
 
 
 class RecordingAction(StrEnum):
@@ -55,7 +64,7 @@ class Command:
         if not isinstance(self.action, ActionType):
             raise CommandValidationError(f"Unknown action: {self.action}")
 
-        if self.action == ActionType.STOP or self.action == ActionType.STATS:
+        if self.action in (ActionType.STOP, ActionType.STATS, ActionType.KEYFRAME):
             return
 
         if self.action == ActionType.RECORDING:
@@ -64,6 +73,23 @@ class Command:
 
             return
 
+        if self.action == ActionType.FEEDBACK:
+            if not isinstance(self.value, dict):
+                raise CommandValidationError("Missing or invalid feedback value")
+
+            return
+
+        if self.action == ActionType.APPLY_STATUS:
+            if not isinstance(self.value, int) or isinstance(self.value, bool):
+                raise CommandValidationError("Missing or invalid request id")
+
+            return
+
+        if self.action == ActionType.RECONFIGURE:
+            self._validate_reconfigure()
+
+            return
+
         if not self.element:
             raise CommandValidationError("Missing element parameter")
 
@@ -73,5 +99,20 @@ class Command:
         if not self.property:
             raise CommandValidationError("Missing property parameter")
 
-        if self.action == ActionType.SET and self.value is None:
+        if self.action in (ActionType.SET, ActionType.APPLY) and self.value is None:
             raise CommandValidationError("Missing value")
+
+    def _validate_reconfigure(self) -> None:
+        if not isinstance(self.value, dict) or not self.value:
+            raise CommandValidationError("Missing or invalid reconfigure value")
+
+        for key, value in self.value.items():
+            if key not in RECONFIGURE_KEYS:
+                raise CommandValidationError(f"Unknown reconfigure key: {key}")
+
+            if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+                raise CommandValidationError(f"Invalid {key}: {value}")
+
+            # NV12 needs even dimensions
+            if key in ("width", "height") and value % 2:
+                raise CommandValidationError(f"{key} must be even: {value}")
@@ -1,19 +1,47 @@
 import json
 import socket
+import threading
 from typing import Any
 
 
 class ControlClient:
-    """Client to control a running Streamer instance."""
+    """
+    Client to control a running Streamer instance.
 
-    def __init__(self, socket_path: str = "/tmp/v3xctrl.sock") -> None:
+    Commands and responses are newline delimited JSON. The connection is kept
+    open between calls and transparently re-established if the server went
+    away in the meantime. Multiple commands can be pipelined: all of them are
+    written at once and responses are read back in order.
+    """
+
+    RECV_SIZE = 4096
+
+    def __init__(self, socket_path: str = "/tmp/v3xctrl.sock", timeout: float = 2.0, persistent: bool = True) -> None:
         """
         Initialize the client.
 
         Args:
             socket_path: Path to Unix socket file
+            timeout: Socket timeout in seconds
+            persistent: Keep the connection open between calls
         """
         self.socket_path = socket_path
+        self.timeout = timeout
+        self.persistent = persistent
+
+        self._sock: socket.socket | None = None
+        self._buffer = b""
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ControlClient":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
 
     def list_properties(self, element: str) -> dict[str, Any]:
         return self._send_command({"action": "list", "element": element})
@@ -24,6 +52,28 @@ class ControlClient:
     def set_property(self, element: str, property_name: str, value: Any) -> dict[str, Any]:
         return self._send_command({"action": "set", "element": element, "property": property_name, "value": value})
 
+    def apply_property(self, element: str, property_name: str, value: Any) -> dict[str, Any]:
+        """Queue a property change without waiting for it to stick, see apply_status."""
+        return self._send_command({"action": "apply", "element": element, "property": property_name, "value": value})
+
+    def apply_status(self, request_id: int) -> dict[str, Any]:
+        return self._send_command({"action": "apply_status", "value": request_id})
+
+    def get_properties(self, element: str, property_names: list[str]) -> list[dict[str, Any]]:
+        """Get multiple properties with a single round trip."""
+        return self.send_batch(
+            [{"action": "get", "element": element, "property": property_name} for property_name in property_names]
+        )
+
+    def set_properties(self, element: str, values: dict[str, Any]) -> list[dict[str, Any]]:
+        """Set multiple properties with a single round trip."""
+        return self.send_batch(
+            [
+                {"action": "set", "element": element, "property": property_name, "value": value}
+                for property_name, value in values.items()
+            ]
+        )
+
     def stop(self) -> dict[str, Any]:
         return self._send_command({"action": "stop"})
 
@@ -38,6 +88,56 @@ class ControlClient:
     def stats(self) -> dict[str, Any]:
         return self._send_command({"action": "stats"})
 
+    def request_keyframe(self) -> dict[str, Any]:
+        """Ask the encoder for an IDR frame, rate limited by the streamer."""
+        return self._send_command({"action": "keyframe"})
+
+    def reconfigure(
+        self, width: int | None = None, height: int | None = None, framerate: int | None = None
+    ) -> dict[str, Any]:
+        """Change resolution and/or framerate without restarting the streamer."""
+        values = {
+            key: value
+            for key, value in (("width", width), ("height", height), ("framerate", framerate))
+            if value is not None
+        }
+        return self._send_command({"action": "reconfigure", "value": values})
+
+    def network_feedback(self, delay_ms: float | None = None, loss: float | None = None) -> dict[str, Any]:
+        """
+        Report network conditions for bitrate control.
+
+        Args:
+            delay_ms: RTT sample measured by the viewer
+            loss: Video packet loss in percent as seen by the receiver
+        """
+        return self._send_command({"action": "feedback", "value": {"delay_ms": delay_ms, "loss": loss}})
+
+    def send_batch(self, commands: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Pipeline multiple commands.
+
+        Args:
+            commands: Command dictionaries
+
+        Returns:
+            Response dictionaries, in the same order as the commands
+        """
+        if not commands:
+            return []
+
+        with self._lock:
+            try:
+                return self._exchange(commands)
+
+            except Exception as e:
+                self._disconnect()
+                return [{"status": "error", "message": str(e)} for _ in commands]
+
+            finally:
+                if not self.persistent:
+                    self._disconnect()
+
     def _send_command(self, command: dict[str, Any]) -> dict[str, Any]:
         """
         Send a command to the control server.
@@ -48,15 +148,60 @@ class ControlClient:
         Returns:
             Response dictionary
         """
+        return self.send_batch([command])[0]
+
+    def _exchange(self, commands: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        payload = b"".join(json.dumps(command).encode("utf-8") + b"\n" for command in commands)
+
+        # A kept-alive connection might have been closed by the server (e.g.
+        # Streamer restart) - retry once on a fresh connection. Nothing has
+        # been answered in that case, so no command is executed twice.
+        reused = self._sock is not None
         try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock = self._connect()
+            sock.sendall(payload)
+            first = self._read_response(sock)
+
+        except (ConnectionError, BrokenPipeError):
+            if not reused:
+                raise
+
+            self._disconnect()
+            sock = self._connect()
+            sock.sendall(payload)
+            first = self._read_response(sock)
+
+        return [first] + [self._read_response(sock) for _ in commands[1:]]
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
                 sock.connect(self.socket_path)
+            except Exception:
+                sock.close()
+                raise
+
+            self._sock = sock
+            self._buffer = b""
+
+        return self._sock
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._buffer = b""
 
-                sock.sendall(json.dumps(command).encode("utf-8"))
-                response = sock.recv(4096).decode("utf-8")
+    def _read_response(self, sock: socket.socket) -> dict[str, Any]:
+        while b"\n" not in self._buffer:
+            data = sock.recv(self.RECV_SIZE)
+            if not data:
+                raise ConnectionError("Connection closed by server")
+            self._buffer += data
 
-                result: dict[str, Any] = json.loads(response)
-                return result
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        result: dict[str, Any] = json.loads(line.decode("utf-8"))
 
-        except Exception as e:
-            return {"status": "error", "message": str(e)}
+        return result
@@ -17,6 +17,14 @@ logger = logging.getLogger(__name__)
 class ControlServer:
     """Unix socket-based control server for runtime pipeline control."""
 
+    RECV_SIZE = 4096
+
+    # Upper bound for a single, unterminated command
+    MAX_COMMAND_SIZE = 1024 * 1024
+
+    # Idle time after which an unterminated command is tried as a whole
+    LEGACY_COMMAND_TIMEOUT = 0.1
+
     def __init__(self, streamer: "Streamer", socket_path: str = "/tmp/v3xctrl.sock") -> None:
         """
         Initialize the control server.
@@ -34,8 +42,13 @@ class ControlServer:
             ActionType.LIST: self._handle_list,
             ActionType.GET: self._handle_get,
             ActionType.SET: self._handle_set,
+            ActionType.APPLY: self._handle_apply,
+            ActionType.APPLY_STATUS: self._handle_apply_status,
             ActionType.STATS: self._handle_stats,
             ActionType.RECORDING: self._handle_recording,
+            ActionType.FEEDBACK: self._handle_feedback,
+            ActionType.KEYFRAME: self._handle_keyframe,
+            ActionType.RECONFIGURE: self._handle_reconfigure,
         }
 
         self.server_socket: socket.socket | None = None
@@ -101,45 +114,97 @@ class ControlServer:
             if self.server_socket:
                 self.server_socket.close()
 
-            with contextlib.suppress(OSError):
-                if os.path.exists(self.socket_path):
-                    os.unlink(self.socket_path)
+            # stop() already removed the socket, by now it may belong to a
+            # new server on the same path
+            if self.running:
+                with contextlib.suppress(OSError):
+                    if os.path.exists(self.socket_path):
+                        os.unlink(self.socket_path)
 
     def _handle_client(self, client_socket: socket.socket) -> None:
         """
         Handle a client connection.
 
+        Commands are newline delimited, a client may send any number of
+        commands over the same connection and pipeline them without waiting
+        for responses. Responses are sent in order, one per line.
+
         Args:
             client_socket: Connected client socket
         """
+        buffer = b""
+        checked = 0
         try:
             while self.running:
-                data = client_socket.recv(4096)
-                if not data:
-                    break
-
+                # Older clients send a single command without newline and wait
+                # for the response. An unterminated command is only tried once
+                # the client goes quiet, not re-parsed on every read.
+                client_socket.settimeout(self.LEGACY_COMMAND_TIMEOUT if len(buffer) != checked else None)
                 try:
-                    command_dict = json.loads(data.decode("utf-8"))
-                    command = Command(**command_dict)
-                    command.validate()
-                    response = self._execute_command(command)
+                    data = client_socket.recv(self.RECV_SIZE)
+                except TimeoutError:
+                    checked = len(buffer)
+                    if self._is_complete(buffer):
+                        client_socket.sendall(self._process_line(buffer))
+                        buffer = b""
+                        checked = 0
+                    continue
 
-                except json.JSONDecodeError as e:
-                    response = {"status": "error", "message": f"Invalid JSON: {e}"}
+                if not data:
+                    # Client closed its side, answer a trailing command if any
+                    if buffer.strip():
+                        client_socket.sendall(self._process_line(buffer))
+                    break
 
-                except (TypeError, CommandValidationError) as e:
-                    response = {"status": "error", "message": str(e)}
+                buffer += data
+                *lines, buffer = buffer.split(b"\n")
+                if lines:
+                    checked = 0
 
-                except Exception as e:
-                    response = {"status": "error", "message": str(e)}
+                if len(buffer) > self.MAX_COMMAND_SIZE:
+                    client_socket.sendall(self._encode({"status": "error", "message": "Command too large"}))
+                    break
 
-                client_socket.sendall(json.dumps(response).encode("utf-8") + b"\n")
+                responses = [self._process_line(line) for line in lines if line.strip()]
+                if responses:
+                    client_socket.sendall(b"".join(responses))
 
         except Exception as e:
             logger.error(f"Client handler error: {e}")
         finally:
             client_socket.close()
 
+    def _process_line(self, line: bytes) -> bytes:
+        try:
+            command_dict = json.loads(line.decode("utf-8"))
+            command = Command(**command_dict)
+            command.validate()
+            response = self._execute_command(command)
+
+        except json.JSONDecodeError as e:
+            response = {"status": "error", "message": f"Invalid JSON: {e}"}
+
+        except (TypeError, CommandValidationError) as e:
+            response = {"status": "error", "message": str(e)}
+
+        except Exception as e:
+            response = {"status": "error", "message": str(e)}
+
+        try:
+            return self._encode(response)
+        except (TypeError, ValueError) as e:
+            return self._encode({"status": "error", "message": f"Unserializable response: {e}"})
+
+    def _is_complete(self, data: bytes) -> bool:
+        try:
+            json.loads(data.decode("utf-8"))
+            return True
+        except ValueError:
+            return False
+
+    def _encode(self, response: dict[str, Any]) -> bytes:
+        return json.dumps(response).encode("utf-8") + b"\n"
+
     def _handle_recording(self, command: Command) -> dict[str, Any]:
         value = command.value
         if value is None:
@@ -159,6 +224,27 @@ class ControlServer:
     def _handle_stats(self, command: Command) -> dict[str, Any]:
         return self.streamer.get_stats()
 
+    def _handle_feedback(self, command: Command) -> dict[str, Any]:
+        assert isinstance(command.value, dict)
+        self.streamer.on_network_feedback(command.value.get("delay_ms"), command.value.get("loss"))
+        return {"status": "success"}
+
+    def _handle_keyframe(self, command: Command) -> dict[str, Any]:
+        scheduled = self.streamer.request_keyframe()
+        return {"status": "success", "scheduled": scheduled}
+
+    def _handle_reconfigure(self, command: Command) -> dict[str, Any]:
+        assert isinstance(command.value, dict)
+        success = self.streamer.reconfigure(**command.value)
+        settings = self.streamer.settings
+
+        return {
+            "status": "success" if success else "error",
+            "width": settings["width"],
+            "height": settings["height"],
+            "framerate": settings["framerate"],
+        }
+
     def _handle_stop(self, command: Command) -> dict[str, Any]:
         self.streamer.stop()
         return {"status": "success", "message": "Pipeline stopped"}
@@ -196,6 +282,26 @@ class ControlServer:
             "value": self._serialize_value(value),
         }
 
+    def _handle_apply(self, command: Command) -> dict[str, Any]:
+        assert command.element is not None
+        assert command.property is not None
+        request_id = self.streamer.apply_property(command.element, command.property, command.value)
+
+        return {
+            "status": "success",
+            "id": request_id,
+            "element": command.element,
+            "property": command.property,
+        }
+
+    def _handle_apply_status(self, command: Command) -> dict[str, Any]:
+        assert isinstance(command.value, int)
+        request = self.streamer.get_apply_status(command.value)
+        if request is None:
+            return {"status": "error", "message": f"Unknown request id: {command.value}"}
+
+        return {"status": "success", "request": self._serialize_value(request)}
+
     def _execute_command(self, command: Command) -> dict[str, Any]:
         handler = self._command_handlers.get(command.action)
         if handler:
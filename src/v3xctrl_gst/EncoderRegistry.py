@@ -0,0 +1,30 @@
+from typing import Any, ClassVar
+
+from v3xctrl_gst.Encoders import (
+    EncoderBuilder,
+    OpenH264EncoderBuilder,
+    V4L2EncoderBuilder,
+    X264EncoderBuilder,
+)
+
+
+class EncoderRegistry:
+    _builders: ClassVar[dict[str, type[EncoderBuilder]]] = {
+        "v4l2": V4L2EncoderBuilder,
+        "x264": X264EncoderBuilder,
+        "openh264": OpenH264EncoderBuilder,
+    }
+
+    @classmethod
+    def create(cls, name: str, settings: dict[str, Any]) -> EncoderBuilder:
+        """Create an encoder builder by name"""
+        builder_class = cls._builders.get(name)
+        if not builder_class:
+            available = ", ".join(cls._builders.keys())
+            raise ValueError(f"Unknown encoder builder: '{name}'. Available: {available}")
+
+        return builder_class(settings)
+
+    @classmethod
+    def list_encoders(cls) -> list[str]:
+        return list(cls._builders.keys())
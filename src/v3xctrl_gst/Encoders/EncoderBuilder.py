@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+import gi
+
+gi.require_version("Gst", "1.0")
+from gi.repository import Gst  # noqa: E402
+
+
+class EncoderBuilder(ABC):
+    """
+    Base class for H.264 encoder builders.
+
+    Every backend is configured from the same settings (bitrate in bit/s,
+    keyframe interval, QP range, ...) and maps them onto its own properties,
+    runtime changes of bitrate and QP go through the builder as well.
+    """
+
+    ELEMENT_NAME = "encoder"
+
+    # Override in subclasses that can refresh the picture with a rolling
+    # band of intra macroblocks instead of periodic IDR frames
+    SUPPORTS_INTRA_REFRESH: bool = False
+
+    # Override in subclasses that can change the QP range while PLAYING,
+    # QP control and the i-frame adjustment depend on it
+    SUPPORTS_RUNTIME_QP: bool = False
+
+    def __init__(self, settings: dict[str, Any]):
+        self.settings = settings
+        self._input_element: Gst.Element | None = None
+
+    @property
+    def intra_refresh(self) -> bool:
+        return bool(self.settings["intra_refresh"]) and self.SUPPORTS_INTRA_REFRESH
+
+    @abstractmethod
+    def build(self, pipeline: Gst.Pipeline) -> Gst.Element:
+        """
+        Build and return the encoder element.
+
+        Implementations must set self._input_element to the element the raw
+        video is linked to, which is the encoder itself unless it needs a
+        conversion in front of it.
+        """
+        pass
+
+    @abstractmethod
+    def set_bitrate(self, encoder: Gst.Element, bitrate: int) -> None:
+        """Change the target bitrate (bit/s) of a running encoder."""
+        pass
+
+    @abstractmethod
+    def set_qp(self, encoder: Gst.Element, qp_min: int, qp_max: int) -> None:
+        """
+        Change the QP range of the encoder. Without SUPPORTS_RUNTIME_QP
+        this only takes effect before the pipeline is PLAYING.
+        """
+        pass
+
+    def get_caps(self) -> str:
+        """Caps the encoder output is restricted to."""
+        return (
+            f"video/x-h264,"
+            f"level=(string){self.settings['h264_level']},"
+            f"profile=(string){self.settings['h264_profile']},"
+            f"stream-format=(string)byte-stream"
+        )
+
+    def get_input_element(self) -> Gst.Element:
+        if self._input_element is None:
+            raise RuntimeError("build() must be called before get_input_element()")
+
+        return self._input_element
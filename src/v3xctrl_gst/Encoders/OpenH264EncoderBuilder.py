@@ -0,0 +1,58 @@
+import logging
+
+import gi
+
+gi.require_version("Gst", "1.0")
+from gi.repository import Gst  # noqa: E402
+
+from .EncoderBuilder import EncoderBuilder  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+class OpenH264EncoderBuilder(EncoderBuilder):
+    """
+    Builds the openh264enc software encoder.
+
+    openh264 only takes I420 and only produces the baseline profiles, so the
+    input is converted and profile and level are left to the encoder.
+    """
+
+    def build(self, pipeline: Gst.Pipeline) -> Gst.Element:
+        convert = Gst.ElementFactory.make("videoconvert", "encoder_convert")
+        if not convert:
+            raise RuntimeError("Failed to create videoconvert")
+
+        encoder = Gst.ElementFactory.make("openh264enc", self.ELEMENT_NAME)
+        if not encoder:
+            raise RuntimeError("Failed to create openh264enc")
+
+        encoder.set_property("usage-type", "camera")
+        encoder.set_property("bitrate", self.settings["bitrate"])  # bit/s
+        encoder.set_property("rate-control", "bitrate" if self.settings["bitrate_mode"] == 1 else "quality")
+        encoder.set_property("enable-frame-skip", False)
+        encoder.set_property("gop-size", self.settings["h264_i_frame_period"])
+        encoder.set_property("qp-min", self.settings["h264_minimum_qp_value"])
+        encoder.set_property("qp-max", self.settings["h264_maximum_qp_value"])
+
+        pipeline.add(convert)
+        pipeline.add(encoder)
+
+        if not convert.link(encoder):
+            raise RuntimeError("Failed to link videoconvert to openh264enc")
+
+        self._input_element = convert
+
+        logger.info("Created openh264 software encoder")
+
+        return encoder
+
+    def set_bitrate(self, encoder: Gst.Element, bitrate: int) -> None:
+        encoder.set_property("bitrate", bitrate)
+
+    def set_qp(self, encoder: Gst.Element, qp_min: int, qp_max: int) -> None:
+        encoder.set_property("qp-min", qp_min)
+        encoder.set_property("qp-max", qp_max)
+
+    def get_caps(self) -> str:
+        return "video/x-h264,stream-format=(string)byte-stream"
@@ -0,0 +1,61 @@
+import logging
+
+import gi
+
+gi.require_version("Gst", "1.0")
+from gi.repository import Gst  # noqa: E402
+
+from .EncoderBuilder import EncoderBuilder  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+class V4L2EncoderBuilder(EncoderBuilder):
+    """Builds the hardware v4l2h264enc, configured via extra-controls"""
+
+    SUPPORTS_INTRA_REFRESH = True
+    SUPPORTS_RUNTIME_QP = True
+
+    # IDR period with intra refresh, IDRs are then only sent when forced
+    INTRA_REFRESH_IDR_PERIOD = 2**31 - 1
+
+    def build(self, pipeline: Gst.Pipeline) -> Gst.Element:
+        encoder = Gst.ElementFactory.make("v4l2h264enc", self.ELEMENT_NAME)
+        if not encoder:
+            raise RuntimeError("Failed to create v4l2h264enc")
+
+        encoder_controls = (
+            f"controls,"
+            f"video_b_frames=0,"
+            f"repeat_sequence_header=1,"
+            f"video_bitrate={self.settings['bitrate']},"
+            f"bitrate_mode={self.settings['bitrate_mode']},"
+            f"h264_minimum_qp_value={self.settings['h264_minimum_qp_value']},"
+            f"h264_maximum_qp_value={self.settings['h264_maximum_qp_value']},"
+        )
+
+        if self.intra_refresh:
+            # The refresh cycle takes as long as the I-frame period would
+            encoder_controls += (
+                f"h264_i_frame_period={self.INTRA_REFRESH_IDR_PERIOD},"
+                f"intra_refresh_period={self.settings['h264_i_frame_period']}"
+            )
+        else:
+            encoder_controls += f"h264_i_frame_period={self.settings['h264_i_frame_period']}"
+
+        encoder.set_property("extra-controls", Gst.Structure.from_string(encoder_controls)[0])
+        encoder.set_property("capture-io-mode", self.settings["capture_io_mode"])
+        encoder.set_property("output-io-mode", self.settings["output_io_mode"])
+        pipeline.add(encoder)
+
+        self._input_element = encoder
+
+        return encoder
+
+    def set_bitrate(self, encoder: Gst.Element, bitrate: int) -> None:
+        encoder_controls = f"controls,video_bitrate={bitrate}"
+        encoder.set_property("extra-controls", Gst.Structure.from_string(encoder_controls)[0])
+
+    def set_qp(self, encoder: Gst.Element, qp_min: int, qp_max: int) -> None:
+        encoder_controls = f"controls,h264_minimum_qp_value={qp_min},h264_maximum_qp_value={qp_max}"
+        encoder.set_property("extra-controls", Gst.Structure.from_string(encoder_controls)[0])
@@ -0,0 +1,58 @@
+import logging
+
+import gi
+
+gi.require_version("Gst", "1.0")
+from gi.repository import Gst  # noqa: E402
+
+from .EncoderBuilder import EncoderBuilder  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+class X264EncoderBuilder(EncoderBuilder):
+    """
+    Builds the x264enc software encoder.
+
+    Tuned for latency the same way the hardware encoder is used: no B-frames,
+    no lookahead, a fixed keyframe interval and headers with every keyframe.
+
+    With intra refresh the keyframe interval is the length of a refresh
+    cycle, x264 starts each cycle with a recovery point SEI.
+    """
+
+    SUPPORTS_INTRA_REFRESH = True
+
+    def build(self, pipeline: Gst.Pipeline) -> Gst.Element:
+        encoder = Gst.ElementFactory.make("x264enc", self.ELEMENT_NAME)
+        if not encoder:
+            raise RuntimeError("Failed to create x264enc")
+
+        encoder.set_property("tune", "zerolatency")
+        encoder.set_property("speed-preset", "ultrafast")
+        encoder.set_property("bframes", 0)
+        encoder.set_property("byte-stream", True)
+        encoder.set_property("key-int-max", self.settings["h264_i_frame_period"])
+        encoder.set_property("bitrate", self.settings["bitrate"] // 1000)  # kbit/s
+        encoder.set_property("qp-min", self.settings["h264_minimum_qp_value"])
+        encoder.set_property("qp-max", self.settings["h264_maximum_qp_value"])
+        encoder.set_property("intra-refresh", self.intra_refresh)
+
+        if self.settings["bitrate_mode"] == 1:
+            # One frame of VBV buffer is as close to CBR as x264 gets
+            encoder.set_property("vbv-buf-capacity", max(1, 1000 // self.settings["framerate"]))
+
+        pipeline.add(encoder)
+
+        self._input_element = encoder
+
+        logger.info("Created x264 software encoder")
+
+        return encoder
+
+    def set_bitrate(self, encoder: Gst.Element, bitrate: int) -> None:
+        encoder.set_property("bitrate", bitrate // 1000)
+
+    def set_qp(self, encoder: Gst.Element, qp_min: int, qp_max: int) -> None:
+        encoder.set_property("qp-min", qp_min)
+        encoder.set_property("qp-max", qp_max)
@@ -0,0 +1,11 @@
+from v3xctrl_gst.Encoders.EncoderBuilder import EncoderBuilder
+from v3xctrl_gst.Encoders.OpenH264EncoderBuilder import OpenH264EncoderBuilder
+from v3xctrl_gst.Encoders.V4L2EncoderBuilder import V4L2EncoderBuilder
+from v3xctrl_gst.Encoders.X264EncoderBuilder import X264EncoderBuilder
+
+__all__ = [
+    "EncoderBuilder",
+    "OpenH264EncoderBuilder",
+    "V4L2EncoderBuilder",
+    "X264EncoderBuilder",
+]
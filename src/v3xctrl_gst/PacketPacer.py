@@ -0,0 +1,201 @@
+"""
+Paced RTP sender.
+
+The payloader emits a whole frame as a back-to-back burst of packets. For
+I-frames that is easily 20+ packets at once, which overflows the buffers of
+cellular modems and causes loss exactly on the frames that matter most.
+
+The pacer takes over from udpsink: frames are queued from the streaming
+thread and a sender thread spreads the packets of each frame over a fraction
+of the frame interval. A burst allowance lets small frames (most P-frames)
+go out immediately, only the bytes above it are paced.
+
+If frames arrive faster than they can be paced, the backlog is flushed
+without pacing - pacing must never add more than a frame of latency.
+"""
+
+import logging
+import socket
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class PacketPacer:
+    # Frames waiting before the current one is flushed unpaced
+    MAX_QUEUED_FRAMES = 1
+
+    # Number of pacing delay samples kept for statistics
+    DELAY_WINDOW = 512
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        bind_port: int,
+        framerate: float,
+        fraction: float = 0.5,
+        burst_bytes: int = 8192,
+        on_error: Callable[[OSError], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            host: Destination host
+            port: Destination port
+            bind_port: Local port to send from
+            framerate: Frames per second, determines the frame interval
+            fraction: Part of the frame interval packets are spread over
+            burst_bytes: Bytes per frame sent without pacing
+            on_error: Called when sending fails (network unreachable...)
+        """
+        self.address = (host, port)
+        self.bind_port = bind_port
+        self.frame_interval = 1.0 / framerate
+        self.fraction = fraction
+        self.burst_bytes = burst_bytes
+        self._on_error = on_error
+
+        self._sock: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+        self._running = threading.Event()
+
+        self._condition = threading.Condition()
+        self._frames: deque[tuple[float, Sequence[bytes]]] = deque()
+
+        self._delays: deque[float] = deque(maxlen=self.DELAY_WINDOW)
+        self._frames_sent = 0
+        self._packets_sent = 0
+        self._bytes_sent = 0
+        self._flushed = 0
+        self._errors = 0
+
+    def start(self) -> None:
+        if self._running.is_set():
+            return
+
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(("0.0.0.0", self.bind_port))
+
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name="PacketPacer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running.clear()
+        with self._condition:
+            self._condition.notify()
+
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+
+    def submit(self, packets: Sequence[bytes]) -> None:
+        """Queue the packets of one frame, safe to call from any thread."""
+        if not packets:
+            return
+
+        with self._condition:
+            self._frames.append((time.monotonic(), packets))
+            self._condition.notify()
+
+    def schedule(self, sizes: Sequence[int], start: float) -> list[float]:
+        """
+        Calculate send times for the packets of a frame.
+
+        Packets within the burst allowance are sent at `start`, the remaining
+        bytes are spread evenly over `fraction` of the frame interval.
+        """
+        total = sum(sizes)
+        paced_bytes = total - self.burst_bytes
+        if paced_bytes <= 0:
+            return [start] * len(sizes)
+
+        duration = self.frame_interval * self.fraction
+        times = []
+        sent = 0
+        for size in sizes:
+            over = sent - self.burst_bytes
+            times.append(start + duration * over / paced_bytes if over > 0 else start)
+            sent += size
+
+        return times
+
+    def get_stats(self) -> dict[str, Any]:
+        delays = sorted(self._delays)
+        count = len(delays)
+
+        return {
+            "pacing_frames": self._frames_sent,
+            "pacing_packets": self._packets_sent,
+            "pacing_bytes": self._bytes_sent,
+            "pacing_flushed_packets": self._flushed,
+            "pacing_errors": self._errors,
+            "pacing_delay_avg_ms": round(sum(delays) / count * 1000, 2) if count else 0.0,
+            "pacing_delay_p95_ms": round(delays[min(count - 1, int(count * 0.95))] * 1000, 2) if count else 0.0,
+            "pacing_delay_max_ms": round(delays[-1] * 1000, 2) if count else 0.0,
+        }
+
+    def _run(self) -> None:
+        while self._running.is_set():
+            with self._condition:
+                while not self._frames and self._running.is_set():
+                    self._condition.wait()
+
+                if not self._running.is_set():
+                    return
+
+                queued_at, packets = self._frames.popleft()
+
+            self._send_frame(queued_at, packets)
+
+    def _send_frame(self, queued_at: float, packets: Sequence[bytes]) -> None:
+        schedule = self.schedule([len(packet) for packet in packets], time.monotonic())
+
+        for packet, send_at in zip(packets, schedule, strict=True):
+            if not self._wait_until(send_at):
+                self._flushed += 1
+
+            self._send(packet)
+            self._delays.append(time.monotonic() - queued_at)
+
+        self._frames_sent += 1
+
+    def _wait_until(self, send_at: float) -> bool:
+        """
+        Wait for the scheduled send time of a packet.
+
+        Returns:
+            False if the wait was cut short because frames are backing up -
+            pacing would only add latency then
+        """
+        with self._condition:
+            while len(self._frames) < self.MAX_QUEUED_FRAMES and self._running.is_set():
+                delay = send_at - time.monotonic()
+                if delay <= 0:
+                    return True
+
+                self._condition.wait(delay)
+
+            return len(self._frames) < self.MAX_QUEUED_FRAMES
+
+    def _send(self, packet: bytes) -> None:
+        if self._sock is None:
+            return
+
+        try:
+            self._sock.sendto(packet, self.address)
+            self._packets_sent += 1
+            self._bytes_sent += len(packet)
+        except OSError as e:
+            self._errors += 1
+            if self._on_error:
+                self._on_error(e)
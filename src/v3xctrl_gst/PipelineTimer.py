@@ -1,5 +1,7 @@
 import logging
 import time
+from array import array
+from typing import Any
 
 import gi
 
@@ -15,15 +17,39 @@ class PipelineTimer:
     Tracks timing data at four probe points (source, capsfilter, encoder, UDP)
     and periodically logs aggregate statistics. Designed to be owned by Streamer
     and called from its pad probe callbacks.
+
+    Frames in flight live in fixed size arrays indexed by frame slot, a new
+    frame takes the next slot and overwrites whatever was left there by a
+    dropped frame. Stage durations go to ring buffers of the last `WINDOW`
+    frames from which percentiles are calculated on request.
     """
 
+    # Frames tracked between source and udpsink at the same time
+    SLOTS = 64
+
+    # Completed frames kept per stage for percentiles
+    WINDOW = 512
+
+    STAGES = ("capture", "capsfilter", "encode", "package", "payloader", "total")
+    PERCENTILES = (50, 95, 99)
+
     def __init__(self, log_interval: float = 1.0) -> None:
         self._enabled = False
         self._log_interval = log_interval
         self._last_log = 0.0
 
-        self._data: dict[int, dict[str, float]] = {}
-        self._stats: dict[str, list[float]] = self._empty_stats()
+        self._pts = array("q", [-1] * self.SLOTS)
+        self._source = array("d", [0.0] * self.SLOTS)
+        self._capture_delay = array("d", [0.0] * self.SLOTS)
+        self._capsfilter = array("d", [0.0] * self.SLOTS)
+        self._encoder = array("d", [0.0] * self.SLOTS)
+        self._payloader_in = array("d", [0.0] * self.SLOTS)
+        self._next_slot = 0
+
+        self._samples = {stage: array("d", [0.0] * self.WINDOW) for stage in self.STAGES}
+        self._sample_count = 0
+        self._frames_since_log = 0
+
         self._debug: dict[str, int] = self._empty_debug()
 
     @property
@@ -32,36 +58,41 @@ class PipelineTimer:
 
     def enable(self) -> None:
         self._enabled = True
-        self._data.clear()
-        self._stats = self._empty_stats()
-        self._debug = self._empty_debug()
+        self._reset()
         self._last_log = time.monotonic()
 
     def disable(self) -> None:
         self._enabled = False
 
     def on_source_buffer(self, pts: int, pipeline: Gst.Pipeline) -> None:
-        if not self._enabled:
+        # Without a PTS the frame can not be followed through the stages,
+        # CLOCK_TIME_NONE also does not fit into the signed PTS array
+        if not self._enabled or pts == Gst.CLOCK_TIME_NONE:
             return
 
         now = time.monotonic()
         self._debug["source_probe"] += 1
 
         running_time = pipeline.get_clock().get_time() - pipeline.get_base_time()
-        capture_delay = (running_time - pts) / Gst.MSECOND
 
-        self._data[pts] = {
-            "source": now,
-            "capture_delay": capture_delay,
-        }
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.SLOTS
+
+        self._pts[slot] = pts
+        self._source[slot] = now
+        self._capture_delay[slot] = (running_time - pts) / Gst.MSECOND
+        self._capsfilter[slot] = 0.0
+        self._encoder[slot] = 0.0
+        self._payloader_in[slot] = 0.0
 
     def on_capsfilter_buffer(self, pts: int) -> None:
         if not self._enabled:
             return
 
         self._debug["capsfilter_probe"] += 1
-        if pts in self._data:
-            self._data[pts]["capsfilter"] = time.monotonic()
+        slot = self._find_slot(pts)
+        if slot >= 0:
+            self._capsfilter[slot] = time.monotonic()
         else:
             self._debug["capsfilter_miss"] += 1
 
@@ -70,8 +101,9 @@ class PipelineTimer:
             return
 
         self._debug["encoder_probe"] += 1
-        if pts in self._data:
-            self._data[pts]["encoder"] = time.monotonic()
+        slot = self._find_slot(pts)
+        if slot >= 0:
+            self._encoder[slot] = time.monotonic()
         else:
             self._debug["encoder_miss"] += 1
 
@@ -79,97 +111,115 @@ class PipelineTimer:
         if not self._enabled:
             return
 
-        if pts not in self._data:
+        slot = self._find_slot(pts)
+        if slot < 0:
             self._debug["udp_miss"] += 1
             return
 
-        timing = self._data[pts]
         self._debug["udp_probe"] += 1
 
-        if "source" not in timing or "capsfilter" not in timing or "encoder" not in timing:
+        if not self._capsfilter[slot] or not self._encoder[slot]:
             self._debug["incomplete"] += 1
             return
 
-        timing["payloader_in"] = time.monotonic()
+        self._payloader_in[slot] = time.monotonic()
 
     def on_udpsink_buffer_list(self, pts: int) -> None:
         if not self._enabled:
             return
 
-        if pts not in self._data:
-            return
-
-        timing = self._data[pts]
+        slot = self._find_slot(pts)
 
         # payloader_in is only set by on_payloader_in when source, capsfilter,
         # and encoder are all present, so this implicitly guarantees completeness.
-        if "payloader_in" not in timing:
+        if slot < 0 or not self._payloader_in[slot]:
             return
 
         now = time.monotonic()
-        self._data.pop(pts)
-
-        capture_time = timing.get("capture_delay", 0)
-        capsfilter_time = (timing["capsfilter"] - timing["source"]) * 1000
-        encode_time = (timing["encoder"] - timing["capsfilter"]) * 1000
-        package_time = (timing["payloader_in"] - timing["encoder"]) * 1000
-        payloader_time = (now - timing["payloader_in"]) * 1000
-
-        self._stats["capture"].append(capture_time)
-        self._stats["capsfilter"].append(capsfilter_time)
-        self._stats["encode"].append(encode_time)
-        self._stats["package"].append(package_time)
-        self._stats["payloader"].append(payloader_time)
+        self._pts[slot] = -1
+
+        capture_time = self._capture_delay[slot]
+        capsfilter_time = (self._capsfilter[slot] - self._source[slot]) * 1000
+        encode_time = (self._encoder[slot] - self._capsfilter[slot]) * 1000
+        package_time = (self._payloader_in[slot] - self._encoder[slot]) * 1000
+        payloader_time = (now - self._payloader_in[slot]) * 1000
+
+        index = self._sample_count % self.WINDOW
+        self._samples["capture"][index] = capture_time
+        self._samples["capsfilter"][index] = capsfilter_time
+        self._samples["encode"][index] = encode_time
+        self._samples["package"][index] = package_time
+        self._samples["payloader"][index] = payloader_time
+        self._samples["total"][index] = capture_time + (now - self._source[slot]) * 1000
+        self._sample_count += 1
+        self._frames_since_log += 1
 
         if now - self._last_log >= self._log_interval:
             self._log_stats()
             self._last_log = now
 
-        # Purge entries older than current PTS (dropped frames)
-        stale = [k for k in self._data if k < pts]
-        for k in stale:
-            del self._data[k]
+    def percentiles(self, stage: str) -> dict[int, float]:
+        """Percentiles in ms of a stage over the last `WINDOW` frames."""
+        count = min(self._sample_count, self.WINDOW)
+        if not count:
+            return dict.fromkeys(self.PERCENTILES, 0.0)
+
+        samples = sorted(self._samples[stage][:count])
+        return {p: samples[min(count - 1, count * p // 100)] for p in self.PERCENTILES}
+
+    def get_stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {"timing_frames": min(self._sample_count, self.WINDOW)}
+        for stage in self.STAGES:
+            for p, value in self.percentiles(stage).items():
+                stats[f"timing_{stage}_p{p}_ms"] = round(value, 2)
+
+        return stats
+
+    def _find_slot(self, pts: int) -> int:
+        """
+        Slot of the frame with the given PTS, -1 if it is not tracked.
+
+        Frames pass the stages in order, so the search goes backwards from
+        the most recent frame and usually ends within a few slots.
+        """
+        slot = self._next_slot
+        for _ in range(self.SLOTS):
+            slot = (slot - 1) % self.SLOTS
+            if self._pts[slot] == pts:
+                return slot
+
+        return -1
+
+    def _reset(self) -> None:
+        for slot in range(self.SLOTS):
+            self._pts[slot] = -1
+        self._next_slot = 0
+        self._sample_count = 0
+        self._frames_since_log = 0
+        self._debug = self._empty_debug()
 
     def _log_stats(self) -> None:
-        if not self._stats["capture"]:
+        if not self._frames_since_log:
             return
 
-        def stats(data: list[float]) -> tuple[float, float, float]:
-            if not data:
-                return 0.0, 0.0, 0.0
-            return min(data), sum(data) / len(data), max(data)
+        p50 = {stage: self.percentiles(stage)[50] for stage in self.STAGES}
+        total_p95 = self.percentiles("total")[95]
 
-        _cap_min, cap_avg, _cap_max = stats(self._stats["capture"])
-        _enc_min, enc_avg, _enc_max = stats(self._stats["encode"])
-        _pkg_min, pkg_avg, _pkg_max = stats(self._stats["package"])
-        _pay_min, pay_avg, _pay_max = stats(self._stats["payloader"])
-
-        total_avg = cap_avg + enc_avg + pkg_avg + pay_avg
-        frame_count = len(self._stats["capture"])
+        frame_count = self._frames_since_log
         interval = time.monotonic() - self._last_log
         fps = frame_count / interval if interval > 0 else 0
 
         logger.debug(
-            f"[TIMING] capture: {cap_avg:.1f}ms | "
-            f"encode: {enc_avg:.1f}ms | "
-            f"package: {pkg_avg:.1f}ms | "
-            f"payloader: {pay_avg:.1f}ms | "
-            f"total: {total_avg:.1f}ms | "
+            f"[TIMING] p50 capture: {p50['capture']:.1f}ms | "
+            f"encode: {p50['encode']:.1f}ms | "
+            f"package: {p50['package']:.1f}ms | "
+            f"payloader: {p50['payloader']:.1f}ms | "
+            f"total: {p50['total']:.1f}ms (p95 {total_p95:.1f}ms) | "
             f"fps: {fps:.1f} ({frame_count} frames)"
         )
 
         self._debug = self._empty_debug()
-        self._stats = self._empty_stats()
-
-    @staticmethod
-    def _empty_stats() -> dict[str, list[float]]:
-        return {
-            "capture": [],
-            "capsfilter": [],
-            "encode": [],
-            "package": [],
-            "payloader": [],
-        }
+        self._frames_since_log = 0
 
     @staticmethod
     def _empty_debug() -> dict[str, int]:
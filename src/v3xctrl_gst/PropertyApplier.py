@@ -0,0 +1,240 @@
+"""
+Asynchronous property application.
+
+Property changes are queued from any thread and applied on the GLib main loop.
+Some elements (libcamera in particular) take a moment until a value sticks, so
+every change is verified after a settle time and re-applied if needed - all
+driven by GLib timers, no thread is blocked while waiting.
+
+Repeated changes to the same property are coalesced: only the latest value is
+applied, earlier requests are reported as superseded.
+"""
+
+import contextlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ApplyStatus(StrEnum):
+    PENDING = "pending"
+    APPLIED = "applied"
+    FAILED = "failed"
+    SUPERSEDED = "superseded"
+
+
+@dataclass
+class PropertyRequest:
+    id: int
+    element: str
+    property_name: str
+    value: Any
+    status: ApplyStatus = ApplyStatus.PENDING
+    max_retries: int = 3
+    attempts: int = 0
+    actual: Any = None
+    callback: Callable[["PropertyRequest"], None] | None = field(default=None, repr=False)
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.element, self.property_name)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "element": self.element,
+            "property": self.property_name,
+            "value": self.value,
+            "status": str(self.status),
+            "attempts": self.attempts,
+        }
+
+
+class PropertyApplier:
+    # Number of finished requests kept for status queries
+    HISTORY_SIZE = 256
+
+    def __init__(
+        self,
+        get_element: Callable[[str], Any],
+        idle_add: Callable[..., Any],
+        timeout_add: Callable[..., Any],
+        settle_ms: int = 500,
+        max_retries: int = 3,
+    ) -> None:
+        """
+        Args:
+            get_element: Look up a pipeline element by name
+            idle_add: Schedule a callback on the main loop (GLib.idle_add)
+            timeout_add: Schedule a delayed callback (GLib.timeout_add)
+            settle_ms: Time to give an element before verifying a value
+            max_retries: Attempts before a request is reported as failed
+        """
+        self._get_element = get_element
+        self._idle_add = idle_add
+        self._timeout_add = timeout_add
+        self.settle_ms = settle_ms
+        self.max_retries = max_retries
+
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._queued: dict[tuple[str, str], PropertyRequest] = {}
+        self._latest: dict[tuple[str, str], int] = {}
+        self._requests: OrderedDict[int, PropertyRequest] = OrderedDict()
+        self._scheduled = False
+
+    def submit(
+        self,
+        element: str,
+        property_name: str,
+        value: Any,
+        callback: Callable[[PropertyRequest], None] | None = None,
+        max_retries: int | None = None,
+    ) -> int:
+        """
+        Queue a property change, safe to call from any thread.
+
+        The callback is invoked once the request is applied, failed or
+        superseded by a newer value for the same property.
+
+        Returns:
+            Request ID for status queries
+        """
+        superseded: PropertyRequest | None = None
+        with self._lock:
+            request = PropertyRequest(
+                self._next_id,
+                element,
+                property_name,
+                value,
+                max_retries=max_retries if max_retries is not None else self.max_retries,
+                callback=callback,
+            )
+            self._next_id += 1
+
+            superseded = self._queued.get(request.key)
+            self._queued[request.key] = request
+            self._latest[request.key] = request.id
+            self._remember(request)
+
+            schedule = not self._scheduled
+            self._scheduled = True
+
+        if superseded:
+            self._finish(superseded, ApplyStatus.SUPERSEDED)
+
+        if schedule:
+            self._idle_add(self._process_queue)
+
+        return request.id
+
+    def status(self, request_id: int) -> dict[str, Any] | None:
+        with self._lock:
+            request = self._requests.get(request_id)
+            return request.to_dict() if request else None
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(1 for request in self._requests.values() if request.status == ApplyStatus.PENDING)
+
+    def _remember(self, request: PropertyRequest) -> None:
+        self._requests[request.id] = request
+        while len(self._requests) > self.HISTORY_SIZE:
+            self._requests.popitem(last=False)
+
+    def _process_queue(self) -> bool:
+        with self._lock:
+            queued = list(self._queued.values())
+            self._queued.clear()
+            self._scheduled = False
+
+        for request in queued:
+            self._apply(request)
+
+        return False
+
+    def _apply(self, request: PropertyRequest) -> None:
+        if self._is_superseded(request):
+            self._finish(request, ApplyStatus.SUPERSEDED)
+            return
+
+        request.attempts += 1
+        element = self._get_element(request.element)
+        if element is None:
+            logger.error(f"Element '{request.element}' not found")
+            self._finish(request, ApplyStatus.FAILED)
+            return
+
+        try:
+            element.set_property(request.property_name, request.value)
+        except Exception as e:
+            logger.error(f"Failed to set property '{request.property_name}': {e}")
+            self._finish(request, ApplyStatus.FAILED)
+            return
+
+        # Give the element some time to process the setting - especially
+        # important for elements that interact with hardware like libcamera
+        self._timeout_add(self.settle_ms, self._verify, request)
+
+    def _verify(self, request: PropertyRequest) -> bool:
+        if self._is_superseded(request):
+            self._finish(request, ApplyStatus.SUPERSEDED)
+            return False
+
+        element = self._get_element(request.element)
+        if element is not None:
+            with contextlib.suppress(Exception):
+                request.actual = element.get_property(request.property_name)
+
+        if self._matches(request.actual, request.value):
+            if request.attempts > 1:
+                logger.debug(f"Property '{request.property_name}' stuck after {request.attempts} attempts")
+            self._finish(request, ApplyStatus.APPLIED)
+
+        elif request.attempts < request.max_retries:
+            logger.debug(
+                f"Attempt {request.attempts}: value is {request.actual}, expected {request.value}, retrying..."
+            )
+            self._apply(request)
+
+        else:
+            logger.warning(
+                f"Property '{request.property_name}' failed to stick after {request.attempts} attempts "
+                f"(value: {request.actual})"
+            )
+            self._finish(request, ApplyStatus.FAILED)
+
+        return False
+
+    def _is_superseded(self, request: PropertyRequest) -> bool:
+        with self._lock:
+            return self._latest.get(request.key) != request.id
+
+    def _finish(self, request: PropertyRequest, status: ApplyStatus) -> None:
+        with self._lock:
+            request.status = status
+            if self._latest.get(request.key) == request.id:
+                del self._latest[request.key]
+
+        if request.callback:
+            try:
+                request.callback(request)
+            except Exception as e:
+                logger.error(f"Property callback failed for '{request.property_name}': {e}")
+
+    @staticmethod
+    def _matches(actual: Any, expected: Any) -> bool:
+        # For float properties, use approximate comparison
+        if isinstance(actual, float):
+            try:
+                return bool(abs(actual - expected) < 0.001)
+            except TypeError:
+                return False
+
+        return bool(actual == expected)
@@ -0,0 +1,202 @@
+"""
+Model based QP control using the size of every encoded frame.
+
+Unlike QPManager, which only looks at I-frames, this keeps an exponentially
+weighted moving average of the frame size per frame type and estimates the
+resulting data rate from them:
+
+    rate = (avg_i + avg_p * (gop - 1)) / gop * framerate
+
+Each QP step changes the frame size by about 12% (+6 QP halves it), so the
+control error is expressed in QP units:
+
+    error = 6 * log2(rate / target)
+
+The error is measured at the current QP, so it already tells how far the QP
+is from where it should be. A PI loop in velocity form turns it into a QP
+change:
+
+    qp += kp * (error - previous_error) + ki * error
+
+Adding an integral on top of the current QP would integrate twice. The QP is
+tracked unrounded, so small corrections add up instead of being rounded away,
+and clamped to the limits, which also keeps it from winding up. The maximum QP
+follows the minimum at a fixed distance. A dead band around the target and a
+minimum step keep the controller from oscillating between neighbouring QP
+values.
+"""
+
+import logging
+import math
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class QPController:
+    # QP steps needed to halve the frame size
+    QP_PER_OCTAVE = 6.0
+
+    def __init__(
+        self,
+        apply: Callable[[int, int], None],
+        target_bytes_per_second: float,
+        framerate: float,
+        gop: int,
+        qp_min: int,
+        qp_max: int,
+        qp_range: int | None = None,
+        kp: float = 0.2,
+        ki: float = 0.4,
+        smoothing: float = 0.2,
+        deadband: float = 0.75,
+        hysteresis: int = 1,
+        update_interval: int = 15,
+    ) -> None:
+        """
+        Args:
+            apply: Called with the new minimum and maximum QP
+            target_bytes_per_second: Data rate to aim for
+            framerate: Frames per second
+            gop: Frames per I-frame period
+            qp_min: Lowest minimum QP (best quality) the controller may set
+            qp_max: Highest QP the controller may set
+            qp_range: Distance of the maximum to the minimum QP, defaults to
+                the full range so only the minimum QP is controlled
+            kp: Proportional gain, applied to the change of the error
+            ki: Integral gain, the share of the error corrected per update
+            smoothing: Weight of the latest frame in the size averages
+            deadband: Error in QP units that is considered on target
+            hysteresis: Minimum QP change to apply
+            update_interval: Frames between control updates
+        """
+        self._apply = apply
+        self.target = target_bytes_per_second
+        self.framerate = framerate
+        self.gop = max(1, gop)
+
+        self._qp_min_limit = qp_min
+        self._qp_max_limit = qp_max
+        self._qp_range = qp_range if qp_range is not None else qp_max - qp_min
+
+        self.kp = kp
+        self.ki = ki
+        self.smoothing = smoothing
+        self.deadband = deadband
+        self.hysteresis = hysteresis
+        self.update_interval = update_interval
+
+        self._avg_i: float | None = None
+        self._avg_p: float | None = None
+        self._frames = 0
+
+        self._error = 0.0
+        self._previous_error = 0.0
+        self._position = float(qp_min)
+        self._current_qp_min = qp_min
+
+    @property
+    def current_qp_min(self) -> int:
+        return self._current_qp_min
+
+    @property
+    def qp_max(self) -> int:
+        return min(self._current_qp_min + self._qp_range, self._qp_max_limit)
+
+    def set_target(self, bytes_per_second: float) -> None:
+        self.target = bytes_per_second
+
+    def on_frame(self, size: int, keyframe: bool) -> bool:
+        """
+        Called for every encoded frame.
+
+        Args:
+            size: Frame size in bytes
+            keyframe: True for I-frames
+
+        Returns:
+            True if the QP was changed
+        """
+        if keyframe:
+            self._avg_i = self._average(self._avg_i, size)
+        else:
+            self._avg_p = self._average(self._avg_p, size)
+
+        self._frames += 1
+        if self._frames < self.update_interval:
+            return False
+
+        self._frames = 0
+        return self.update()
+
+    def estimated_rate(self) -> float | None:
+        """Estimated data rate in bytes per second at the current QP."""
+        if self._avg_p is None and self._avg_i is None:
+            return None
+
+        avg_p = self._avg_p if self._avg_p is not None else self._avg_i
+        avg_i = self._avg_i if self._avg_i is not None else avg_p
+        assert avg_p is not None and avg_i is not None
+
+        return (avg_i + avg_p * (self.gop - 1)) / self.gop * self.framerate
+
+    def update(self) -> bool:
+        rate = self.estimated_rate()
+        if rate is None or rate <= 0 or self.target <= 0:
+            return False
+
+        error = self.QP_PER_OCTAVE * math.log2(rate / self.target)
+        previous_error = self._previous_error
+        self._error = error
+        self._previous_error = error
+
+        if abs(error) < self.deadband:
+            return False
+
+        position = self._position + self.kp * (error - previous_error) + self.ki * error
+        self._position = max(float(self._qp_min_limit), min(float(self._qp_max_limit), position))
+
+        qp_min = round(self._position)
+        if abs(qp_min - self._current_qp_min) < self.hysteresis:
+            return False
+
+        logger.info(
+            "QP %d -> %d (rate %.0f kB/s, target %.0f kB/s)",
+            self._current_qp_min,
+            qp_min,
+            rate / 1000,
+            self.target / 1000,
+        )
+
+        # The averages were measured at the old QP, scale them to the new one
+        # so the next update does not react to the same error again
+        scale = 2 ** (-(qp_min - self._current_qp_min) / self.QP_PER_OCTAVE)
+        if self._avg_i is not None:
+            self._avg_i *= scale
+        if self._avg_p is not None:
+            self._avg_p *= scale
+
+        self._current_qp_min = qp_min
+
+        self._apply(self._current_qp_min, self.qp_max)
+
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        rate = self.estimated_rate()
+        return {
+            "qp_min": self._current_qp_min,
+            "qp_max": self.qp_max,
+            "avg_i_bytes": round(self._avg_i or 0),
+            "avg_p_bytes": round(self._avg_p or 0),
+            "rate_bytes": round(rate or 0),
+            "target_bytes": round(self.target),
+            "error_qp": round(self._error, 2),
+        }
+
+    def _average(self, current: float | None, sample: int) -> float:
+        if current is None:
+            return float(sample)
+
+        return current + (sample - current) * self.smoothing
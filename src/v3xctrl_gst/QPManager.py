@@ -6,6 +6,7 @@ helping control bandwidth spikes during scene changes.
 """
 
 import logging
+from collections.abc import Callable
 
 import gi
 
@@ -26,8 +27,15 @@ class QPManager:
         max_step: int = 5,
         cooldown_keyframes: int = 0,
         lower_limit_percent: float = 0.85,
+        apply: Callable[[int, int], None] | None = None,
     ) -> None:
+        """
+        Args:
+            apply: Called with the new QP range instead of setting the
+                v4l2 extra-controls on `encoder` directly
+        """
         self._encoder = encoder
+        self._apply = apply
 
         self._max_i_frame_bytes = max_i_frame_bytes
         self._min_i_frame_bytes = max_i_frame_bytes * lower_limit_percent
@@ -92,6 +100,11 @@ class QPManager:
     def _apply_qp(self) -> None:
         """Apply the current QP settings to the encoder."""
         try:
+            if self._apply:
+                self._apply(self._current_qp_min, self._qp_max_limit)
+                logger.info("QP min set to %d", self._current_qp_min)
+                return
+
             encoder_controls = (
                 f"controls,h264_minimum_qp_value={self._current_qp_min},h264_maximum_qp_value={self._qp_max_limit}"
             )
@@ -0,0 +1,130 @@
+"""
+Offline replay of recorded frame size traces through the QPController.
+
+Traces are written by the streamer when a trace file is configured, one frame
+per line:
+
+    keyframe,size,qp
+
+where `qp` is the minimum QP that was in effect while the frame was encoded.
+On replay every frame is scaled to the QP chosen by the controller with the
+same model the controller uses (+6 QP halves the size), which is good enough
+to compare controller parameters against each other without a camera.
+"""
+
+import csv
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from v3xctrl_gst.QPController import QPController
+
+
+@dataclass
+class TraceFrame:
+    keyframe: bool
+    size: int
+    qp: int
+
+
+@dataclass
+class SimulationResult:
+    target: float
+    framerate: float
+    rates: list[float] = field(default_factory=list)
+    qps: list[int] = field(default_factory=list)
+    changes: int = 0
+
+    @property
+    def mean_error_percent(self) -> float:
+        """Mean absolute deviation of the per second rate from the target."""
+        if not self.rates or self.target <= 0:
+            return 0.0
+
+        return sum(abs(rate - self.target) for rate in self.rates) / len(self.rates) / self.target * 100
+
+    @property
+    def max_overshoot_percent(self) -> float:
+        if not self.rates or self.target <= 0:
+            return 0.0
+
+        return max(0.0, max(self.rates) / self.target * 100 - 100)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "seconds": len(self.rates),
+            "target_bytes": round(self.target),
+            "mean_error_percent": round(self.mean_error_percent, 1),
+            "max_overshoot_percent": round(self.max_overshoot_percent, 1),
+            "qp_changes": self.changes,
+            "qp_min": min(self.qps, default=0),
+            "qp_max": max(self.qps, default=0),
+        }
+
+
+def load_trace(path: Path | str) -> list[TraceFrame]:
+    frames = []
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            if not row or row[0].startswith("#"):
+                continue
+
+            keyframe, size, qp = row[:3]
+            frames.append(TraceFrame(keyframe.strip() in ("1", "true", "True"), int(size), int(qp)))
+
+    return frames
+
+
+def simulate(
+    trace: Iterable[TraceFrame],
+    target_bytes_per_second: float,
+    framerate: float,
+    gop: int,
+    qp_min: int,
+    qp_max: int,
+    **controller_args: Any,
+) -> SimulationResult:
+    """
+    Replay a trace through a QPController.
+
+    Args:
+        trace: Recorded frames
+        target_bytes_per_second: Data rate the controller aims for
+        framerate: Frames per second of the trace
+        gop: I-frame period of the trace
+        qp_min: Lowest QP the controller may set
+        qp_max: Highest QP the controller may set
+        controller_args: Passed on to the QPController (gains, dead band...)
+    """
+    result = SimulationResult(target=target_bytes_per_second, framerate=framerate)
+    controller = QPController(
+        apply=lambda _qp_min, _qp_max: None,
+        target_bytes_per_second=target_bytes_per_second,
+        framerate=framerate,
+        gop=gop,
+        qp_min=qp_min,
+        qp_max=qp_max,
+        **controller_args,
+    )
+
+    frames_per_second = max(1, round(framerate))
+    second_bytes = 0.0
+    frames = 0
+
+    for frame in trace:
+        qp = controller.current_qp_min
+        size = frame.size * 2 ** (-(qp - frame.qp) / QPController.QP_PER_OCTAVE)
+
+        if controller.on_frame(round(size), frame.keyframe):
+            result.changes += 1
+
+        second_bytes += size
+        frames += 1
+        if frames == frames_per_second:
+            result.rates.append(second_bytes)
+            result.qps.append(qp)
+            second_bytes = 0.0
+            frames = 0
+
+    return result
@@ -2,12 +2,18 @@
 Manages dynamic recording branch for a GStreamer pipeline.
 
 Handles adding/removing recording elements to/from a running pipeline
-via a tee element.
+via a tee element. The muxed stream is handed to a SegmentWriter which does
+the file I/O off the streaming thread.
+
+With a pre-roll configured the recording branch is attached as soon as the
+pipeline is built and stays attached, so the writer always has the last
+seconds of the stream at hand.
 """
 
 import logging
 import os
 import threading
+from collections import deque
 from collections.abc import Callable
 from datetime import datetime
 from typing import Any
@@ -17,6 +23,9 @@ import gi
 gi.require_version("Gst", "1.0")
 from gi.repository import GLib, Gst  # noqa: E402
 
+from v3xctrl_gst.SegmentWriter import SegmentWriter  # noqa: E402
+from v3xctrl_helper import parse_sei_nal  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,22 +39,74 @@ class RecordingManager:
         recording_dir: str,
         sizebuffers: int = 30,
         on_queue_overrun: Callable[[Gst.Element], None] | None = None,
+        segment_duration: float = 0.0,
+        segment_size: int = 0,
+        preroll: float = 0.0,
+        write_buffer_size: int = 1024 * 1024,
     ) -> None:
+        """
+        Args:
+            pipeline: Pipeline the recording branch is added to
+            tee: Tee the recording branch is linked to
+            recording_dir: Directory recordings are saved to
+            sizebuffers: Buffers the recording queue holds before leaking
+            on_queue_overrun: Called when the recording queue overruns
+            segment_duration: Seconds per file, 0 for a single file
+            segment_size: Bytes per file, 0 for a single file
+            preroll: Seconds recorded before the recording was started
+            write_buffer_size: Bytes collected before writing to disk
+        """
         self._pipeline = pipeline
         self._tee = tee
         self._recording_dir = recording_dir
         self._sizebuffers = sizebuffers
         self._on_queue_overrun = on_queue_overrun
+        self._preroll = preroll
+
+        self._writer = SegmentWriter(
+            segment_duration=segment_duration,
+            segment_size=segment_size,
+            preroll=preroll,
+            write_size=write_buffer_size,
+        )
 
         self._is_recording = False
         self._elements: dict[str, Any] = {}
         self._tee_pad: Gst.Pad | None = None
         self._stop_complete: threading.Event | None = None
+        self._has_header = False
+
+        # SEI capture timestamps of keyframes on their way through the muxer
+        self._capture_timestamps: deque[int | None] = deque(maxlen=16)
 
     @property
     def is_recording(self) -> bool:
         return self._is_recording
 
+    @property
+    def preroll(self) -> float:
+        return self._preroll
+
+    def get_stats(self) -> dict[str, Any]:
+        return self._writer.get_stats()
+
+    def arm(self) -> bool:
+        """
+        Attach the recording branch ahead of time to fill the pre-roll.
+
+        Does nothing without a pre-roll configured.
+
+        Returns:
+            True if the branch is attached
+        """
+        if self._preroll <= 0 or not self._recording_dir:
+            return False
+
+        if self._tee_pad:
+            return True
+
+        return self._attach_branch()
+
     def start(self) -> bool:
         """
         Dynamically start recording by adding a recording branch to the pipeline.
@@ -70,6 +131,61 @@ class RecordingManager:
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         filename = f"{self._recording_dir}/stream-{timestamp}.ts"
 
+        if not self._tee_pad and not self._attach_branch():
+            return False
+
+        self._elements["filename"] = filename
+        self._writer.start(filename)
+
+        logger.info(f"Recording started: {filename}")
+
+        return True
+
+    def stop(self) -> bool:
+        """
+        Dynamically stop recording by removing the recording branch from the pipeline.
+
+        Uses a blocking pad probe on the tee's src pad to ensure no buffer is
+        in-flight when the branch is torn down. This prevents the tee from
+        blocking the main pipeline (including the UDP video branch).
+
+        Returns:
+            True if recording stopped successfully, False otherwise
+        """
+        if not self._is_recording:
+            logger.warning("Recording is not active")
+            return False
+
+        if not self._tee_pad:
+            logger.error("Tee pad not available for recording stop")
+            return False
+
+        if self._preroll > 0:
+            # The branch stays attached to keep filling the pre-roll
+            self._is_recording = False
+            self._writer.stop()
+            filename = self._elements.pop("filename", "unknown")
+            logger.info(f"Recording stopped: {filename}")
+
+            return True
+
+        # Set flag early so telemetry reflects the change immediately
+        # while the pipeline is being torn down.
+        self._is_recording = False
+
+        self._stop_complete = threading.Event()
+
+        self._tee_pad.add_probe(Gst.PadProbeType.BLOCK_DOWNSTREAM, self._on_tee_pad_blocked)
+
+        if not self._stop_complete.wait(timeout=self.STOP_TIMEOUT):
+            logger.error("Recording stop timed out, forcing teardown")
+            self._force_teardown()
+
+        return True
+
+    def _attach_branch(self) -> bool:
+        self._capture_timestamps.clear()
+
         queue_rec = Gst.ElementFactory.make("queue", "queue_rec")
         if not queue_rec:
             logger.error("Failed to create recording queue")
@@ -87,34 +203,40 @@ class RecordingManager:
             self._is_recording = False
             return False
 
+        parser_sink_pad = parser.get_static_pad("sink")
+        if parser_sink_pad:
+            parser_sink_pad.add_probe(Gst.PadProbeType.BUFFER, self._on_parser_buffer)
+
         muxer = Gst.ElementFactory.make("mpegtsmux", "muxer")
         if not muxer:
             logger.error("Failed to create mpegtsmux")
             self._is_recording = False
             return False
 
-        filesink = Gst.ElementFactory.make("filesink", "filesink")
-        if not filesink:
-            logger.error("Failed to create filesink")
+        sink = Gst.ElementFactory.make("appsink", "recording_sink")
+        if not sink:
+            logger.error("Failed to create recording appsink")
             self._is_recording = False
             return False
 
-        filesink.set_property("location", filename)
-        filesink.set_property("sync", False)
-        filesink.set_property("async", False)
+        sink.set_property("emit-signals", True)
+        sink.set_property("sync", False)
+        sink.set_property("async", False)
+        # mpegtsmux pushes a frame as a list of TS packets, take it in one go
+        sink.set_property("buffer-list", True)
+        sink.connect("new-sample", self._on_sample)
 
         self._elements = {
             "queue": queue_rec,
             "parser": parser,
             "muxer": muxer,
-            "filesink": filesink,
-            "filename": filename,
+            "sink": sink,
         }
 
         self._pipeline.add(queue_rec)
         self._pipeline.add(parser)
         self._pipeline.add(muxer)
-        self._pipeline.add(filesink)
+        self._pipeline.add(sink)
 
         # Link the internal chain first, before connecting to the tee.
         # This ensures all elements are linked and in PLAYING state before
@@ -131,8 +253,8 @@ class RecordingManager:
 
             return False
 
-        if not muxer.link(filesink):
-            logger.error("Failed to link muxer to filesink")
+        if not muxer.link(sink):
+            logger.error("Failed to link muxer to recording sink")
             self._cleanup()
 
             return False
@@ -140,7 +262,7 @@ class RecordingManager:
         queue_rec.sync_state_with_parent()
         parser.sync_state_with_parent()
         muxer.sync_state_with_parent()
-        filesink.sync_state_with_parent()
+        sink.sync_state_with_parent()
 
         # Connect to tee last, when the branch is fully ready to receive data.
         tee_src_pad = self._tee.request_pad_simple("src_%u")
@@ -159,42 +281,72 @@ class RecordingManager:
 
             return False
 
-        logger.info(f"Recording started: {filename}")
-
         return True
 
-    def stop(self) -> bool:
-        """
-        Dynamically stop recording by removing the recording branch from the pipeline.
+    def _on_sample(self, sink: Gst.Element) -> Gst.FlowReturn:
+        """Hand the muxed stream over to the writer, runs on the streaming thread."""
+        sample = sink.emit("pull-sample")
+        if not sample:
+            return Gst.FlowReturn.OK
 
-        Uses a blocking pad probe on the tee's src pad to ensure no buffer is
-        in-flight when the branch is torn down. This prevents the tee from
-        blocking the main pipeline (including the UDP video branch).
+        if not self._has_header:
+            self._read_stream_header(sample)
 
-        Returns:
-            True if recording stopped successfully, False otherwise
-        """
-        if not self._is_recording:
-            logger.warning("Recording is not active")
-            return False
-
-        if not self._tee_pad:
-            logger.error("Tee pad not available for recording stop")
-            return False
-
-        # Set flag early so telemetry reflects the change immediately
-        # while the pipeline is being torn down.
-        self._is_recording = False
-
-        self._stop_complete = threading.Event()
-
-        self._tee_pad.add_probe(Gst.PadProbeType.BLOCK_DOWNSTREAM, self._on_tee_pad_blocked)
-
-        if not self._stop_complete.wait(timeout=self.STOP_TIMEOUT):
-            logger.error("Recording stop timed out, forcing teardown")
-            self._force_teardown()
-
-        return True
+        buffer_list = sample.get_buffer_list()
+        if buffer_list is not None:
+            buffers = [buffer_list.get(i) for i in range(buffer_list.length())]
+        else:
+            buffer = sample.get_buffer()
+            buffers = [buffer] if buffer else []
+
+        if not buffers:
+            return Gst.FlowReturn.OK
+
+        # Flags and timestamp of the frame are on its first packet
+        first = buffers[0]
+        keyframe = not first.has_flags(Gst.BufferFlags.DELTA_UNIT)
+        capture_timestamp_us = None
+        if keyframe and self._capture_timestamps:
+            capture_timestamp_us = self._capture_timestamps.popleft()
+
+        self._writer.push(
+            b"".join(buffer.extract_dup(0, buffer.get_size()) for buffer in buffers),
+            keyframe,
+            pts=first.pts if first.pts != Gst.CLOCK_TIME_NONE else -1,
+            capture_timestamp_us=capture_timestamp_us,
+        )
+
+        return Gst.FlowReturn.OK
+
+    def _on_parser_buffer(self, pad: Gst.Pad, info: Gst.PadProbeInfo) -> Gst.PadProbeReturn:
+        """Remember the SEI capture timestamp of keyframes for the keyframe index."""
+        buffer = info.get_buffer()
+        if buffer and not buffer.has_flags(Gst.BufferFlags.DELTA_UNIT):
+            timestamp_us = None
+            ok, map_info = buffer.map(Gst.MapFlags.READ)
+            if ok:
+                try:
+                    timestamp_us = parse_sei_nal(map_info.data)
+                finally:
+                    buffer.unmap(map_info)
+
+            self._capture_timestamps.append(timestamp_us)
+
+        return Gst.PadProbeReturn.OK
+
+    def _read_stream_header(self, sample: Gst.Sample) -> None:
+        """The muxer announces PAT/PMT in its caps, every segment starts with them."""
+        caps = sample.get_caps()
+        if not caps or caps.get_size() == 0:
+            return
+
+        structure = caps.get_structure(0)
+        if not structure.has_field("streamheader"):
+            return
+
+        header = b"".join(buffer.extract_dup(0, buffer.get_size()) for buffer in structure.get_value("streamheader"))
+        self._writer.set_header(header)
+        self._has_header = True
 
     def _on_tee_pad_blocked(self, pad, info):
         """
@@ -216,12 +368,12 @@ class RecordingManager:
         if queue_sink_pad:
             queue_sink_pad.send_event(Gst.Event.new_eos())
 
-        # Listen for EOS on filesink to know when flushing is complete
-        filesink = self._elements.get("filesink")
-        if filesink:
-            filesink_pad = filesink.get_static_pad("sink")
-            if filesink_pad:
-                filesink_pad.add_probe(Gst.PadProbeType.EVENT_DOWNSTREAM, self._on_recording_eos)
+        # Listen for EOS on the sink to know when flushing is complete
+        sink = self._elements.get("sink")
+        if sink:
+            sink_pad = sink.get_static_pad("sink")
+            if sink_pad:
+                sink_pad.add_probe(Gst.PadProbeType.EVENT_DOWNSTREAM, self._on_recording_eos)
             else:
                 GLib.idle_add(self._teardown)
         else:
@@ -231,8 +383,8 @@ class RecordingManager:
 
     def _on_recording_eos(self, pad, info):
         """
-        Probe callback invoked when an event reaches the filesink's sink pad.
-        When EOS arrives, the muxer has finalized the file and we can safely
+        Probe callback invoked when an event reaches the recording sink's pad.
+        When EOS arrives, the muxer has handed over all data and we can safely
         tear down the recording elements.
         """
         event = info.get_event()
@@ -251,6 +403,8 @@ class RecordingManager:
                 element.set_state(Gst.State.NULL)
                 self._pipeline.remove(element)
 
+        self._writer.stop()
+
         filename = self._elements.get("filename", "unknown")
         logger.info(f"Recording stopped: {filename}")
 
@@ -280,6 +434,8 @@ class RecordingManager:
                 if element.get_parent():
                     self._pipeline.remove(element)
 
+        self._writer.stop()
+
         filename = self._elements.get("filename", "unknown")
         logger.warning(f"Recording stopped (forced): {filename}")
 
@@ -63,20 +63,20 @@ class SEIInjector:
         if timestamp_us is None:
             return Gst.PadProbeReturn.OK
 
-        sei_bytes = build_sei_nal(timestamp_us)
-
-        ok, map_info = buffer.map(Gst.MapFlags.READ)
-        if not ok:
+        # Shallow copy: the new buffer references the encoded memory, only the
+        # SEI NAL is allocated. Timestamps, offsets and flags are carried over.
+        flags = (
+            Gst.BufferCopyFlags.FLAGS
+            | Gst.BufferCopyFlags.TIMESTAMPS
+            | Gst.BufferCopyFlags.META
+            | Gst.BufferCopyFlags.MEMORY
+        )
+        new_buf = buffer.copy_region(flags, 0, buffer.get_size())
+        if new_buf is None:
             return Gst.PadProbeReturn.OK
 
-        combined = sei_bytes + bytes(map_info.data)
-        buffer.unmap(map_info)
-
-        new_buf = Gst.Buffer.new_wrapped(combined)
-        new_buf.pts = buffer.pts
-        new_buf.dts = buffer.dts
-        new_buf.duration = buffer.duration
-        new_buf.offset = buffer.offset
+        sei_buf = Gst.Buffer.new_wrapped(build_sei_nal(timestamp_us))
+        new_buf.prepend_memory(sei_buf.get_memory(0))
 
         # Replace the buffer in GstPadProbeInfo.data directly, avoiding
         # Gst.Pad.chain() which leaks a ref per call in Python GI bindings.
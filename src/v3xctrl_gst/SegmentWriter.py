@@ -0,0 +1,349 @@
+"""
+Write-behind writer for recordings.
+
+Muxed transport stream data is handed over from the streaming thread and
+written by a background thread in large chunks, SD cards are a lot faster
+with few big writes than with many small ones, and a slow write never stalls
+the pipeline. If the card can not keep up, data is dropped up to the next
+keyframe once `max_pending` bytes are waiting.
+
+Recordings can be split into segments by duration and/or size, segments
+always start with a keyframe preceded by the stream headers (PAT/PMT) so each
+of them plays on its own. Every segment gets a KeyframeIndex sidecar with the
+byte offset, PTS and wall clock time of each keyframe.
+
+With a pre-roll configured, the last seconds of the stream are kept in memory
+while not recording, a recording then starts with the first keyframe within
+that window instead of at the moment it was triggered.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from v3xctrl_helper.KeyframeIndex import FLAG_SEI_TIMESTAMP, INDEX_SUFFIX, KeyframeIndex
+
+logger = logging.getLogger(__name__)
+
+
+class SegmentWriter:
+    # Number of write latency samples kept for statistics
+    LATENCY_WINDOW = 256
+
+    def __init__(
+        self,
+        segment_duration: float = 0.0,
+        segment_size: int = 0,
+        preroll: float = 0.0,
+        write_size: int = 1024 * 1024,
+        max_pending: int = 32 * 1024 * 1024,
+        flush_interval: float = 2.0,
+    ) -> None:
+        """
+        Args:
+            segment_duration: Seconds per segment, 0 to not split by duration
+            segment_size: Bytes per segment, 0 to not split by size
+            preroll: Seconds of stream kept in memory while not recording
+            write_size: Bytes collected before they are written
+            max_pending: Bytes waiting to be written before data is dropped
+            flush_interval: Seconds after which collected data is written
+                even if less than `write_size`
+        """
+        self.segment_duration = segment_duration
+        self.segment_size = segment_size
+        self.preroll = preroll
+        self.write_size = write_size
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+
+        self._header = b""
+        self._condition = threading.Condition()
+        self._queue: deque[tuple[float, bytes, bool, int, int, int]] = deque()
+        self._preroll: deque[tuple[float, bytes, bool, int, int, int]] = deque()
+        self._preroll_bytes = 0
+        self._pending = 0
+        self._dropping = False
+        self._recording = False
+        self._thread: threading.Thread | None = None
+
+        self._path = ""
+        self._file: Any = None
+        self._index_file: Any = None
+        self._index_buffer = bytearray()
+        self._segment_index = 0
+        self._segment_started = 0.0
+        self._segment_bytes = 0
+        self._segment_offset = 0
+
+        self._latencies: deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self._bytes_written = 0
+        self._bytes_dropped = 0
+        self._segments = 0
+        self._errors = 0
+
+    @property
+    def recording(self) -> bool:
+        return self._recording
+
+    @property
+    def segmented(self) -> bool:
+        return bool(self.segment_duration or self.segment_size)
+
+    def set_header(self, header: bytes) -> None:
+        """Stream headers written at the start of every segment."""
+        self._header = header
+
+    def push(self, data: bytes, keyframe: bool, pts: int = -1, capture_timestamp_us: int | None = None) -> None:
+        """
+        Hand over muxed data, safe to call from any thread.
+
+        Args:
+            data: Muxed stream data
+            keyframe: True if `data` starts with a keyframe
+            pts: PTS of the frame in ns, -1 if unknown
+            capture_timestamp_us: Capture time from the SEI, the current
+                time is indexed instead if not available
+        """
+        now = time.monotonic()
+
+        flags = 0
+        if not keyframe:
+            timestamp_us = 0
+        elif capture_timestamp_us is not None:
+            timestamp_us = capture_timestamp_us
+            flags = FLAG_SEI_TIMESTAMP
+        else:
+            timestamp_us = int(time.time() * 1_000_000)
+
+        chunk = (now, data, keyframe, pts, timestamp_us, flags)
+
+        with self._condition:
+            if not self._recording:
+                if self.preroll > 0:
+                    self._add_preroll(chunk)
+                return
+
+            if self._pending + len(data) > self.max_pending:
+                if not self._dropping:
+                    logger.warning("Recording can not keep up, dropping data until next keyframe")
+                self._dropping = True
+
+            if self._dropping:
+                if not keyframe or self._pending + len(data) > self.max_pending:
+                    self._bytes_dropped += len(data)
+                    return
+                self._dropping = False
+
+            self._queue.append(chunk)
+            self._pending += len(data)
+            self._condition.notify()
+
+    def start(self, path: str) -> None:
+        """
+        Start writing to `path`, segments get a running number appended.
+
+        Data kept for pre-roll is written first, starting with its oldest keyframe.
+        """
+        with self._condition:
+            if self._recording:
+                return
+
+            self._path = path
+            self._segment_index = 0
+            self._dropping = False
+
+            for chunk in self._preroll:
+                self._queue.append(chunk)
+                self._pending += len(chunk[1])
+            self._preroll.clear()
+            self._preroll_bytes = 0
+
+            self._recording = True
+
+        self._thread = threading.Thread(target=self._run, name="SegmentWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write everything still pending and close the current segment."""
+        with self._condition:
+            if not self._recording:
+                return
+
+            self._recording = False
+            self._condition.notify()
+
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def segment_path(self, index: int) -> str:
+        if not self.segmented:
+            return self._path
+
+        root, ext = os.path.splitext(self._path)
+        return f"{root}-{index:03d}{ext}"
+
+    def get_stats(self) -> dict[str, Any]:
+        latencies = list(self._latencies)
+        count = len(latencies)
+
+        return {
+            "recording_bytes_pending": self._pending,
+            "recording_bytes_written": self._bytes_written,
+            "recording_bytes_dropped": self._bytes_dropped,
+            "recording_preroll_bytes": self._preroll_bytes,
+            "recording_segments": self._segments,
+            "recording_write_errors": self._errors,
+            "recording_write_latency_avg_ms": round(sum(latencies) / count * 1000, 2) if count else 0.0,
+            "recording_write_latency_max_ms": round(max(latencies) * 1000, 2) if count else 0.0,
+        }
+
+    def _add_preroll(self, chunk: tuple[float, bytes, bool, int, int, int]) -> None:
+        self._preroll.append(chunk)
+        self._preroll_bytes += len(chunk[1])
+
+        cutoff = chunk[0] - self.preroll
+        while self._preroll and (self._preroll[0][0] < cutoff or self._preroll_bytes > self.max_pending):
+            dropped = self._preroll.popleft()
+            self._preroll_bytes -= len(dropped[1])
+
+    def _run(self) -> None:
+        buffer = bytearray()
+        last_write = time.monotonic()
+
+        while True:
+            with self._condition:
+                if not self._queue and self._recording:
+                    self._condition.wait(self.flush_interval)
+
+                chunks = list(self._queue)
+                self._queue.clear()
+                recording = self._recording
+
+            for timestamp, data, keyframe, pts, timestamp_us, flags in chunks:
+                if keyframe and self._should_rotate(timestamp):
+                    self._write(buffer)
+                    self._close_segment()
+
+                if self._file is None:
+                    if not keyframe:
+                        # Nothing decodes before the first keyframe
+                        self._discard(len(data))
+                        continue
+
+                    self._open_segment(timestamp)
+                    buffer += self._header
+                    self._segment_offset = len(self._header)
+                    with self._condition:
+                        self._pending += len(self._header)
+
+                if keyframe:
+                    self._index_buffer += KeyframeIndex.pack_record(self._segment_offset, pts, timestamp_us, flags)
+
+                buffer += data
+                self._segment_bytes += len(data)
+                self._segment_offset += len(data)
+
+            now = time.monotonic()
+            if len(buffer) >= self.write_size or (buffer and now - last_write >= self.flush_interval):
+                self._write(buffer)
+                last_write = now
+
+            if not recording:
+                self._write(buffer)
+                self._close_segment()
+                return
+
+    def _should_rotate(self, timestamp: float) -> bool:
+        if self._file is None:
+            return False
+
+        if self.segment_duration and timestamp - self._segment_started >= self.segment_duration:
+            return True
+
+        return bool(self.segment_size and self._segment_bytes >= self.segment_size)
+
+    def _open_segment(self, timestamp: float) -> None:
+        path = self.segment_path(self._segment_index)
+        self._segment_index += 1
+        self._segment_started = timestamp
+        self._segment_bytes = 0
+
+        try:
+            self._file = open(path, "wb", buffering=0)  # noqa: SIM115
+            self._segments += 1
+            logger.info(f"Recording segment: {path}")
+        except OSError as e:
+            self._errors += 1
+            logger.error(f"Failed to open recording segment {path}: {e}")
+            return
+
+        self._index_buffer = bytearray(KeyframeIndex.pack_header(len(self._header)))
+        try:
+            self._index_file = open(path + INDEX_SUFFIX, "wb", buffering=0)  # noqa: SIM115
+        except OSError as e:
+            self._errors += 1
+            logger.error(f"Failed to open keyframe index {path}{INDEX_SUFFIX}: {e}")
+
+    def _close_segment(self) -> None:
+        if self._file is None:
+            return
+
+        try:
+            os.fsync(self._file.fileno())
+            self._file.close()
+        except OSError as e:
+            self._errors += 1
+            logger.error(f"Failed to close recording segment: {e}")
+
+        self._file = None
+
+        if self._index_file is not None:
+            self._write_index()
+            try:
+                self._index_file.close()
+            except OSError as e:
+                self._errors += 1
+                logger.error(f"Failed to close keyframe index: {e}")
+
+            self._index_file = None
+
+    def _write(self, buffer: bytearray) -> None:
+        if not buffer:
+            return
+
+        size = len(buffer)
+        if self._file is not None:
+            start = time.monotonic()
+            try:
+                self._file.write(buffer)
+                self._bytes_written += size
+            except OSError as e:
+                self._errors += 1
+                logger.error(f"Failed to write recording: {e}")
+            self._latencies.append(time.monotonic() - start)
+
+            # The index only ever points at data that is already written
+            self._write_index()
+
+        buffer.clear()
+        self._discard(size)
+
+    def _write_index(self) -> None:
+        if self._index_file is None or not self._index_buffer:
+            return
+
+        try:
+            self._index_file.write(self._index_buffer)
+        except OSError as e:
+            self._errors += 1
+            logger.error(f"Failed to write keyframe index: {e}")
+
+        self._index_buffer.clear()
+
+    def _discard(self, size: int) -> None:
+        with self._condition:
+            self._pending -= size
@@ -14,6 +14,7 @@ class CameraSourceBuilder(SourceBuilder):
     """Builds libcamerasrc with optional sensor mode control"""
 
     NEEDS_SYNC = False  # Live source, no sync needed
+    RESTART_ON_RECONFIGURE = True  # Camera is configured when it starts
 
     def build(self, pipeline: Gst.Pipeline) -> Gst.Element:
         """
@@ -14,6 +14,7 @@ class FileSourceBuilder(SourceBuilder):
     """Builds file source with demux/decode chain"""
 
     NEEDS_SYNC = True  # File source needs sync for real-time playback
+    SUPPORTS_RESIZE = False  # Decoded frames keep the resolution of the file
 
     def build(self, pipeline: Gst.Pipeline) -> Gst.Element:
         """
@@ -13,6 +13,14 @@ class SourceBuilder(ABC):
     # Override in subclasses to indicate if source needs sync
     NEEDS_SYNC: bool = False
 
+    # Override in subclasses whose source can not change its output format
+    # while running, it is then restarted to pick up new caps
+    RESTART_ON_RECONFIGURE: bool = False
+
+    # Override in subclasses whose source can not change its resolution,
+    # resolution changes are then rejected instead of failing negotiation
+    SUPPORTS_RESIZE: bool = True
+
     def __init__(self, settings: dict[str, Any]):
         self.settings = settings
         self._output_element: Gst.Element | None = None
@@ -1,20 +1,26 @@
-import contextlib
 import logging
 import os
 import signal
 import sys
 import time
-from threading import Event
-from typing import Any
+from collections.abc import Callable
+from threading import Event, Lock
+from typing import Any, TextIO
 
 import gi
 
+from v3xctrl_gst.BitrateController import BitrateController
 from v3xctrl_gst.ControlServer import ControlServer
+from v3xctrl_gst.EncoderRegistry import EncoderRegistry
+from v3xctrl_gst.PacketPacer import PacketPacer
 from v3xctrl_gst.PipelineTimer import PipelineTimer
+from v3xctrl_gst.PropertyApplier import ApplyStatus, PropertyApplier, PropertyRequest
+from v3xctrl_gst.QPController import QPController
 from v3xctrl_gst.QPManager import QPManager
 from v3xctrl_gst.RecordingManager import RecordingManager
 from v3xctrl_gst.SEIInjector import SEIInjector
 from v3xctrl_gst.SourceRegistry import SourceRegistry
+from v3xctrl_gst.Sources import SourceBuilder
 
 gi.require_version("Gst", "1.0")
 from gi.repository import GLib, Gst  # noqa: E402
@@ -53,6 +59,7 @@ class Streamer:
 
         self._udpsink_network_down: bool = False
         self._udpsink_recovery_timeout_id: int | None = None
+        self._pacer_error_pending: bool = False
 
         self._udp_queue_overrun_active: bool = False
         self._udp_queue_overrun_recovery_timeout_id: int | None = None
@@ -67,12 +74,21 @@ class Streamer:
             "sizebuffers": 2,
             "recording_dir": None,
             "recording": False,
+            "recording_segment_duration": 0,  # Seconds, 0: single file
+            "recording_segment_size": 0,  # Bytes, 0: single file
+            "recording_preroll": 0,  # Seconds recorded before start
+            "recording_write_buffer": 1024 * 1024,  # Bytes per write
             "test_pattern": False,
             "buffertime_udp": 50000000,
             "sizebuffers_udp": 2,
             "sizebuffers_write": 30,
             "mtu": 1400,
+            "pacing": False,
+            "pacing_fraction": 0.5,
+            "pacing_burst_bytes": 8192,
             "file_src": None,
+            # Encoder backend: v4l2 (hardware), x264 or openh264
+            "encoder": "v4l2",
             # Encoder (via CAPS)
             "h264_profile": "high",
             "h264_level": "4.1",
@@ -82,11 +98,18 @@ class Streamer:
             "bitrate_mode": 1,  # 0 VBR, 1: CBR
             "bitrate": 1800000,
             "h264_i_frame_period": 15,
+            "intra_refresh": False,  # Rolling intra refresh over the I-frame period
+            "keyframe_min_interval": 1.0,  # Seconds between forced keyframes
             "h264_minimum_qp_value": 20,
             "h264_maximum_qp_value": 51,
             # Auto adjust
             "enable_i_frame_adjust": False,
             "max_i_frame_bytes": 25600,
+            "qp_control": False,
+            "frame_trace": None,
+            "adaptive_bitrate": False,
+            "bitrate_min": 300000,
+            "bitrate_max": None,  # Defaults to bitrate
             # Camera settings
             "af_mode": 0,
             "lens_position": 0,
@@ -115,15 +138,49 @@ class Streamer:
         logger.debug(self.settings)
 
         self.pipeline: Gst.Pipeline | None = None
+        self.source_builder: SourceBuilder | None = None
+        self._source: Gst.Element | None = None
         self.loop: GLib.MainLoop | None = None
         self.bus: Gst.Bus | None = None
 
         Gst.init(None)
 
+        self.encoder_builder = EncoderRegistry.create(self.settings["encoder"], self.settings)
+        if self.settings["intra_refresh"] and not self.encoder_builder.SUPPORTS_INTRA_REFRESH:
+            logger.warning(f"Encoder '{self.settings['encoder']}' does not support intra refresh, using periodic IDR")
+
+        adjusts_qp = self.settings["qp_control"] or self.settings["enable_i_frame_adjust"]
+        if adjusts_qp and not self.encoder_builder.SUPPORTS_RUNTIME_QP:
+            logger.warning(
+                f"Encoder '{self.settings['encoder']}' can not change QP while running, "
+                f"disabling QP control and i-frame adjustment"
+            )
+            self.settings["qp_control"] = False
+            self.settings["enable_i_frame_adjust"] = False
+
+        # Both drive the minimum QP of the encoder and would fight each other
+        if self.settings["qp_control"] and self.settings["enable_i_frame_adjust"]:
+            logger.warning("QP control replaces the i-frame adjustment, disabling i-frame adjustment")
+            self.settings["enable_i_frame_adjust"] = False
+
         self.sei_injector: SEIInjector | None = None
         if self.timer.enabled:
             self.sei_injector = SEIInjector()
 
+        self.bitrate_controller: BitrateController | None = None
+        self.qp_controller: QPController | None = None
+        self.packet_pacer: PacketPacer | None = None
+
+        self._keyframe_lock = Lock()
+        self._keyframe_pending = False
+        self._last_forced_keyframe = 0.0
+        self.keyframes_forced = 0
+        self.keyframe_requests_coalesced = 0
+        self.reconfigurations = 0
+        self._frame_trace: TextIO | None = None
+
+        self.property_applier = PropertyApplier(self.get_element, GLib.idle_add, GLib.timeout_add)
+
         self.control_server = ControlServer(self, control_socket)
 
     def start(self) -> None:
@@ -140,15 +197,51 @@ class Streamer:
             recording_dir=self.settings["recording_dir"],
             sizebuffers=self.settings["sizebuffers_write"],
             on_queue_overrun=self._on_queue_overrun,
+            segment_duration=self.settings["recording_segment_duration"],
+            segment_size=self.settings["recording_segment_size"],
+            preroll=self.settings["recording_preroll"],
+            write_buffer_size=self.settings["recording_write_buffer"],
         )
+        if self.recording_manager.arm():
+            logger.info(f"Recording pre-roll: {self.settings['recording_preroll']}s")
 
         self.qp_manager = QPManager(
             encoder=self.get_element("encoder"),
+            apply=self._apply_qp,
             max_i_frame_bytes=self.settings["max_i_frame_bytes"],
             qp_min=self.settings["h264_minimum_qp_value"],
             qp_max=self.settings["h264_maximum_qp_value"],
         )
 
+        if self.settings["qp_control"]:
+            self.qp_controller = QPController(
+                apply=self._apply_qp,
+                target_bytes_per_second=self.settings["bitrate"] / 8,
+                framerate=self.settings["framerate"],
+                gop=self.settings["h264_i_frame_period"],
+                qp_min=self.settings["h264_minimum_qp_value"],
+                qp_max=self.settings["h264_maximum_qp_value"],
+            )
+
+        if self.settings["frame_trace"]:
+            try:
+                self._frame_trace = open(self.settings["frame_trace"], "w")  # noqa: SIM115
+            except OSError as e:
+                logger.error(f"Failed to open frame trace: {e}")
+
+        if self.settings["adaptive_bitrate"]:
+            bitrate = self.settings["bitrate"]
+            self.bitrate_controller = BitrateController(
+                apply=self._apply_bitrate,
+                bitrate=bitrate,
+                min_bitrate=min(self.settings["bitrate_min"], bitrate),
+                max_bitrate=self.settings["bitrate_max"] or bitrate,
+            )
+            GLib.timeout_add(self.BITRATE_UPDATE_INTERVAL_MS, self._on_bitrate_update)
+
+        if self.packet_pacer:
+            self.packet_pacer.start()
+
         assert self.pipeline is not None
         self.bus = self.pipeline.get_bus()
         self.bus.add_signal_watch()
@@ -167,6 +260,8 @@ class Streamer:
 
         self.control_server.start()
 
+    BITRATE_UPDATE_INTERVAL_MS: int = 1000
+
     # Timeout for pipeline NULL transition before forcing exit.
     # If the v4l2 encoder hangs during shutdown, we bail before the encoder
     # thread enters uninterruptible kernel sleep (D-state).
@@ -190,6 +285,13 @@ class Streamer:
                 logger.error("Pipeline failed to reach NULL state within timeout - forcing exit")
                 os._exit(1)
 
+        if self.packet_pacer:
+            self.packet_pacer.stop()
+
+        if self._frame_trace:
+            self._frame_trace.close()
+            self._frame_trace = None
+
         if self.loop:
             self.loop.quit()
 
@@ -238,7 +340,8 @@ class Streamer:
     def set_property(self, element_name: str, property_name: str, value: Any, max_retries: int = 3) -> bool:
         """
         Set a property on a named element. Will validate the result and attempt
-        to set multiple times
+        to set multiple times. Blocks until the value stuck, use apply_property
+        to not wait for the result.
 
         Args:
             element_name: Name of the element
@@ -249,67 +352,52 @@ class Streamer:
         Returns:
             True if successful, False otherwise
         """
-        for attempt in range(max_retries):
-            result = {"success": False}
-            event = Event()
-
-            def _do_set(result=result, event=event):
-                element = self.get_element(element_name)
-                if element:
-                    try:
-                        element.set_property(property_name, value)
-                        result["success"] = True
-                    except Exception as e:
-                        logger.error(f"Failed to set property '{property_name}': {e}")
-                event.set()
-                return False
-
-            GLib.idle_add(_do_set)
-            event.wait(timeout=0.5)
+        done = Event()
+        result: dict[str, Any] = {}
 
-            if not result["success"]:
-                return False
+        def _on_done(request: PropertyRequest) -> None:
+            result["status"] = request.status
+            done.set()
 
-            # Give the element some time to process the setting - especially
-            # important for elements that interact with hardware like libcamera
-            time.sleep(0.5)
+        self.apply_property(element_name, property_name, value, _on_done, max_retries)
 
-            # Verify setting actually stuck
-            verify_result = {"actual": None}
-            verify_event = Event()
+        # Every attempt waits for the settle time, leave some room for the loop
+        timeout = max_retries * (self.property_applier.settle_ms / 1000 + 0.5)
+        if not done.wait(timeout):
+            logger.warning(f"Timed out setting property '{property_name}'")
+            return False
 
-            def _do_verify(verify_result=verify_result, verify_event=verify_event):
-                element = self.get_element(element_name)
-                if element:
-                    with contextlib.suppress(Exception):
-                        verify_result["actual"] = element.get_property(property_name)
-                verify_event.set()
-                return False
+        return bool(result["status"] == ApplyStatus.APPLIED)
 
-            GLib.idle_add(_do_verify)
-            verify_event.wait(timeout=0.5)
+    def apply_property(
+        self,
+        element_name: str,
+        property_name: str,
+        value: Any,
+        callback: Callable[[PropertyRequest], None] | None = None,
+        max_retries: int | None = None,
+    ) -> int:
+        """
+        Queue a property change without waiting for it to be applied.
 
-            # For float properties, use approximate comparison
-            if isinstance(verify_result["actual"], float):
-                if abs(verify_result["actual"] - value) < 0.001:
-                    if attempt > 0:
-                        logger.debug(f"Property '{property_name}' stuck after {attempt + 1} attempts")
-                    return True
+        The change is applied and verified on the main loop, repeated changes
+        to the same property are coalesced.
 
-            elif verify_result["actual"] == value:
-                if attempt > 0:
-                    logger.debug(f"Property '{property_name}' stuck after {attempt + 1} attempts")
-                return True
+        Args:
+            element_name: Name of the element
+            property_name: Name of the property
+            value: Value to set
+            callback: Called with the request once it is finished
+            max_retries: Retry in case the setting did not stick
 
-            if attempt < max_retries - 1:
-                logger.debug(
-                    f"Attempt {attempt + 1}: value is {verify_result['actual']}, expected {value}, retrying..."
-                )
+        Returns:
+            Request ID, see get_apply_status
+        """
+        return self.property_applier.submit(element_name, property_name, value, callback, max_retries)
 
-        logger.warning(
-            f"Property '{property_name}' failed to stick after {max_retries} attempts (value: {verify_result['actual']})"
-        )
-        return False
+    def get_apply_status(self, request_id: int) -> dict[str, Any] | None:
+        """Status of a queued property change, None for unknown IDs."""
+        return self.property_applier.status(request_id)
 
     def get_property(self, element_name: str, property_name: str) -> Any | None:
         """
@@ -361,13 +449,109 @@ class Streamer:
         return properties
 
     def get_stats(self) -> dict[str, Any]:
-        return {
+        stats = {
             "recording": self.recording_manager.is_recording,
-            "qp_min": self.qp_manager.current_qp_min,
-            "qp_max": self.qp_manager.qp_max,
+            **self.recording_manager.get_stats(),
+            "qp_min": self._current_qp_min(),
+            "qp_max": self._current_qp_max(),
             "udp_overrun": (time.monotonic() - self.last_udp_overflow_time) < 5,
+            "bitrate": self.settings["bitrate"],
+            "keyframes_forced": self.keyframes_forced,
+            "keyframe_requests_coalesced": self.keyframe_requests_coalesced,
+            "width": self.settings["width"],
+            "height": self.settings["height"],
+            "framerate": self.settings["framerate"],
+            "reconfigurations": self.reconfigurations,
         }
 
+        if self.qp_controller:
+            stats.update(self.qp_controller.get_stats())
+
+        if self.packet_pacer:
+            stats.update(self.packet_pacer.get_stats())
+
+        if self.bitrate_controller:
+            stats.update(self.bitrate_controller.get_stats())
+
+        if self.timer.enabled:
+            stats.update(self.timer.get_stats())
+
+        return stats
+
+    def on_network_feedback(self, delay_ms: float | None, loss: float | None) -> None:
+        """
+        Network feedback from the receiving end, used for bitrate control.
+
+        Args:
+            delay_ms: RTT sample measured by the viewer
+            loss: Video packet loss in percent as seen by the receiver
+        """
+        if self.bitrate_controller:
+            GLib.idle_add(self.bitrate_controller.on_feedback, delay_ms, loss)
+
+    def request_keyframe(self) -> bool:
+        """
+        Force an IDR frame, e.g. after the receiver lost packets.
+
+        Safe to call from any thread. Requests are rate limited to one per
+        `keyframe_min_interval` to prevent IDR storms on lossy links: a request
+        arriving too early is deferred, further requests while one is pending
+        are coalesced into it.
+
+        Returns:
+            True if the keyframe was scheduled, False if coalesced
+        """
+        with self._keyframe_lock:
+            if self._keyframe_pending:
+                self.keyframe_requests_coalesced += 1
+                return False
+
+            self._keyframe_pending = True
+            wait = self._last_forced_keyframe + self.settings["keyframe_min_interval"] - time.monotonic()
+
+        if wait > 0:
+            GLib.timeout_add(int(wait * 1000), self._force_keyframe)
+        else:
+            GLib.idle_add(self._force_keyframe)
+
+        return True
+
+    # Seconds to wait for the main loop to apply a reconfiguration
+    RECONFIGURE_TIMEOUT: float = 5.0
+
+    def reconfigure(self, width: int | None = None, height: int | None = None, framerate: int | None = None) -> bool:
+        """
+        Change resolution and/or framerate of the running pipeline.
+
+        Only the raw caps are renegotiated, the encoder drains and restarts
+        with the new format and the first frame is forced to be an IDR. The
+        main loop, sockets and recording branch keep running. Blocks until
+        the change was applied on the main loop.
+
+        Args:
+            width: New width, None to keep the current one
+            height: New height, None to keep the current one
+            framerate: New framerate, None to keep the current one
+
+        Returns:
+            True if successful, False otherwise
+        """
+        done = Event()
+        result: dict[str, bool] = {}
+
+        def _apply() -> bool:
+            result["success"] = self._apply_video_format(width, height, framerate)
+            done.set()
+            return False
+
+        GLib.idle_add(_apply)
+
+        if not done.wait(self.RECONFIGURE_TIMEOUT):
+            logger.warning("Timed out reconfiguring the pipeline")
+            return False
+
+        return result["success"]
+
     def enable_timing(self, enabled: bool = True) -> None:
         if enabled:
             self.timer.enable()
@@ -375,7 +559,15 @@ class Streamer:
             self.timer.disable()
 
     def start_recording(self) -> bool:
-        return self.recording_manager.start()
+        if not self.recording_manager.start():
+            return False
+
+        # Without pre-roll the recording starts with the next keyframe,
+        # do not wait for a whole I-frame period
+        if not self.recording_manager.preroll and self.pipeline:
+            self.request_keyframe()
+
+        return True
 
     def stop_recording(self) -> bool:
         return self.recording_manager.stop()
@@ -416,12 +608,110 @@ class Streamer:
 
         self._reschedule_recovery_timeout()
 
+    def _on_pacer_error(self, _error: OSError) -> None:
+        """
+        Runs on the pacer thread for every packet that could not be sent.
+        While the network is down that is every packet, so only one call to
+        the main loop is queued at a time.
+        """
+        if self._pacer_error_pending:
+            return
+
+        self._pacer_error_pending = True
+        GLib.idle_add(self._on_pacer_error_idle)
+
+    def _on_pacer_error_idle(self) -> bool:
+        self._pacer_error_pending = False
+        self._handle_network_unreachable()
+
+        return False
+
     def _reschedule_recovery_timeout(self) -> None:
         if self._udpsink_recovery_timeout_id is not None:
             GLib.source_remove(self._udpsink_recovery_timeout_id)
 
         self._udpsink_recovery_timeout_id = GLib.timeout_add(1000, self._on_recovery_timeout)
 
+    def _input_caps(self) -> Gst.Caps:
+        return Gst.Caps.from_string(
+            f"video/x-raw,"
+            f"width={self.settings['width']},"
+            f"height={self.settings['height']},"
+            f"framerate={self.settings['framerate']}/1,"
+            f"format=NV12,"
+            f"interlace-mode=progressive"
+        )
+
+    def _apply_video_format(self, width: int | None, height: int | None, framerate: int | None) -> bool:
+        """Renegotiate the raw video format, runs on the main loop."""
+        input_caps_filter = self.get_element("input_caps")
+        encoder = self.get_element("encoder")
+        if input_caps_filter is None or encoder is None or self.source_builder is None or self._source is None:
+            logger.error("Pipeline not ready for reconfiguration")
+            return False
+
+        changes = {
+            key: value
+            for key, value in (("width", width), ("height", height), ("framerate", framerate))
+            if value is not None and value != self.settings[key]
+        }
+        if not changes:
+            return True
+
+        if ("width" in changes or "height" in changes) and not self.source_builder.SUPPORTS_RESIZE:
+            logger.warning(f"{type(self.source_builder).__name__} can not change resolution, ignoring reconfiguration")
+            return False
+
+        previous = {key: self.settings[key] for key in changes}
+        self.settings.update(changes)
+
+        # The first frame in the new format is forced to be an IDR, the
+        # encoder sees the new caps once all queued frames are encoded
+        encoder_pad = encoder.get_static_pad("sink")
+        probe_id = encoder_pad.add_probe(Gst.PadProbeType.EVENT_DOWNSTREAM, self._on_encoder_caps)
+
+        restart = self.source_builder.RESTART_ON_RECONFIGURE
+        if restart and self._source.set_state(Gst.State.READY) == Gst.StateChangeReturn.FAILURE:
+            logger.error("Failed to stop source for reconfiguration")
+            encoder_pad.remove_probe(probe_id)
+            self.settings.update(previous)
+            return False
+
+        input_caps_filter.set_property("caps", self._input_caps())
+
+        if restart and not self._source.sync_state_with_parent():
+            logger.error("Failed to restart source after reconfiguration, restoring previous format")
+            encoder_pad.remove_probe(probe_id)
+            self.settings.update(previous)
+            input_caps_filter.set_property("caps", self._input_caps())
+
+            if not self._source.sync_state_with_parent():
+                logger.error("Failed to restart source with previous format")
+
+            return False
+
+        framerate = self.settings["framerate"]
+        if self.qp_controller:
+            self.qp_controller.framerate = framerate
+        if self.packet_pacer:
+            self.packet_pacer.frame_interval = 1.0 / framerate
+
+        self.last_buffer_pts = None
+        self.last_camera_pts = None
+        self.reconfigurations += 1
+
+        logger.info(f"Reconfigured to {self.settings['width']}x{self.settings['height']}@{framerate}")
+
+        return True
+
+    def _on_encoder_caps(self, pad, info):
+        if info.get_event().type != Gst.EventType.CAPS:
+            return Gst.PadProbeReturn.OK
+
+        GLib.idle_add(self._force_keyframe)
+
+        return Gst.PadProbeReturn.REMOVE
+
     def _on_recovery_timeout(self) -> bool:
         self._udpsink_network_down = False
         self._udpsink_recovery_timeout_id = None
@@ -446,9 +736,9 @@ class Streamer:
 
         # Create source using registry
         try:
-            source_builder = SourceRegistry.create(source_type, self.settings)
-            _ = source_builder.build(self.pipeline)
-            source_output = source_builder.get_output_element()
+            self.source_builder = SourceRegistry.create(source_type, self.settings)
+            self._source = self.source_builder.build(self.pipeline)
+            source_output = self.source_builder.get_output_element()
         except (RuntimeError, ValueError) as e:
             logger.error(f"Failed to create source: {e}")
             return False
@@ -459,15 +749,7 @@ class Streamer:
             logger.error("Failed to create capsfilter")
             return False
 
-        input_caps = Gst.Caps.from_string(
-            f"video/x-raw,"
-            f"width={self.settings['width']},"
-            f"height={self.settings['height']},"
-            f"framerate={self.settings['framerate']}/1,"
-            f"format=NV12,"
-            f"interlace-mode=progressive"
-        )
-        input_caps_filter.set_property("caps", input_caps)
+        input_caps_filter.set_property("caps", self._input_caps())
         self.pipeline.add(input_caps_filter)
 
         # Add probe on source output to measure camera/ISP latency
@@ -495,27 +777,13 @@ class Streamer:
         queue_encoder.connect("overrun", self._on_queue_overrun)
         self.pipeline.add(queue_encoder)
 
-        encoder = Gst.ElementFactory.make("v4l2h264enc", "encoder")
-        if not encoder:
-            logger.error("Failed to create v4l2h264enc")
+        try:
+            encoder = self.encoder_builder.build(self.pipeline)
+            encoder_input = self.encoder_builder.get_input_element()
+        except RuntimeError as e:
+            logger.error(f"Failed to create encoder: {e}")
             return False
 
-        encoder_controls = (
-            f"controls,"
-            f"video_b_frames=0,"
-            f"repeat_sequence_header=1,"
-            f"video_bitrate={self.settings['bitrate']},"
-            f"bitrate_mode={self.settings['bitrate_mode']},"
-            f"h264_i_frame_period={self.settings['h264_i_frame_period']},"
-            f"h264_minimum_qp_value={self.settings['h264_minimum_qp_value']},"
-            f"h264_maximum_qp_value={self.settings['h264_maximum_qp_value']}"
-        )
-
-        encoder.set_property("extra-controls", Gst.Structure.from_string(encoder_controls)[0])
-        encoder.set_property("capture-io-mode", self.settings["capture_io_mode"])
-        encoder.set_property("output-io-mode", self.settings["output_io_mode"])
-        self.pipeline.add(encoder)
-
         if self.timer.enabled and self.sei_injector:
             encoder_sink_pad = encoder.get_static_pad("sink")
             encoder_sink_pad.add_probe(Gst.PadProbeType.BUFFER, self.sei_injector.on_pre_encode)
@@ -532,12 +800,7 @@ class Streamer:
         if self.timer.enabled and self.sei_injector:
             encoder_pad.add_probe(Gst.PadProbeType.BUFFER, self.sei_injector.on_post_encode)
 
-        encoder_caps = Gst.Caps.from_string(
-            f"video/x-h264,"
-            f"level=(string){self.settings['h264_level']},"
-            f"profile=(string){self.settings['h264_profile']},"
-            f"stream-format=(string)byte-stream"
-        )
+        encoder_caps = Gst.Caps.from_string(self.encoder_builder.get_caps())
         encoder_caps_filter.set_property("caps", encoder_caps)
         self.pipeline.add(encoder_caps_filter)
 
@@ -576,21 +839,42 @@ class Streamer:
             payloader_pad = payloader.get_static_pad("sink")
             payloader_pad.add_probe(Gst.PadProbeType.BUFFER, self._on_payloader_in)
 
-        udpsink = Gst.ElementFactory.make("udpsink", "udpsink")
-        if not udpsink:
-            logger.error("Failed to create udpsink")
-            return False
+        if self.settings["pacing"]:
+            # Packets are sent from Python, spread over the frame interval
+            udpsink = Gst.ElementFactory.make("appsink", "pacer_sink")
+            if not udpsink:
+                logger.error("Failed to create appsink")
+                return False
+
+            udpsink.set_property("emit-signals", True)
+            udpsink.set_property("buffer-list", True)
+            udpsink.connect("new-sample", self._on_pacer_sample)
+
+            self.packet_pacer = PacketPacer(
+                self.host,
+                self.port,
+                self.bind_port,
+                framerate=self.settings["framerate"],
+                fraction=self.settings["pacing_fraction"],
+                burst_bytes=self.settings["pacing_burst_bytes"],
+                on_error=self._on_pacer_error,
+            )
+        else:
+            udpsink = Gst.ElementFactory.make("udpsink", "udpsink")
+            if not udpsink:
+                logger.error("Failed to create udpsink")
+                return False
+
+            udpsink.set_property("host", self.host)
+            udpsink.set_property("port", self.port)
+            udpsink.set_property("bind-port", self.bind_port)
 
         if self.timer.enabled:
             udpsink_pad = udpsink.get_static_pad("sink")
             udpsink_pad.add_probe(Gst.PadProbeType.BUFFER_LIST, self._on_udpsink_buffer_list)
 
-        udpsink.set_property("host", self.host)
-        udpsink.set_property("port", self.port)
-        udpsink.set_property("bind-port", self.bind_port)
-
         # Use source builder's NEEDS_SYNC property
-        udpsink.set_property("sync", source_builder.NEEDS_SYNC)
+        udpsink.set_property("sync", self.source_builder.NEEDS_SYNC)
         udpsink.set_property("async", False)
         self.pipeline.add(udpsink)
 
@@ -599,7 +883,7 @@ class Streamer:
             logger.error("Failed to link input_caps_filter to queue_encoder")
             return False
 
-        if not queue_encoder.link(encoder):
+        if not queue_encoder.link(encoder_input):
             logger.error("Failed to link queue_encoder to encoder")
             return False
 
@@ -640,8 +924,73 @@ class Streamer:
             logger.error("UDP queue overrun - dropping frames!")
             self._udp_queue_overrun_active = True
 
+        if self.bitrate_controller:
+            self.bitrate_controller.on_overrun()
+
         self._reschedule_udp_queue_overrun_recovery_timeout()
 
+    def _on_bitrate_update(self) -> bool:
+        if self.bitrate_controller:
+            self.bitrate_controller.update()
+
+        return True
+
+    def _apply_bitrate(self, bitrate: int) -> None:
+        encoder = self.get_element("encoder")
+        if encoder is None:
+            return
+
+        try:
+            self.encoder_builder.set_bitrate(encoder, bitrate)
+        except Exception as e:
+            logger.error(f"Failed to set bitrate: {e}")
+            return
+
+        if self.qp_controller:
+            self.qp_controller.set_target(bitrate / 8)
+
+    def _apply_qp(self, qp_min: int, qp_max: int) -> None:
+        encoder = self.get_element("encoder")
+        if encoder is None:
+            return
+
+        try:
+            self.encoder_builder.set_qp(encoder, qp_min, qp_max)
+        except Exception as e:
+            logger.error(f"Failed to adjust QP: {e}")
+
+    def _force_keyframe(self) -> bool:
+        with self._keyframe_lock:
+            self._keyframe_pending = False
+            self._last_forced_keyframe = time.monotonic()
+
+        encoder = self.get_element("encoder")
+        if encoder is None:
+            return False
+
+        # Upstream force-key-unit event, handled by the video encoder base class
+        structure = Gst.Structure.new_from_string("GstForceKeyUnit, all-headers=(boolean)true")
+        event = Gst.Event.new_custom(Gst.EventType.CUSTOM_UPSTREAM, structure)
+        if encoder.get_static_pad("src").send_event(event):
+            self.keyframes_forced += 1
+            logger.debug("Forced keyframe")
+        else:
+            logger.warning("Encoder did not accept keyframe request")
+
+        return False
+
+    def _current_qp_min(self) -> int:
+        if self.qp_controller:
+            return self.qp_controller.current_qp_min
+
+        return self.qp_manager.current_qp_min
+
+    def _current_qp_max(self) -> int:
+        if self.qp_controller:
+            return self.qp_controller.qp_max
+
+        return self.qp_manager.qp_max
+
     def _reschedule_udp_queue_overrun_recovery_timeout(self) -> None:
         if self._udp_queue_overrun_recovery_timeout_id is not None:
             GLib.source_remove(self._udp_queue_overrun_recovery_timeout_id)
@@ -668,6 +1017,13 @@ class Streamer:
             logger.debug(f"i-frame: {size / 1024:.1f} KB at PTS {pts / Gst.SECOND:.3f}s")
             self.qp_manager.on_keyframe(size)
 
+        if self.qp_controller or self._frame_trace:
+            size = buffer.get_size()
+            if self.qp_controller:
+                self.qp_controller.on_frame(size, is_keyframe)
+            if self._frame_trace:
+                self._frame_trace.write(f"{int(is_keyframe)},{size},{self._current_qp_min()}\n")
+
         if self.last_buffer_pts is not None:
             delta = (pts - self.last_buffer_pts) / Gst.SECOND
             expected = 1.0 / self.settings["framerate"]
@@ -716,6 +1072,22 @@ class Streamer:
         self.timer.on_payloader_in(buffer.pts)
         return Gst.PadProbeReturn.OK
 
+    def _on_pacer_sample(self, sink):
+        sample = sink.emit("pull-sample")
+        if sample is None:
+            return Gst.FlowReturn.OK
+
+        buffer_list = sample.get_buffer_list()
+        if buffer_list is not None:
+            buffers = [buffer_list.get(i) for i in range(buffer_list.length())]
+        else:
+            buffers = [sample.get_buffer()]
+
+        if self.packet_pacer:
+            self.packet_pacer.submit([buffer.extract_dup(0, buffer.get_size()) for buffer in buffers])
+
+        return Gst.FlowReturn.OK
+
     def _on_udpsink_buffer_list(self, pad, info):
         buffer_list = info.get_buffer_list()
         if buffer_list.length() == 0:
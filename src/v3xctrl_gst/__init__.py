@@ -1,5 +1,6 @@
 from v3xctrl_gst.ControlClient import ControlClient
 from v3xctrl_gst.ControlServer import ControlServer
+from v3xctrl_gst.QPController import QPController
 from v3xctrl_gst.QPManager import QPManager
 from v3xctrl_gst.RecordingManager import RecordingManager
 from v3xctrl_gst.Streamer import Streamer
@@ -7,6 +8,7 @@ from v3xctrl_gst.Streamer import Streamer
 __all__ = [
     "ControlClient",
     "ControlServer",
+    "QPController",
     "QPManager",
     "RecordingManager",
     "Streamer",
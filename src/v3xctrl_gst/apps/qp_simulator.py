@@ -0,0 +1,48 @@
+import argparse
+import json
+
+from v3xctrl_gst.QPSimulator import load_trace, simulate
+
+
+def main() -> None:
+    """Replay a recorded frame size trace through the QP controller."""
+    parser = argparse.ArgumentParser(description="Offline QP controller simulation")
+
+    parser.add_argument("trace", help="Frame trace recorded with --frame-trace")
+    parser.add_argument("--bitrate", type=int, default=1800000, help="Target bitrate (default: 1800000)")
+    parser.add_argument("--framerate", type=float, default=30, help="Framerate of the trace (default: 30)")
+    parser.add_argument("--i-frame-period", type=int, default=30, help="I-frame period of the trace (default: 30)")
+    parser.add_argument("--qp-minimum", type=int, default=20, help="QP minimum (default: 20)")
+    parser.add_argument("--qp-maximum", type=int, default=51, help="QP maximum (default: 51)")
+    parser.add_argument("--kp", type=float, default=0.2, help="Proportional gain (default: 0.2)")
+    parser.add_argument("--ki", type=float, default=0.4, help="Integral gain (default: 0.4)")
+    parser.add_argument("--smoothing", type=float, default=0.2, help="Frame size smoothing (default: 0.2)")
+    parser.add_argument("--deadband", type=float, default=0.75, help="Dead band in QP (default: 0.75)")
+    parser.add_argument("--update-interval", type=int, default=15, help="Frames between updates (default: 15)")
+    parser.add_argument("--verbose", action="store_true", help="Print rate and QP for every second")
+
+    args = parser.parse_args()
+
+    result = simulate(
+        load_trace(args.trace),
+        target_bytes_per_second=args.bitrate / 8,
+        framerate=args.framerate,
+        gop=args.i_frame_period,
+        qp_min=args.qp_minimum,
+        qp_max=args.qp_maximum,
+        kp=args.kp,
+        ki=args.ki,
+        smoothing=args.smoothing,
+        deadband=args.deadband,
+        update_interval=args.update_interval,
+    )
+
+    if args.verbose:
+        for second, (rate, qp) in enumerate(zip(result.rates, result.qps, strict=True)):
+            print(f"{second:5d}s  {rate * 8 / 1000:8.0f} kbit/s  QP {qp}")
+
+    print(json.dumps(result.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,30 @@ from v3xctrl_gst import ControlClient
 
 actions = [
     "set",
+    "apply",
+    "apply_status",
     "get",
     "list",
     "stop",
     "recording",
     "stats",
+    "keyframe",
+    "reconfigure",
 ]
 
 
+def parse_resolution(value: str) -> tuple[int, int] | None:
+    """Parse WIDTHxHEIGHT, returns None if malformed."""
+    width, separator, height = value.partition("x")
+    if not separator or not width.isdigit() or not height.isdigit():
+        return None
+
+    if int(width) == 0 or int(height) == 0:
+        return None
+
+    return int(width), int(height)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="GStreamer pipeline control client")
     parser.add_argument("action", choices=actions, help="Action to perform")
@@ -27,9 +43,16 @@ def main() -> None:
     args = parser.parse_args()
 
     # Validate arguments based on action
-    if args.action == "set":
+    if args.action in ("set", "apply"):
         if not args.element or not args.property or not args.value:
-            parser.error("set requires: element property value")
+            parser.error(f"{args.action} requires: element property value")
+
+    elif args.action == "apply_status":
+        if not args.element:
+            parser.error("apply_status requires: request id")
+
+        if not args.element.isdigit():
+            parser.error(f"invalid request id: {args.element}")
 
     elif args.action == "get":
         if not args.element or not args.property:
@@ -39,13 +62,23 @@ def main() -> None:
         if not args.element:
             parser.error("list requires: element")
 
+    elif args.action == "reconfigure":
+        if not args.element:
+            parser.error("reconfigure requires: WIDTHxHEIGHT [framerate]")
+
+        if parse_resolution(args.element) is None:
+            parser.error(f"invalid resolution, expected WIDTHxHEIGHT: {args.element}")
+
+        if args.property and (not args.property.isdigit() or int(args.property) == 0):
+            parser.error(f"invalid framerate: {args.property}")
+
     elif args.action == "record" and not args.element:
         parser.error("record requires: element")
 
     client = ControlClient(args.socket_path)
 
     response = None
-    if args.action == "set":
+    if args.action in ("set", "apply"):
         # Try to convert value to appropriate type
         value: Any = args.value
         try:
@@ -53,7 +86,14 @@ def main() -> None:
         except ValueError:
             with contextlib.suppress(ValueError):
                 value = float(value)
-        response = client.set_property(args.element, args.property, value)
+
+        if args.action == "set":
+            response = client.set_property(args.element, args.property, value)
+        else:
+            response = client.apply_property(args.element, args.property, value)
+
+    elif args.action == "apply_status":
+        response = client.apply_status(int(args.element))
 
     elif args.action == "get":
         response = client.get_property(args.element, args.property)
@@ -70,6 +110,15 @@ def main() -> None:
     elif args.action == "stats":
         response = client.stats()
 
+    elif args.action == "keyframe":
+        response = client.request_keyframe()
+
+    elif args.action == "reconfigure":
+        resolution = parse_resolution(args.element)
+        assert resolution is not None
+        framerate = int(args.property) if args.property else None
+        response = client.reconfigure(*resolution, framerate)
+
     print(json.dumps(response, indent=2))
 
 
@@ -3,6 +3,7 @@ import logging
 from typing import Any
 
 from v3xctrl_control.message import PeerAnnouncement
+from v3xctrl_gst.EncoderRegistry import EncoderRegistry
 from v3xctrl_gst.Streamer import Streamer
 from v3xctrl_tcp import Transport
 from v3xctrl_tcp.TcpTunnel import TcpTunnel
@@ -23,16 +24,81 @@ def main() -> None:
     parser.add_argument("--height", type=int, default=720, help="Video height (default: 720)")
     parser.add_argument("--framerate", type=int, default=30, help="Framerate (default: 30)")
     parser.add_argument("--bitrate", type=int, default=1800000, help="Bitrate (default: 1800000)")
+    parser.add_argument(
+        "--adaptive-bitrate", action="store_true", help="Adjust the bitrate to network conditions at runtime"
+    )
+    parser.add_argument(
+        "--bitrate-min", type=int, default=300000, help="Minimum bitrate with adaptive bitrate (default: 300000)"
+    )
+    parser.add_argument(
+        "--bitrate-max", type=int, default=None, help="Maximum bitrate with adaptive bitrate (default: --bitrate)"
+    )
     parser.add_argument("--mtu", type=int, default=1400, help="RTP MTU in bytes (default: 1400)")
+    parser.add_argument(
+        "--pacing", action="store_true", help="Spread the packets of each frame instead of sending bursts"
+    )
+    parser.add_argument(
+        "--pacing-fraction",
+        type=float,
+        default=0.5,
+        help="Part of the frame interval packets are spread over (default: 0.5)",
+    )
+    parser.add_argument(
+        "--pacing-burst", type=int, default=8192, help="Bytes per frame sent without pacing (default: 8192)"
+    )
+    parser.add_argument(
+        "--encoder",
+        type=str,
+        default="v4l2",
+        choices=EncoderRegistry.list_encoders(),
+        help="H.264 encoder, x264 and openh264 are software encoders (default: v4l2)",
+    )
     parser.add_argument("--h264-profile", type=str, default="high", help="H.264 profile (default: high)")
     parser.add_argument("--buffertime", type=int, default=150000000, help="Buffer time in ns (default: 150000000)")
     parser.add_argument("--sizebuffers", type=int, default=5, help="Size of buffers (default: 5)")
     parser.add_argument("--recording-dir", type=str, default="", help="Directory to save recording")
+    parser.add_argument(
+        "--recording-segment-duration",
+        type=float,
+        default=0,
+        help="Start a new recording file every N seconds (default: 0 - single file)",
+    )
+    parser.add_argument(
+        "--recording-segment-size",
+        type=int,
+        default=0,
+        help="Start a new recording file every N MB (default: 0 - single file)",
+    )
+    parser.add_argument(
+        "--recording-preroll",
+        type=float,
+        default=0,
+        help="Seconds of video before the start of a recording to include (default: 0)",
+    )
     parser.add_argument("--test-pattern", action="store_true", default=False, help="Use test pattern instead of camera")
     parser.add_argument("--i-frame-period", type=int, default=30, help="I-frame period (default: 30)")
+    parser.add_argument(
+        "--keyframe-min-interval",
+        type=float,
+        default=1.0,
+        help="Minimum seconds between keyframes forced on request of the viewer (default: 1.0)",
+    )
     parser.add_argument("--qp-minimum", type=int, default=20, help="QP minimum (default: 20)")
     parser.add_argument("--qp-maximum", type=int, default=51, help="QP maximum (default: 51)")
     parser.add_argument("--max-i-frame-bytes", type=int, default=25600, help="Maximum i-frame size (default: 25600)")
+    parser.add_argument(
+        "--intra-refresh",
+        action="store_true",
+        help="Refresh the picture over the I-frame period instead of sending periodic I-frames",
+    )
+    parser.add_argument(
+        "--qp-control",
+        action="store_true",
+        help="Adjust the minimum QP to keep the data rate at the bitrate, replaces --enable-i-frame-adjust",
+    )
+    parser.add_argument(
+        "--frame-trace", type=str, default=None, help="Record frame sizes for offline QP simulation to this file"
+    )
     parser.add_argument("--enable-i-frame-adjust", action="store_true", help="Use test pattern instead of camera")
     parser.add_argument("--file-src", type=str, default=None, help="Path to src file")
     parser.add_argument("--af-mode", type=int, default=0, help="Auto focus mode (default: 0 - off)")
@@ -53,6 +119,9 @@ def main() -> None:
     parser.add_argument("--saturation", type=float, default=1.0, help="Saturation (default: 1.0)")
     parser.add_argument("--sharpness", type=float, default=0.0, help="Sharpness (default: 1.0)")
 
+    parser.add_argument(
+        "--timing", action="store_true", help="Measure pipeline timing and embed capture timestamps (SEI)"
+    )
     parser.add_argument(
         "--log", default="ERROR", help="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL). (default: ERROR)"
     )
@@ -81,17 +150,31 @@ def main() -> None:
         "height": args.height,
         "framerate": args.framerate,
         "bitrate": args.bitrate,
+        "adaptive_bitrate": args.adaptive_bitrate,
+        "bitrate_min": args.bitrate_min,
+        "bitrate_max": args.bitrate_max,
         "mtu": args.mtu,
+        "pacing": args.pacing,
+        "pacing_fraction": args.pacing_fraction,
+        "pacing_burst_bytes": args.pacing_burst,
+        "encoder": args.encoder,
         "h264_profile": args.h264_profile,
         "buffertime": args.buffertime,
         "sizebuffers": args.sizebuffers,
         "recording_dir": args.recording_dir,
+        "recording_segment_duration": args.recording_segment_duration,
+        "recording_segment_size": args.recording_segment_size * 1024 * 1024,
+        "recording_preroll": args.recording_preroll,
         "test_pattern": args.test_pattern,
         "h264_i_frame_period": args.i_frame_period,
+        "intra_refresh": args.intra_refresh,
+        "keyframe_min_interval": args.keyframe_min_interval,
         "h264_minimum_qp_value": args.qp_minimum,
         "h264_maximum_qp_value": args.qp_maximum,
         "max_i_frame_bytes": args.max_i_frame_bytes,
         "enable_i_frame_adjust": args.enable_i_frame_adjust,
+        "qp_control": args.qp_control,
+        "frame_trace": args.frame_trace,
         "file_src": args.file_src,
         "af_mode": args.af_mode,
         "lens_position": args.lens_position,
@@ -106,7 +189,7 @@ def main() -> None:
         "contrast": args.contrast,
         "saturation": args.saturation,
         "sharpness": args.sharpness,
-        "timing_enabled": level == logging.DEBUG,
+        "timing_enabled": args.timing or level == logging.DEBUG,
     }
 
     tcp_tunnel = None
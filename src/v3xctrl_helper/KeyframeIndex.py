@@ -0,0 +1,160 @@
+"""
+Keyframe index written next to recorded transport stream segments.
+
+Lets players and tools jump to a point in a recording without decoding it
+from the start. The sidecar (`<segment>.idx`) is a fixed size header followed
+by one fixed size little endian record per keyframe:
+
+    header: magic "V3XI", version (u8), reserved (u8), record size (u16),
+            stream header size (u32)
+    record: byte offset (u64), PTS in ns (i64, -1 if unknown),
+            wall clock timestamp in us (i64), flags (u32), padding (4)
+
+Records are in stream order, so lookups are a binary search over the mapped
+file. The stream header (PAT/PMT) at the start of the segment is what a clip
+needs in front of its first keyframe to be playable on its own.
+"""
+
+import mmap
+import os
+import struct
+from typing import BinaryIO, NamedTuple
+
+INDEX_SUFFIX = ".idx"
+
+MAGIC = b"V3XI"
+VERSION = 1
+
+HEADER = struct.Struct("<4sBBHI")
+RECORD = struct.Struct("<QqqI4x")
+
+# Wall clock timestamp is the capture time from the SEI, not the write time
+FLAG_SEI_TIMESTAMP = 0x01
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class Keyframe(NamedTuple):
+    offset: int
+    pts: int
+    timestamp_us: int
+    flags: int
+
+    @property
+    def sei_timestamp(self) -> bool:
+        return bool(self.flags & FLAG_SEI_TIMESTAMP)
+
+
+class KeyframeIndex:
+    """Read access to a keyframe index sidecar."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.stream_path = path[: -len(INDEX_SUFFIX)] if path.endswith(INDEX_SUFFIX) else path
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"Not a keyframe index: {path}")
+
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, record_size, header_size = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self._data.close()
+            raise ValueError(f"Unsupported keyframe index: {path}")
+
+        self.stream_header_size = header_size
+
+        # A record cut short by a crash while recording is ignored
+        self._count = (size - HEADER.size) // RECORD.size
+
+    @staticmethod
+    def pack_header(stream_header_size: int) -> bytes:
+        return HEADER.pack(MAGIC, VERSION, 0, RECORD.size, stream_header_size)
+
+    @staticmethod
+    def pack_record(offset: int, pts: int, timestamp_us: int, flags: int = 0) -> bytes:
+        return RECORD.pack(offset, pts, timestamp_us, flags)
+
+    @classmethod
+    def for_stream(cls, stream_path: str) -> "KeyframeIndex":
+        return cls(stream_path + INDEX_SUFFIX)
+
+    def close(self) -> None:
+        self._data.close()
+
+    def __enter__(self) -> "KeyframeIndex":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Keyframe:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("keyframe index out of range")
+
+        return Keyframe(*RECORD.unpack_from(self._data, HEADER.size + index * RECORD.size))
+
+    def find_pts(self, pts: int) -> int:
+        """Position of the last keyframe at or before `pts`, -1 if there is none."""
+        return self._bisect(pts, 1)
+
+    def find_time(self, timestamp_us: int) -> int:
+        """Position of the last keyframe at or before `timestamp_us`, -1 if there is none."""
+        return self._bisect(timestamp_us, 2)
+
+    def extract_clip(self, start_us: int, end_us: int, output: BinaryIO) -> int:
+        """
+        Copy the part of the stream between two wall clock timestamps.
+
+        The clip starts at the last keyframe at or before `start_us` and ends
+        before the first keyframe after `end_us`, prefixed with the stream
+        header. Nothing is re-muxed, byte ranges are copied as they are.
+
+        Returns:
+            Bytes written to `output`
+        """
+        if self._count == 0:
+            return 0
+
+        first = max(0, self.find_time(start_us))
+        last = max(first, self.find_time(end_us))
+        end = self[last + 1].offset if last < self._count - 1 else None
+
+        with open(self.stream_path, "rb") as stream:
+            written = self._copy(stream, 0, self.stream_header_size, output)
+            written += self._copy(stream, self[first].offset, end, output)
+
+        return written
+
+    def _bisect(self, value: int, field: int) -> int:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self[middle][field] <= value:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low - 1
+
+    @staticmethod
+    def _copy(stream: BinaryIO, start: int, end: int | None, output: BinaryIO) -> int:
+        stream.seek(start)
+        written = 0
+        while end is None or start + written < end:
+            size = COPY_CHUNK_SIZE if end is None else min(COPY_CHUNK_SIZE, end - start - written)
+            chunk = stream.read(size)
+            if not chunk:
+                break
+
+            output.write(chunk)
+            written += len(chunk)
+
+        return written
@@ -7,16 +7,23 @@ from v3xctrl_helper.helper import (
     apply_expo,
     clamp,
     color_to_hex,
+    dict_delta,
+    dict_merge,
     is_int,
 )
+from v3xctrl_helper.KeyframeIndex import Keyframe, KeyframeIndex
 from v3xctrl_helper.sei import (
     build_sei_nal,
+    detect_framing,
+    parse_recovery_point,
     parse_sei_nal,
 )
 from v3xctrl_helper.SlidingWindowAverage import SlidingWindowAverage
 
 __all__ = [
     "Address",
+    "Keyframe",
+    "KeyframeIndex",
     "MessageFromAddress",
     "PeerAddresses",
     "SlidingWindowAverage",
@@ -24,6 +31,10 @@ __all__ = [
     "build_sei_nal",
     "clamp",
     "color_to_hex",
+    "detect_framing",
+    "dict_delta",
+    "dict_merge",
     "is_int",
+    "parse_recovery_point",
     "parse_sei_nal",
 ]
@@ -1,4 +1,5 @@
 import math
+from typing import Any
 
 
 def clamp(raw: float, min_val: float, max_val: float) -> float:
@@ -28,3 +29,34 @@ def is_int(number: str) -> bool:
 
     except ValueError:
         return False
+
+
+def dict_delta(base: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """
+    Recursively collect all values of current that differ from base. Nested
+    dicts only hold the differing keys. Keys missing in current are ignored.
+    """
+    delta: dict[str, Any] = {}
+    for key, value in current.items():
+        previous = base.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            nested = dict_delta(previous, value)
+            if nested:
+                delta[key] = nested
+        elif key not in base or previous != value:
+            delta[key] = value
+
+    return delta
+
+
+def dict_merge(base: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Recursively apply a delta created by dict_delta, returns a new dict."""
+    merged = dict(base)
+    for key, value in delta.items():
+        previous = merged.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            merged[key] = dict_merge(previous, value)
+        else:
+            merged[key] = value
+
+    return merged
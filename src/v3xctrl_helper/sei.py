@@ -1,4 +1,5 @@
 import struct
+from collections.abc import Callable
 
 # v3xctrl SEI UUID - identifies our custom timestamp payloads
 SEI_UUID = bytes.fromhex("ef840fbc7f77401886ad83d713d27592")
@@ -12,9 +13,21 @@ NAL_HEADER_SEI = 0x06
 # SEI payload type 5: user_data_unregistered
 SEI_TYPE_USER_DATA_UNREGISTERED = 0x05
 
+# SEI payload type 6: recovery_point, sent at the start of every intra
+# refresh cycle instead of an IDR
+SEI_TYPE_RECOVERY_POINT = 0x06
+
 # UUID (16) + timestamp (8)
 SEI_PAYLOAD_SIZE = 24
 
+# Stream framing formats
+FRAMING_ANNEX_B = "annex-b"
+FRAMING_AVC = "avc"
+
+# SEI, SPS and PPS precede the first slice of an access unit, a timestamp SEI
+# further into the frame than this is not looked for
+SCAN_LIMIT = 512
+
 
 def build_sei_nal(timestamp_us: int) -> bytes:
     """Build a complete SEI NAL unit with a capture timestamp."""
@@ -28,7 +41,7 @@ def build_sei_nal(timestamp_us: int) -> bytes:
     )
 
 
-def _try_parse_sei(data: bytes, nal_start: int) -> int | None:
+def _try_parse_sei(data: bytes | memoryview, nal_start: int) -> int | None:
     """Try parsing a SEI NAL at nal_start (pointing to NAL header byte)."""
     if nal_start >= len(data):
         return None
@@ -56,38 +69,184 @@ def _try_parse_sei(data: bytes, nal_start: int) -> int | None:
     if data[uuid_start:uuid_end] != SEI_UUID:
         return None
 
-    (timestamp_us,) = struct.unpack(">q", data[uuid_end : uuid_end + 8])
+    (timestamp_us,) = struct.unpack_from(">q", data, uuid_end)
     return int(timestamp_us)
 
 
-def parse_sei_nal(data: bytes) -> int | None:
+def _try_parse_recovery_point(data: bytes | memoryview, nal_start: int) -> int | None:
     """
-    Parse a v3xctrl SEI NAL unit. Returns timestamp_us or None.
+    Try parsing a recovery point SEI message at nal_start.
 
-    Supports both Annex B (start code) and AVC (length-prefixed) formats.
+    A SEI NAL may carry several messages, they are walked until the recovery
+    point or the RBSP trailing bits. Returns recovery_frame_cnt or None.
     """
-    # Try Annex B format (start code delimited)
-    pos = data.find(START_CODE)
+    if nal_start >= len(data) or data[nal_start] & 0x1F != 6:
+        return None
+
+    # Annex B data is not cut at the end of the NAL, a malformed message
+    # must not walk into the slice data
+    data = data[: nal_start + SCAN_LIMIT]
+
+    pos = nal_start + 1
+    while pos < len(data) and data[pos] != 0x80:
+        payload_type = 0
+        while pos < len(data) and data[pos] == 0xFF:
+            payload_type += 255
+            pos += 1
+        if pos >= len(data):
+            return None
+        payload_type += data[pos]
+        pos += 1
+
+        payload_size = 0
+        while pos < len(data) and data[pos] == 0xFF:
+            payload_size += 255
+            pos += 1
+        if pos >= len(data):
+            return None
+        payload_size += data[pos]
+        pos += 1
+
+        if payload_type == SEI_TYPE_RECOVERY_POINT:
+            return _read_ue(data, pos, pos + payload_size)
+
+        pos += payload_size
+
+    return None
+
+
+def _read_ue(data: bytes | memoryview, start: int, end: int) -> int | None:
+    """Read an unsigned Exp-Golomb value from the bits starting at data[start]."""
+    end = min(end, len(data))
+    bit = start * 8
+    limit = end * 8
+
+    leading_zeros = 0
+    while bit < limit and not data[bit >> 3] & (0x80 >> (bit & 7)):
+        leading_zeros += 1
+        bit += 1
+
+    if bit + leading_zeros >= limit:
+        return None
+
+    value = 0
+    for _ in range(leading_zeros + 1):
+        value = value << 1 | bool(data[bit >> 3] & (0x80 >> (bit & 7)))
+        bit += 1
+
+    return value - 1
+
+
+def _is_vcl(nal_header: int) -> bool:
+    """Coded slice NAL units (types 1-5), nothing relevant follows them."""
+    return 1 <= nal_header & 0x1F <= 5
+
+
+_Parser = Callable[[bytes | memoryview, int], int | None]
+
+
+def _scan_annex_b(data: bytes | memoryview, parse: _Parser = _try_parse_sei) -> int | None:
+    # The streamer puts the timestamp first, check there before searching
+    if data[:4] == START_CODE:
+        result = parse(data, 4)
+        if result is not None:
+            return result
+
+    # Only the head of the frame is searched, this copies at most SCAN_LIMIT bytes
+    head = bytes(data[:SCAN_LIMIT])
+
+    pos = head.find(b"\x00\x00\x01")
     while pos != -1:
-        result = _try_parse_sei(data, pos + 4)
+        nal_start = pos + 3
+        if nal_start >= len(head) or _is_vcl(head[nal_start]):
+            return None
+
+        result = parse(data, nal_start)
         if result is not None:
             return result
 
-        pos = data.find(START_CODE, pos + 4)
+        pos = head.find(b"\x00\x00\x01", nal_start)
+
+    return None
+
 
-    # Try AVC format (4-byte length prefix)
+def _scan_avc(data: bytes | memoryview, parse: _Parser = _try_parse_sei) -> int | None:
+    # Slices of a memoryview do not copy, used to keep the SEI parse within its NAL
+    data = memoryview(data)
     pos = 0
     while pos + 4 < len(data):
-        nal_len = struct.unpack(">I", data[pos : pos + 4])[0]
+        (nal_len,) = struct.unpack_from(">I", data, pos)
         nal_start = pos + 4
 
-        if nal_len == 0 or nal_start + nal_len > len(data):
-            break
+        if nal_len == 0 or nal_start + nal_len > len(data) or _is_vcl(data[nal_start]):
+            return None
 
-        result = _try_parse_sei(data, nal_start)
+        result = parse(data[: nal_start + nal_len], nal_start)
         if result is not None:
             return result
 
         pos = nal_start + nal_len
 
     return None
+
+
+def detect_framing(data: bytes | memoryview) -> str | None:
+    """
+    Detect whether H.264 data is start code delimited or length prefixed.
+
+    Returns FRAMING_ANNEX_B, FRAMING_AVC or None if neither fits.
+    """
+    if data[:4] == START_CODE:
+        return FRAMING_ANNEX_B
+
+    if len(data) > 4:
+        (nal_len,) = struct.unpack_from(">I", data, 0)
+        if 0 < nal_len <= len(data) - 4:
+            return FRAMING_AVC
+
+    return None
+
+
+def parse_sei_nal(data: bytes | memoryview, framing: str | None = None) -> int | None:
+    """
+    Parse a v3xctrl SEI NAL unit. Returns timestamp_us or None.
+
+    Supports both Annex B (start code) and AVC (length-prefixed) formats.
+    Only the NAL units in front of the first slice are looked at, so frames
+    without a timestamp are rejected without walking the whole frame. Pass
+    a memoryview to avoid copying the frame and the framing from
+    detect_framing() to skip detecting it on every frame.
+    """
+    if framing is None:
+        framing = detect_framing(data)
+
+    if framing == FRAMING_ANNEX_B:
+        return _scan_annex_b(data)
+
+    if framing == FRAMING_AVC:
+        return _scan_avc(data)
+
+    return None
+
+
+def parse_recovery_point(data: bytes | memoryview, framing: str | None = None) -> int | None:
+    """
+    Parse a recovery point SEI in front of the first slice.
+
+    Encoders in intra refresh mode mark the start of every refresh cycle with
+    one, the picture is complete again `recovery_frame_cnt` frames later.
+    Emulation prevention bytes are not removed, they can not occur in the
+    first bytes of a recovery point for any sensible frame count.
+
+    Returns recovery_frame_cnt or None.
+    """
+    if framing is None:
+        framing = detect_framing(data)
+
+    if framing == FRAMING_ANNEX_B:
+        return _scan_annex_b(data, _try_parse_recovery_point)
+
+    if framing == FRAMING_AVC:
+        return _scan_avc(data, _try_parse_recovery_point)
+
+    return None
@@ -13,7 +13,9 @@ from v3xctrl_control.message import (
     Message,
     PeerAnnouncement,
 )
+from v3xctrl_control.PathMtuDiscovery import IP_MTU_DISCOVER, IP_PMTUDISC_PROBE
 from v3xctrl_helper import Address
+from v3xctrl_relay.ForwardTarget import TcpTarget
 from v3xctrl_relay.PacketRelay import PacketRelay
 from v3xctrl_relay.Role import Role
 from v3xctrl_relay.SessionStore import SessionStore
@@ -74,6 +76,10 @@ class RelayServer(threading.Thread):
     _CONNECTION_TEST_PREFIX = b"\x83\xa1t\xaeConnectionTest"
     _CONTROL_PREFIXES = (_PEER_ANNOUNCEMENT_PREFIX, _CONNECTION_TEST_PREFIX)
 
+    # Path MTU probes of the streamer, forwarded like data but without
+    # fragmentation, see _forward_mtu_probe
+    _MTU_PROBE_PREFIX = b"\x83\xa1t\xa8MtuProbe"
+
     def run(self) -> None:
         logger.info(f"Relay server listening on {self.ip}:{self.port}")
 
@@ -86,7 +92,11 @@ class RelayServer(threading.Thread):
                 if is_control:
                     self.control_executor.submit(self._handle_slow_packet, data, addr)
                 else:
-                    deferred_tcp = self.relay.forward_packet(data, addr)
+                    if data.startswith(self._MTU_PROBE_PREFIX):
+                        deferred_tcp = self._forward_mtu_probe(data, addr)
+                    else:
+                        deferred_tcp = self.relay.forward_packet(data, addr)
+
                     if deferred_tcp is not None:
                         for tcp_target in deferred_tcp:
                             self.tcp_executor.submit(tcp_target.send, data)
@@ -223,6 +233,32 @@ class RelayServer(threading.Thread):
 
         return result
 
+    def _forward_mtu_probe(self, data: bytes, addr: Address) -> list[TcpTarget] | None:
+        """
+        Forward a path MTU probe with the don't fragment bit set and without
+        local fragmentation, the way the streamer sent it. Otherwise the relay
+        would fragment probes that are too large for the relay -> viewer leg
+        and the streamer would only measure its own leg. A probe too large for
+        the outgoing interface is dropped.
+        """
+        try:
+            previous = self.sock.getsockopt(socket.IPPROTO_IP, IP_MTU_DISCOVER)
+            self.sock.setsockopt(socket.IPPROTO_IP, IP_MTU_DISCOVER, IP_PMTUDISC_PROBE)
+        except OSError as e:
+            logger.debug(f"Can not set path MTU discovery mode: {e}")
+            previous = None
+
+        try:
+            return self.relay.forward_packet(data, addr)
+
+        except OSError as e:
+            logger.debug(f"Dropped MTU probe of {len(data)} bytes from {addr}: {e}")
+            return []
+
+        finally:
+            if previous is not None:
+                self.sock.setsockopt(socket.IPPROTO_IP, IP_MTU_DISCOVER, previous)
+
     def _handle_peer_announcement(self, msg: PeerAnnouncement, addr: Address) -> None:
         self.relay.register_peer(msg, addr)
 
@@ -10,6 +10,7 @@ from v3xctrl_helper import Address
 from v3xctrl_relay.custom_types import PortType
 from v3xctrl_relay.ForwardTarget import TcpTarget
 from v3xctrl_relay.Role import Role
+from v3xctrl_tcp.FrameReader import FrameReader
 from v3xctrl_tcp.framing import recv_message
 from v3xctrl_tcp.keepalive import configure_keepalive
 
@@ -127,16 +128,20 @@ class TCPAcceptor:
 
     def _read_and_forward_loop(self, tcp_sock: socket.socket, addr: Address) -> None:
         """Read framed messages from a TCP peer and forward via relay."""
+        reader = FrameReader(tcp_sock)
         try:
             while not self.stop_event.is_set():
-                data = recv_message(tcp_sock)
-                if data is None:
+                frames = reader.read_frames()
+                if frames is None:
                     break
 
-                deferred_tcp = self.relay.forward_packet(data, addr)
-                if deferred_tcp:
-                    for tcp_target in deferred_tcp:
-                        tcp_target.send(data)
+                # Frames are views into the reader's buffer, they are sent
+                # before the next read
+                for data in frames:
+                    deferred_tcp = self.relay.forward_packet(data, addr)
+                    if deferred_tcp:
+                        for tcp_target in deferred_tcp:
+                            tcp_target.send(data)
 
         except OSError:
             pass
@@ -0,0 +1,101 @@
+"""
+Buffered reader for length-prefixed TCP frames.
+
+recv_message needs at least two recv calls per frame and copies every frame
+into new objects. The reader receives into one reusable buffer with
+recv_into, as much as the socket has ready, and returns every frame completed
+by that read as a memoryview into the buffer. Only the start of an incomplete
+frame is moved to the front before the next read.
+
+Every complete frame is handed out right away, whatever is left in the buffer
+is an incomplete frame, so waiting on the socket with select() before reading
+never leaves a frame behind.
+"""
+
+import struct
+from collections.abc import Iterator
+from socket import socket
+
+from v3xctrl_tcp.framing import HEADER_FORMAT, HEADER_SIZE, MAX_PAYLOAD_SIZE
+
+_HEADER = struct.Struct(HEADER_FORMAT)
+
+
+class FrameReader:
+    """Reads length-prefixed frames from a TCP socket."""
+
+    def __init__(self, sock: socket, buffer_size: int = 256 * 1024) -> None:
+        """
+        Args:
+            sock: Connected TCP socket
+            buffer_size: Receive buffer size, has to fit at least one frame
+                of maximum size
+        """
+        if buffer_size < HEADER_SIZE + MAX_PAYLOAD_SIZE:
+            raise ValueError(f"Buffer size must be at least {HEADER_SIZE + MAX_PAYLOAD_SIZE} bytes")
+
+        self.sock = sock
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+
+        self.reads = 0
+        self.frames = 0
+
+    def read_frames(self) -> list[memoryview] | None:
+        """
+        Receive once, blocks until data is available.
+
+        The returned views are only valid until the next call.
+
+        Returns:
+            Frames completed by this read, possibly none. None on disconnect.
+        """
+        if self._start:
+            remaining = self._end - self._start
+            self._view[:remaining] = self._view[self._start : self._end]
+            self._start = 0
+            self._end = remaining
+
+        received = self.sock.recv_into(self._view[self._end :])
+        if not received:
+            return None
+
+        self._end += received
+        self.reads += 1
+
+        return self._parse()
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """Yield frames until the peer disconnects, each valid until the next one is requested."""
+        while True:
+            frames = self.read_frames()
+            if frames is None:
+                return
+
+            yield from frames
+
+    def _parse(self) -> list[memoryview]:
+        frames: list[memoryview] = []
+        start = self._start
+        end = self._end
+
+        while end - start >= HEADER_SIZE:
+            (length,) = _HEADER.unpack_from(self._buffer, start)
+            frame_end = start + HEADER_SIZE + length
+            if frame_end > end:
+                break
+
+            frames.append(self._view[start + HEADER_SIZE : frame_end])
+            start = frame_end
+
+        if start == end:
+            # Nothing left over, the next read starts at the front without a move
+            start = end = 0
+
+        self._start = start
+        self._end = end
+        self.frames += len(frames)
+
+        return frames
@@ -0,0 +1,193 @@
+"""
+Scatter-gather writer for length-prefixed TCP frames.
+
+send_message concatenates header and payload, copying every packet, and
+issues one sendall per frame. With TCP_NODELAY every RTP packet then becomes
+its own segment. The writer hands header and payload to sendmsg as separate
+buffers, and collects the frames arriving within a short window (the
+packets of one video frame arrive as a burst) so they go out with a single
+syscall and fill the segments.
+
+The window is a timer on the TunnelEngine, frames arriving with later
+readable events are added to the pending batch, nothing blocks while
+waiting for them.
+
+Backpressure is the same as with sendall: once SO_SNDTIMEO expires the
+send fails, and since part of a batch may already be on the wire the
+connection has to be dropped.
+"""
+
+import select
+import struct
+from collections.abc import Callable
+from socket import socket
+from typing import Any
+
+from v3xctrl_tcp.framing import HEADER_FORMAT, MAX_PAYLOAD_SIZE
+from v3xctrl_tcp.TunnelEngine import TimerHandle, TunnelEngine
+
+_HEADER = struct.Struct(HEADER_FORMAT)
+
+
+class FrameWriter:
+    """Writes length-prefixed frames to a TCP socket, batched if possible."""
+
+    # Seconds a batch waits for more frames after the first one
+    BATCH_WINDOW = 0.0005
+
+    # Header and payload take one iovec each, IOV_MAX is 1024 on Linux
+    MAX_BATCH_FRAMES = 256
+    MAX_BATCH_BYTES = 256 * 1024
+
+    def __init__(
+        self,
+        sock: socket,
+        batch_window: float = BATCH_WINDOW,
+        engine: TunnelEngine | None = None,
+        on_error: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            sock: Connected TCP socket
+            batch_window: Seconds to wait for more frames before a batch is
+                sent, 0 to only batch what is already waiting
+            engine: Engine the batch window timer runs on, without one only
+                what is already waiting is batched
+            on_error: Called when a batch sent by the timer fails
+        """
+        self.sock = sock
+        self.batch_window = batch_window
+        self._engine = engine
+        self._on_error = on_error
+
+        self._buffers: list[bytes | memoryview] = []
+        self._pending_bytes = 0
+        self._flush_timer: TimerHandle | None = None
+
+        self._frames = 0
+        self._batches = 0
+        self._bytes = 0
+        self._max_batch = 0
+        self._partial_sends = 0
+        self._oversized = 0
+
+    @property
+    def pending(self) -> int:
+        """Frames added but not sent yet."""
+        return len(self._buffers) // 2
+
+    @property
+    def batch_full(self) -> bool:
+        return self.pending >= self.MAX_BATCH_FRAMES or self._pending_bytes >= self.MAX_BATCH_BYTES
+
+    def add(self, data: bytes | memoryview) -> bool:
+        """
+        Add a frame to the current batch without sending it.
+
+        Returns:
+            False if the payload is too large to be framed
+        """
+        length = len(data)
+        if length > MAX_PAYLOAD_SIZE:
+            self._oversized += 1
+            return False
+
+        self._buffers.append(_HEADER.pack(length))
+        self._buffers.append(data)
+        self._pending_bytes += _HEADER.size + length
+
+        return True
+
+    def flush(self) -> bool:
+        """
+        Send all pending frames with one syscall if the socket takes them.
+
+        Returns:
+            False on error, the connection is unusable then
+        """
+        if not self._buffers:
+            return True
+
+        buffers = self._buffers
+        total = self._pending_bytes
+        frames = self.pending
+        self._buffers = []
+        self._pending_bytes = 0
+
+        try:
+            sent = self.sock.sendmsg(buffers)
+            if sent < total:
+                # Only the rest is copied, this is rare with a reasonably
+                # sized send buffer
+                self._partial_sends += 1
+                self.sock.sendall(b"".join(buffers)[sent:])
+
+        except OSError:
+            return False
+
+        self._frames += frames
+        self._batches += 1
+        self._bytes += total
+        self._max_batch = max(self._max_batch, frames)
+
+        return True
+
+    def send(self, data: bytes | memoryview) -> bool:
+        """Send a single frame right away, returns False on error."""
+        return self.add(data) and self.flush()
+
+    def forward_from(self, udp_sock: socket) -> bool:
+        """
+        Add the datagrams waiting on `udp_sock` to the batch without
+        blocking. Call when `udp_sock` is readable. The batch is sent once it
+        is full, otherwise after the batch window.
+
+        Returns:
+            False on error, the connection is unusable then
+        """
+        while True:
+            data, _addr = udp_sock.recvfrom(65535)
+            self.add(data)
+
+            if self.batch_full:
+                break
+
+            readable, _, _ = select.select([udp_sock], [], [], 0)
+            if not readable:
+                break
+
+        if self.batch_full or self._engine is None or self.batch_window <= 0:
+            self._cancel_flush()
+            return self.flush()
+
+        if self._flush_timer is None:
+            self._flush_timer = self._engine.call_later(self.batch_window, self._on_flush_timer)
+
+        return True
+
+    def discard(self) -> None:
+        """Drop pending frames and the scheduled flush, call when the connection is closed."""
+        self._cancel_flush()
+        self._buffers = []
+        self._pending_bytes = 0
+
+    def _cancel_flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _on_flush_timer(self) -> None:
+        self._flush_timer = None
+        if not self.flush() and self._on_error is not None:
+            self._on_error()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "frames": self._frames,
+            "batches": self._batches,
+            "bytes": self._bytes,
+            "frames_per_batch": round(self._frames / self._batches, 2) if self._batches else 0.0,
+            "max_batch": self._max_batch,
+            "partial_sends": self._partial_sends,
+            "oversized": self._oversized,
+        }
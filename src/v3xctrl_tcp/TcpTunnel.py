@@ -10,22 +10,32 @@ UDP proxy model:
 - Outbound: local component sends to localhost:E -> proxy reads -> forwards over TCP
 - Inbound: TCP data -> proxy sends from E to localhost:local_component_port
 - Responses: component replies to localhost:E -> proxy reads -> forwards over TCP
+
+All of this runs as callbacks on a TunnelEngine. Tunnels created with the same
+engine share its thread, a tunnel without one gets a private engine.
 """
 
+import errno
 import logging
-import select
+import os
+import selectors
 import socket
 import threading
 import time
+from typing import Any
 
-from v3xctrl_tcp.framing import recv_message, send_message
+from v3xctrl_tcp.FrameReader import FrameReader
+from v3xctrl_tcp.FrameWriter import FrameWriter
+from v3xctrl_tcp.framing import send_message
 from v3xctrl_tcp.keepalive import configure_keepalive
 from v3xctrl_tcp.send_timeout import configure_send_timeout
+from v3xctrl_tcp.TunnelEngine import TimerHandle, TunnelEngine
 
 logger = logging.getLogger(__name__)
 
 # Retry backoff sequence (seconds)
 _RETRY_DELAYS = [1.0, 2.0, 5.0]
+_CONNECT_TIMEOUT = 5.0
 _CONNECT_WARN_TIMEOUT = 30.0
 
 
@@ -39,210 +49,264 @@ class TcpTunnel:
         local_component_port: int,
         bidirectional: bool = True,
         handshake: bytes | None = None,
+        batch_window: float = FrameWriter.BATCH_WINDOW,
+        engine: TunnelEngine | None = None,
     ) -> None:
         self.remote_host = remote_host
         self.remote_port = remote_port
         self.local_component_port = local_component_port
         self.bidirectional = bidirectional
         self.handshake = handshake
+        self.batch_window = batch_window
+
+        self._engine = engine or TunnelEngine(f"TcpTunnel-{remote_host}:{remote_port}")
+        self._started = False
+        self._closed = threading.Event()
 
-        self._stop_event = threading.Event()
         self._ephemeral_port: int | None = None
         self._port_ready = threading.Event()
-        self._threads: list[threading.Thread] = []
+
+        # Only touched on the engine thread
+        self._udp_sock: socket.socket | None = None
+        self._tcp_sock: socket.socket | None = None
+        self._reader: FrameReader | None = None
+        self._writer: FrameWriter | None = None
+        self._timer: TimerHandle | None = None
+        self._awaiting_handshake = False
+        self._bridged = False
+
+        self._attempt = 0
+        self._first_attempt_time = 0.0
+        self._warned = False
 
     @property
     def ephemeral_port(self) -> int | None:
         """The UDP ephemeral port local components should send to."""
         return self._ephemeral_port
 
+    def get_stats(self) -> dict[str, Any]:
+        """Outbound batching statistics of the current connection."""
+        return self._writer.get_stats() if self._writer else {}
+
     def wait_for_port(self, timeout: float = 5.0) -> int | None:
         """Block until the ephemeral port is allocated. Returns the port."""
         self._port_ready.wait(timeout=timeout)
         return self._ephemeral_port
 
     def start(self) -> None:
-        self._stop_event.clear()
-        self._port_ready.clear()
+        if self._started:
+            return
 
-        main_thread = threading.Thread(
-            target=self._run,
-            name=f"TcpTunnel-{self.remote_host}:{self.remote_port}",
-            daemon=True,
-        )
-        self._threads = [main_thread]
-        main_thread.start()
-
-    def stop(self) -> None:
-        self._stop_event.set()
-
-        for t in self._threads:
-            t.join(timeout=5.0)
-
-        self._threads.clear()
+        self._closed.clear()
+        self._port_ready.clear()
 
-    def _run(self) -> None:
-        """Main loop: bind UDP, connect TCP with retry, bridge traffic."""
         udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         udp_sock.bind(("127.0.0.1", 0))
+        self._udp_sock = udp_sock
         self._ephemeral_port = udp_sock.getsockname()[1]
         self._port_ready.set()
 
         logger.info(f"TcpTunnel UDP proxy bound on ephemeral port {self._ephemeral_port}")
 
-        try:
-            while not self._stop_event.is_set():
-                tcp_sock = self._connect_with_retry()
-                if tcp_sock is None:
-                    break  # stop was requested
-
-                if self.handshake is not None and not self._do_handshake(tcp_sock):
-                    tcp_sock.close()
-                    continue  # retry connection
-
-                logger.info(f"TcpTunnel connected to {self.remote_host}:{self.remote_port}")
-
-                self._bridge(tcp_sock, udp_sock)
-
-                tcp_sock.close()
-                if not self._stop_event.is_set():
-                    logger.warning(
-                        f"TcpTunnel disconnected from {self.remote_host}:{self.remote_port}, reconnecting..."
-                    )
-        finally:
-            udp_sock.close()
-
-    def _connect_with_retry(self) -> socket.socket | None:
-        """Try to connect TCP with backoff. Returns socket or None if stopped."""
-        attempt = 0
-        first_attempt_time = time.monotonic()
-        warned = False
-
-        while not self._stop_event.is_set():
-            tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            tcp_sock.settimeout(5.0)
-
-            try:
-                tcp_sock.connect((self.remote_host, self.remote_port))
-                tcp_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-                configure_keepalive(tcp_sock)
-                configure_send_timeout(tcp_sock, 200)
-                tcp_sock.settimeout(None)
-                return tcp_sock
-
-            except OSError as e:
-                tcp_sock.close()
-                elapsed = time.monotonic() - first_attempt_time
-
-                if not warned and elapsed >= _CONNECT_WARN_TIMEOUT:
-                    logger.error(
-                        f"Cannot establish TCP connection to "
-                        f"{self.remote_host}:{self.remote_port} after "
-                        f"{elapsed:.0f}s - is the remote side configured "
-                        f"for TCP?"
-                    )
-                    warned = True
-
-                delay = _RETRY_DELAYS[min(attempt, len(_RETRY_DELAYS) - 1)]
-                logger.debug(f"TCP connect failed ({e}), retrying in {delay}s...")
-
-                # Sleep in small increments to check stop_event
-                deadline = time.monotonic() + delay
-                while time.monotonic() < deadline:
-                    if self._stop_event.is_set():
-                        return None
-                    time.sleep(0.1)
-
-                attempt += 1
-
-        return None
-
-    def _do_handshake(self, tcp_sock: socket.socket) -> bool:
-        """Send handshake and read response. Returns True on success."""
-        assert self.handshake is not None
-
-        if not send_message(tcp_sock, self.handshake):
-            logger.error("TcpTunnel handshake send failed")
-            return False
-
-        response = recv_message(tcp_sock)
-        if response is None:
-            logger.error("TcpTunnel handshake response failed (disconnected)")
-            return False
-
-        logger.info(f"TcpTunnel handshake complete ({len(response)} bytes)")
-        return True
-
-    def _bridge(
-        self,
-        tcp_sock: socket.socket,
-        udp_sock: socket.socket,
-    ) -> None:
-        """Bridge traffic between TCP and local UDP until disconnect."""
-        inbound_thread: threading.Thread | None = None
-
-        if self.bidirectional:
-            # Inbound: TCP -> UDP to localhost:local_component_port
-            inbound_thread = threading.Thread(
-                target=self._inbound_loop,
-                args=(tcp_sock, udp_sock),
-                name=f"TcpTunnel-in-{self.remote_port}",
-                daemon=True,
-            )
-            inbound_thread.start()
+        self._started = True
+        self._engine.attach()
+        self._engine.call_soon(self._connect)
+
+    def stop(self) -> None:
+        if not self._started:
+            return
+
+        self._started = False
+        if self._engine.in_engine_thread:
+            self._shutdown()
+        else:
+            self._engine.call_soon(self._shutdown)
+            self._closed.wait(timeout=5.0)
+
+        self._engine.detach()
+
+    def _shutdown(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._close_tcp()
+
+        if self._udp_sock is not None:
+            self._udp_sock.close()
+            self._udp_sock = None
+
+        self._closed.set()
+
+    def _connect(self) -> None:
+        """Start a non-blocking connect, the result arrives in _on_connect."""
+        self._timer = None
+        if not self._started:
+            return
+
+        if self._attempt == 0:
+            self._first_attempt_time = time.monotonic()
+
+        tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        tcp_sock.setblocking(False)
 
-        # Outbound: UDP on ephemeral port -> TCP
-        # In unidirectional mode, also watch tcp_sock for disconnect detection
-        # (in bidirectional mode, the inbound thread handles that).
-        watch_fds = [udp_sock, tcp_sock] if not self.bidirectional else [udp_sock]
         try:
-            while not self._stop_event.is_set():
-                readable, _, _ = select.select(watch_fds, [], [], 1.0)
-                if not readable:
-                    continue
-
-                if tcp_sock in readable:
-                    # TCP readable in unidirectional = EOF (no data expected)
-                    try:
-                        peek = tcp_sock.recv(1, socket.MSG_PEEK)
-                        if not peek:
-                            break  # remote disconnected
-                    except OSError:
-                        break
-
-                if udp_sock in readable:
-                    try:
-                        data, _addr = udp_sock.recvfrom(65535)
-                    except OSError:
-                        break
-
-                    if not send_message(tcp_sock, data):
-                        break
-        except OSError:
-            pass
+            result = tcp_sock.connect_ex((self.remote_host, self.remote_port))
+        except OSError as e:
+            tcp_sock.close()
+            self._retry(e)
+            return
 
-        finally:
+        if result not in (0, errno.EINPROGRESS):
             tcp_sock.close()
-            if inbound_thread is not None:
-                inbound_thread.join(timeout=2.0)
+            self._retry(OSError(result, os.strerror(result)))
+            return
+
+        self._tcp_sock = tcp_sock
+        self._engine.register(tcp_sock, selectors.EVENT_WRITE, self._on_connect)
+        self._timer = self._engine.call_later(_CONNECT_TIMEOUT, self._on_connect_timeout)
+
+    def _on_connect(self, _events: int) -> None:
+        assert self._tcp_sock is not None
+        tcp_sock = self._tcp_sock
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._engine.unregister(tcp_sock)
+        error = tcp_sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if error:
+            self._close_tcp()
+            self._retry(OSError(error, os.strerror(error)))
+            return
+
+        # Blocking from here on, so SO_SNDTIMEO bounds sends. Reads only
+        # happen once select reported the socket readable.
+        tcp_sock.setblocking(True)
+        tcp_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        configure_keepalive(tcp_sock)
+        configure_send_timeout(tcp_sock, 200)
+
+        self._attempt = 0
+        self._warned = False
+
+        self._reader = FrameReader(tcp_sock)
+        self._writer = FrameWriter(tcp_sock, self.batch_window, self._engine, self._reconnect)
+        self._engine.register(tcp_sock, selectors.EVENT_READ, self._on_tcp_readable)
+
+        if self.handshake is not None:
+            if not send_message(tcp_sock, self.handshake):
+                logger.error("TcpTunnel handshake send failed")
+                self._reconnect()
+                return
+
+            self._awaiting_handshake = True
+            return
+
+        self._start_bridge()
+
+    def _on_connect_timeout(self) -> None:
+        self._timer = None
+        self._close_tcp()
+        self._retry(TimeoutError("timed out"))
+
+    def _retry(self, error: OSError) -> None:
+        """Schedule the next connect with backoff."""
+        elapsed = time.monotonic() - self._first_attempt_time
+        if not self._warned and elapsed >= _CONNECT_WARN_TIMEOUT:
+            logger.error(
+                f"Cannot establish TCP connection to "
+                f"{self.remote_host}:{self.remote_port} after "
+                f"{elapsed:.0f}s - is the remote side configured "
+                f"for TCP?"
+            )
+            self._warned = True
+
+        delay = _RETRY_DELAYS[min(self._attempt, len(_RETRY_DELAYS) - 1)]
+        logger.debug(f"TCP connect failed ({error}), retrying in {delay}s...")
+
+        self._attempt += 1
+        self._timer = self._engine.call_later(delay, self._connect)
+
+    def _start_bridge(self) -> None:
+        assert self._udp_sock is not None
+
+        logger.info(f"TcpTunnel connected to {self.remote_host}:{self.remote_port}")
+
+        self._bridged = True
+        self._engine.register(self._udp_sock, selectors.EVENT_READ, self._on_udp_readable)
+
+    def _on_tcp_readable(self, _events: int) -> None:
+        """Inbound: TCP -> UDP to localhost:local_component_port."""
+        assert self._reader is not None
+        assert self._udp_sock is not None
 
-    def _inbound_loop(
-        self,
-        tcp_sock: socket.socket,
-        udp_sock: socket.socket,
-    ) -> None:
-        """Read TCP data, forward as UDP to localhost:local_component_port."""
         try:
-            while not self._stop_event.is_set():
-                readable, _, _ = select.select([tcp_sock], [], [], 1.0)
-                if not readable:
-                    continue
+            frames = self._reader.read_frames()
+            if frames is None:
+                if self._awaiting_handshake:
+                    logger.error("TcpTunnel handshake response failed (disconnected)")
+                self._reconnect()
+                return
+
+            if self._awaiting_handshake:
+                if not frames:
+                    return
+
+                logger.info(f"TcpTunnel handshake complete ({len(frames[0])} bytes)")
+                self._awaiting_handshake = False
+                frames = frames[1:]
+                self._start_bridge()
+
+            # In unidirectional mode nothing is expected, reading only
+            # detects the disconnect
+            if self.bidirectional:
+                target = ("127.0.0.1", self.local_component_port)
+                for frame in frames:
+                    self._udp_sock.sendto(frame, target)
 
-                data = recv_message(tcp_sock)
-                if data is None:
-                    break
+        except OSError:
+            self._reconnect()
 
-                udp_sock.sendto(data, ("127.0.0.1", self.local_component_port))
+    def _on_udp_readable(self, _events: int) -> None:
+        """Outbound: UDP on ephemeral port -> TCP."""
+        assert self._writer is not None
+        assert self._udp_sock is not None
 
+        try:
+            if self._writer.forward_from(self._udp_sock):
+                return
         except OSError:
             pass
+
+        self._reconnect()
+
+    def _reconnect(self) -> None:
+        bridged = self._bridged
+        self._close_tcp()
+
+        if self._started:
+            if bridged:
+                logger.warning(f"TcpTunnel disconnected from {self.remote_host}:{self.remote_port}, reconnecting...")
+            self._connect()
+
+    def _close_tcp(self) -> None:
+        if self._udp_sock is not None:
+            self._engine.unregister(self._udp_sock)
+
+        if self._tcp_sock is not None:
+            self._engine.unregister(self._tcp_sock)
+            self._tcp_sock.close()
+            self._tcp_sock = None
+
+        if self._writer is not None:
+            self._writer.discard()
+
+        if self._bridged and self._writer is not None:
+            stats = self._writer.get_stats()
+            logger.debug(f"TcpTunnel sent {stats['frames']} frames in {stats['batches']} batches")
+
+        self._reader = None
+        self._awaiting_handshake = False
+        self._bridged = False
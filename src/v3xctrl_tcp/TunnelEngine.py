@@ -0,0 +1,225 @@
+"""
+Single-threaded event loop for TCP tunnels.
+
+Without it every TcpTunnel runs a thread polling its UDP socket with select,
+another thread reading TCP, and blocks in connect and sleep while
+reconnecting. The viewer's TcpServer does the same per channel. The engine
+watches the sockets of any number of tunnels with one selector from one
+thread:
+
+- A socket's callback runs as soon as the socket is ready, instead of when a
+  polling loop gets around to it
+- Connects are non-blocking and retries are timers, so a tunnel that is
+  reconnecting does not hold up the others
+- stop() wakes the loop right away instead of waiting for a select timeout
+
+Callbacks run on the engine thread and must not block. The exception is
+sending on TCP: sockets stay in blocking mode so that SO_SNDTIMEO still
+limits how long a send may block. A send that times out is connection-fatal,
+as before.
+
+The thread runs while at least one user is attached. Several tunnels can
+share an engine without any further lifecycle handling.
+"""
+
+import contextlib
+import heapq
+import itertools
+import logging
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(order=True)
+class TimerHandle:
+    """A callback scheduled with TunnelEngine.call_later."""
+
+    when: float
+    sequence: int
+    callback: Callable[[], None] = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TunnelEngine:
+    """Runs the socket callbacks and timers of several tunnels in one thread."""
+
+    def __init__(self, name: str = "TunnelEngine") -> None:
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._users = 0
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+        self._selector: selectors.BaseSelector | None = None
+        self._wakeup_recv: socket.socket | None = None
+        self._wakeup_send: socket.socket | None = None
+
+        self._ready: deque[Callable[[], None]] = deque()
+        self._timers: list[TimerHandle] = []
+        self._sequence = itertools.count()
+
+        self.iterations = 0
+
+    @property
+    def in_engine_thread(self) -> bool:
+        return self._thread is threading.current_thread()
+
+    def attach(self) -> None:
+        """Start the engine thread unless it is already running."""
+        with self._lock:
+            self._users += 1
+            if self._thread is not None:
+                return
+
+            self._selector = selectors.DefaultSelector()
+            self._wakeup_recv, self._wakeup_send = socket.socketpair()
+            self._wakeup_recv.setblocking(False)
+            self._wakeup_send.setblocking(False)
+            self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
+
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def detach(self) -> None:
+        """Stop the engine thread once the last user detached."""
+        with self._lock:
+            if self._users == 0:
+                return
+
+            self._users -= 1
+            if self._users > 0 or self._thread is None:
+                return
+
+            thread = self._thread
+            self._running = False
+            self._wakeup()
+            if thread is not threading.current_thread():
+                thread.join(timeout=5.0)
+
+            self._thread = None
+
+    def call_soon(self, callback: Callable[[], None]) -> None:
+        """Run `callback` on the engine thread, safe to call from any thread."""
+        self._ready.append(callback)
+        self._wakeup()
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """Run `callback` on the engine thread after `delay` seconds. Engine thread only."""
+        timer = TimerHandle(time.monotonic() + delay, next(self._sequence), callback)
+        heapq.heappush(self._timers, timer)
+
+        return timer
+
+    def register(self, sock: socket.socket, events: int, callback: Callable[[int], None]) -> None:
+        """
+        Call `callback` with the ready events whenever `sock` is ready. Engine
+        thread only.
+
+        Args:
+            sock: Socket to watch
+            events: selectors.EVENT_READ and/or selectors.EVENT_WRITE
+            callback: Called with the mask of ready events
+        """
+        assert self._selector is not None
+        self._selector.register(sock, events, callback)
+
+    def unregister(self, sock: socket.socket) -> None:
+        """Stop watching `sock`, does nothing if it is not registered. Engine thread only."""
+        if self._selector is None:
+            return
+
+        with contextlib.suppress(KeyError, ValueError):
+            self._selector.unregister(sock)
+
+    def _wakeup(self) -> None:
+        if self._wakeup_send is None:
+            return
+
+        # A full buffer means a wakeup is pending anyway
+        with contextlib.suppress(OSError):
+            self._wakeup_send.send(b"\0")
+
+    def _timeout(self) -> float | None:
+        if self._ready:
+            return 0
+
+        while self._timers and self._timers[0].cancelled:
+            heapq.heappop(self._timers)
+
+        if not self._timers:
+            return None
+
+        return max(0.0, self._timers[0].when - time.monotonic())
+
+    def _run(self) -> None:
+        assert self._selector is not None
+        assert self._wakeup_recv is not None
+        selector = self._selector
+
+        try:
+            while self._running:
+                events = selector.select(self._timeout())
+                self.iterations += 1
+
+                for key, mask in events:
+                    if key.fileobj is self._wakeup_recv:
+                        self._drain_wakeup()
+                        continue
+
+                    # An earlier callback in this round may have closed the socket
+                    if selector.get_map().get(key.fd) is not key:
+                        continue
+
+                    self._invoke(key.data, mask)
+
+                for _ in range(len(self._ready)):
+                    self._invoke(self._ready.popleft())
+
+                now = time.monotonic()
+                while self._timers and self._timers[0].when <= now:
+                    timer = heapq.heappop(self._timers)
+                    if not timer.cancelled:
+                        self._invoke(timer.callback)
+
+        finally:
+            # Callbacks queued right before the last user detached, usually
+            # the shutdown of that user
+            while self._ready:
+                self._invoke(self._ready.popleft())
+
+            selector.close()
+            self._wakeup_recv.close()
+            if self._wakeup_send is not None:
+                self._wakeup_send.close()
+
+            self._selector = None
+            self._wakeup_recv = None
+            self._wakeup_send = None
+            self._timers.clear()
+
+    def _drain_wakeup(self) -> None:
+        assert self._wakeup_recv is not None
+        try:
+            while self._wakeup_recv.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _invoke(self, callback: Callable[..., None], *args: int) -> None:
+        """One failing tunnel must not take down the others."""
+        try:
+            callback(*args)
+        except Exception:
+            logger.exception(f"{self.name} callback failed")
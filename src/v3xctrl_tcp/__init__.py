@@ -1,10 +1,16 @@
+from .FrameReader import FrameReader
+from .FrameWriter import FrameWriter
 from .framing import recv_message, send_message
 from .keepalive import configure_keepalive
 from .send_timeout import configure_send_timeout
 from .transport import Transport
+from .TunnelEngine import TunnelEngine
 
 __all__ = [
+    "FrameReader",
+    "FrameWriter",
     "Transport",
+    "TunnelEngine",
     "configure_keepalive",
     "configure_send_timeout",
     "recv_message",
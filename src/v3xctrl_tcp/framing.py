@@ -16,14 +16,22 @@ MAX_PAYLOAD_SIZE = 0xFFFF
 
 
 def send_message(sock: socket, data: bytes) -> bool:
-    """Send a length-prefixed message. Returns False on error."""
+    """
+    Send a length-prefixed message. Returns False on error.
+
+    Header and payload are passed to sendmsg separately, the payload is only
+    copied in the rare case that the socket does not take all of it at once.
+    Use FrameWriter to send several messages with one syscall.
+    """
     length = len(data)
     if length > MAX_PAYLOAD_SIZE:
         return False
 
     header = struct.pack(HEADER_FORMAT, length)
     try:
-        sock.sendall(header + data)
+        sent = sock.sendmsg([header, data])
+        if sent < HEADER_SIZE + length:
+            sock.sendall((header + data)[sent:])
         return True
 
     except OSError:
@@ -0,0 +1,164 @@
+"""
+Cached systemd service status.
+
+All services are queried with a single `systemctl show` call instead of
+forking one process per service. Results are cached for `max_age` seconds, so
+multiple consumers polling at their own rate share a single query.
+
+Listeners are notified whenever the status of a service changes.
+"""
+
+import logging
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ServiceStatus:
+    name: str
+    type: str
+    state: str
+    result: str
+
+    @property
+    def active(self) -> bool:
+        return self.state == "active"
+
+    @classmethod
+    def unknown(cls, name: str) -> "ServiceStatus":
+        return cls(name, "unknown", "unknown", "error")
+
+
+# Called with the new and the previous status (None on first query)
+StatusListener = Callable[[ServiceStatus, ServiceStatus | None], None]
+
+
+class ServiceStatusProvider:
+    PROPERTIES = ("Type", "ActiveState", "Result")
+    TIMEOUT = 2.0
+
+    def __init__(self, services: list[str], max_age: float = 1.0) -> None:
+        self._services = list(services)
+        self._max_age = max_age
+
+        self._statuses: dict[str, ServiceStatus] = {}
+        self._updated_at: float | None = None
+        self._success = False
+        self._listeners: list[StatusListener] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: StatusListener) -> None:
+        """
+        Register a listener for status changes. Statuses that are already
+        cached are passed to the new listener right away, as first queries.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+            known = list(self._statuses.values())
+
+        for status in known:
+            self._notify(listener, status, None)
+
+    def invalidate(self) -> None:
+        """Force the next read to query systemd, e.g. after starting a service."""
+        with self._lock:
+            self._updated_at = None
+
+    def get_all(self) -> list[ServiceStatus]:
+        """Status of all services, in the order they were passed in."""
+        self.refresh()
+        with self._lock:
+            return [self._statuses.get(name, ServiceStatus.unknown(name)) for name in self._services]
+
+    def get(self, name: str) -> ServiceStatus:
+        """Status of a single service, services not being tracked are queried directly."""
+        if name not in self._services:
+            return self.query([name])[0]
+
+        self.refresh()
+        with self._lock:
+            return self._statuses.get(name, ServiceStatus.unknown(name))
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Query all services, unless the cached status is younger than max_age.
+
+        Args:
+            force: Query even if the cached status is still fresh
+
+        Returns:
+            False if systemd could not be queried
+        """
+        with self._lock:
+            if not force and not self._is_stale():
+                return self._success
+
+        statuses = self.query(self._services)
+        success = not all(status == ServiceStatus.unknown(status.name) for status in statuses)
+
+        changes: list[tuple[ServiceStatus, ServiceStatus | None]] = []
+        with self._lock:
+            for status in statuses:
+                previous = self._statuses.get(status.name)
+                if status != previous:
+                    changes.append((status, previous))
+                self._statuses[status.name] = status
+            self._updated_at = time.monotonic()
+            self._success = success
+            listeners = list(self._listeners)
+
+        for status, previous in changes:
+            for listener in listeners:
+                self._notify(listener, status, previous)
+
+        return success
+
+    def query(self, services: list[str]) -> list[ServiceStatus]:
+        """
+        Query the given services with a single systemctl call. Properties of
+        multiple units are returned as blocks separated by an empty line, in
+        the order the units were passed.
+        """
+        try:
+            output = subprocess.check_output(
+                ["systemctl", "show", *services, f"--property={','.join(self.PROPERTIES)}"],
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=self.TIMEOUT,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.debug("Failed to query services: %s", e)
+            return [ServiceStatus.unknown(name) for name in services]
+
+        blocks = [block for block in output.strip().split("\n\n") if block.strip()]
+        if len(blocks) != len(services):
+            logger.debug("Unexpected systemctl output for %d services: %r", len(services), output)
+            return [ServiceStatus.unknown(name) for name in services]
+
+        statuses: list[ServiceStatus] = []
+        for name, block in zip(services, blocks, strict=True):
+            props = dict(line.split("=", 1) for line in block.splitlines() if "=" in line)
+            statuses.append(
+                ServiceStatus(
+                    name,
+                    props.get("Type", ""),
+                    props.get("ActiveState", ""),
+                    props.get("Result", ""),
+                )
+            )
+
+        return statuses
+
+    def _notify(self, listener: StatusListener, status: ServiceStatus, previous: ServiceStatus | None) -> None:
+        try:
+            listener(status, previous)
+        except Exception as e:
+            logger.error("Service status listener failed for %s: %s", status.name, e)
+
+    def _is_stale(self) -> bool:
+        return self._updated_at is None or time.monotonic() - self._updated_at > self._max_age
@@ -1,7 +1,7 @@
-import subprocess
 from typing import ClassVar
 
 from v3xctrl_telemetry.dataclasses import ServiceFlags
+from v3xctrl_telemetry.ServiceStatusProvider import ServiceStatus, ServiceStatusProvider
 
 
 class ServiceTelemetry:
@@ -12,22 +12,21 @@ class ServiceTelemetry:
         "debug": "v3xctrl-debug.service",
     }
 
-    def __init__(self):
+    def __init__(self, provider: ServiceStatusProvider | None = None):
         self._state = ServiceFlags()
-
-    def _is_active(self, service: str) -> bool:
-        return (
-            subprocess.call(
-                ["systemctl", "is-active", "--quiet", service],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            == 0
-        )
+        self._fields = {service_name: field_name for field_name, service_name in self.SERVICE_NAMES.items()}
+        self._provider = provider or ServiceStatusProvider(list(self.SERVICE_NAMES.values()))
+        self._provider.add_listener(self._on_status_change)
 
     def update(self) -> None:
-        for field_name, service_name in self.SERVICE_NAMES.items():
-            setattr(self._state, field_name, self._is_active(service_name))
+        """Refresh the service status, flags are updated by the change listener."""
+        if not self._provider.refresh():
+            raise RuntimeError("Failed to query service status")
+
+    def _on_status_change(self, status: ServiceStatus, previous: ServiceStatus | None) -> None:
+        field_name = self._fields.get(status.name)
+        if field_name is not None:
+            setattr(self._state, field_name, status.active)
 
     def get_state(self) -> ServiceFlags:
         return self._state
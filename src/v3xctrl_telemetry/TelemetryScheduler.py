@@ -0,0 +1,184 @@
+"""
+Multi-rate scheduler for telemetry sources.
+
+Every source is polled by its own worker thread at its own interval, so a slow
+source (AT commands, subprocesses) does not delay any other source, and fast
+sources (GPS) can be polled at their native rate.
+
+Blocking calls can not be interrupted, a source exceeding its timeout is
+counted and reported as stalled instead. A source without a successful update
+for longer than its interval plus timeout is stale, its last values should no
+longer be trusted.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# An update returning False counts as failure, as does raising an exception
+UpdateFunction = Callable[[], bool | None]
+
+
+@dataclass
+class SourceStats:
+    """Per source statistics, latencies in milliseconds."""
+
+    updates: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    last_latency_ms: float = 0.0
+    avg_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    stalled: bool = False
+    stale: bool = False
+
+
+class _Source:
+    def __init__(self, name: str, update: UpdateFunction, interval: float, timeout: float) -> None:
+        self.name = name
+        self.update = update
+        self.interval = interval
+        self.timeout = timeout
+
+        self.stats = SourceStats()
+        self.started_at: float | None = None
+        self.succeeded_at: float | None = None
+        self.thread: threading.Thread | None = None
+
+
+class TelemetryScheduler:
+    # Weight of the latest sample in the average latency
+    LATENCY_SMOOTHING = 0.2
+
+    def __init__(self, on_update: Callable[[str], None] | None = None) -> None:
+        self._on_update = on_update
+
+        self._sources: dict[str, _Source] = {}
+        self._running = threading.Event()
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    def add(self, name: str, update: UpdateFunction, interval: float, timeout: float | None = None) -> None:
+        """
+        Register a source, it is polled every interval seconds. The timeout
+        defaults to the interval.
+        """
+        if self._running.is_set():
+            raise RuntimeError("Sources can not be added while the scheduler is running")
+
+        self._sources[name] = _Source(name, update, interval, timeout if timeout is not None else interval)
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._running.set()
+
+        # Every source gets its full timeout for the first update
+        now = time.monotonic()
+        for source in self._sources.values():
+            source.succeeded_at = now
+
+        for source in self._sources.values():
+            source.thread = threading.Thread(
+                target=self._worker, args=(source,), name=f"Telemetry-{source.name}", daemon=True
+            )
+            source.thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._running.clear()
+        self._stopped.set()
+        for source in self._sources.values():
+            if source.thread is not None:
+                source.thread.join(timeout)
+
+    def stale_sources(self) -> set[str]:
+        """Names of the sources whose values are outdated."""
+        now = time.monotonic()
+        with self._lock:
+            return {name for name, source in self._sources.items() if self._is_stale(source, now)}
+
+    def get_stats(self) -> dict[str, SourceStats]:
+        now = time.monotonic()
+        stats: dict[str, SourceStats] = {}
+        with self._lock:
+            for name, source in self._sources.items():
+                stalled = source.started_at is not None and now - source.started_at > source.timeout
+                stats[name] = SourceStats(
+                    updates=source.stats.updates,
+                    failures=source.stats.failures,
+                    timeouts=source.stats.timeouts,
+                    last_latency_ms=source.stats.last_latency_ms,
+                    avg_latency_ms=source.stats.avg_latency_ms,
+                    max_latency_ms=source.stats.max_latency_ms,
+                    stalled=stalled,
+                    stale=self._is_stale(source, now),
+                )
+
+        return stats
+
+    def _is_stale(self, source: _Source, now: float) -> bool:
+        if source.succeeded_at is None:
+            return False
+
+        return now - source.succeeded_at > source.interval + source.timeout
+
+    def _worker(self, source: _Source) -> None:
+        next_run = time.monotonic()
+        while self._running.is_set():
+            start = time.monotonic()
+            with self._lock:
+                source.started_at = start
+
+            success = self._run_update(source)
+
+            end = time.monotonic()
+            self._record(source, (end - start) * 1000, success)
+
+            if success and self._on_update:
+                try:
+                    self._on_update(source.name)
+                except Exception as e:
+                    logger.error("Telemetry update callback failed for %s: %s", source.name, e)
+
+            # Fixed rate, but do not try to catch up after overruns
+            next_run = max(next_run + source.interval, end)
+            self._stopped.wait(next_run - end)
+
+    def _run_update(self, source: _Source) -> bool:
+        try:
+            return source.update() is not False
+
+        except Exception as e:
+            logger.debug("Failed to update %s telemetry: %s", source.name, e)
+            return False
+
+    def _record(self, source: _Source, latency_ms: float, success: bool) -> None:
+        with self._lock:
+            stats = source.stats
+            source.started_at = None
+
+            if stats.updates + stats.failures == 0:
+                stats.avg_latency_ms = latency_ms
+            else:
+                stats.avg_latency_ms += (latency_ms - stats.avg_latency_ms) * self.LATENCY_SMOOTHING
+
+            stats.last_latency_ms = latency_ms
+            stats.max_latency_ms = max(stats.max_latency_ms, latency_ms)
+
+            if success:
+                stats.updates += 1
+                source.succeeded_at = time.monotonic()
+            else:
+                stats.failures += 1
+
+            if latency_ms > source.timeout * 1000:
+                stats.timeouts += 1
+                logger.warning(
+                    "%s telemetry took %.0fms, exceeding its %.0fms timeout",
+                    source.name,
+                    latency_ms,
+                    source.timeout * 1000,
+                )
@@ -1,21 +1,21 @@
 import subprocess
+from pathlib import Path
 
 from v3xctrl_telemetry.dataclasses import VideoCoreFlags
 
 
 class VideoCoreTelemetry:
+    # Exposed by the raspberrypi-hwmon firmware driver, reading it is a lot
+    # cheaper than forking vcgencmd on every update.
+    THROTTLED_PATH = Path("/sys/devices/platform/soc/soc:firmware/get_throttled")
+
     def __init__(self):
         self._state = VideoCoreFlags()
+        self._sysfs_available = True
 
     def update(self) -> None:
-        """Update current and historical flags from vcgencmd."""
-        # Example: throttled=0x50005
-        out = self._run_vcgencmd("get_throttled")
-
-        try:
-            value = int(out.split("=", 1)[1], 16)
-        except (ValueError, IndexError):
-            raise RuntimeError(f"Unexpected vcgencmd output: {out}") from None
+        """Update current and historical flags from sysfs, or vcgencmd as fallback."""
+        value = self._read_throttled()
 
         # Current flags (bits 0-3)
         self._state.current.undervolt = bool(value & (1 << 0))
@@ -36,6 +36,23 @@ class VideoCoreTelemetry:
         """Return flags packed as a byte for telemetry transmission."""
         return self._state.to_byte()
 
+    def _read_throttled(self) -> int:
+        if self._sysfs_available:
+            try:
+                # Example: 50005
+                return int(self.THROTTLED_PATH.read_text().strip(), 16)
+            except (OSError, ValueError):
+                # Do not retry on every update if the driver is not loaded
+                self._sysfs_available = False
+
+        # Example: throttled=0x50005
+        out = self._run_vcgencmd("get_throttled")
+
+        try:
+            return int(out.split("=", 1)[1], 16)
+        except (ValueError, IndexError):
+            raise RuntimeError(f"Unexpected vcgencmd output: {out}") from None
+
     def _run_vcgencmd(self, *args: str) -> str:
         out = subprocess.check_output(
             ["vcgencmd", *args],
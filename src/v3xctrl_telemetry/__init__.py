@@ -5,6 +5,7 @@ from .dataclasses import (
     GpsFixType,
     GpsProtocol,
     GstFlags,
+    LinkInfo,
     LocationInfo,
     ServiceFlags,
     SignalInfo,
@@ -19,6 +20,7 @@ __all__ = [
     "GpsFixType",
     "GpsProtocol",
     "GstFlags",
+    "LinkInfo",
     "LocationInfo",
     "ServiceFlags",
     "SignalInfo",
@@ -161,6 +161,16 @@ class BatteryInfo:
     cur: int = 0  # current in mA
 
 
+@dataclass
+class LinkInfo:
+    """Control channel statistics as seen by the streamer (viewer -> streamer)."""
+
+    loss: float = 0.0  # percent
+    reo: float = 0.0  # percent
+    dup: int = 0
+    bst: int = 0  # longest loss burst in packets
+
+
 @dataclass
 class TelemetryPayload:
     """Complete telemetry payload."""
@@ -172,3 +182,4 @@ class TelemetryPayload:
     svc: int = 0
     vc: int = 0
     gst: int = 0
+    net: LinkInfo = field(default_factory=LinkInfo)
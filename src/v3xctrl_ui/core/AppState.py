@@ -141,9 +141,12 @@ class AppState:
                 logger.warning(f"Input read error: {e}")
             self.timing_controller.mark_control_updated(now)
 
+        self.network_coordinator.request_video_keyframe_if_needed()
+
         # Handle latency checks
         if self.timing_controller.should_check_latency(now):
             self.network_coordinator.send_latency_check()
+            self.osd.update_link_stats(self.network_coordinator.get_sequence_stats())
             self.timing_controller.mark_latency_checked(now)
 
     def tick(self) -> None:
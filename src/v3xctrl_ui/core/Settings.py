@@ -36,6 +36,7 @@ class Settings:
         },
         "udp_packet_ttl": 100,
         "control_buffer_capacity": 1,
+        "control_redundancy": 0,
         "debug": True,
         "show_connection_info": True,
         "timing": {
@@ -49,6 +50,7 @@ class Settings:
             "debug_fps_video": {"display": True},
             "debug_data": {"display": True},
             "debug_latency": {"display": True},
+            "debug_loss": {"display": True},
             "fps": {
                 "width": 100,
                 "height": 75,
@@ -1,12 +1,16 @@
 """Shared telemetry context for accessing telemetry state across components."""
 
 from threading import Lock
+from typing import Any
 
+from v3xctrl_control.message import Telemetry
+from v3xctrl_helper import dict_merge
 from v3xctrl_ui.core.dataclasses import (
     BatteryData,
     GpsData,
     GpsFixType,
     GstFlags,
+    LinkData,
     ServiceFlags,
     SignalData,
     ThrottleFlags,
@@ -31,6 +35,30 @@ class TelemetryContext:
         self._battery = BatteryData()
         self._signal = SignalData()
         self._gps = GpsData()
+        self._uplink = LinkData()
+        self._downlink = LinkData()
+        self._keyframe_id: int | None = None
+        self._keyframe_values: dict[str, Any] = {}
+
+    def reconstruct_telemetry(self, message: Telemetry) -> dict[str, Any] | None:
+        """
+        Reconstruct the full telemetry values from a keyframe or delta message.
+        Returns None if the keyframe a delta is based on is unknown.
+        """
+        with self._lock:
+            if message.keyframe is not None:
+                self._keyframe_id = message.keyframe
+                self._keyframe_values = message.get_values()
+
+                return self._keyframe_values
+
+            if message.base is None:
+                return message.get_values()
+
+            if message.base != self._keyframe_id:
+                return None
+
+            return dict_merge(self._keyframe_values, message.get_values())
 
     def update_services(self, byte_value: int) -> None:
         """Update service flags from telemetry byte."""
@@ -81,6 +109,18 @@ class TelemetryContext:
                 warning=warning,
             )
 
+    def update_uplink(self, link: LinkData) -> None:
+        """Update control channel statistics reported by the streamer (viewer -> streamer)."""
+        with self._lock:
+            self._uplink = LinkData(loss=link.loss, reorder=link.reorder, duplicates=link.duplicates, burst=link.burst)
+
+    def update_downlink(self, link: LinkData) -> None:
+        """Update control channel statistics measured locally (streamer -> viewer)."""
+        with self._lock:
+            self._downlink = LinkData(
+                loss=link.loss, reorder=link.reorder, duplicates=link.duplicates, burst=link.burst
+            )
+
     def get_services(self) -> ServiceFlags:
         """Get current service flags (thread-safe)."""
         with self._lock:
@@ -137,6 +177,26 @@ class TelemetryContext:
                 warning=self._battery.warning,
             )
 
+    def get_uplink(self) -> LinkData:
+        """Get control channel statistics viewer -> streamer (thread-safe)."""
+        with self._lock:
+            return LinkData(
+                loss=self._uplink.loss,
+                reorder=self._uplink.reorder,
+                duplicates=self._uplink.duplicates,
+                burst=self._uplink.burst,
+            )
+
+    def get_downlink(self) -> LinkData:
+        """Get control channel statistics streamer -> viewer (thread-safe)."""
+        with self._lock:
+            return LinkData(
+                loss=self._downlink.loss,
+                reorder=self._downlink.reorder,
+                duplicates=self._downlink.duplicates,
+                burst=self._downlink.burst,
+            )
+
     def reset(self) -> None:
         """Reset all telemetry data to defaults."""
         with self._lock:
@@ -146,3 +206,7 @@ class TelemetryContext:
             self._battery = BatteryData()
             self._signal = SignalData()
             self._gps = GpsData()
+            self._uplink = LinkData()
+            self._downlink = LinkData()
+            self._keyframe_id = None
+            self._keyframe_values = {}
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 from v3xctrl_control.message import Telemetry
-from v3xctrl_ui.core.dataclasses import GpsFixType
+from v3xctrl_ui.core.dataclasses import GpsFixType, LinkData
 
 
 @dataclass
@@ -25,6 +25,7 @@ class TelemetryData:
     service_debug: bool = False
     vc_current_flags: int = 0
     vc_history_flags: int = 0
+    uplink: LinkData = field(default_factory=LinkData)
 
 
 def parse_telemetry(message: Telemetry) -> TelemetryData:
@@ -84,4 +85,13 @@ def parse_telemetry(message: Telemetry) -> TelemetryData:
     data.vc_current_flags = video_core & 0x0F
     data.vc_history_flags = (video_core >> 4) & 0x0F
 
+    # Control channel statistics as seen by the streamer
+    net = values.get("net", {})
+    data.uplink = LinkData(
+        loss=float(net.get("loss", 0.0)),
+        reorder=float(net.get("reo", 0.0)),
+        duplicates=int(net.get("dup", 0)),
+        burst=int(net.get("bst", 0)),
+    )
+
     return data
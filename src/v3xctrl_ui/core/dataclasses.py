@@ -74,3 +74,13 @@ class GpsData:
     fix_type: GpsFixType = GpsFixType.NO_HARDWARE
     speed: float = 0.0
     satellites: str = "0 SAT"
+
+
+@dataclass
+class LinkData:
+    """Sequence statistics of one direction of the control channel."""
+
+    loss: float = 0.0
+    reorder: float = 0.0
+    duplicates: int = 0
+    burst: int = 0
@@ -124,10 +124,21 @@ class NetworkTab(Tab):
             mono_font=MONO_FONT,
             on_change=lambda value: self._on_control_buffer_capacity_change(value),
         )
+        self.control_redundancy_input = NumberInput(
+            t("Control Redundancy"),
+            label_width=180,
+            input_width=75,
+            min_val=0,
+            max_val=5,
+            font=LABEL_FONT,
+            mono_font=MONO_FONT,
+            on_change=lambda value: self._on_control_redundancy_change(value),
+        )
 
         self.misc_widgets: list[BaseInput | BaseWidget] = [
             self.udp_packet_ttl_input,
             self.control_buffer_capacity_input,
+            self.control_redundancy_input,
         ]
 
         self.elements = self.general_widgets + self.relay_widgets + self.misc_widgets
@@ -162,6 +173,7 @@ class NetworkTab(Tab):
         return {
             "udp_packet_ttl": self.udp_packet_ttl,
             "control_buffer_capacity": self.control_buffer_capacity,
+            "control_redundancy": self.control_redundancy,
             "transport": self.transport,
             "ports": self.ports,
             "relay": self.relay,
@@ -174,6 +186,7 @@ class NetworkTab(Tab):
         self.relay = self.settings.get("relay", {})
         self.udp_packet_ttl = self.settings.get("udp_packet_ttl", 100)
         self.control_buffer_capacity = self.settings.get("control_buffer_capacity", 1)
+        self.control_redundancy = self.settings.get("control_redundancy", 0)
 
         # Transport select - defer set_options until positioned (rect != None)
         transport_index = (
@@ -197,6 +210,7 @@ class NetworkTab(Tab):
         # Misc inputs
         self.udp_packet_ttl_input.value = str(self.udp_packet_ttl)
         self.control_buffer_capacity_input.value = str(self.control_buffer_capacity)
+        self.control_redundancy_input.value = str(self.control_redundancy)
 
     def _on_transport_change(self, index: int) -> None:
         self.transport = self._transport_options[index].lower()
@@ -213,6 +227,10 @@ class NetworkTab(Tab):
         if is_int(value):
             self.control_buffer_capacity = int(value)
 
+    def _on_control_redundancy_change(self, value: str) -> None:
+        if is_int(value):
+            self.control_redundancy = int(value)
+
     def _on_relay_enable_change(self, value: bool) -> None:
         self.relay["enabled"] = value
 
@@ -38,6 +38,14 @@ class Commands:
     def trim_decrease() -> Command:
         return Command("trim", {"action": "decrease"})
 
+    @staticmethod
+    def telemetry_keyframe() -> Command:
+        return Command("telemetry", {"action": "keyframe"})
+
+    @staticmethod
+    def video_keyframe() -> Command:
+        return Command("video", {"action": "keyframe"})
+
     @staticmethod
     def shutdown() -> Command:
         return Command("shutdown")
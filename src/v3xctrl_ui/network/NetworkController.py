@@ -3,7 +3,7 @@ import threading
 import time
 from typing import Any
 
-from v3xctrl_control import Server
+from v3xctrl_control import SequenceStats, Server
 from v3xctrl_control.message import Latency
 from v3xctrl_tcp.TcpTunnel import TcpTunnel
 from v3xctrl_ui.core.Settings import Settings
@@ -31,6 +31,7 @@ class NetworkController:
         self.video_keep_alive = None
         self.server: Server | None = None
         self.server_error = None
+        self.rtt_ms: float | None = None
         self.tcp_server: TcpServer | None = None
         self.tcp_video_tunnel: TcpTunnel | None = None
         self.tcp_control_tunnel: TcpTunnel | None = None
@@ -68,9 +69,21 @@ class NetworkController:
         self._setup_thread = threading.Thread(target=self._setup_ports_task, daemon=True)
         self._setup_thread.start()
 
+    def record_rtt(self, rtt_ms: float) -> None:
+        """RTT of a latency check, reported to the streamer with the next one."""
+        self.rtt_ms = rtt_ms
+
     def send_latency_check(self) -> None:
         if self.server and not self.server_error:
-            self.server.send(Latency())
+            loss = self.server.get_sequence_stats().loss_percent
+            video_loss = self.video_receiver.get_video_loss() if self.video_receiver else None
+            self.server.send(
+                Latency(
+                    ls=round(loss, 1),
+                    rt=round(self.rtt_ms, 1) if self.rtt_ms is not None else None,
+                    vl=round(video_loss, 2) if video_loss is not None else None,
+                )
+            )
 
     def get_data_queue_size(self) -> int:
         if self.server and not self.server_error:
@@ -84,6 +97,12 @@ class NetworkController:
 
         return 0
 
+    def get_sequence_stats(self) -> SequenceStats:
+        if self.server and not self.server_error:
+            return self.server.get_sequence_stats()
+
+        return SequenceStats()
+
     def update_ttl(self, ttl_ms: int) -> None:
         if self.server:
             self.server.update_ttl(ttl_ms)
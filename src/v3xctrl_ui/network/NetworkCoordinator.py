@@ -7,10 +7,11 @@ import time
 from collections.abc import Callable
 from typing import Any
 
-from v3xctrl_control import State
+from v3xctrl_control import SequenceStats, State
 from v3xctrl_control.message import Command, Control, Latency, Telemetry
 from v3xctrl_ui.core.dataclasses import ApplicationModel
 from v3xctrl_ui.core.Settings import Settings
+from v3xctrl_ui.network.Commands import Commands
 from v3xctrl_ui.network.NetworkController import NetworkController
 from v3xctrl_ui.network.video.ClockOffset import ClockOffset
 from v3xctrl_ui.osd.OSD import OSD
@@ -44,6 +45,8 @@ class NetworkCoordinator:
         # collects callbacks to be processed on the main thread.
         self._callback_queue: queue.Queue[tuple[Callable, tuple]] = queue.Queue()
 
+        self.osd.on_keyframe_request = self.request_telemetry_keyframe
+
     def create_network_controller(self, settings: Settings) -> NetworkController:
         handlers = self._create_handlers()
         return NetworkController(settings, handlers, self.clock_offset)
@@ -104,6 +107,31 @@ class NetworkCoordinator:
             logger.error(f"Server is not set, cannot send command: {command}")
             callback(False)
 
+    def request_telemetry_keyframe(self) -> None:
+        """Ask the streamer for a full telemetry keyframe, e.g. after reconnecting."""
+        # Skip in spectator mode, the streamer sends keyframes periodically anyway
+        if self.network_controller and self.network_controller.relay_spectator_mode:
+            return
+
+        if self.network_controller and self.network_controller.server:
+            self.network_controller.server.send_command(Commands.telemetry_keyframe(), max_retries=3)
+
+    def request_video_keyframe_if_needed(self) -> None:
+        """Ask the streamer for a keyframe when the video receiver lost data."""
+        controller = self.network_controller
+        if not controller or not controller.video_receiver:
+            return
+
+        if not controller.video_receiver.take_keyframe_request():
+            return
+
+        # Spectators can not control the streamer
+        if controller.relay_spectator_mode or not controller.server:
+            return
+
+        # A late keyframe is useless, the periodic one would be there by then
+        controller.server.send_command(Commands.video_keyframe(), max_retries=2, timeout=1.0)
+
     def send_latency_check(self) -> None:
         # Skip latency checks in spectator mode
         if self.network_controller and self.network_controller.relay_spectator_mode:
@@ -141,6 +169,12 @@ class NetworkCoordinator:
 
         return 0
 
+    def get_sequence_stats(self) -> SequenceStats:
+        if self.network_controller:
+            return self.network_controller.get_sequence_stats()
+
+        return SequenceStats()
+
     def get_video_buffer_size(self) -> int:
         if self.network_controller and self.network_controller.video_receiver:
             return len(self.network_controller.video_receiver.frame_buffer)
@@ -183,7 +217,10 @@ class NetworkCoordinator:
         def latency_handler(message: Latency, address: tuple[str, int]) -> None:
             self.osd.message_handler(message)
             if message.streamer_timestamp is not None:
-                self.clock_offset.update(message.timestamp, message.streamer_timestamp, time.time())
+                now = time.time()
+                self.clock_offset.update(message.timestamp, message.streamer_timestamp, now)
+                if self.network_controller:
+                    self.network_controller.record_rtt((now - message.timestamp) * 1000)
 
         return {
             "messages": [
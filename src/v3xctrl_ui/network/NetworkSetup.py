@@ -15,6 +15,7 @@ from v3xctrl_relay.Peer import Peer
 from v3xctrl_relay.Role import Role
 from v3xctrl_tcp import Transport
 from v3xctrl_tcp.TcpTunnel import TcpTunnel
+from v3xctrl_tcp.TunnelEngine import TunnelEngine
 from v3xctrl_ui.core.Settings import Settings
 from v3xctrl_ui.network.TcpServer import TcpServer
 from v3xctrl_ui.network.video.Receiver import Receiver
@@ -159,6 +160,9 @@ class NetworkSetup:
             spectator_mode = relay_config.get("spectator_mode", False)
             role = Role.SPECTATOR if spectator_mode else Role.VIEWER
 
+            # Both tunnels run on one thread
+            engine = TunnelEngine("TcpTunnel-relay")
+
             video_handshake = PeerAnnouncement(r=role.value, i=session_id, p=PortType.VIDEO.value).to_bytes()
             result.tcp_video_tunnel = TcpTunnel(
                 remote_host=relay_host,
@@ -166,6 +170,7 @@ class NetworkSetup:
                 local_component_port=self.video_port,
                 bidirectional=True,
                 handshake=video_handshake,
+                engine=engine,
             )
             result.tcp_video_tunnel.start()
 
@@ -176,6 +181,7 @@ class NetworkSetup:
                 local_component_port=self.control_port,
                 bidirectional=True,
                 handshake=control_handshake,
+                engine=engine,
             )
             result.tcp_control_tunnel.start()
 
@@ -412,7 +418,8 @@ class NetworkSetup:
         try:
             udp_ttl_ms = self.settings.get("udp_packet_ttl", 100)
             control_buffer_capacity = self.settings.get("control_buffer_capacity", 1)
-            server = Server(self.control_port, udp_ttl_ms, control_buffer_capacity)
+            control_redundancy = self.settings.get("control_redundancy", 0)
+            server = Server(self.control_port, udp_ttl_ms, control_buffer_capacity, control_redundancy)
 
             for message_type, callback in message_handlers:
                 server.subscribe(message_type, callback)
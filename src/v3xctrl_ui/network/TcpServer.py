@@ -10,28 +10,53 @@ and the streamer connects as a client.
 Each channel (video, control) runs independently:
 - Video: TCP inbound -> UDP to localhost:videoPort (unidirectional)
 - Control: TCP inbound -> UDP to localhost:controlPort, UDP replies -> TCP outbound
+
+Both channels run as callbacks on one TunnelEngine thread. A channel serves
+one connection at a time, further connections wait in the backlog.
 """
 
 import logging
-import select
+import selectors
 import socket
 import threading
+from dataclasses import dataclass
 
-from v3xctrl_tcp.framing import recv_message, send_message
+from v3xctrl_tcp.FrameReader import FrameReader
+from v3xctrl_tcp.FrameWriter import FrameWriter
 from v3xctrl_tcp.keepalive import configure_keepalive
 from v3xctrl_tcp.send_timeout import configure_send_timeout
+from v3xctrl_tcp.TunnelEngine import TunnelEngine
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _Channel:
+    port: int
+    bidirectional: bool
+    listener: socket.socket
+    tcp_sock: socket.socket | None = None
+    udp_sock: socket.socket | None = None
+    reader: FrameReader | None = None
+    writer: FrameWriter | None = None
+
+    @property
+    def name(self) -> str:
+        return "control" if self.bidirectional else "video"
+
+
 class TcpServer:
     """TCP server that bridges TCP connections to local UDP components."""
 
-    def __init__(self, video_port: int, control_port: int) -> None:
+    def __init__(self, video_port: int, control_port: int, engine: TunnelEngine | None = None) -> None:
         self.video_port = video_port
         self.control_port = control_port
-        self._stop_event = threading.Event()
-        self._threads: list[threading.Thread] = []
+        self._engine = engine or TunnelEngine("TcpServer")
+        self._started = False
+        self._closed = threading.Event()
+        self._channels: list[_Channel] = []
+        self._video_udp_port: int | None = None
+        self._control_udp_port: int | None = None
 
     @property
     def ephemeral_video_port(self) -> int | None:
@@ -44,137 +69,145 @@ class TcpServer:
         return self._control_udp_port
 
     def start(self) -> None:
-        self._stop_event.clear()
-        self._video_udp_port: int | None = None
-        self._control_udp_port: int | None = None
+        if self._started:
+            return
+
+        self._video_udp_port = None
+        self._control_udp_port = None
 
-        video_thread = threading.Thread(
-            target=self._run_channel,
-            args=(self.video_port, False),
-            name="TcpServer-video",
-            daemon=True,
-        )
-        control_thread = threading.Thread(
-            target=self._run_channel,
-            args=(self.control_port, True),
-            name="TcpServer-control",
-            daemon=True,
-        )
-        self._threads = [video_thread, control_thread]
-        video_thread.start()
-        control_thread.start()
+        self._started = True
+        self._closed.clear()
+        self._engine.attach()
+        self._engine.call_soon(lambda: self._listen(self.video_port, False))
+        self._engine.call_soon(lambda: self._listen(self.control_port, True))
 
     def stop(self) -> None:
-        self._stop_event.set()
+        if not self._started:
+            return
+
+        self._started = False
+        if self._engine.in_engine_thread:
+            self._shutdown()
+        else:
+            self._engine.call_soon(self._shutdown)
+            self._closed.wait(timeout=5.0)
+
+        self._engine.detach()
 
-        for t in self._threads:
-            t.join(timeout=2.0)
+    def _shutdown(self) -> None:
+        for channel in self._channels:
+            self._close_connection(channel)
+            self._engine.unregister(channel.listener)
+            channel.listener.close()
 
-        self._threads.clear()
+        self._channels.clear()
+        self._closed.set()
 
-    def _run_channel(self, port: int, bidirectional: bool) -> None:
-        """Accept loop for a single channel (video or control)."""
-        tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        tcp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    def _listen(self, port: int, bidirectional: bool) -> None:
+        """Open the listening socket of a single channel (video or control)."""
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
         try:
-            tcp_sock.bind(("0.0.0.0", port))
-            tcp_sock.listen(1)
-            tcp_sock.settimeout(1.0)
-            channel = "control" if bidirectional else "video"
-            logger.info(f"TCP server listening on port {port} ({channel})")
+            listener.bind(("0.0.0.0", port))
+            listener.listen(1)
+            listener.setblocking(False)
 
         except OSError:
             logger.error(f"Failed to bind TCP server on port {port}")
+            listener.close()
             return
 
+        channel = _Channel(port, bidirectional, listener)
+        self._channels.append(channel)
+        self._engine.register(listener, selectors.EVENT_READ, lambda _events: self._accept(channel))
+
+        logger.info(f"TCP server listening on port {port} ({channel.name})")
+
+    def _accept(self, channel: _Channel) -> None:
         try:
-            while not self._stop_event.is_set():
-                # Accept a connection (with timeout so we can check stop_event)
-                try:
-                    client_sock, addr = tcp_sock.accept()
-                except TimeoutError:
-                    continue
-
-                client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-                configure_keepalive(client_sock)
-                configure_send_timeout(client_sock, 200)
-                logger.info(f"TCP client connected on port {port} from {addr}")
-
-                # Fresh UDP socket per connection so outbound threads from
-                # prior (disconnected) connections don't steal UDP replies.
-                udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                udp_sock.bind(("127.0.0.1", 0))
-                ephemeral_port = udp_sock.getsockname()[1]
-
-                if bidirectional:
-                    self._control_udp_port = ephemeral_port
-                else:
-                    self._video_udp_port = ephemeral_port
-
-                self._handle_connection(client_sock, udp_sock, port, bidirectional)
-
-                udp_sock.close()
-                logger.info(f"TCP client disconnected on port {port}")
-
-        finally:
-            tcp_sock.close()
-
-    def _handle_connection(
-        self,
-        tcp_sock: socket.socket,
-        udp_sock: socket.socket,
-        local_port: int,
-        bidirectional: bool,
-    ) -> None:
-        """Handle a single TCP connection, forwarding data to/from UDP."""
-        outbound_thread: threading.Thread | None = None
-
-        if bidirectional:
-            # Start outbound thread: UDP replies on ephemeral port -> TCP
-            outbound_thread = threading.Thread(
-                target=self._outbound_loop,
-                args=(tcp_sock, udp_sock),
-                name=f"TcpServer-out-{local_port}",
-                daemon=True,
-            )
-            outbound_thread.start()
-
-        # Inbound: TCP -> UDP to localhost:local_port
+            tcp_sock, addr = channel.listener.accept()
+        except BlockingIOError:
+            return
+
+        # Blocking, so SO_SNDTIMEO bounds sends. Reads only happen once
+        # select reported the socket readable.
+        tcp_sock.setblocking(True)
+        tcp_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        configure_keepalive(tcp_sock)
+        configure_send_timeout(tcp_sock, 200)
+        logger.info(f"TCP client connected on port {channel.port} from {addr}")
+
+        # Fresh UDP socket per connection so replies meant for a prior
+        # (disconnected) connection are not forwarded to this one.
+        udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        udp_sock.bind(("127.0.0.1", 0))
+        ephemeral_port = udp_sock.getsockname()[1]
+
+        if channel.bidirectional:
+            self._control_udp_port = ephemeral_port
+        else:
+            self._video_udp_port = ephemeral_port
+
+        channel.tcp_sock = tcp_sock
+        channel.udp_sock = udp_sock
+        channel.reader = FrameReader(tcp_sock)
+
+        # One connection at a time, the next one is accepted after this one ends
+        self._engine.unregister(channel.listener)
+        self._engine.register(tcp_sock, selectors.EVENT_READ, lambda _events: self._inbound(channel))
+
+        if channel.bidirectional:
+            channel.writer = FrameWriter(tcp_sock, engine=self._engine, on_error=lambda: self._disconnect(channel))
+            self._engine.register(udp_sock, selectors.EVENT_READ, lambda _events: self._outbound(channel))
+
+    def _inbound(self, channel: _Channel) -> None:
+        """TCP -> UDP to localhost:port of the channel."""
+        assert channel.reader is not None
+        assert channel.udp_sock is not None
+
+        target = ("127.0.0.1", channel.port)
         try:
-            while not self._stop_event.is_set():
-                # Wait for TCP data with timeout so stop_event can be checked
-                readable, _, _ = select.select([tcp_sock], [], [], 1.0)
-                if not readable:
-                    continue
-                data = recv_message(tcp_sock)
-                if data is None:
-                    break
-                udp_sock.sendto(data, ("127.0.0.1", local_port))
+            frames = channel.reader.read_frames()
+            if frames is None:
+                self._disconnect(channel)
+                return
+
+            for frame in frames:
+                channel.udp_sock.sendto(frame, target)
 
         except OSError:
-            pass
+            self._disconnect(channel)
+
+    def _outbound(self, channel: _Channel) -> None:
+        """UDP replies on ephemeral port -> TCP."""
+        assert channel.writer is not None
+        assert channel.udp_sock is not None
 
-        finally:
-            tcp_sock.close()
-            if outbound_thread is not None:
-                outbound_thread.join(timeout=2.0)
-
-    def _outbound_loop(
-        self,
-        tcp_sock: socket.socket,
-        udp_sock: socket.socket,
-    ) -> None:
-        """Read UDP replies on ephemeral port, forward over TCP."""
         try:
-            while not self._stop_event.is_set():
-                readable, _, _ = select.select([udp_sock], [], [], 1.0)
-                if not readable:
-                    continue
+            if channel.writer.forward_from(channel.udp_sock):
+                return
+        except OSError:
+            pass
 
-                data, _addr = udp_sock.recvfrom(65535)
-                if not send_message(tcp_sock, data):
-                    break
+        self._disconnect(channel)
 
-        except (OSError, ValueError):
-            pass
+    def _disconnect(self, channel: _Channel) -> None:
+        self._close_connection(channel)
+        logger.info(f"TCP client disconnected on port {channel.port}")
+
+        self._engine.register(channel.listener, selectors.EVENT_READ, lambda _events: self._accept(channel))
+
+    def _close_connection(self, channel: _Channel) -> None:
+        if channel.writer is not None:
+            channel.writer.discard()
+
+        for sock in (channel.tcp_sock, channel.udp_sock):
+            if sock is not None:
+                self._engine.unregister(sock)
+                sock.close()
+
+        channel.tcp_sock = None
+        channel.udp_sock = None
+        channel.reader = None
+        channel.writer = None
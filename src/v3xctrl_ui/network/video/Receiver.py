@@ -68,8 +68,24 @@ class Receiver(ABC, threading.Thread):
     1. It was broken
     2. It arrived too late (previous frames have already been shown)
     3. It arrived in a burst
+
+    Broken frames (lost packets, decode errors) leave the picture corrupted
+    until the next I-frame. Receivers flag those so a keyframe can be
+    requested from the streamer instead of waiting for the periodic one.
+
+    Streams in intra refresh mode have no periodic I-frames, every refresh
+    cycle starts with a recovery point SEI instead and the picture heals on
+    its own within a cycle. While recovery points arrive, a keyframe is only
+    requested if the stream is still broken after a full cycle.
     """
 
+    # Minimum seconds between keyframe requests
+    KEYFRAME_REQUEST_INTERVAL = 1.0
+
+    # Seconds without a recovery point after which the stream is no longer
+    # treated as intra refresh
+    RECOVERY_POINT_TIMEOUT = 3.0
+
     def __init__(
         self,
         port: int,
@@ -131,6 +147,16 @@ class Receiver(ABC, threading.Thread):
 
         self.last_time = time.monotonic()
 
+        self._keyframe_needed = threading.Event()
+        self._last_keyframe_request = 0.0
+        self.keyframe_requests = 0
+
+        self._last_recovery_point: float | None = None
+        self._recovery_cycle = 0.0
+        self._broken_since: float | None = None
+        self.recovery_points = 0
+        self.keyframe_requests_avoided = 0
+
     @abstractmethod
     def _setup(self) -> None:
         """Setup resources (SDP files, containers, etc.)."""
@@ -311,6 +337,70 @@ class Receiver(ABC, threading.Thread):
 
         self.decoded_frame_count += 1
 
+    def _request_keyframe(self, reason: str) -> None:
+        """Flag that the stream is broken and needs a keyframe to recover."""
+        now = time.monotonic()
+
+        if self._is_intra_refresh(now):
+            if self._broken_since is None:
+                self._broken_since = now
+            if now - self._broken_since <= self._recovery_cycle:
+                self.keyframe_requests_avoided += 1
+                return
+
+        if now - self._last_keyframe_request < self.KEYFRAME_REQUEST_INTERVAL:
+            return
+
+        self._broken_since = None
+
+        self._last_keyframe_request = now
+        self.keyframe_requests += 1
+        self._keyframe_needed.set()
+        logger.debug(f"Requesting keyframe: {reason}")
+
+    @property
+    def intra_refresh(self) -> bool:
+        """True while the stream carries recovery points."""
+        return self._is_intra_refresh(time.monotonic())
+
+    def _is_intra_refresh(self, now: float) -> bool:
+        if self._last_recovery_point is None:
+            return False
+
+        return now - self._last_recovery_point < self.RECOVERY_POINT_TIMEOUT
+
+    def _on_recovery_point(self, recovery_frame_count: int) -> None:
+        """
+        A refresh cycle started, the picture is complete again after
+        `recovery_frame_count` more frames.
+        """
+        now = time.monotonic()
+        self.recovery_points += 1
+
+        # Damage from before a cycle is gone once the cycle has completed,
+        # allow for two cycles since the damage can be anywhere in the current one
+        self._recovery_cycle = 2 * (recovery_frame_count + 1) / self.target_fps
+
+        if self._broken_since is not None and now - self._broken_since > self._recovery_cycle:
+            self._broken_since = None
+
+        self._last_recovery_point = now
+
+    def take_keyframe_request(self) -> bool:
+        """Returns True once per flagged keyframe request."""
+        if not self._keyframe_needed.is_set():
+            return False
+
+        self._keyframe_needed.clear()
+        return True
+
+    def get_video_loss(self) -> float | None:
+        """
+        Loss of video packets in percent since the previous call, None if the
+        receiver can not tell.
+        """
+        return None
+
     def set_clock_offset(self, clock_offset: "ClockOffset") -> None:
         """Set the clock offset tracker for e2e latency measurement.
 
@@ -5,7 +5,7 @@ from collections.abc import Callable
 import gi
 import numpy as np
 
-from v3xctrl_helper import parse_sei_nal
+from v3xctrl_helper import detect_framing, parse_recovery_point, parse_sei_nal
 from v3xctrl_ui.network.video.ClockOffset import ClockOffset
 from v3xctrl_ui.network.video.Receiver import Receiver
 
@@ -39,6 +39,9 @@ class ReceiverGst(Receiver):
 
         self.pipeline: Gst.Pipeline | None = None
         self.appsink: GstApp.AppSink | None = None
+        self.jitterbuffer: Gst.Element | None = None
+        self._packets_lost = 0
+        self._loss_report: tuple[int, int] = (0, 0)
         self.loop: GLib.MainLoop | None = None
 
         self.latest_pts: int | None = None
@@ -60,6 +63,7 @@ class ReceiverGst(Receiver):
         # SEI-based end-to-end latency (only used when timing_enabled)
         self._clock_offset: ClockOffset | None = None
         self._sei_timestamps: dict[int, int] = {}
+        self._sei_framing: str | None = None
         self._timing_e2e_samples: list[float] = []
 
         # Cached frame dimensions and pre-allocated buffer
@@ -110,14 +114,29 @@ class ReceiverGst(Receiver):
         return Gst.PadProbeReturn.OK
 
     def _on_sei_extract_probe(self, pad: Gst.Pad, info: Gst.PadProbeInfo) -> Gst.PadProbeReturn:
-        """Extract SEI timestamp from H.264 data after depayloading."""
+        """Extract recovery points and SEI timestamps from H.264 data after depayloading."""
         buffer = info.get_buffer()
         if buffer and buffer.pts != Gst.CLOCK_TIME_NONE:
             ok, map_info = buffer.map(Gst.MapFlags.READ)
             if ok:
-                data = bytes(map_info.data)
-                buffer.unmap(map_info)
-                result = parse_sei_nal(data)
+                # Parse straight from the mapped memory, the framing does not
+                # change within a stream so it is only detected once
+                result = None
+                recovery_frame_count = None
+                try:
+                    data = map_info.data
+                    if self._sei_framing is None:
+                        self._sei_framing = detect_framing(data)
+
+                    recovery_frame_count = parse_recovery_point(data, self._sei_framing)
+                    if self.timing_enabled:
+                        result = parse_sei_nal(data, self._sei_framing)
+                finally:
+                    buffer.unmap(map_info)
+
+                if recovery_frame_count is not None:
+                    self._on_recovery_point(recovery_frame_count)
+
                 if result is not None:
                     # Cap dict size to prevent leaks from dropped frames
                     if len(self._sei_timestamps) > 300:
@@ -151,6 +170,9 @@ class ReceiverGst(Receiver):
 
         jitterbuffer.set_property("latency", 0)
         jitterbuffer.set_property("drop-on-latency", True)
+        self.jitterbuffer = jitterbuffer
+        self._packets_lost = 0
+        self._loss_report = (0, 0)
 
         # RTP H264 depayloader
         depay = Gst.ElementFactory.make("rtph264depay", "depay")
@@ -252,19 +274,22 @@ class ReceiverGst(Receiver):
             if decoder_sink:
                 decoder_sink.add_probe(Gst.PadProbeType.BUFFER, self._on_decoder_entry_probe)
 
-            # SEI extraction for e2e latency (probe depay output = Annex B)
+            # SEI extraction for e2e latency
             self._sei_timestamps = {}
             self._timing_e2e_samples = []
 
-            depay_src = depay.get_static_pad("src")
-            if depay_src:
-                depay_src.add_probe(Gst.PadProbeType.BUFFER, self._on_sei_extract_probe)
+        # Recovery points (and timestamps) from the depay output = Annex B
+        self._sei_framing = None
+        depay_src = depay.get_static_pad("src")
+        if depay_src:
+            depay_src.add_probe(Gst.PadProbeType.BUFFER, self._on_sei_extract_probe)
 
         # Setup bus message handling
         bus = self.pipeline.get_bus()
         bus.add_signal_watch()
         bus.connect("message::error", self._on_error)
         bus.connect("message::eos", self._on_eos)
+        bus.connect("message::warning", self._on_warning)
         bus.connect("message::state-changed", self._on_state_changed)
 
         return True
@@ -386,6 +411,54 @@ class ReceiverGst(Receiver):
         if self.loop and self.loop.is_running():
             self.loop.quit()
 
+    def _on_warning(self, bus: Gst.Bus, message: Gst.Message) -> None:
+        """The decoder posts warnings for frames it could not decode."""
+        if message.src is not None and message.src.get_name() == "decoder":
+            self._request_keyframe("decode error")
+
+    def _check_packet_loss(self) -> None:
+        """Request a keyframe when the jitterbuffer saw sequence gaps."""
+        if self.jitterbuffer is None:
+            return
+
+        stats = self.jitterbuffer.get_property("stats")
+        if stats is None:
+            return
+
+        ok, lost = stats.get_uint64("num-lost")
+        if not ok:
+            return
+
+        if lost > self._packets_lost:
+            self._request_keyframe(f"{lost - self._packets_lost} packets lost")
+
+        self._packets_lost = lost
+
+    def get_video_loss(self) -> float | None:
+        """Loss from the jitterbuffer counters since the previous call."""
+        jitterbuffer = self.jitterbuffer
+        if jitterbuffer is None:
+            return None
+
+        stats = jitterbuffer.get_property("stats")
+        if stats is None:
+            return None
+
+        ok_lost, lost = stats.get_uint64("num-lost")
+        ok_pushed, pushed = stats.get_uint64("num-pushed")
+        if not ok_lost or not ok_pushed:
+            return None
+
+        last_lost, last_pushed = self._loss_report
+        self._loss_report = (lost, pushed)
+
+        lost_delta = max(0, lost - last_lost)
+        expected = lost_delta + max(0, pushed - last_pushed)
+        if expected == 0:
+            return None
+
+        return lost_delta / expected * 100
+
     def _on_eos(self, bus: Gst.Bus, message: Gst.Message) -> None:
         """Handle end of stream."""
         logger.info("End of stream received")
@@ -429,6 +502,7 @@ class ReceiverGst(Receiver):
                     return False
 
                 self._check_timeout()
+                self._check_packet_loss()
                 return True
 
             GLib.timeout_add(100, check_running)
@@ -453,6 +527,7 @@ class ReceiverGst(Receiver):
             self.pipeline.set_state(Gst.State.NULL)
             self.pipeline = None
             self.appsink = None
+            self.jitterbuffer = None
 
         if self.loop and self.loop.is_running():
             self.loop.quit()
@@ -8,6 +8,8 @@ from pathlib import Path
 
 import av
 
+from v3xctrl_helper import parse_recovery_point
+from v3xctrl_helper.sei import FRAMING_ANNEX_B
 from v3xctrl_ui.network.video.Receiver import Receiver
 from v3xctrl_ui.network.video.UdpVideoProxy import UdpVideoProxy
 
@@ -149,6 +151,7 @@ class ReceiverPyAV(Receiver):
                         break
 
                     self.packet_count += 1
+                    self._check_recovery_point(packet)
 
                     if self._should_drop_packet_by_age(packet, stream):
                         self.dropped_old_frames += 1
@@ -171,6 +174,7 @@ class ReceiverPyAV(Receiver):
                         decoded_frames = list(packet.decode())
                     except av.AVError as e:
                         consecutive_decode_errors += 1
+                        self._request_keyframe("decode error")
                         if consecutive_decode_errors >= 30:
                             logger.warning(
                                 f"Too many consecutive decode errors "
@@ -254,6 +258,12 @@ a=recvonly
 
         logger.debug(f"SDP written: {self.sdp_path} (listen={listen_addr}:{listen_port})")
 
+    def _check_recovery_point(self, packet: av.Packet) -> None:
+        # RTP depayloaded packets are always Annex B, the buffer is not copied
+        recovery_frame_count = parse_recovery_point(memoryview(packet), FRAMING_ANNEX_B)
+        if recovery_frame_count is not None:
+            self._on_recovery_point(recovery_frame_count)
+
     def _should_drop_packet_by_age(self, packet: av.Packet, stream: av.VideoStream) -> bool:
         if packet.pts is None:
             return False
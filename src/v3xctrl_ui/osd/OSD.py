@@ -1,13 +1,15 @@
 import logging
 import time
 from collections import deque
+from collections.abc import Callable
 from typing import ClassVar
 
 import pygame
 
+from v3xctrl_control import SequenceStats
 from v3xctrl_control.message import Latency, Message, Telemetry
 from v3xctrl_helper import SlidingWindowAverage
-from v3xctrl_ui.core.dataclasses import GpsFixType
+from v3xctrl_ui.core.dataclasses import GpsFixType, LinkData
 from v3xctrl_ui.core.Settings import Settings
 from v3xctrl_ui.core.TelemetryContext import TelemetryContext
 from v3xctrl_ui.core.TelemetryParser import parse_telemetry
@@ -43,12 +45,17 @@ class OSD:
         self.debug_data: str | None = None
         self.debug_latency: str | None = None
         self.debug_buffer: str | None = None
+        self.debug_loss: str | None = None
         self.loop_history: deque[float] | None = None
         self.video_history: deque[float] | None = None
         self.is_spectator: bool = False
         self.throttle: float = 0.0
         self.steering: float = 0.0
 
+        # Invoked when telemetry deltas can not be applied for lack of a keyframe
+        self.on_keyframe_request: Callable[[], None] | None = None
+        self._keyframe_requested_for: int | None = None
+
         self._latency_samples = SlidingWindowAverage(window_seconds=1.0)
 
         self.widgets_debug: dict[str, Widget] = {}
@@ -148,6 +155,18 @@ class OSD:
     def update_debug_status(self, status: str) -> None:
         self.debug_data = status
 
+    def update_link_stats(self, stats: SequenceStats) -> None:
+        """Update locally measured statistics of the streamer -> viewer direction."""
+        self.telemetry_context.update_downlink(
+            LinkData(
+                loss=stats.loss_percent,
+                reorder=stats.reorder_percent,
+                duplicates=stats.duplicates,
+                burst=stats.max_burst,
+            )
+        )
+        self._update_loss_widget()
+
     def render(self, screen: pygame.Surface, loop_history: deque[float], video_history: deque[float] | None) -> None:
         self.loop_history = loop_history
         self.video_history = video_history
@@ -173,8 +192,11 @@ class OSD:
         self.debug_data = None
         self.debug_latency = None
         self.debug_buffer = None
+        self.debug_loss = None
+        self._keyframe_requested_for = None
 
         self.widgets_debug["debug_latency"].set_value(None)
+        self.widgets_debug["debug_loss"].set_value(None)
         self.telemetry_context.reset()
         self.widgets_gps["gps_fix"].set_text_color(WHITE)
 
@@ -227,9 +249,31 @@ class OSD:
 
         self.widgets_debug["debug_latency"].set_value(avg_ms)
 
+    def _update_loss_widget(self) -> None:
+        """Show the worse of both control channel directions."""
+        uplink = self.telemetry_context.get_uplink()
+        downlink = self.telemetry_context.get_downlink()
+        loss = max(uplink.loss, downlink.loss)
+
+        if loss <= 1:
+            self.debug_loss = "green"
+        elif loss <= 5:
+            self.debug_loss = "yellow"
+        else:
+            self.debug_loss = "red"
+
+        self.widgets_debug["debug_loss"].set_value(round(loss))
+
     def _telemetry_update(self, message: Telemetry) -> None:
+        values = self.telemetry_context.reconstruct_telemetry(message)
+        if values is None:
+            if self.on_keyframe_request and self._keyframe_requested_for != message.base:
+                self._keyframe_requested_for = message.base
+                self.on_keyframe_request()
+            return
+
+        message = Telemetry(values, timestamp=message.timestamp)
         data = parse_telemetry(message)
-        values = message.get_values()
 
         self.telemetry_context.update_signal_quality(values["sig"]["rsrq"], values["sig"]["rsrp"])
         self.telemetry_context.update_signal_band(data.signal_band)
@@ -252,6 +296,8 @@ class OSD:
         self.telemetry_context.update_services(values.get("svc", 0))
         self.telemetry_context.update_gst(values.get("gst", 0))
         self.telemetry_context.update_videocore(values.get("vc", 0))
+        self.telemetry_context.update_uplink(data.uplink)
+        self._update_loss_widget()
 
         color = RED if data.battery_warning else WHITE
         for widget_name in ["battery_voltage", "battery_average_voltage", "battery_percent", "battery_current"]:
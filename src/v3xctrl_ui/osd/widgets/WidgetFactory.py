@@ -79,6 +79,7 @@ def create_debug_widgets(fps_width: int, fps_height: int) -> dict[str, Widget]:
     debug_data_widget = StatusValueWidget(position, 26, "CTRL", average=True)
     debug_latency_widget = StatusValueWidget(position, 26, "LATENCY")
     debug_buffer_widget = StatusValueWidget(position, 26, "BUFFER", average=True, average_window=2)
+    debug_loss_widget = StatusValueWidget(position, 26, "LOSS")
 
     return {
         "debug_fps_loop": debug_fps_loop_widget,
@@ -86,6 +87,7 @@ def create_debug_widgets(fps_width: int, fps_height: int) -> dict[str, Widget]:
         "debug_data": debug_data_widget,
         "debug_latency": debug_latency_widget,
         "debug_buffer": debug_buffer_widget,
+        "debug_loss": debug_loss_widget,
     }
 
 
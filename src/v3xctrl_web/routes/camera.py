@@ -53,7 +53,7 @@ class CameraSetting(MethodView):
         except Exception as e:
             return error("Unexpected error", str(e))
 
-    @blueprint.response(200, description="Set a camera setting via v3xctrl-video-control")
+    @blueprint.response(200, description="Queue a camera setting change via v3xctrl-video-control")
     def put(self, name: str) -> tuple[Response, int]:
         try:
             data = request.get_json()
@@ -65,7 +65,7 @@ class CameraSetting(MethodView):
 
             output = (
                 subprocess.check_output(
-                    ["v3xctrl-video-control", "set", "camera", name, str(value)], stderr=subprocess.STDOUT
+                    ["v3xctrl-video-control", "apply", "camera", name, str(value)], stderr=subprocess.STDOUT
                 )
                 .decode()
                 .strip()
@@ -4,6 +4,8 @@ from flask import Response
 from flask.views import MethodView
 from flask_smorest import Blueprint
 
+from v3xctrl_telemetry.ServiceStatusProvider import ServiceStatus, ServiceStatusProvider
+
 from .response import error, success
 
 blueprint = Blueprint("service", "service", url_prefix="/service", description="Systemd service control")
@@ -22,33 +24,20 @@ SERVICES = [
 ]
 
 
+# Shared by all requests, the service list is queried with a single systemctl
+# call and cached briefly, so a polling UI does not fork a process per service.
+status_provider = ServiceStatusProvider(SERVICES, max_age=1.0)
+
+
+def serialize(status: ServiceStatus) -> dict[str, str]:
+    return {"name": status.name, "type": status.type, "state": status.state, "result": status.result}
+
+
 @blueprint.route("/")
 class ListServices(MethodView):
     @blueprint.response(200, description="List all monitored systemd services with state info")
     def get(self) -> tuple[Response, int]:
-        services = []
-
-        for service in SERVICES:
-            try:
-                output = (
-                    subprocess.check_output(
-                        ["systemctl", "show", service, "--property=Type,ActiveState,Result"], stderr=subprocess.DEVNULL
-                    )
-                    .decode()
-                    .strip()
-                )
-
-                props = dict(line.split("=", 1) for line in output.splitlines())
-                service_type = props.get("Type", "")
-                active_state = props.get("ActiveState", "")
-                result = props.get("Result", "")
-
-            except subprocess.CalledProcessError:
-                service_type = "unknown"
-                active_state = "unknown"
-                result = "error"
-
-            services.append({"name": service, "type": service_type, "state": active_state, "result": result})
+        services = [serialize(status) for status in status_provider.get_all()]
 
         return success({"services": services})
 
@@ -57,34 +46,7 @@ class ListServices(MethodView):
 class GetService(MethodView):
     @blueprint.response(200, description="Get status of a single systemd service")
     def get(self, name: str) -> tuple[Response, int]:
-        try:
-            output = (
-                subprocess.check_output(
-                    ["systemctl", "show", name, "--property=Type,ActiveState,Result"], stderr=subprocess.DEVNULL
-                )
-                .decode()
-                .strip()
-            )
-
-            props = dict(line.split("=", 1) for line in output.splitlines())
-            return success(
-                {
-                    "name": name,
-                    "type": props.get("Type", ""),
-                    "state": props.get("ActiveState", ""),
-                    "result": props.get("Result", ""),
-                }
-            )
-
-        except subprocess.CalledProcessError:
-            return success(
-                {
-                    "name": name,
-                    "type": "unknown",
-                    "state": "unknown",
-                    "result": "error",
-                }
-            )
+        return success(serialize(status_provider.get(name)))
 
 
 @blueprint.route("/<name>/start")
@@ -93,6 +55,7 @@ class StartService(MethodView):
     def post(self, name: str) -> tuple[Response, int]:
         try:
             subprocess.run(["sudo", "systemctl", "start", name], check=True, capture_output=True, text=True)
+            status_provider.invalidate()
             return success({"message": f"Started service: {name}"})
         except subprocess.CalledProcessError as e:
             return error(f"Failed to start service: {name}", e.stderr.strip())
@@ -104,6 +67,7 @@ class StopService(MethodView):
     def post(self, name: str) -> tuple[Response, int]:
         try:
             subprocess.run(["sudo", "systemctl", "stop", name], check=True, capture_output=True, text=True)
+            status_provider.invalidate()
             return success({"message": f"Stopped service: {name}"})
         except subprocess.CalledProcessError as e:
             return error(f"Failed to stop service: {name}", e.stderr.strip())
@@ -115,6 +79,7 @@ class RestartService(MethodView):
     def post(self, name: str) -> tuple[Response, int]:
         try:
             subprocess.run(["sudo", "systemctl", "restart", name], check=True, capture_output=True, text=True)
+            status_provider.invalidate()
             return success({"message": f"Restarted service: {name}"})
         except subprocess.CalledProcessError as e:
             return error(f"Failed to restart service: {name}", e.stderr.strip())
@@ -39,6 +39,31 @@ class TestLatency(unittest.TestCase):
         self.assertEqual(restored.timestamp, 99.0)
         self.assertEqual(restored.streamer_timestamp, 100.5)
 
+    def test_roundtrip_with_loss(self) -> None:
+        latency = Latency(ls=2.5, timestamp=99.0)
+
+        restored = Message.from_bytes(latency.to_bytes())
+
+        self.assertIsInstance(restored, Latency)
+        self.assertEqual(restored.loss, 2.5)
+        self.assertIsNone(restored.streamer_timestamp)
+
+    def test_roundtrip_with_network_feedback(self) -> None:
+        latency = Latency(ls=0.5, rt=42.0, vl=3.0, timestamp=99.0)
+
+        restored = Message.from_bytes(latency.to_bytes())
+
+        self.assertIsInstance(restored, Latency)
+        self.assertEqual(restored.rtt, 42.0)
+        self.assertEqual(restored.video_loss, 3.0)
+        self.assertEqual(restored.loss, 0.5)
+
+    def test_network_feedback_is_optional(self) -> None:
+        latency = Latency()
+
+        self.assertIsNone(latency.rtt)
+        self.assertIsNone(latency.video_loss)
+
     def test_peek_type(self) -> None:
         latency = Latency()
         data = latency.to_bytes()
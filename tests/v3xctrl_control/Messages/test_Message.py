@@ -39,6 +39,17 @@ class TestMessages(unittest.TestCase):
         with self.assertRaises(ValueError):
             Message.from_bytes(broken)
 
+    def test_sequence_roundtrip(self):
+        msg = Message._registry["Heartbeat"]()
+        msg.sequence = 42
+
+        deserialized = Message.from_bytes(msg.to_bytes())
+        self.assertEqual(deserialized.sequence, 42)
+
+    def test_missing_sequence_is_none(self):
+        data = msgpack.packb({"t": "Heartbeat", "p": {}, "d": time.time()})
+        self.assertIsNone(Message.from_bytes(data).sequence)
+
     def test_peek_type_invalid_msgpack(self):
         data = b"not-a-valid-msgpack"
         self.assertEqual(Message.peek_type(data), "Unknown")
@@ -0,0 +1,27 @@
+import unittest
+
+from v3xctrl_control.message import Message, MtuProbe
+
+
+class TestMtuProbe(unittest.TestCase):
+    def test_roundtrip(self) -> None:
+        msg = MtuProbe(i=3, z=bytes(1000), timestamp=99.0)
+
+        restored = Message.from_bytes(msg.to_bytes())
+
+        self.assertIsInstance(restored, MtuProbe)
+        self.assertEqual(restored.probe_id, 3)
+        self.assertEqual(restored.padding, bytes(1000))
+        self.assertEqual(restored.timestamp, 99.0)
+
+    def test_padding_defaults_to_empty(self) -> None:
+        msg = MtuProbe(i=1)
+
+        self.assertEqual(msg.padding, b"")
+        self.assertEqual(msg.payload, {"i": 1, "z": b""})
+
+    def test_padding_sets_datagram_size(self) -> None:
+        small = MtuProbe(i=1, z=bytes(300)).to_bytes()
+        large = MtuProbe(i=1, z=bytes(1300)).to_bytes()
+
+        self.assertEqual(len(large) - len(small), 1000)
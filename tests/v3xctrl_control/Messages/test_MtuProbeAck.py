@@ -0,0 +1,22 @@
+import unittest
+
+import msgpack
+
+from v3xctrl_control.message import Message, MtuProbeAck
+
+
+class TestMtuProbeAck(unittest.TestCase):
+    def test_roundtrip(self) -> None:
+        msg = MtuProbeAck(i=42)
+
+        restored = Message.from_bytes(msg.to_bytes())
+
+        self.assertIsInstance(restored, MtuProbeAck)
+        self.assertEqual(restored.probe_id, 42)
+
+    def test_missing_id(self) -> None:
+        obj = msgpack.unpackb(MtuProbeAck(i=1).to_bytes())
+        obj["p"] = {}
+
+        with self.assertRaises(TypeError):
+            Message.from_bytes(msgpack.packb(obj))
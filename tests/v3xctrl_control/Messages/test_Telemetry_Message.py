@@ -22,6 +22,17 @@ class TestTelemetry(unittest.TestCase):
         # getter returns inner dict
         self.assertEqual(restored.get_values(), payload)
 
+    def test_keyframe_and_delta_roundtrip(self) -> None:
+        keyframe = Message.from_bytes(Telemetry(v={"a": 1}, k=4).to_bytes())
+        delta = Message.from_bytes(Telemetry(v={}, b=4).to_bytes())
+
+        assert isinstance(keyframe, Telemetry)
+        assert isinstance(delta, Telemetry)
+        self.assertEqual(keyframe.keyframe, 4)
+        self.assertFalse(keyframe.is_delta())
+        self.assertEqual(delta.base, 4)
+        self.assertTrue(delta.is_delta())
+
     def test_peek_type(self) -> None:
         t = Telemetry(v={"a": 1})
         data = t.to_bytes()
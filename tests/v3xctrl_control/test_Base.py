@@ -1,3 +1,4 @@
+import threading
 import time
 import unittest
 from unittest.mock import Mock
@@ -158,6 +159,42 @@ class TestBase(unittest.TestCase):
         self.base.check_timeout()
         self.assertEqual(self.base.state, State.DISCONNECTED)
 
+    def test_timer_due_in(self) -> None:
+        self.base.last_sent_timestamp = time.time()
+        self.base.last_sent_timeout = 1
+        self.base.last_message_timestamp = time.monotonic() - 2
+        self.base.no_message_timeout = 5
+
+        self.assertAlmostEqual(self.base.heartbeat_due_in(), 1, delta=0.05)
+        self.assertAlmostEqual(self.base.timeout_due_in(), 3, delta=0.05)
+
+    def test_wait_for_event_until_due(self) -> None:
+        start = time.monotonic()
+        self.base.wait_for_event(0.05)
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.05)
+        self.assertLess(elapsed, 0.5)
+
+    def test_wait_for_event_capped_by_state_check_interval(self) -> None:
+        self.base.STATE_CHECK_INTERVAL_MS = 20
+
+        start = time.monotonic()
+        self.base.wait_for_event(None)
+
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_state_change_wakes_up_waiting(self) -> None:
+        timer = threading.Timer(0.02, self.base.handle_state_change, args=(State.CONNECTED,))
+        timer.start()
+
+        start = time.monotonic()
+        self.base.wait_for_event(5)
+        timer.join()
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(self.base.state, State.CONNECTED)
+
     def test_message_history_trimming(self) -> None:
         self.base.message_history_length = 3
         addr = ("127.0.0.1", 5000)
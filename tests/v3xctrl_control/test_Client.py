@@ -1,5 +1,6 @@
 # tests/v3xctrl_control/test_Client.py
 import socket
+import threading
 import time
 import unittest
 from unittest.mock import MagicMock, patch
@@ -172,5 +173,34 @@ class TestClient(unittest.TestCase):
             mock_hb.assert_called_once()
             mock_ct.assert_called_once()
 
+    @patch.object(Client, "send")
+    def test_failsafe_fires_at_deadline(self, mock_send):
+        self.client.no_message_timeout = 0.1
+        self.client.last_sent_timestamp = time.time() + 10
+        self.client.state = State.CONNECTED
+
+        disconnected = threading.Event()
+        disconnected_at = []
+
+        def on_disconnect():
+            disconnected_at.append(time.monotonic())
+            disconnected.set()
+            self.client.running.clear()
+
+        self.client.on(State.DISCONNECTED, on_disconnect)
+        self.client.last_message_timestamp = time.monotonic()
+        deadline = self.client.last_message_timestamp + self.client.no_message_timeout
+
+        thread = threading.Thread(target=self.client.run)
+        thread.start()
+        self.assertTrue(disconnected.wait(1))
+        thread.join(1)
+
+        self.assertGreaterEqual(disconnected_at[0], deadline)
+        self.assertLess(disconnected_at[0] - deadline, 0.05)
+
+        self.client.running.set()
+        self.client.stop()
+
     def test_stop_without_start(self):
         self.client.stop()  # started is not set, should do nothing
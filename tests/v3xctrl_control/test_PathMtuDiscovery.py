@@ -0,0 +1,167 @@
+import socket
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.v3xctrl_control import PathMtuDiscovery
+from src.v3xctrl_control.message import Message, MtuProbeAck
+
+
+class FakeViewer:
+    """Acknowledges probes up to `limit` bytes, like a path with that MTU."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.sizes: list[int] = []
+        self.discovery: PathMtuDiscovery | None = None
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.05)
+        self.address = self.sock.getsockname()
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while self._running:
+            try:
+                data, addr = self.sock.recvfrom(65535)
+            except TimeoutError:
+                continue
+
+            self.sizes.append(len(data))
+            if len(data) <= self.limit and self.discovery:
+                probe = Message.from_bytes(data)
+                self.discovery.ack_handler(MtuProbeAck(probe.probe_id), addr)
+
+    def stop(self) -> None:
+        self._running = False
+        self._thread.join()
+        self.sock.close()
+
+
+class TestPathMtuDiscovery(unittest.TestCase):
+    def setUp(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.results: list[int] = []
+        self.viewer: FakeViewer | None = None
+
+    def tearDown(self):
+        if self.viewer:
+            self.viewer.stop()
+        self.sock.close()
+
+    def _create(self, limit: int) -> PathMtuDiscovery:
+        self.viewer = FakeViewer(limit)
+        client = MagicMock()
+        client.socket = self.sock
+        client.server_address = self.viewer.address
+
+        discovery = PathMtuDiscovery(client, self.results.append, probe_timeout=0.05)
+        self.viewer.discovery = discovery
+        return discovery
+
+    def test_finds_path_mtu(self):
+        discovery = self._create(1400)
+
+        size = discovery.discover()
+
+        assert size is not None
+        self.assertLessEqual(size, 1400)
+        self.assertGreater(size, 1400 - PathMtuDiscovery.PRECISION)
+
+    def test_full_size_path(self):
+        discovery = self._create(1500)
+
+        self.assertEqual(discovery.discover(), PathMtuDiscovery.MAX_SIZE)
+        self.assertEqual(self.viewer.sizes, [PathMtuDiscovery.MIN_SIZE, PathMtuDiscovery.MAX_SIZE])
+
+    def test_no_answer(self):
+        discovery = self._create(0)
+
+        self.assertIsNone(discovery.discover())
+        self.assertEqual(self.viewer.sizes, [PathMtuDiscovery.MIN_SIZE] * PathMtuDiscovery.ATTEMPTS)
+
+    def test_probes_have_exact_size(self):
+        for size in (PathMtuDiscovery.MIN_SIZE, 1000, PathMtuDiscovery.MAX_SIZE):
+            self.assertEqual(len(PathMtuDiscovery._build_probe(12345, size)), size)
+
+    def test_result_is_reported_when_changed(self):
+        discovery = self._create(1200)
+
+        self.assertTrue(discovery.start())
+        discovery.join()
+
+        self.assertEqual(len(self.results), 1)
+        self.assertEqual(discovery.path_mtu, self.results[0])
+        self.assertEqual(discovery.searches, 1)
+
+    def test_searches_are_rate_limited(self):
+        discovery = self._create(1200)
+
+        self.assertTrue(discovery.start())
+        discovery.join()
+
+        self.assertFalse(discovery.start())
+
+    def test_stale_ack_is_ignored(self):
+        discovery = self._create(0)
+        discovery._probe_id = 5
+
+        discovery.ack_handler(MtuProbeAck(4), ("127.0.0.1", 1))
+
+        self.assertFalse(discovery._acked.is_set())
+
+    def test_send_error_fails_probe(self):
+        discovery = self._create(1500)
+        client_sock = MagicMock()
+        client_sock.sendto.side_effect = OSError(90, "Message too long")
+
+        self.assertFalse(discovery._probe(client_sock, 1472))
+
+
+class TestReprobe(unittest.TestCase):
+    def setUp(self):
+        self.discovery = PathMtuDiscovery(MagicMock(), MagicMock())
+
+    def test_repeated_video_loss_starts_search(self):
+        with patch.object(self.discovery, "start", return_value=True) as start:
+            for _ in range(PathMtuDiscovery.LOSS_EVENTS - 1):
+                self.assertFalse(self.discovery.on_keyframe_request())
+
+            self.assertTrue(self.discovery.on_keyframe_request())
+
+        start.assert_called_once()
+
+    def test_lossy_control_channel_is_not_fragmentation(self):
+        self.discovery.on_control_loss(5.0)
+
+        with patch.object(self.discovery, "start") as start:
+            for _ in range(PathMtuDiscovery.LOSS_EVENTS):
+                self.discovery.on_keyframe_request()
+
+        start.assert_not_called()
+
+    def test_old_requests_expire(self):
+        with (
+            patch("src.v3xctrl_control.PathMtuDiscovery.time.monotonic") as monotonic,
+            patch.object(self.discovery, "start") as start,
+        ):
+            for i in range(PathMtuDiscovery.LOSS_EVENTS):
+                monotonic.return_value = i * PathMtuDiscovery.LOSS_WINDOW
+                self.discovery.on_keyframe_request()
+
+        start.assert_not_called()
+
+    def test_missing_loss_keeps_last_value(self):
+        self.discovery.on_control_loss(3.0)
+        self.discovery.on_control_loss(None)
+
+        self.assertEqual(self.discovery._control_loss, 3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
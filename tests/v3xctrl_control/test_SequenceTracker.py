@@ -0,0 +1,118 @@
+import unittest
+
+from src.v3xctrl_control.SequenceTracker import SequenceStats, SequenceTracker
+
+
+class TestSequenceTracker(unittest.TestCase):
+    def setUp(self):
+        self.tracker = SequenceTracker(window=16)
+
+    def test_empty_stats(self):
+        self.assertEqual(self.tracker.stats(), SequenceStats())
+        self.assertEqual(self.tracker.stats().loss_percent, 0.0)
+        self.assertEqual(self.tracker.stats().reorder_percent, 0.0)
+
+    def test_in_order_sequence_is_newest(self):
+        for sequence in range(5):
+            self.assertTrue(self.tracker.track(sequence))
+
+        stats = self.tracker.stats()
+        self.assertEqual(stats.expected, 5)
+        self.assertEqual(stats.lost, 0)
+        self.assertEqual(stats.reordered, 0)
+        self.assertEqual(stats.duplicates, 0)
+
+    def test_first_sequence_does_not_count_earlier_as_lost(self):
+        self.tracker.track(100)
+        self.tracker.track(101)
+
+        stats = self.tracker.stats()
+        self.assertEqual(stats.expected, 2)
+        self.assertEqual(stats.lost, 0)
+
+    def test_gap_counts_as_loss_and_burst(self):
+        self.tracker.track(0)
+        self.tracker.track(4)
+
+        stats = self.tracker.stats()
+        self.assertEqual(stats.expected, 5)
+        self.assertEqual(stats.lost, 3)
+        self.assertEqual(stats.max_burst, 3)
+        self.assertAlmostEqual(stats.loss_percent, 60.0)
+
+    def test_late_arrival_is_reorder_not_loss(self):
+        self.tracker.track(0)
+        self.tracker.track(2)
+        self.assertFalse(self.tracker.track(1))
+
+        stats = self.tracker.stats()
+        self.assertEqual(stats.lost, 0)
+        self.assertEqual(stats.reordered, 1)
+        self.assertAlmostEqual(stats.reorder_percent, 100 / 3)
+
+    def test_duplicate_is_counted(self):
+        self.tracker.track(0)
+        self.tracker.track(1)
+        self.assertFalse(self.tracker.track(1))
+        self.assertFalse(self.tracker.track(0))
+
+        stats = self.tracker.stats()
+        self.assertEqual(stats.duplicates, 2)
+        self.assertEqual(stats.reordered, 0)
+
+    def test_stats_roll_with_window(self):
+        self.tracker.track(0)
+        self.tracker.track(5)
+        for sequence in range(6, 30):
+            self.tracker.track(sequence)
+
+        stats = self.tracker.stats()
+        self.assertEqual(stats.expected, 16)
+        self.assertEqual(stats.lost, 0)
+
+    def test_max_burst_picks_longest_run(self):
+        for sequence in [0, 2, 3, 7, 8, 10]:
+            self.tracker.track(sequence)
+
+        stats = self.tracker.stats()
+        self.assertEqual(stats.lost, 5)
+        self.assertEqual(stats.max_burst, 3)
+
+    def test_counter_restart_resets(self):
+        for sequence in range(100, 120):
+            self.tracker.track(sequence)
+
+        self.assertTrue(self.tracker.track(0))
+
+        stats = self.tracker.stats()
+        self.assertEqual(stats.expected, 1)
+        self.assertEqual(stats.lost, 0)
+
+    def test_reset(self):
+        self.tracker.track(0)
+        self.tracker.track(3)
+        self.tracker.reset()
+
+        self.assertEqual(self.tracker.stats(), SequenceStats())
+        self.assertTrue(self.tracker.track(1))
+
+
+class TestSequenceStats(unittest.TestCase):
+    def test_combine(self):
+        combined = SequenceStats.combine(
+            [
+                SequenceStats(expected=10, lost=1, reordered=2, duplicates=0, max_burst=1),
+                SequenceStats(expected=30, lost=3, reordered=0, duplicates=4, max_burst=3),
+            ]
+        )
+
+        self.assertEqual(combined, SequenceStats(expected=40, lost=4, reordered=2, duplicates=4, max_burst=3))
+        self.assertAlmostEqual(combined.loss_percent, 10.0)
+        self.assertAlmostEqual(combined.reorder_percent, 5.0)
+
+    def test_combine_empty(self):
+        self.assertEqual(SequenceStats.combine([]), SequenceStats())
+
+
+if __name__ == "__main__":
+    unittest.main()
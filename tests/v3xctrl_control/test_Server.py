@@ -9,6 +9,8 @@ from src.v3xctrl_control.message import (
     Command,
     CommandAck,
     Message,
+    MtuProbe,
+    MtuProbeAck,
     Syn,
 )
 from tests.v3xctrl_control.config import HOST, PORT
@@ -84,6 +86,16 @@ class TestServer(unittest.TestCase):
         self.mock_base_send.assert_called_once()
         self.assertEqual(self.server.state, State.CONNECTED)
 
+    def test_mtu_probe_is_acknowledged(self):
+        addr = (HOST, PORT)
+
+        self.server.mtu_probe_handler(MtuProbe(7, b"\x00" * 100), addr)
+
+        ack, ack_addr = self.mock_base_send.call_args[0]
+        self.assertIsInstance(ack, MtuProbeAck)
+        self.assertEqual(ack.probe_id, 7)
+        self.assertEqual(ack_addr, addr)
+
     def test_send_with_address(self):
         # CRITICAL: Reset mock and ensure clean state
         self.mock_base_send.reset_mock()
@@ -132,21 +144,69 @@ class TestServer(unittest.TestCase):
         self.mock_handler.join.assert_called_once()
         self.assertFalse(self.server.running.is_set())
 
-    def test_stop_shuts_down_thread_pool(self):
+    def test_stop_shuts_down_command_scheduler(self):
+        self.server.send_command(Command("ping", {}))
+        thread = self.server._command_thread
+
         self.server.started.set()
         self.server.running.set()
+        self.server.stop()
 
-        with patch.object(self.server.thread_pool, "shutdown") as mock_shutdown:
-            self.server.stop()
-            mock_shutdown.assert_called_once_with(wait=False)
+        self.assertIsNotNone(thread)
+        self.assertFalse(thread.is_alive())
 
-    def test_send_command_uses_thread_pool(self):
-        command = Command("ping", {})
+    def test_send_command_uses_single_scheduler_thread(self):
+        self.server.send_command(Command("ping", {}))
+        thread = self.server._command_thread
+        self.server.send_command(Command("status", {}))
+
+        self.assertIsNotNone(thread)
+        self.assertIs(self.server._command_thread, thread)
+
+    def test_send_command_backs_off_exponentially(self):
+        sent_at = []
+        self.server.send = MagicMock(side_effect=lambda command: sent_at.append(time.monotonic()))
+        self.server.COMMAND_DELAY = 0.02
+        self.server.COMMAND_BACKOFF = 2.0
+        self.server.COMMAND_MAX_DELAY = 1.0
         callback = MagicMock()
 
-        with patch.object(self.server.thread_pool, "submit") as mock_submit:
-            self.server.send_command(command, callback=callback)
-            mock_submit.assert_called_once()
+        self.server.send_command(Command("ping", {}), callback=callback, max_retries=3)
+        time.sleep(0.25)
+
+        callback.assert_called_once_with(False)
+        self.assertEqual(len(sent_at), 3)
+        self.assertGreaterEqual(sent_at[1] - sent_at[0], 0.02)
+        self.assertGreaterEqual(sent_at[2] - sent_at[1], 0.04)
+
+    def test_send_command_default_retry_window(self):
+        """Without backoff the command fails right after the last attempt."""
+        sent_at = []
+        self.server.send = MagicMock(side_effect=lambda command: sent_at.append(time.monotonic()))
+        self.server.COMMAND_DELAY = 0.02
+        failed_at = []
+
+        started = time.monotonic()
+        self.server.send_command(
+            Command("ping", {}), callback=lambda ok: failed_at.append(time.monotonic()), max_retries=5
+        )
+        time.sleep(0.3)
+
+        self.assertEqual(len(sent_at), 5)
+        self.assertEqual(len(failed_at), 1)
+        self.assertGreaterEqual(failed_at[0] - started, 4 * 0.02)
+        self.assertLess(failed_at[0] - sent_at[-1], 0.015)
+
+    def test_send_command_deadline(self):
+        self.server.COMMAND_DELAY = 0.01
+        callback = MagicMock()
+
+        self.server.send_command(Command("ping", {}), callback=callback, max_retries=1000, timeout=0.05)
+        time.sleep(0.02)
+        callback.assert_not_called()
+
+        time.sleep(0.1)
+        callback.assert_called_once_with(False)
 
     def test_send_command_retries_and_sends(self):
         self.mock_base_send.reset_mock()
@@ -377,13 +437,12 @@ class TestServer(unittest.TestCase):
         # Should have made fewer than max retries due to early exit
         self.assertLess(self.mock_base_send.call_count, self.server.COMMAND_MAX_RETRIES)
 
-    def test_send_command_thread_pool_shutdown_calls_callback(self):
-        """Test that callback is called with False when thread pool is shut down."""
+    def test_send_command_after_stop_calls_callback(self):
+        """Test that callback is called with False when the server is shut down."""
         command = Command("ping", {})
         callback = MagicMock()
 
-        # Shutdown the thread pool first
-        self.server.thread_pool.shutdown(wait=True)
+        self.server.stop()
 
         # Now try to send a command - should call callback with False
         self.server.send_command(command, callback=callback)
@@ -415,12 +474,11 @@ class TestServer(unittest.TestCase):
         with self.server.pending_lock:
             self.assertNotIn(command.get_command_id(), self.server.pending_commands)
 
-    def test_send_command_thread_pool_shutdown_without_callback(self):
-        """Test that no error occurs when thread pool is shut down and no callback."""
+    def test_send_command_after_stop_without_callback(self):
+        """Test that no error occurs when the server is shut down and no callback."""
         command = Command("ping", {})
 
-        # Shutdown the thread pool first
-        self.server.thread_pool.shutdown(wait=True)
+        self.server.stop()
 
         # Should not raise an error even without callback
         self.server.send_command(command, callback=None)
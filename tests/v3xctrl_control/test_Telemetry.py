@@ -10,8 +10,16 @@ _saved = {key: sys.modules.pop(key, None) for key in _gi_keys}
 sys.modules.update({key: MagicMock() for key in _gi_keys})
 
 # Import the actual Telemetry class and dataclasses
+from src.v3xctrl_control.SequenceTracker import SequenceStats  # noqa: E402
 from src.v3xctrl_control.Telemetry import Telemetry  # noqa: E402
-from src.v3xctrl_telemetry import BatteryInfo, CellInfo, SignalInfo, TelemetryPayload  # noqa: E402
+from src.v3xctrl_telemetry import (  # noqa: E402
+    BatteryInfo,
+    CellInfo,
+    GpsFixType,
+    LocationInfo,
+    SignalInfo,
+    TelemetryPayload,
+)
 
 # Restore original modules so other tests that need real gi are not affected
 for _key in _gi_keys:
@@ -200,6 +208,8 @@ class TestTelemetry(unittest.TestCase):
             vc=0x55,
             gst=0x01,
         )
+        tel._scheduler = MagicMock()
+        tel._scheduler.stale_sources.return_value = set()
         result = tel.get_telemetry()
 
         # Verify it's a dict
@@ -216,30 +226,86 @@ class TestTelemetry(unittest.TestCase):
         result["sig"]["rsrq"] = 999
         self.assertEqual(tel.payload.sig.rsrq, 10)
 
-    def test_run_and_stop(self):
+    def test_get_telemetry_reports_stale_sources_unknown(self):
         tel = Telemetry.__new__(Telemetry)
         tel._lock = threading.Lock()
+        tel.payload = TelemetryPayload(
+            sig=SignalInfo(rsrq=10, rsrp=20),
+            cell=CellInfo(id="123", band="7"),
+            loc=LocationInfo(lat=1.0, lng=2.0, fix_type=GpsFixType.FIX_3D, satellites=9),
+            bat=BatteryInfo(vol=12000, avg=4000, pct=75),
+            vc=0x55,
+        )
+        tel._scheduler = MagicMock()
+        tel._scheduler.stale_sources.return_value = {"modem", "gps"}
+
+        result = tel.get_telemetry()
+
+        self.assertEqual(result["sig"], {"rsrq": -1, "rsrp": -1})
+        self.assertEqual(result["cell"], {"id": "?", "band": "?"})
+        self.assertEqual(result["loc"]["fix_type"], GpsFixType.NO_FIX)
+        self.assertEqual(result["loc"]["satellites"], 0)
+        self.assertEqual(result["bat"]["pct"], 75)
+        self.assertEqual(result["vc"], 0x55)
+
+        # The payload keeps the last values for when the source recovers
+        self.assertEqual(tel.payload.sig.rsrq, 10)
+
+    def test_update_link(self):
+        tel = Telemetry.__new__(Telemetry)
+        tel._lock = threading.Lock()
+        tel.payload = TelemetryPayload(sig=SignalInfo(), cell=CellInfo(), loc=MagicMock(), bat=BatteryInfo())
+
+        tel.update_link(SequenceStats(expected=30, lost=1, reordered=2, duplicates=3, max_burst=1))
+
+        self.assertEqual(tel.payload.net.loss, 3.3)
+        self.assertEqual(tel.payload.net.reo, 6.7)
+        self.assertEqual(tel.payload.net.dup, 3)
+        self.assertEqual(tel.payload.net.bst, 1)
+
+    def test_run_and_stop(self):
+        tel = Telemetry.__new__(Telemetry)
         tel._running = threading.Event()
+        tel._stopped = threading.Event()
         tel._interval = 0.01
-        tel._modem = MagicMock()
-        tel._sim_absent = False
-        tel._sim_recheck_counter = 0
-        tel._gps = None
-        tel._update_signal = MagicMock()
-        tel._update_cell = MagicMock()
-        tel._update_battery = MagicMock()
-        tel._update_services = MagicMock()
-        tel._update_videocore = MagicMock()
-        tel._update_gst = MagicMock()
-        tel.run = Telemetry.run.__get__(tel)  # bind actual run method
+        tel._scheduler = MagicMock()
         t = threading.Thread(target=tel.run)
         t.start()
         time.sleep(0.05)
         tel.stop()
         t.join()
-        tel._update_signal.assert_called()
-        tel._update_cell.assert_called()
-        tel._update_battery.assert_called()
+        tel._scheduler.start.assert_called_once()
+        tel._scheduler.stop.assert_called_once()
+
+    def test_update_modem(self):
+        tel = Telemetry.__new__(Telemetry)
+        tel._modem_available = MagicMock(return_value=True)
+        tel._update_signal = MagicMock(return_value=True)
+        tel._update_cell = MagicMock(return_value=True)
+        self.assertTrue(tel._update_modem())
+        tel._update_signal.assert_called_once()
+        tel._update_cell.assert_called_once()
+
+    def test_update_modem_skips_when_unavailable(self):
+        tel = Telemetry.__new__(Telemetry)
+        tel._modem_available = MagicMock(return_value=False)
+        tel._update_signal = MagicMock()
+        tel._update_cell = MagicMock()
+        self.assertFalse(tel._update_modem())
+        tel._update_signal.assert_not_called()
+        tel._update_cell.assert_not_called()
+
+    def test_wait_for_update(self):
+        tel = Telemetry.__new__(Telemetry)
+        tel._updated = threading.Event()
+        tel._on_update = MagicMock()
+
+        self.assertFalse(tel.wait_for_update(timeout=0.01))
+
+        tel._source_updated("gps")
+        tel._on_update.assert_called_once_with("gps")
+        self.assertTrue(tel.wait_for_update(timeout=0.01))
+        self.assertFalse(tel.wait_for_update(timeout=0.01))
 
     def test_modem_available_when_modem_exists(self):
         tel = Telemetry.__new__(Telemetry)
@@ -303,31 +369,22 @@ class TestTelemetry(unittest.TestCase):
         self.assertTrue(result)
         self.assertFalse(tel._sim_absent)
 
-    def test_run_skips_modem_updates_when_unavailable(self):
-        tel = Telemetry.__new__(Telemetry)
-        tel._lock = threading.Lock()
-        tel._running = threading.Event()
-        tel._interval = 0.01
-        tel._modem = None
-        tel._sim_absent = True
-        tel._sim_recheck_counter = 0
-        tel._init_modem = MagicMock(return_value=False)
-        tel._gps = None
-        tel._update_signal = MagicMock()
-        tel._update_cell = MagicMock()
-        tel._update_battery = MagicMock()
-        tel._update_services = MagicMock()
-        tel._update_videocore = MagicMock()
-        tel._update_gst = MagicMock()
-        tel.run = Telemetry.run.__get__(tel)
-        t = threading.Thread(target=tel.run)
-        t.start()
-        time.sleep(0.05)
-        tel.stop()
-        t.join()
-        tel._update_signal.assert_not_called()
-        tel._update_cell.assert_not_called()
-        tel._update_battery.assert_called()
+    def test_sources_scheduled_at_own_rate(self):
+        with (
+            patch.object(Telemetry, "_init_modem", return_value=False),
+            patch("src.v3xctrl_control.Telemetry.UBXGpsTelemetry") as mock_gps,
+            patch("src.v3xctrl_control.Telemetry.BatteryTelemetry", side_effect=Exception("no battery")),
+            patch("src.v3xctrl_control.Telemetry.ServiceTelemetry"),
+            patch("src.v3xctrl_control.Telemetry.VideoCoreTelemetry"),
+            patch("src.v3xctrl_control.Telemetry.GstTelemetry"),
+            patch("src.v3xctrl_control.Telemetry.TelemetryScheduler") as mock_scheduler_cls,
+        ):
+            mock_gps.return_value = MagicMock()
+            Telemetry("/dev/null", gps_rate_hz=5, interval=1.0)
+
+        scheduler = mock_scheduler_cls.return_value
+        intervals = {call.args[0]: call.args[2] for call in scheduler.add.call_args_list}
+        self.assertEqual(intervals, {"modem": 1.0, "gps": 0.2, "services": 1.0, "videocore": 1.0, "gst": 1.0})
 
 
 if __name__ == "__main__":
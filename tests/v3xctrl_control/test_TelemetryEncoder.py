@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import patch
+
+from src.v3xctrl_control import TelemetryEncoder
+from src.v3xctrl_control.message import Message, Telemetry
+
+
+class TestTelemetryEncoder(unittest.TestCase):
+    def setUp(self):
+        self.encoder = TelemetryEncoder(keyframe_interval=10)
+        self.values = {"svc": 1, "bat": {"vol": 3700, "wrn": False}}
+
+    def test_first_message_is_keyframe(self):
+        message = self.encoder.encode(self.values)
+
+        self.assertEqual(message.keyframe, 0)
+        self.assertIsNone(message.base)
+        self.assertEqual(message.get_values(), self.values)
+
+    def test_delta_relative_to_keyframe(self):
+        self.encoder.encode(self.values)
+        self.encoder.encode({"svc": 3, "bat": {"vol": 3600, "wrn": False}})
+        message = self.encoder.encode({"svc": 1, "bat": {"vol": 3650, "wrn": False}})
+
+        self.assertTrue(message.is_delta())
+        self.assertEqual(message.base, 0)
+        # svc changed back to the keyframe value, so it is not part of the delta
+        self.assertEqual(message.get_values(), {"bat": {"vol": 3650}})
+
+    def test_unchanged_values_send_empty_delta(self):
+        self.encoder.encode(self.values)
+        message = self.encoder.encode(dict(self.values))
+
+        self.assertEqual(message.get_values(), {})
+
+    def test_keyframe_interval(self):
+        with patch("src.v3xctrl_control.TelemetryEncoder.time.monotonic", side_effect=[0, 5, 10]):
+            self.assertEqual(self.encoder.encode(self.values).keyframe, 0)
+            self.assertTrue(self.encoder.encode(self.values).is_delta())
+            self.assertEqual(self.encoder.encode(self.values).keyframe, 1)
+
+    def test_request_keyframe(self):
+        self.encoder.encode(self.values)
+        self.encoder.request_keyframe()
+
+        self.assertEqual(self.encoder.encode(self.values).keyframe, 1)
+        self.assertTrue(self.encoder.encode(self.values).is_delta())
+
+    def test_roundtrip(self):
+        self.encoder.encode(self.values)
+        message = self.encoder.encode({"svc": 3, "bat": {"vol": 3700, "wrn": False}})
+
+        restored = Message.from_bytes(message.to_bytes())
+
+        assert isinstance(restored, Telemetry)
+        self.assertEqual(restored.base, 0)
+        self.assertIsNone(restored.keyframe)
+        self.assertEqual(restored.get_values(), {"svc": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,13 +5,14 @@ import unittest
 from unittest.mock import MagicMock
 
 from src.v3xctrl_control import UDPReceiver
-from src.v3xctrl_control.message import Message
+from src.v3xctrl_control.message import Message, MtuProbe
 
 
 class FakeMessage:
     def __init__(self, timestamp: int):
         self.timestamp = timestamp
         self.type = "test_message"
+        self.sequence = None
 
     @staticmethod
     def from_bytes(data: bytes):
@@ -125,6 +126,43 @@ class TestUDPReceiver(unittest.TestCase):
         # Let worker loop process
         time.sleep(0.05)
 
+    def test_sequence_orders_per_channel(self):
+        msg = FakeMessage(10)
+        msg.sequence = 5
+        self.assertTrue(self.receiver.is_valid_message(msg, (self.host, self.port)))
+
+        # Older timestamp but newer sequence is still valid
+        msg = FakeMessage(1)
+        msg.sequence = 7
+        self.assertTrue(self.receiver.is_valid_message(msg, (self.host, self.port)))
+
+        msg = FakeMessage(20)
+        msg.sequence = 6
+        self.assertFalse(self.receiver.is_valid_message(msg, (self.host, self.port)))
+
+        # Different channel has its own sequence
+        other = FakeMessage(20)
+        other.type = "other_message"
+        other.sequence = 0
+        self.assertTrue(self.receiver.is_valid_message(other, (self.host, self.port)))
+
+        stats = self.receiver.get_sequence_stats()
+        self.assertEqual(set(stats.keys()), {"test_message", "other_message"})
+        self.assertEqual(stats["test_message"].reordered, 1)
+
+    def test_mtu_probe_skips_order_check(self):
+        self.receiver.last_valid_timestamp = 5
+
+        self.assertTrue(self.receiver.is_valid_message(MtuProbe(1, timestamp=1), (self.host, self.port)))
+
+    def test_reset_clears_sequence_stats(self):
+        msg = FakeMessage(10)
+        msg.sequence = 5
+        self.receiver.is_valid_message(msg, (self.host, self.port))
+        self.receiver.reset()
+
+        self.assertEqual(self.receiver.get_sequence_stats(), {})
+
     def test_is_valid_message_reasons(self):
         self.receiver._should_validate_timestamp = True
 
@@ -5,8 +5,11 @@ from src.v3xctrl_control import UDPPacket, UDPTransmitter
 
 
 class FakeMessage:
+    type = "FakeMessage"
+
     def __init__(self, value):
         self.value = value
+        self.sequence = None
 
     def to_bytes(self):
         return self.value.encode()
@@ -47,6 +50,20 @@ class TestUDPTransmitter(unittest.TestCase):
         data, _ = self.recv_sock.recvfrom(1024)
         self.assertEqual(data, b"hello-payload")
 
+    def test_sequence_assigned_per_type(self):
+        first = FakeMessage("a")
+        second = FakeMessage("b")
+        other = FakeMessage("c")
+        other.type = "OtherMessage"
+
+        self.transmitter.add_message(first, (self.host, self.port))
+        self.transmitter.set_control_message(second, (self.host, self.port))
+        self.transmitter.add_message(other, (self.host, self.port))
+
+        self.assertEqual(first.sequence, 0)
+        self.assertEqual(second.sequence, 1)
+        self.assertEqual(other.sequence, 0)
+
     def test_stop_cleans_up(self):
         self.transmitter.stop()
         self.assertFalse(self.transmitter.is_running())
@@ -229,5 +246,73 @@ class TestSendFailureDetection(unittest.TestCase):
         self.assertFalse(self.transmitter.has_recent_send_failures(window=0.0))
 
 
+class TestControlRedundancy(unittest.TestCase):
+    def setUp(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addr = ("localhost", 9999)
+
+    def tearDown(self):
+        self.sock.close()
+
+    def test_no_resend_by_default(self):
+        transmitter = UDPTransmitter(self.sock)
+        transmitter.set_control_message(FakeMessage("control"), self.addr)
+        transmitter._next_resend_at = 0
+
+        self.assertIsNone(transmitter._take_control_resend())
+
+    def test_resend_not_due_yet(self):
+        transmitter = UDPTransmitter(self.sock, control_redundancy=2)
+        transmitter.set_control_message(FakeMessage("control"), self.addr)
+
+        self.assertIsNone(transmitter._take_control_resend())
+
+    def test_resends_are_resequenced_and_limited(self):
+        transmitter = UDPTransmitter(self.sock, control_redundancy=2)
+        msg = FakeMessage("control")
+        transmitter.set_control_message(msg, self.addr)
+        self.assertEqual(msg.sequence, 0)
+
+        sequences = []
+        for _ in range(2):
+            transmitter._next_resend_at = 0
+            packet = transmitter._take_control_resend()
+            self.assertIsNotNone(packet)
+            self.assertEqual(packet.data, b"control")
+            sequences.append(msg.sequence)
+
+        self.assertEqual(sequences, [1, 2])
+
+        transmitter._next_resend_at = 0
+        self.assertIsNone(transmitter._take_control_resend())
+
+    def test_new_control_message_replaces_resend(self):
+        transmitter = UDPTransmitter(self.sock, control_redundancy=1)
+        transmitter.set_control_message(FakeMessage("old"), self.addr)
+        transmitter.set_control_message(FakeMessage("new"), self.addr)
+        transmitter._next_resend_at = 0
+
+        packet = transmitter._take_control_resend()
+        self.assertEqual(packet.data, b"new")
+
+    def test_resends_are_transmitted(self):
+        recv_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        recv_sock.bind(("localhost", 0))
+        recv_sock.settimeout(1)
+        host, port = recv_sock.getsockname()
+
+        transmitter = UDPTransmitter(self.sock, control_redundancy=2)
+        transmitter.start()
+        transmitter.start_task()
+        try:
+            transmitter.set_control_message(FakeMessage("control"), (host, port))
+            received = [recv_sock.recvfrom(1024)[0] for _ in range(3)]
+        finally:
+            transmitter.stop()
+            recv_sock.close()
+
+        self.assertEqual(received, [b"control"] * 3)
+
+
 if __name__ == "__main__":
     unittest.main()
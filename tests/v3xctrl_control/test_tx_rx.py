@@ -57,13 +57,37 @@ class TestUDPTransmission(unittest.TestCase):
         self.handler.assert_not_called()
 
     def test_udp_ignore_out_of_order(self):
-        # Should only handle the messages with timestamps 10 and 20
+        # Should only handle the messages with sequence numbers 10 and 20
+        for sequence in [10, 5, 20]:
+            message = Heartbeat()
+            message.sequence = sequence
+            self.transmitter.add(UDPPacket(message.to_bytes(), HOST, PORT))
+        time.sleep(SLEEP)
+
+        self.assertEqual(self.handler.call_count, 2)
+
+    def test_udp_sequence_ignores_timestamps(self):
+        # Wall clock going backwards does not matter when sequenced
         self.transmitter.add_message(Heartbeat(10), (HOST, PORT))
-        self.transmitter.add_message(Heartbeat(5), (HOST, PORT))  # should be ignored
+        self.transmitter.add_message(Heartbeat(5), (HOST, PORT))
         self.transmitter.add_message(Heartbeat(20), (HOST, PORT))
         time.sleep(SLEEP)
 
-        self.assertEqual(self.handler.call_count, 2)
+        self.assertEqual(self.handler.call_count, 3)
+
+    def test_udp_sequence_stats(self):
+        for sequence in [0, 1, 3, 2, 3, 6]:
+            message = Heartbeat()
+            message.sequence = sequence
+            self.transmitter.add(UDPPacket(message.to_bytes(), HOST, PORT))
+        time.sleep(SLEEP)
+
+        stats = self.receiver.get_sequence_stats()["Heartbeat"]
+        self.assertEqual(stats.expected, 7)
+        self.assertEqual(stats.lost, 2)
+        self.assertEqual(stats.reordered, 1)
+        self.assertEqual(stats.duplicates, 1)
+        self.assertEqual(stats.max_burst, 2)
 
 
 if __name__ == "__main__":
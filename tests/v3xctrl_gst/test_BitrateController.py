@@ -0,0 +1,159 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from v3xctrl_gst.BitrateController import BitrateController
+
+
+class TestBitrateController(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.time_patcher = patch("v3xctrl_gst.BitrateController.time.monotonic", side_effect=lambda: self.now)
+        self.time_patcher.start()
+
+        self.apply = MagicMock()
+        self.controller = BitrateController(
+            self.apply,
+            bitrate=2_000_000,
+            min_bitrate=500_000,
+            max_bitrate=2_000_000,
+            decrease_factor=0.5,
+            increase_step=100_000,
+            hold_time=3.0,
+            reaction_time=2.0,
+        )
+
+    def tearDown(self):
+        self.time_patcher.stop()
+
+    def test_initial_bitrate_is_clamped(self):
+        controller = BitrateController(self.apply, bitrate=5_000_000, min_bitrate=500_000, max_bitrate=2_000_000)
+        self.assertEqual(controller.bitrate, 2_000_000)
+
+    def test_no_change_without_congestion_at_max(self):
+        self.now += 10
+        self.assertFalse(self.controller.update())
+        self.apply.assert_not_called()
+
+    def test_overrun_decreases(self):
+        self.controller.on_overrun()
+
+        self.assertTrue(self.controller.update())
+        self.assertEqual(self.controller.bitrate, 1_000_000)
+        self.apply.assert_called_once_with(1_000_000)
+
+    def test_overruns_from_other_threads_are_counted(self):
+        def overrun():
+            for _ in range(10_000):
+                self.controller.on_overrun()
+
+        threads = [threading.Thread(target=overrun) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self.assertLogs("v3xctrl_gst.BitrateController", level="INFO") as logs:
+            self.controller.update()
+
+        self.assertIn("40000 queue overruns", logs.output[0])
+
+    def test_overruns_are_consumed(self):
+        self.controller.on_overrun()
+        self.controller.update()
+
+        self.now += 1
+        self.assertFalse(self.controller.update())
+
+    def test_loss_decreases(self):
+        self.controller.on_feedback(loss=5.0)
+
+        self.assertTrue(self.controller.update())
+        self.assertEqual(self.controller.bitrate, 1_000_000)
+
+    def test_loss_below_threshold_is_ignored(self):
+        self.controller.on_feedback(loss=1.0)
+        self.assertFalse(self.controller.update())
+
+    def test_rising_delay_decreases(self):
+        # Constant clock offset, only the trend matters
+        for _ in range(10):
+            self.controller.on_feedback(delay_ms=5000.0)
+        self.assertFalse(self.controller.update())
+
+        for _ in range(10):
+            self.controller.on_feedback(delay_ms=5200.0)
+
+        self.assertGreater(self.controller.queuing_delay_ms, 40)
+        self.assertTrue(self.controller.update())
+
+    def test_no_repeated_decrease_while_reacting(self):
+        self.controller.on_feedback(loss=5.0)
+        self.controller.update()
+
+        self.now += 1
+        self.assertFalse(self.controller.update())
+
+        self.now += 1.5
+        self.assertTrue(self.controller.update())
+        self.assertEqual(self.controller.bitrate, 500_000)
+
+    def test_overrun_bypasses_reaction_time(self):
+        self.controller.on_feedback(loss=5.0)
+        self.controller.update()
+
+        self.now += 0.5
+        self.controller.on_overrun()
+        self.assertTrue(self.controller.update())
+
+    def test_never_below_minimum(self):
+        for _ in range(10):
+            self.controller.on_overrun()
+            self.controller.update()
+
+        self.assertEqual(self.controller.bitrate, 500_000)
+
+    def test_probes_up_after_hold_time(self):
+        self.controller.on_overrun()
+        self.controller.update()
+        self.apply.reset_mock()
+
+        self.now += 2
+        self.assertFalse(self.controller.update())
+
+        self.now += 1.5
+        self.assertTrue(self.controller.update())
+        self.apply.assert_called_once_with(1_100_000)
+
+    def test_probing_stops_at_maximum(self):
+        self.controller.on_overrun()
+        self.controller.update()
+
+        self.now += 3
+        for _ in range(20):
+            self.now += 1
+            self.controller.update()
+
+        self.assertEqual(self.controller.bitrate, 2_000_000)
+
+    def test_stats(self):
+        self.controller.on_overrun()
+        self.controller.update()
+
+        stats = self.controller.get_stats()
+        self.assertEqual(stats["bitrate"], 1_000_000)
+        self.assertEqual(stats["decreases"], 1)
+        self.assertEqual(stats["increases"], 0)
+
+    def test_decisions_are_logged(self):
+        self.controller.on_feedback(loss=5.0)
+        with patch("v3xctrl_gst.BitrateController.logger") as mock_logger:
+            self.controller.update()
+
+        message = mock_logger.info.call_args[0][0]
+        self.assertIn("2000 -> 1000", message)
+        self.assertIn("loss", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,8 +14,11 @@ class TestActionType(unittest.TestCase):
         self.assertEqual(ActionType.LIST, "list")
         self.assertEqual(ActionType.GET, "get")
         self.assertEqual(ActionType.SET, "set")
+        self.assertEqual(ActionType.APPLY, "apply")
+        self.assertEqual(ActionType.APPLY_STATUS, "apply_status")
         self.assertEqual(ActionType.RECORDING, "recording")
         self.assertEqual(ActionType.STATS, "stats")
+        self.assertEqual(ActionType.RECONFIGURE, "reconfigure")
 
     def test_action_type_is_str(self):
         self.assertIsInstance(ActionType.STOP, str)
@@ -23,7 +26,7 @@ class TestActionType(unittest.TestCase):
     def test_action_type_membership(self):
         self.assertIn(ActionType.STOP, ActionType)
         self.assertIn(ActionType.SET, ActionType)
-        self.assertEqual(len(ActionType), 6)
+        self.assertEqual(len(ActionType), 11)
 
 
 class TestRecordingAction(unittest.TestCase):
@@ -116,6 +119,61 @@ class TestCommandValidation(unittest.TestCase):
         command = Command(action=ActionType.SET, element="encoder", property="enabled", value=False)
         command.validate()
 
+    def test_apply_action_valid(self):
+        command = Command(action=ActionType.APPLY, element="camera", property="brightness", value=0.5)
+        command.validate()
+
+    def test_apply_action_missing_value_raises(self):
+        command = Command(action=ActionType.APPLY, element="camera", property="brightness")
+        with self.assertRaises(CommandValidationError) as context:
+            command.validate()
+        self.assertIn("Missing value", str(context.exception))
+
+    def test_feedback_action_valid(self):
+        command = Command(action=ActionType.FEEDBACK, value={"delay_ms": 40.0, "loss": 1.5})
+        command.validate()
+
+    def test_feedback_action_requires_dict(self):
+        command = Command(action=ActionType.FEEDBACK, value=40)
+        with self.assertRaises(CommandValidationError):
+            command.validate()
+
+    def test_keyframe_action_valid(self):
+        command = Command(action=ActionType.KEYFRAME)
+        command.validate()
+
+    def test_reconfigure_action_valid(self):
+        command = Command(action=ActionType.RECONFIGURE, value={"width": 640, "height": 480, "framerate": 60})
+        command.validate()
+
+    def test_reconfigure_requires_values(self):
+        for value in (None, {}, 30):
+            command = Command(action=ActionType.RECONFIGURE, value=value)
+            with self.assertRaises(CommandValidationError):
+                command.validate()
+
+    def test_reconfigure_rejects_unknown_key(self):
+        command = Command(action=ActionType.RECONFIGURE, value={"bitrate": 1000})
+        with self.assertRaises(CommandValidationError) as context:
+            command.validate()
+        self.assertIn("bitrate", str(context.exception))
+
+    def test_reconfigure_rejects_invalid_values(self):
+        for value in ({"framerate": 0}, {"framerate": "30"}, {"width": True}, {"width": 641}):
+            command = Command(action=ActionType.RECONFIGURE, value=value)
+            with self.assertRaises(CommandValidationError):
+                command.validate()
+
+    def test_apply_status_action_valid(self):
+        command = Command(action=ActionType.APPLY_STATUS, value=3)
+        command.validate()
+
+    def test_apply_status_action_invalid_id_raises(self):
+        command = Command(action=ActionType.APPLY_STATUS, value="3")
+        with self.assertRaises(CommandValidationError) as context:
+            command.validate()
+        self.assertIn("request id", str(context.exception))
+
     def test_stop_action_ignores_extra_fields(self):
         command = Command(action=ActionType.STOP, element="encoder", property="bitrate", value=5000)
         command.validate()
@@ -0,0 +1,120 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from v3xctrl_gst.ControlClient import ControlClient
+from v3xctrl_gst.ControlServer import ControlServer
+
+
+class TestControlClient(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.tmpdir, "control.sock")
+
+        self.streamer = MagicMock()
+        self.streamer.get_property.side_effect = lambda element, name: f"{element}.{name}"
+        self.streamer.set_property.return_value = True
+        self.streamer.get_stats.return_value = {"recording": False}
+
+        self.server = self._start_server()
+        self.client = ControlClient(self.socket_path, timeout=2.0)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        if self.server.thread:
+            self.server.thread.join(timeout=2)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _start_server(self) -> ControlServer:
+        server = ControlServer(self.streamer, socket_path=self.socket_path)
+        server.start()
+
+        deadline = time.monotonic() + 2
+        while not os.path.exists(self.socket_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        return server
+
+    def test_get_property(self):
+        response = self.client.get_property("encoder", "bitrate")
+
+        self.assertEqual(response["status"], "success")
+        self.assertEqual(response["value"], "encoder.bitrate")
+
+    def test_connection_is_reused(self):
+        self.client.stats()
+        sock = self.client._sock
+        self.client.stats()
+
+        self.assertIsNotNone(sock)
+        self.assertIs(self.client._sock, sock)
+
+    def test_non_persistent_closes_connection(self):
+        client = ControlClient(self.socket_path, persistent=False)
+        client.stats()
+
+        self.assertIsNone(client._sock)
+
+    def test_get_properties_pipelined(self):
+        responses = self.client.get_properties("camera", ["brightness", "contrast", "saturation"])
+
+        self.assertEqual([r["value"] for r in responses], ["camera.brightness", "camera.contrast", "camera.saturation"])
+
+    def test_set_properties_pipelined(self):
+        responses = self.client.set_properties("encoder", {"bitrate": 1000, "qp": 30})
+
+        self.assertEqual([r["status"] for r in responses], ["success", "success"])
+        self.streamer.set_property.assert_any_call("encoder", "bitrate", 1000)
+        self.streamer.set_property.assert_any_call("encoder", "qp", 30)
+
+    def test_large_response(self):
+        properties = {f"property-{i}": "x" * 64 for i in range(200)}
+        self.streamer.list_properties.return_value = properties
+
+        response = self.client.list_properties("camera")
+
+        self.assertEqual(response["status"], "success")
+        self.assertEqual(response["properties"], properties)
+
+    def test_reconnects_after_server_restart(self):
+        self.assertEqual(self.client.get_property("a", "b")["status"], "success")
+
+        self.server.stop()
+        self.server.thread.join(timeout=2)
+        self.server = self._start_server()
+
+        self.assertEqual(self.client.get_property("a", "b")["status"], "success")
+
+    def test_no_server_returns_error(self):
+        client = ControlClient(os.path.join(self.tmpdir, "missing.sock"))
+
+        responses = client.send_batch([{"action": "stats"}, {"action": "stats"}])
+
+        self.assertEqual([r["status"] for r in responses], ["error", "error"])
+
+    def test_request_keyframe(self):
+        self.streamer.request_keyframe.return_value = True
+
+        response = self.client.request_keyframe()
+
+        self.assertEqual(response, {"status": "success", "scheduled": True})
+
+    def test_reconfigure_sends_given_values(self):
+        self.streamer.reconfigure.return_value = True
+        self.streamer.settings = {"width": 1280, "height": 720, "framerate": 60}
+
+        response = self.client.reconfigure(framerate=60)
+
+        self.assertEqual(response["status"], "success")
+        self.streamer.reconfigure.assert_called_once_with(framerate=60)
+
+    def test_empty_batch(self):
+        self.assertEqual(self.client.send_batch([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
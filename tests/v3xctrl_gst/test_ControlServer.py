@@ -1,5 +1,8 @@
 import json
+import os
 import socket
+import tempfile
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -144,6 +147,92 @@ class TestHandleSet(unittest.TestCase):
         self.assertEqual(result["value"], 50)
 
 
+class TestHandleFeedback(unittest.TestCase):
+    def test_forwards_feedback_to_streamer(self):
+        streamer = MagicMock()
+        server = ControlServer(streamer)
+        command = Command(action=ActionType.FEEDBACK, value={"delay_ms": 35.0, "loss": 2.0})
+
+        result = server._handle_feedback(command)
+
+        self.assertEqual(result["status"], "success")
+        streamer.on_network_feedback.assert_called_once_with(35.0, 2.0)
+
+    def test_missing_values_are_none(self):
+        streamer = MagicMock()
+        server = ControlServer(streamer)
+        command = Command(action=ActionType.FEEDBACK, value={})
+
+        server._handle_feedback(command)
+
+        streamer.on_network_feedback.assert_called_once_with(None, None)
+
+
+class TestHandleKeyframe(unittest.TestCase):
+    def test_forwards_request_to_streamer(self):
+        streamer = MagicMock()
+        streamer.request_keyframe.return_value = False
+        server = ControlServer(streamer)
+
+        result = server._handle_keyframe(Command(action=ActionType.KEYFRAME))
+
+        self.assertEqual(result, {"status": "success", "scheduled": False})
+        streamer.request_keyframe.assert_called_once()
+
+
+class TestHandleReconfigure(unittest.TestCase):
+    def test_forwards_values_and_reports_format(self):
+        streamer = MagicMock()
+        streamer.reconfigure.return_value = True
+        streamer.settings = {"width": 640, "height": 480, "framerate": 60}
+        server = ControlServer(streamer)
+
+        result = server._handle_reconfigure(Command(action=ActionType.RECONFIGURE, value={"framerate": 60}))
+
+        self.assertEqual(result, {"status": "success", "width": 640, "height": 480, "framerate": 60})
+        streamer.reconfigure.assert_called_once_with(framerate=60)
+
+    def test_failure_is_reported(self):
+        streamer = MagicMock()
+        streamer.reconfigure.return_value = False
+        streamer.settings = {"width": 1280, "height": 720, "framerate": 30}
+        server = ControlServer(streamer)
+
+        result = server._handle_reconfigure(Command(action=ActionType.RECONFIGURE, value={"width": 640}))
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["width"], 1280)
+
+
+class TestHandleApply(unittest.TestCase):
+    def setUp(self):
+        self.streamer = MagicMock()
+        self.server = ControlServer(self.streamer)
+
+    def test_apply_returns_request_id(self):
+        self.streamer.apply_property.return_value = 7
+        command = Command(action=ActionType.APPLY, element="camera", property="brightness", value=0.5)
+        result = self.server._handle_apply(command)
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["id"], 7)
+        self.streamer.apply_property.assert_called_once_with("camera", "brightness", 0.5)
+        self.streamer.set_property.assert_not_called()
+
+    def test_apply_status(self):
+        self.streamer.get_apply_status.return_value = {"id": 7, "status": "applied"}
+        command = Command(action=ActionType.APPLY_STATUS, value=7)
+        result = self.server._handle_apply_status(command)
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["request"]["status"], "applied")
+
+    def test_apply_status_unknown_id(self):
+        self.streamer.get_apply_status.return_value = None
+        command = Command(action=ActionType.APPLY_STATUS, value=99)
+        result = self.server._handle_apply_status(command)
+        self.assertEqual(result["status"], "error")
+        self.assertIn("99", result["message"])
+
+
 class TestHandleRecording(unittest.TestCase):
     def setUp(self):
         self.streamer = MagicMock()
@@ -242,6 +331,67 @@ class TestHandleClient(unittest.TestCase):
         self.assertEqual(response["status"], "error")
         client_socket.close.assert_called_once()
 
+    def test_pipelined_commands(self):
+        data = b'{"action": "stats"}\n{"action": "stop"}\n'
+        self.streamer.get_stats.return_value = {"recording": False}
+        client_socket = self._make_mock_socket([data, b""])
+        self.server._handle_client(client_socket)
+
+        client_socket.sendall.assert_called_once()
+        lines = client_socket.sendall.call_args[0][0].decode("utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0]), {"recording": False})
+        self.assertEqual(json.loads(lines[1])["status"], "success")
+
+    def test_command_split_across_reads(self):
+        client_socket = self._make_mock_socket([b'{"action": ', b'"stop"}\n', b""])
+        self.server._handle_client(client_socket)
+
+        self.streamer.stop.assert_called_once()
+        client_socket.sendall.assert_called_once()
+
+    def test_unterminated_command_answered_when_idle(self):
+        client_socket = self._make_mock_socket([b'{"action": "stop"}', TimeoutError(), b""])
+        self.server._handle_client(client_socket)
+
+        self.streamer.stop.assert_called_once()
+        client_socket.sendall.assert_called_once()
+        client_socket.settimeout.assert_any_call(ControlServer.LEGACY_COMMAND_TIMEOUT)
+
+    def test_partial_command_not_parsed_per_read(self):
+        client_socket = self._make_mock_socket([b'{"action": ', b'"st', b'op"}\n', b""])
+        with patch.object(self.server, "_is_complete") as is_complete:
+            self.server._handle_client(client_socket)
+
+        is_complete.assert_not_called()
+        self.streamer.stop.assert_called_once()
+
+    def test_incomplete_command_checked_once_while_idle(self):
+        client_socket = self._make_mock_socket([b'{"action": ', TimeoutError(), b'"stop"}\n', b""])
+        self.server._handle_client(client_socket)
+
+        self.assertEqual(
+            [c.args[0] for c in client_socket.settimeout.call_args_list],
+            [None, ControlServer.LEGACY_COMMAND_TIMEOUT, None, None],
+        )
+        self.streamer.stop.assert_called_once()
+
+    def test_multiple_commands_per_connection(self):
+        client_socket = self._make_mock_socket([b'{"action": "stop"}\n', b'{"action": "stop"}\n', b""])
+        self.server._handle_client(client_socket)
+
+        self.assertEqual(self.streamer.stop.call_count, 2)
+        self.assertEqual(client_socket.sendall.call_count, 2)
+
+    def test_oversized_command_rejected(self):
+        with patch.object(ControlServer, "MAX_COMMAND_SIZE", 8):
+            client_socket = self._make_mock_socket([b'{"action": "sto', b""])
+            self.server._handle_client(client_socket)
+
+        response = json.loads(client_socket.sendall.call_args[0][0].decode("utf-8"))
+        self.assertEqual(response["status"], "error")
+        self.assertIn("too large", response["message"])
+
     def test_empty_data_disconnect(self):
         client_socket = self._make_mock_socket([b""])
         self.server._handle_client(client_socket)
@@ -373,6 +523,29 @@ class TestStop(unittest.TestCase):
             self.assertFalse(self.server.running)
             mock_exists.assert_called_once_with(self.server.socket_path)
 
+    def test_stopped_thread_keeps_socket_of_new_server(self):
+        """A server thread finishing late must not remove the path of its successor."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = os.path.join(tmpdir, "control.sock")
+            old = ControlServer(self.streamer, socket_path=socket_path)
+            old.start()
+            while not os.path.exists(socket_path):
+                time.sleep(0.01)
+
+            old.stop()
+            new = ControlServer(self.streamer, socket_path=socket_path)
+            new.start()
+            assert old.thread is not None
+            old.thread.join(timeout=2)
+
+            deadline = time.monotonic() + 2
+            while not os.path.exists(socket_path) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            try:
+                self.assertTrue(os.path.exists(socket_path))
+            finally:
+                new.stop()
+
 
 if __name__ == "__main__":
     unittest.main()
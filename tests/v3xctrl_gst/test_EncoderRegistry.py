@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+class TestEncoderRegistry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_v4l2_builder = MagicMock(name="V4L2EncoderBuilder")
+        cls.mock_x264_builder = MagicMock(name="X264EncoderBuilder")
+        cls.mock_openh264_builder = MagicMock(name="OpenH264EncoderBuilder")
+
+    def _get_registry(self):
+        with (
+            patch.dict(
+                "sys.modules",
+                {
+                    "gi": MagicMock(),
+                    "gi.repository": MagicMock(),
+                },
+            ),
+            patch("v3xctrl_gst.Encoders.V4L2EncoderBuilder", self.mock_v4l2_builder),
+            patch("v3xctrl_gst.Encoders.X264EncoderBuilder", self.mock_x264_builder),
+            patch("v3xctrl_gst.Encoders.OpenH264EncoderBuilder", self.mock_openh264_builder),
+        ):
+            import importlib
+
+            import v3xctrl_gst.EncoderRegistry as module
+
+            importlib.reload(module)
+            return module.EncoderRegistry
+
+    def test_list_encoders_returns_all_names(self):
+        registry = self._get_registry()
+        self.assertEqual(sorted(registry.list_encoders()), ["openh264", "v4l2", "x264"])
+
+    def test_create_v4l2_returns_correct_builder(self):
+        registry = self._get_registry()
+        settings = {"bitrate": 1800000}
+        registry.create("v4l2", settings)
+        self.mock_v4l2_builder.assert_called_with(settings)
+
+    def test_create_x264_returns_correct_builder(self):
+        registry = self._get_registry()
+        settings = {"bitrate": 1800000}
+        registry.create("x264", settings)
+        self.mock_x264_builder.assert_called_with(settings)
+
+    def test_create_openh264_returns_correct_builder(self):
+        registry = self._get_registry()
+        settings = {"bitrate": 1800000}
+        registry.create("openh264", settings)
+        self.mock_openh264_builder.assert_called_with(settings)
+
+    def test_error_message_lists_available_encoders(self):
+        registry = self._get_registry()
+        with self.assertRaises(ValueError) as context:
+            registry.create("nvenc", {})
+        error_message = str(context.exception)
+        self.assertIn("nvenc", error_message)
+        self.assertIn("v4l2", error_message)
+        self.assertIn("x264", error_message)
+        self.assertIn("openh264", error_message)
+
+
+if __name__ == "__main__":
+    unittest.main()
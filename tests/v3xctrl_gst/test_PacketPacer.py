@@ -0,0 +1,129 @@
+import socket
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from v3xctrl_gst.PacketPacer import PacketPacer
+
+
+class TestSchedule(unittest.TestCase):
+    def setUp(self):
+        # 10 fps, spread over half of the 100ms interval
+        self.pacer = PacketPacer("127.0.0.1", 5000, 0, framerate=10, fraction=0.5, burst_bytes=2000)
+
+    def test_small_frame_is_sent_at_once(self):
+        self.assertEqual(self.pacer.schedule([1000, 500], 1.0), [1.0, 1.0])
+
+    def test_burst_then_paced(self):
+        times = self.pacer.schedule([1000] * 6, 0.0)
+
+        # 2000 bytes burst, remaining 4000 bytes over 50ms
+        self.assertEqual(times[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(times[3], 0.0125)
+        self.assertAlmostEqual(times[4], 0.025)
+        self.assertAlmostEqual(times[5], 0.0375)
+
+    def test_spread_stays_within_fraction(self):
+        times = self.pacer.schedule([1400] * 20, 0.0)
+
+        self.assertLess(max(times), 0.05)
+        self.assertEqual(times, sorted(times))
+
+    def test_no_burst_allowance(self):
+        self.pacer.burst_bytes = 0
+        times = self.pacer.schedule([1000] * 4, 0.0)
+
+        self.assertEqual(times[0], 0.0)
+        self.assertAlmostEqual(times[1], 0.0125)
+
+
+class TestPacketPacer(unittest.TestCase):
+    def setUp(self):
+        self.receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.receiver.bind(("127.0.0.1", 0))
+        self.receiver.settimeout(2)
+        port = self.receiver.getsockname()[1]
+
+        self.pacer = PacketPacer("127.0.0.1", port, 0, framerate=30, fraction=0.5, burst_bytes=1000)
+        self.pacer.start()
+
+    def tearDown(self):
+        self.pacer.stop()
+        self.receiver.close()
+
+    def _receive(self, count: int) -> list[tuple[bytes, float]]:
+        return [(self.receiver.recv(2048), time.monotonic()) for _ in range(count)]
+
+    def test_packets_are_sent_in_order(self):
+        packets = [bytes([i]) * 500 for i in range(8)]
+        self.pacer.submit(packets)
+
+        received = self._receive(8)
+
+        self.assertEqual([data for data, _ in received], packets)
+
+    def test_packets_are_spread(self):
+        packets = [b"x" * 1000 for _ in range(10)]
+        self.pacer.submit(packets)
+
+        received = self._receive(10)
+
+        # 9000 paced bytes over ~16.7ms
+        spread = received[-1][1] - received[0][1]
+        self.assertGreater(spread, 0.01)
+        self.assertLess(spread, 0.1)
+
+    def test_stats(self):
+        self.pacer.submit([b"x" * 100, b"y" * 100])
+        self._receive(2)
+
+        deadline = time.monotonic() + 1
+        while self.pacer.get_stats()["pacing_frames"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        stats = self.pacer.get_stats()
+        self.assertEqual(stats["pacing_frames"], 1)
+        self.assertEqual(stats["pacing_packets"], 2)
+        self.assertEqual(stats["pacing_bytes"], 200)
+        self.assertEqual(stats["pacing_errors"], 0)
+        self.assertGreaterEqual(stats["pacing_delay_max_ms"], stats["pacing_delay_avg_ms"])
+
+    def test_empty_frame_is_ignored(self):
+        self.pacer.submit([])
+
+        self.assertEqual(self.pacer.get_stats()["pacing_frames"], 0)
+
+    def test_backlog_is_flushed(self):
+        self.pacer.stop()
+        self.pacer.frame_interval = 10.0
+        self.pacer.start()
+
+        # With a 10s frame interval pacing would take seconds, only the last
+        # frame is paced
+        for _ in range(3):
+            self.pacer.submit([b"x" * 1000 for _ in range(4)])
+
+        start = time.monotonic()
+        self._receive(8)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertGreater(self.pacer.get_stats()["pacing_flushed_packets"], 0)
+
+
+class TestSendErrors(unittest.TestCase):
+    def test_error_is_reported(self):
+        on_error = MagicMock()
+        pacer = PacketPacer("127.0.0.1", 5000, 0, framerate=30, on_error=on_error)
+        error = OSError(101, "Network is unreachable")
+        pacer._sock = MagicMock()
+        pacer._sock.sendto.side_effect = error
+
+        pacer._send_frame(time.monotonic(), [b"x"])
+
+        on_error.assert_called_once_with(error)
+        self.assertEqual(pacer.get_stats()["pacing_errors"], 1)
+        self.assertEqual(pacer.get_stats()["pacing_packets"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,33 @@ def timer():
     return PipelineTimer(log_interval=1.0)
 
 
+def _track(timer, pts, source=1.0, capture_delay=0.0, capsfilter=0.0, encoder=0.0, payloader_in=0.0):
+    """Put a frame into the next slot as if it had passed the given probes."""
+    slot = timer._next_slot
+    timer._next_slot = (slot + 1) % timer.SLOTS
+    timer._pts[slot] = pts
+    timer._source[slot] = source
+    timer._capture_delay[slot] = capture_delay
+    timer._capsfilter[slot] = capsfilter
+    timer._encoder[slot] = encoder
+    timer._payloader_in[slot] = payloader_in
+    return slot
+
+
+def _complete(timer, pts, capture_delay=5.0):
+    now = time.monotonic()
+    _track(
+        timer,
+        pts,
+        source=now - 0.010,
+        capture_delay=capture_delay,
+        capsfilter=now - 0.008,
+        encoder=now - 0.003,
+        payloader_in=now - 0.001,
+    )
+    timer.on_udpsink_buffer_list(pts)
+
+
 class TestEnableDisable:
     def test_disabled_by_default(self, timer):
         assert timer.enabled is False
@@ -29,13 +56,13 @@ class TestEnableDisable:
 
     def test_enable_clears_state(self, timer):
         timer.enable()
-        timer._data[123] = {"source": 1.0}
-        timer._stats["capture"].append(5.0)
+        _complete(timer, 100)
+        _track(timer, 123)
         timer._debug["source_probe"] = 10
 
         timer.enable()
-        assert timer._data == {}
-        assert timer._stats["capture"] == []
+        assert timer._find_slot(123) == -1
+        assert timer._sample_count == 0
         assert timer._debug["source_probe"] == 0
 
 
@@ -43,7 +70,7 @@ class TestNoOpWhenDisabled:
     def test_on_source_buffer_noop(self, timer):
         pipeline = MagicMock()
         timer.on_source_buffer(100, pipeline)
-        assert timer._data == {}
+        assert timer._find_slot(100) == -1
         pipeline.get_clock.assert_not_called()
 
     def test_on_capsfilter_buffer_noop(self, timer):
@@ -60,7 +87,7 @@ class TestNoOpWhenDisabled:
 
     def test_on_udpsink_buffer_list_noop(self, timer):
         timer.on_udpsink_buffer_list(100)
-        assert timer._stats["payloader"] == []
+        assert timer._sample_count == 0
 
 
 class TestSourceBuffer:
@@ -78,22 +105,64 @@ class TestSourceBuffer:
         pts = 1 * GST_SECOND
         timer.on_source_buffer(pts, pipeline)
 
-        assert pts in timer._data
-        assert "source" in timer._data[pts]
-        assert "capture_delay" in timer._data[pts]
-        assert timer._data[pts]["capture_delay"] == pytest.approx(1000.0)
+        slot = timer._find_slot(pts)
+        assert slot >= 0
+        assert timer._source[slot] > 0
+        assert timer._capture_delay[slot] == pytest.approx(1000.0)
         assert timer._debug["source_probe"] == 1
 
+    @patch("v3xctrl_gst.PipelineTimer.Gst")
+    def test_buffer_without_pts_is_skipped(self, mock_gst, timer):
+        mock_gst.CLOCK_TIME_NONE = 2**64 - 1
+        timer.enable()
+
+        timer.on_source_buffer(2**64 - 1, MagicMock())
+
+        assert timer._next_slot == 0
+        assert timer._debug["source_probe"] == 0
+
+    @patch("v3xctrl_gst.PipelineTimer.Gst")
+    def test_slots_wrap_around(self, mock_gst, timer):
+        mock_gst.MSECOND = GST_MSECOND
+        timer.enable()
+        pipeline = MagicMock()
+        pipeline.get_clock.return_value.get_time.return_value = 0
+        pipeline.get_base_time.return_value = 0
+
+        for pts in range(timer.SLOTS + 1):
+            timer.on_source_buffer(pts, pipeline)
+
+        # The oldest frame was overwritten, no purge needed
+        assert timer._find_slot(0) == -1
+        assert timer._find_slot(timer.SLOTS) == 0
+        assert timer._find_slot(1) == 1
+
+    @patch("v3xctrl_gst.PipelineTimer.Gst")
+    def test_reused_slot_clears_stage_times(self, mock_gst, timer):
+        mock_gst.MSECOND = GST_MSECOND
+        timer.enable()
+        slot = _track(timer, 5, capsfilter=1.0, encoder=2.0, payloader_in=3.0)
+        timer._next_slot = slot
+        pipeline = MagicMock()
+        pipeline.get_clock.return_value.get_time.return_value = 0
+        pipeline.get_base_time.return_value = 0
+
+        timer.on_source_buffer(6, pipeline)
+
+        assert timer._capsfilter[slot] == 0.0
+        assert timer._encoder[slot] == 0.0
+        assert timer._payloader_in[slot] == 0.0
+
 
 class TestCapsfilterBuffer:
     def test_records_capsfilter_timing(self, timer):
         timer.enable()
         pts = 100
-        timer._data[pts] = {"source": time.monotonic()}
+        slot = _track(timer, pts, source=time.monotonic())
 
         timer.on_capsfilter_buffer(pts)
 
-        assert "capsfilter" in timer._data[pts]
+        assert timer._capsfilter[slot] > 0
         assert timer._debug["capsfilter_probe"] == 1
 
     def test_capsfilter_miss(self, timer):
@@ -107,13 +176,23 @@ class TestEncoderBuffer:
     def test_records_encoder_timing(self, timer):
         timer.enable()
         pts = 100
-        timer._data[pts] = {"source": 1.0, "capsfilter": 1.001}
+        slot = _track(timer, pts, source=1.0, capsfilter=1.001)
 
         timer.on_encoder_buffer(pts)
 
-        assert "encoder" in timer._data[pts]
+        assert timer._encoder[slot] > 0
         assert timer._debug["encoder_probe"] == 1
 
+    def test_finds_older_frame_in_flight(self, timer):
+        timer.enable()
+        slot = _track(timer, 100, capsfilter=1.0)
+        _track(timer, 200)
+        _track(timer, 300)
+
+        timer.on_encoder_buffer(100)
+
+        assert timer._encoder[slot] > 0
+
     def test_encoder_miss(self, timer):
         timer.enable()
         timer.on_encoder_buffer(999)
@@ -131,7 +210,7 @@ class TestPayloaderIn:
     def test_incomplete_when_missing_stages(self, timer):
         timer.enable()
         pts = 100
-        timer._data[pts] = {"source": 1.0}
+        _track(timer, pts)
 
         timer.on_payloader_in(pts)
 
@@ -141,15 +220,11 @@ class TestPayloaderIn:
         timer.enable()
         pts = 100
         now = time.monotonic()
-        timer._data[pts] = {
-            "source": now - 0.010,
-            "capsfilter": now - 0.008,
-            "encoder": now - 0.003,
-        }
+        slot = _track(timer, pts, source=now - 0.010, capsfilter=now - 0.008, encoder=now - 0.003)
 
         timer.on_payloader_in(pts)
 
-        assert "payloader_in" in timer._data[pts]
+        assert timer._payloader_in[slot] > 0
         assert timer._debug["udp_probe"] == 1
 
 
@@ -158,82 +233,86 @@ class TestUdpsinkBufferList:
         timer.enable()
         timer.on_udpsink_buffer_list(999)
 
-        assert timer._stats["capture"] == []
+        assert timer._sample_count == 0
 
     def test_missing_payloader_in_is_noop(self, timer):
         timer.enable()
         pts = 100
-        timer._data[pts] = {"source": 1.0, "capsfilter": 1.001, "encoder": 1.002}
+        _track(timer, pts, source=1.0, capsfilter=1.001, encoder=1.002)
 
         timer.on_udpsink_buffer_list(pts)
 
-        assert timer._stats["capture"] == []
-        assert pts in timer._data
+        assert timer._sample_count == 0
+        assert timer._find_slot(pts) >= 0
 
     def test_full_pipeline_timing(self, timer):
         timer.enable()
         pts = 100
-        now = time.monotonic()
-        timer._data[pts] = {
-            "source": now - 0.010,
-            "capture_delay": 5.0,
-            "capsfilter": now - 0.008,
-            "encoder": now - 0.003,
-            "payloader_in": now - 0.001,
-        }
 
-        timer.on_udpsink_buffer_list(pts)
+        _complete(timer, pts, capture_delay=5.0)
+
+        assert timer._find_slot(pts) == -1
+        assert timer._sample_count == 1
+        assert timer._samples["capture"][0] == pytest.approx(5.0)
+        assert timer._samples["capsfilter"][0] == pytest.approx(2.0, abs=0.5)
+        assert timer._samples["encode"][0] == pytest.approx(5.0, abs=0.5)
+        assert timer._samples["package"][0] == pytest.approx(2.0, abs=0.5)
+        assert timer._samples["total"][0] == pytest.approx(15.0, abs=1.0)
 
-        assert pts not in timer._data
-        assert len(timer._stats["capture"]) == 1
-        assert len(timer._stats["encode"]) == 1
-        assert len(timer._stats["package"]) == 1
-        assert len(timer._stats["payloader"]) == 1
-        assert timer._stats["capture"][0] == pytest.approx(5.0)
 
-    def test_old_entries_cleaned_up(self, timer):
+class TestPercentiles:
+    def test_empty(self, timer):
         timer.enable()
-        for i in range(105):
-            timer._data[i] = {"source": 1.0}
 
-        pts = 200
-        now = time.monotonic()
-        timer._data[pts] = {
-            "source": now,
-            "capture_delay": 0,
-            "capsfilter": now,
-            "encoder": now,
-            "payloader_in": now,
-        }
+        assert timer.percentiles("encode") == {50: 0.0, 95: 0.0, 99: 0.0}
 
-        timer.on_udpsink_buffer_list(pts)
+    def test_percentiles(self, timer):
+        timer.enable()
+        for value in range(1, 101):
+            _complete(timer, value, capture_delay=float(value))
 
-        # All entries with PTS < 200 should be purged
-        assert all(k >= 200 for k in timer._data)
+        result = timer.percentiles("capture")
+
+        assert result[50] == pytest.approx(51.0)
+        assert result[95] == pytest.approx(96.0)
+        assert result[99] == pytest.approx(100.0)
+
+    def test_window_keeps_latest_frames(self, timer):
+        timer.enable()
+        for pts in range(timer.WINDOW):
+            _complete(timer, pts, capture_delay=1000.0)
+        for pts in range(timer.WINDOW, timer.WINDOW * 2):
+            _complete(timer, pts, capture_delay=1.0)
+
+        assert timer.percentiles("capture")[99] == pytest.approx(1.0)
+
+    def test_get_stats(self, timer):
+        timer.enable()
+        _complete(timer, 100, capture_delay=7.5)
+
+        stats = timer.get_stats()
+
+        assert stats["timing_frames"] == 1
+        assert stats["timing_capture_p50_ms"] == 7.5
+        for stage in timer.STAGES:
+            for p in timer.PERCENTILES:
+                assert f"timing_{stage}_p{p}_ms" in stats
 
 
 class TestLogStats:
     def test_log_stats_called_on_interval(self, timer):
         timer = PipelineTimer(log_interval=0.0)
         timer.enable()
-
-        pts = 100
-        now = time.monotonic()
-        timer._data[pts] = {
-            "source": now - 0.010,
-            "capture_delay": 5.0,
-            "capsfilter": now - 0.008,
-            "encoder": now - 0.003,
-            "payloader_in": now - 0.001,
-        }
-        timer._last_log = now - 1.0
+        timer._last_log = time.monotonic() - 1.0
 
         with patch("v3xctrl_gst.PipelineTimer.logger") as mock_logger:
-            timer.on_udpsink_buffer_list(pts)
+            _complete(timer, 100)
             mock_logger.debug.assert_called_once()
             assert "[TIMING]" in mock_logger.debug.call_args[0][0]
 
-        assert timer._stats["capture"] == []
+        # Samples stay available for percentiles after logging
+        assert timer._frames_since_log == 0
+        assert timer._sample_count == 1
 
     def test_log_stats_skipped_when_empty(self, timer):
         timer.enable()
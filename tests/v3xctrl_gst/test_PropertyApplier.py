@@ -0,0 +1,174 @@
+import unittest
+from unittest.mock import MagicMock
+
+from v3xctrl_gst.PropertyApplier import ApplyStatus, PropertyApplier
+
+
+class FakeLoop:
+    """Collects scheduled callbacks so tests can run the main loop by hand."""
+
+    def __init__(self):
+        self.idle = []
+        self.timeouts = []
+
+    def idle_add(self, callback, *args):
+        self.idle.append((callback, args))
+
+    def timeout_add(self, interval, callback, *args):
+        self.timeouts.append((callback, args))
+
+    def run_idle(self):
+        idle, self.idle = self.idle, []
+        for callback, args in idle:
+            callback(*args)
+
+    def run_timeouts(self):
+        timeouts, self.timeouts = self.timeouts, []
+        for callback, args in timeouts:
+            callback(*args)
+
+
+class FakeElement:
+    def __init__(self, sticky: bool = True):
+        self.values = {}
+        self.sticky = sticky
+        self.set_calls = []
+
+    def set_property(self, name, value):
+        self.set_calls.append((name, value))
+        if self.sticky:
+            self.values[name] = value
+
+    def get_property(self, name):
+        return self.values.get(name)
+
+
+class TestPropertyApplier(unittest.TestCase):
+    def setUp(self):
+        self.loop = FakeLoop()
+        self.element = FakeElement()
+        self.elements = {"camera": self.element}
+        self.applier = PropertyApplier(self.elements.get, self.loop.idle_add, self.loop.timeout_add)
+
+    def test_submit_does_not_apply_immediately(self):
+        request_id = self.applier.submit("camera", "brightness", 0.5)
+
+        self.assertEqual(self.element.set_calls, [])
+        self.assertEqual(self.applier.status(request_id)["status"], "pending")
+
+    def test_apply_and_verify(self):
+        callback = MagicMock()
+        request_id = self.applier.submit("camera", "brightness", 0.5, callback)
+
+        self.loop.run_idle()
+        self.assertEqual(self.element.set_calls, [("brightness", 0.5)])
+        callback.assert_not_called()
+
+        self.loop.run_timeouts()
+        self.assertEqual(self.applier.status(request_id)["status"], "applied")
+        callback.assert_called_once()
+        self.assertEqual(callback.call_args[0][0].status, ApplyStatus.APPLIED)
+
+    def test_single_idle_callback_for_many_submits(self):
+        self.applier.submit("camera", "brightness", 0.1)
+        self.applier.submit("camera", "contrast", 1.2)
+
+        self.assertEqual(len(self.loop.idle), 1)
+
+    def test_queued_changes_are_coalesced(self):
+        first = self.applier.submit("camera", "brightness", 0.1)
+        second = self.applier.submit("camera", "brightness", 0.2)
+        third = self.applier.submit("camera", "brightness", 0.3)
+
+        self.loop.run_idle()
+        self.loop.run_timeouts()
+
+        self.assertEqual(self.element.set_calls, [("brightness", 0.3)])
+        self.assertEqual(self.applier.status(first)["status"], "superseded")
+        self.assertEqual(self.applier.status(second)["status"], "superseded")
+        self.assertEqual(self.applier.status(third)["status"], "applied")
+
+    def test_change_during_verification_supersedes(self):
+        first = self.applier.submit("camera", "brightness", 0.1)
+        self.loop.run_idle()
+
+        second = self.applier.submit("camera", "brightness", 0.2)
+        self.loop.run_idle()
+        self.loop.run_timeouts()
+
+        self.assertEqual(self.applier.status(first)["status"], "superseded")
+        self.assertEqual(self.applier.status(second)["status"], "applied")
+        self.assertEqual(self.element.values["brightness"], 0.2)
+
+    def test_retries_until_failed(self):
+        self.element.sticky = False
+        request_id = self.applier.submit("camera", "brightness", 0.5, max_retries=3)
+
+        self.loop.run_idle()
+        for _ in range(3):
+            self.loop.run_timeouts()
+
+        status = self.applier.status(request_id)
+        self.assertEqual(status["status"], "failed")
+        self.assertEqual(status["attempts"], 3)
+        self.assertEqual(len(self.element.set_calls), 3)
+        self.assertEqual(self.loop.timeouts, [])
+
+    def test_retry_succeeds(self):
+        self.element.sticky = False
+        request_id = self.applier.submit("camera", "brightness", 0.5)
+
+        self.loop.run_idle()
+        self.element.sticky = True
+        self.loop.run_timeouts()
+        self.loop.run_timeouts()
+
+        status = self.applier.status(request_id)
+        self.assertEqual(status["status"], "applied")
+        self.assertEqual(status["attempts"], 2)
+
+    def test_float_comparison_is_approximate(self):
+        request_id = self.applier.submit("camera", "brightness", 0.5)
+        self.loop.run_idle()
+        self.element.values["brightness"] = 0.50001
+        self.loop.run_timeouts()
+
+        self.assertEqual(self.applier.status(request_id)["status"], "applied")
+
+    def test_missing_element_fails(self):
+        request_id = self.applier.submit("encoder", "bitrate", 1000)
+        self.loop.run_idle()
+
+        self.assertEqual(self.applier.status(request_id)["status"], "failed")
+
+    def test_set_property_error_fails(self):
+        self.element.set_property = MagicMock(side_effect=TypeError("wrong type"))
+        request_id = self.applier.submit("camera", "brightness", "bright")
+        self.loop.run_idle()
+
+        self.assertEqual(self.applier.status(request_id)["status"], "failed")
+        self.assertEqual(self.loop.timeouts, [])
+
+    def test_pending_count(self):
+        self.applier.submit("camera", "brightness", 0.1)
+        self.applier.submit("camera", "contrast", 1.1)
+        self.assertEqual(self.applier.pending(), 2)
+
+        self.loop.run_idle()
+        self.loop.run_timeouts()
+        self.assertEqual(self.applier.pending(), 0)
+
+    def test_unknown_request(self):
+        self.assertIsNone(self.applier.status(123))
+
+    def test_history_is_bounded(self):
+        self.applier.HISTORY_SIZE = 2
+        first = self.applier.submit("camera", "a", 1)
+        self.applier.submit("camera", "b", 1)
+        self.applier.submit("camera", "c", 1)
+
+        self.assertIsNone(self.applier.status(first))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+import unittest
+from unittest.mock import MagicMock
+
+from v3xctrl_gst.QPController import QPController
+
+
+class TestQPController(unittest.TestCase):
+    def setUp(self):
+        self.apply = MagicMock()
+        # 30 fps, one I-frame per second
+        self.controller = QPController(
+            apply=self.apply,
+            target_bytes_per_second=30_000,
+            framerate=30,
+            gop=30,
+            qp_min=20,
+            qp_max=51,
+            smoothing=1.0,
+            update_interval=1,
+        )
+
+    def _feed(self, controller: QPController, i_size: int, p_size: int, frames: int = 30) -> None:
+        for n in range(frames):
+            keyframe = n % controller.gop == 0
+            controller.on_frame(i_size if keyframe else p_size, keyframe)
+
+    def test_initial_state(self):
+        self.assertEqual(self.controller.current_qp_min, 20)
+        self.assertEqual(self.controller.qp_max, 51)
+        self.assertIsNone(self.controller.estimated_rate())
+
+    def test_estimated_rate_combines_frame_types(self):
+        self.controller.update_interval = 100
+        self.controller.on_frame(3000, True)
+        self.controller.on_frame(1000, False)
+
+        # (3000 + 29 * 1000) / 30 * 30
+        self.assertAlmostEqual(self.controller.estimated_rate(), 32_000)
+
+    def test_estimated_rate_with_single_frame_type(self):
+        self.controller.update_interval = 100
+        self.controller.on_frame(1000, False)
+
+        self.assertAlmostEqual(self.controller.estimated_rate(), 30_000)
+
+    def test_on_target_no_change(self):
+        self._feed(self.controller, 1000, 1000)
+
+        self.apply.assert_not_called()
+        self.assertEqual(self.controller.current_qp_min, 20)
+
+    def test_within_deadband_no_change(self):
+        # ~5% over target is about 0.4 QP
+        self._feed(self.controller, 1050, 1050)
+
+        self.apply.assert_not_called()
+
+    def test_over_target_raises_qp(self):
+        # Twice the target is 6 QP off
+        self.controller.update_interval = 30
+        self._feed(self.controller, 2000, 2000)
+
+        self.assertGreater(self.controller.current_qp_min, 20)
+        self.apply.assert_called_once_with(self.controller.current_qp_min, 51)
+
+    def test_under_target_is_limited_to_qp_min(self):
+        self._feed(self.controller, 100, 100)
+
+        self.assertEqual(self.controller.current_qp_min, 20)
+        self.apply.assert_not_called()
+
+    def test_converges_on_model_encoder(self):
+        # Frame sizes follow the QP model: 4x target at QP 20 means QP 32 fits
+        controller = QPController(
+            apply=self.apply,
+            target_bytes_per_second=30_000,
+            framerate=30,
+            gop=30,
+            qp_min=20,
+            qp_max=51,
+        )
+
+        for _ in range(20):
+            scale = 2 ** (-(controller.current_qp_min - 20) / 6)
+            self._feed(controller, round(12_000 * scale), round(4000 * scale))
+
+        self.assertIn(controller.current_qp_min, range(31, 34))
+
+    def test_lowers_qp_when_rate_drops(self):
+        self.controller.update_interval = 30
+        self._feed(self.controller, 4000, 4000)
+        raised = self.controller.current_qp_min
+
+        for _ in range(10):
+            self._feed(self.controller, 250, 250)
+
+        self.assertLess(self.controller.current_qp_min, raised)
+
+    def test_error_outside_deadband_moves_qp(self):
+        """An earlier error of the other sign must not hold the QP in place."""
+        self.controller.update_interval = 30
+        self._feed(self.controller, 4000, 4000)
+        raised = self.controller.current_qp_min
+
+        # Constantly about 1.4 QP under target
+        self.controller.update_interval = 1
+        size = round(1000 * 2 ** (-1.41 / 6))
+        for _ in range(2):
+            self.controller.on_frame(size, False)
+
+        self.assertLess(self.controller.current_qp_min, raised)
+
+    def test_does_not_overshoot_on_model_encoder(self):
+        controller = QPController(
+            apply=self.apply,
+            target_bytes_per_second=30_000,
+            framerate=30,
+            gop=30,
+            qp_min=20,
+            qp_max=51,
+        )
+
+        qps = []
+        for _ in range(20):
+            scale = 2 ** (-(controller.current_qp_min - 20) / 6)
+            self._feed(controller, round(12_000 * scale), round(4000 * scale))
+            qps.append(controller.current_qp_min)
+
+        # 4x the target at QP 20, QP 32 fits
+        self.assertLessEqual(max(qps), 34)
+
+    def test_respects_qp_max(self):
+        for _ in range(10):
+            self._feed(self.controller, 1_000_000, 1_000_000)
+
+        self.assertEqual(self.controller.current_qp_min, 51)
+        self.assertEqual(self.controller.qp_max, 51)
+
+    def test_qp_range_moves_maximum(self):
+        controller = QPController(
+            apply=self.apply,
+            target_bytes_per_second=30_000,
+            framerate=30,
+            gop=30,
+            qp_min=20,
+            qp_max=51,
+            qp_range=10,
+            smoothing=1.0,
+            update_interval=30,
+        )
+
+        self.assertEqual(controller.qp_max, 30)
+        self._feed(controller, 2000, 2000)
+        self.assertEqual(controller.qp_max, controller.current_qp_min + 10)
+
+    def test_hysteresis_suppresses_small_steps(self):
+        self.controller.hysteresis = 5
+        self.controller.update_interval = 30
+        # ~1.2 QP off, ki 0.4 -> less than 5 QP step
+        self._feed(self.controller, 1150, 1150)
+
+        self.apply.assert_not_called()
+
+    def test_set_target(self):
+        self.controller.update_interval = 30
+        self.controller.set_target(60_000)
+        self._feed(self.controller, 2000, 2000)
+
+        self.apply.assert_not_called()
+
+    def test_update_interval(self):
+        self.controller.update_interval = 10
+        for _ in range(9):
+            self.assertFalse(self.controller.on_frame(10_000, False))
+
+        self.assertTrue(self.controller.on_frame(10_000, False))
+
+    def test_get_stats(self):
+        self.controller.update_interval = 100
+        self.controller.on_frame(3000, True)
+        self.controller.on_frame(1000, False)
+
+        stats = self.controller.get_stats()
+
+        self.assertEqual(stats["qp_min"], 20)
+        self.assertEqual(stats["avg_i_bytes"], 3000)
+        self.assertEqual(stats["avg_p_bytes"], 1000)
+        self.assertEqual(stats["rate_bytes"], 32_000)
+        self.assertEqual(stats["target_bytes"], 30_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
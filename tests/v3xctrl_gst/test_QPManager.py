@@ -202,6 +202,15 @@ class TestApplyQP(unittest.TestCase):
             manager.on_keyframe(15000)
             mock_logger.error.assert_called_once()
 
+    def test_apply_callback_replaces_extra_controls(self, mock_gst):
+        encoder = MagicMock()
+        apply = MagicMock()
+        manager = QPManager(encoder, max_i_frame_bytes=10000, qp_min=10, qp_max=40, apply=apply)
+        manager.on_keyframe(15000)
+
+        apply.assert_called_once_with(manager.current_qp_min, 40)
+        encoder.set_property.assert_not_called()
+
     def test_apply_qp_not_called_when_qp_unchanged(self, mock_gst):
         encoder = MagicMock()
         manager = QPManager(encoder, max_i_frame_bytes=10000, qp_min=10, qp_max=40)
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from v3xctrl_gst.QPSimulator import TraceFrame, load_trace, simulate
+
+
+class TestQPSimulator(unittest.TestCase):
+    def _trace(self, seconds: int, i_size: int, p_size: int, qp: int = 20) -> list[TraceFrame]:
+        return [TraceFrame(n % 30 == 0, i_size if n % 30 == 0 else p_size, qp) for n in range(seconds * 30)]
+
+    def test_load_trace(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+            f.write("# keyframe,size,qp\n1,12000,20\n0,4000,20\n\n0,3900,21\n")
+            path = f.name
+
+        try:
+            trace = load_trace(path)
+        finally:
+            os.unlink(path)
+
+        self.assertEqual(
+            trace,
+            [TraceFrame(True, 12000, 20), TraceFrame(False, 4000, 20), TraceFrame(False, 3900, 21)],
+        )
+
+    def test_on_target_trace_is_untouched(self):
+        result = simulate(self._trace(10, 1000, 1000), 30_000, framerate=30, gop=30, qp_min=20, qp_max=51)
+
+        self.assertEqual(len(result.rates), 10)
+        self.assertEqual(result.changes, 0)
+        self.assertAlmostEqual(result.mean_error_percent, 0.0)
+
+    def test_oversized_trace_is_brought_to_target(self):
+        result = simulate(self._trace(20, 12_000, 4000), 30_000, framerate=30, gop=30, qp_min=20, qp_max=51)
+
+        self.assertGreater(result.changes, 0)
+        self.assertGreater(result.max_overshoot_percent, 100)
+        # Last seconds are close to the target
+        for rate in result.rates[-5:]:
+            self.assertLess(abs(rate - 30_000) / 30_000, 0.15)
+
+    def test_summary(self):
+        result = simulate(self._trace(2, 1000, 1000), 30_000, framerate=30, gop=30, qp_min=20, qp_max=51)
+
+        summary = result.summary()
+
+        self.assertEqual(summary["seconds"], 2)
+        self.assertEqual(summary["qp_changes"], 0)
+        self.assertEqual(summary["qp_min"], 20)
+
+    def test_empty_trace(self):
+        result = simulate([], 30_000, framerate=30, gop=30, qp_min=20, qp_max=51)
+
+        self.assertEqual(result.summary()["seconds"], 0)
+        self.assertEqual(result.mean_error_percent, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
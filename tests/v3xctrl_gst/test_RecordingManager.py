@@ -60,7 +60,7 @@ class TestRecordingManagerStart(unittest.TestCase):
         self.mock_queue = MagicMock()
         self.mock_parser = MagicMock()
         self.mock_muxer = MagicMock()
-        self.mock_filesink = MagicMock()
+        self.mock_sink = MagicMock()
 
         self.mock_queue.link.return_value = True
         self.mock_parser.link.return_value = True
@@ -78,13 +78,14 @@ class TestRecordingManagerStart(unittest.TestCase):
                 "queue": self.mock_queue,
                 "h264parse": self.mock_parser,
                 "mpegtsmux": self.mock_muxer,
-                "filesink": self.mock_filesink,
+                "appsink": self.mock_sink,
             }
             return elements.get(element_type)
 
         self.mock_gst.ElementFactory.make.side_effect = element_factory_side_effect
 
     def tearDown(self):
+        self.manager._writer.stop()
         self.gst_patcher.stop()
 
     def test_already_recording_returns_false(self):
@@ -112,7 +113,7 @@ class TestRecordingManagerStart(unittest.TestCase):
         self.pipeline.add.assert_any_call(self.mock_queue)
         self.pipeline.add.assert_any_call(self.mock_parser)
         self.pipeline.add.assert_any_call(self.mock_muxer)
-        self.pipeline.add.assert_any_call(self.mock_filesink)
+        self.pipeline.add.assert_any_call(self.mock_sink)
         self.assertEqual(self.pipeline.add.call_count, 4)
 
     @patch("os.makedirs")
@@ -121,7 +122,7 @@ class TestRecordingManagerStart(unittest.TestCase):
 
         self.mock_queue.link.assert_called_once_with(self.mock_parser)
         self.mock_parser.link.assert_called_once_with(self.mock_muxer)
-        self.mock_muxer.link.assert_called_once_with(self.mock_filesink)
+        self.mock_muxer.link.assert_called_once_with(self.mock_sink)
 
     @patch("os.makedirs")
     def test_elements_synced_with_parent(self, mock_makedirs):
@@ -130,7 +131,7 @@ class TestRecordingManagerStart(unittest.TestCase):
         self.mock_queue.sync_state_with_parent.assert_called_once()
         self.mock_parser.sync_state_with_parent.assert_called_once()
         self.mock_muxer.sync_state_with_parent.assert_called_once()
-        self.mock_filesink.sync_state_with_parent.assert_called_once()
+        self.mock_sink.sync_state_with_parent.assert_called_once()
 
     @patch("os.makedirs")
     def test_tee_pad_requested_and_linked(self, mock_makedirs):
@@ -141,12 +142,21 @@ class TestRecordingManagerStart(unittest.TestCase):
         self.assertIs(self.manager._tee_pad, self.tee_src_pad)
 
     @patch("os.makedirs")
-    def test_filesink_properties_set(self, mock_makedirs):
+    def test_sink_properties_set(self, mock_makedirs):
         self.manager.start()
 
-        self.mock_filesink.set_property.assert_any_call("location", unittest.mock.ANY)
-        self.mock_filesink.set_property.assert_any_call("sync", False)
-        self.mock_filesink.set_property.assert_any_call("async", False)
+        self.mock_sink.set_property.assert_any_call("emit-signals", True)
+        self.mock_sink.set_property.assert_any_call("sync", False)
+        self.mock_sink.set_property.assert_any_call("async", False)
+        self.mock_sink.set_property.assert_any_call("buffer-list", True)
+        self.mock_sink.connect.assert_called_once_with("new-sample", self.manager._on_sample)
+
+    @patch("os.makedirs")
+    def test_writer_started_with_filename(self, mock_makedirs):
+        self.manager.start()
+
+        self.assertTrue(self.manager._writer.recording)
+        self.assertEqual(self.manager._writer.segment_path(0), self.manager._elements["filename"])
 
     @patch("os.makedirs")
     def test_queue_properties_set(self, mock_makedirs):
@@ -232,9 +242,9 @@ class TestStartElementCreationFailure(unittest.TestCase):
         self.assertFalse(self.manager.is_recording)
 
     @patch("os.makedirs")
-    def test_filesink_creation_failure(self, mock_makedirs):
+    def test_sink_creation_failure(self, mock_makedirs):
         def factory(element_type, name):
-            if element_type == "filesink":
+            if element_type == "appsink":
                 return None
             return MagicMock()
 
@@ -259,14 +269,14 @@ class TestStartLinkFailure(unittest.TestCase):
         self.mock_queue = MagicMock()
         self.mock_parser = MagicMock()
         self.mock_muxer = MagicMock()
-        self.mock_filesink = MagicMock()
+        self.mock_sink = MagicMock()
 
         def factory(element_type, name):
             elements = {
                 "queue": self.mock_queue,
                 "h264parse": self.mock_parser,
                 "mpegtsmux": self.mock_muxer,
-                "filesink": self.mock_filesink,
+                "appsink": self.mock_sink,
             }
             return elements.get(element_type)
 
@@ -295,7 +305,7 @@ class TestStartLinkFailure(unittest.TestCase):
         self.assertFalse(self.manager.is_recording)
 
     @patch("os.makedirs")
-    def test_muxer_to_filesink_link_failure(self, mock_makedirs):
+    def test_muxer_to_sink_link_failure(self, mock_makedirs):
         self.mock_queue.link.return_value = True
         self.mock_parser.link.return_value = True
         self.mock_muxer.link.return_value = False
@@ -320,7 +330,7 @@ class TestStartTeePadFailure(unittest.TestCase):
         self.mock_queue = MagicMock()
         self.mock_parser = MagicMock()
         self.mock_muxer = MagicMock()
-        self.mock_filesink = MagicMock()
+        self.mock_sink = MagicMock()
 
         self.mock_queue.link.return_value = True
         self.mock_parser.link.return_value = True
@@ -331,7 +341,7 @@ class TestStartTeePadFailure(unittest.TestCase):
                 "queue": self.mock_queue,
                 "h264parse": self.mock_parser,
                 "mpegtsmux": self.mock_muxer,
-                "filesink": self.mock_filesink,
+                "appsink": self.mock_sink,
             }
             return elements.get(element_type)
 
@@ -635,5 +645,189 @@ class TestForceTeardown(unittest.TestCase):
         self.tee.release_request_pad.assert_called_once_with(tee_pad)
 
 
+class TestPreroll(unittest.TestCase):
+    def setUp(self):
+        self.gst_patcher = patch("v3xctrl_gst.RecordingManager.Gst")
+        self.mock_gst = self.gst_patcher.start()
+        self.mock_gst.Element = object
+        self.mock_gst.PadLinkReturn.OK = "ok"
+        self.mock_gst.ElementFactory.make.side_effect = lambda element_type, name: MagicMock()
+
+        self.pipeline = MagicMock()
+        self.tee = MagicMock()
+        self.tee.request_pad_simple.return_value.link.return_value = "ok"
+        self.manager = RecordingManager(self.pipeline, self.tee, "/tmp/recordings", preroll=5.0)
+
+    def tearDown(self):
+        self.manager._writer.stop()
+        self.gst_patcher.stop()
+
+    def test_arm_attaches_branch(self):
+        self.assertTrue(self.manager.arm())
+
+        self.assertIsNotNone(self.manager._tee_pad)
+        self.assertFalse(self.manager.is_recording)
+        self.assertEqual(self.pipeline.add.call_count, 4)
+
+    def test_arm_without_preroll_does_nothing(self):
+        manager = RecordingManager(self.pipeline, self.tee, "/tmp/recordings")
+
+        self.assertFalse(manager.arm())
+        self.pipeline.add.assert_not_called()
+
+    @patch("os.makedirs")
+    def test_start_reuses_armed_branch(self, mock_makedirs):
+        self.manager.arm()
+
+        self.assertTrue(self.manager.start())
+
+        self.assertEqual(self.pipeline.add.call_count, 4)
+        self.assertTrue(self.manager._writer.recording)
+
+    @patch("os.makedirs")
+    def test_stop_keeps_branch_attached(self, mock_makedirs):
+        self.manager.arm()
+        self.manager.start()
+        tee_pad = self.manager._tee_pad
+
+        self.assertTrue(self.manager.stop())
+
+        self.assertFalse(self.manager.is_recording)
+        self.assertFalse(self.manager._writer.recording)
+        self.assertIs(self.manager._tee_pad, tee_pad)
+        tee_pad.add_probe.assert_not_called()
+        self.pipeline.remove.assert_not_called()
+
+
+class TestOnSample(unittest.TestCase):
+    def setUp(self):
+        self.gst_patcher = patch("v3xctrl_gst.RecordingManager.Gst")
+        self.mock_gst = self.gst_patcher.start()
+
+        self.manager = RecordingManager(MagicMock(), MagicMock(), "/tmp/recordings")
+        self.manager._writer = MagicMock()
+
+    def tearDown(self):
+        self.gst_patcher.stop()
+
+    def _buffer(self, data: bytes, delta: bool) -> MagicMock:
+        buffer = MagicMock()
+        buffer.get_size.return_value = len(data)
+        buffer.extract_dup.return_value = data
+        buffer.has_flags.return_value = delta
+        return buffer
+
+    def _sample(self, data: bytes, delta: bool) -> MagicMock:
+        sample = MagicMock()
+        sample.get_buffer_list.return_value = None
+        sample.get_buffer.return_value = self._buffer(data, delta)
+        sample.get_caps.return_value.get_size.return_value = 1
+        return sample
+
+    def test_pushes_buffer_to_writer(self):
+        sink = MagicMock()
+        sink.emit.return_value = self._sample(b"ts-data", delta=False)
+
+        result = self.manager._on_sample(sink)
+
+        self.assertEqual(result, self.mock_gst.FlowReturn.OK)
+        self.manager._writer.push.assert_called_once_with(
+            b"ts-data", True, pts=unittest.mock.ANY, capture_timestamp_us=None
+        )
+
+    def test_buffer_list_is_pushed_as_one_frame(self):
+        self.manager._capture_timestamps.append(123456)
+        buffers = [
+            self._buffer(b"pat", delta=False),
+            self._buffer(b"pes", delta=True),
+            self._buffer(b"pes", delta=True),
+        ]
+        buffer_list = MagicMock()
+        buffer_list.length.return_value = len(buffers)
+        buffer_list.get.side_effect = buffers
+        sample = self._sample(b"", delta=False)
+        sample.get_buffer_list.return_value = buffer_list
+        sink = MagicMock()
+        sink.emit.return_value = sample
+
+        self.manager._on_sample(sink)
+
+        self.manager._writer.push.assert_called_once_with(
+            b"patpespes", True, pts=buffers[0].pts, capture_timestamp_us=123456
+        )
+        self.assertEqual(len(self.manager._capture_timestamps), 0)
+
+    def test_delta_unit_is_not_keyframe(self):
+        sink = MagicMock()
+        sink.emit.return_value = self._sample(b"ts-data", delta=True)
+
+        self.manager._on_sample(sink)
+
+        self.manager._writer.push.assert_called_once_with(
+            b"ts-data", False, pts=unittest.mock.ANY, capture_timestamp_us=None
+        )
+
+    def test_keyframe_gets_capture_timestamp(self):
+        self.manager._capture_timestamps.append(123456)
+        sink = MagicMock()
+        sink.emit.return_value = self._sample(b"ts-data", delta=False)
+
+        self.manager._on_sample(sink)
+
+        self.assertEqual(self.manager._writer.push.call_args.kwargs["capture_timestamp_us"], 123456)
+        self.assertEqual(len(self.manager._capture_timestamps), 0)
+
+    def test_parser_probe_reads_sei_of_keyframes(self):
+        from v3xctrl_helper import build_sei_nal
+
+        buffer = MagicMock()
+        buffer.has_flags.return_value = False
+        map_info = MagicMock()
+        map_info.data = build_sei_nal(987654) + b"\x00\x00\x00\x01\x65"
+        buffer.map.return_value = (True, map_info)
+        info = MagicMock()
+        info.get_buffer.return_value = buffer
+
+        self.manager._on_parser_buffer(MagicMock(), info)
+
+        self.assertEqual(list(self.manager._capture_timestamps), [987654])
+        buffer.unmap.assert_called_once_with(map_info)
+
+    def test_parser_probe_skips_delta_units(self):
+        buffer = MagicMock()
+        buffer.has_flags.return_value = True
+        info = MagicMock()
+        info.get_buffer.return_value = buffer
+
+        self.manager._on_parser_buffer(MagicMock(), info)
+
+        self.assertEqual(len(self.manager._capture_timestamps), 0)
+        buffer.map.assert_not_called()
+
+    def test_stream_header_read_once(self):
+        sample = self._sample(b"ts-data", delta=False)
+        structure = sample.get_caps.return_value.get_structure.return_value
+        structure.has_field.return_value = True
+        header = MagicMock()
+        header.get_size.return_value = 3
+        header.extract_dup.return_value = b"pat"
+        structure.get_value.return_value = [header]
+        sink = MagicMock()
+        sink.emit.return_value = sample
+
+        self.manager._on_sample(sink)
+        self.manager._on_sample(sink)
+
+        self.manager._writer.set_header.assert_called_once_with(b"pat")
+
+    def test_no_sample(self):
+        sink = MagicMock()
+        sink.emit.return_value = None
+
+        self.manager._on_sample(sink)
+
+        self.manager._writer.push.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
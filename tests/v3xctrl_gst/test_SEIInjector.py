@@ -81,125 +81,100 @@ class TestSEIInjectorPostEncode(unittest.TestCase):
         injector = SEIInjector()
         return injector, mock_gst, mock_libgst
 
-    def _make_buffer_with_data(self, pts, data, mock_gst):
+    def _make_buffer(self, pts):
         buffer = MagicMock()
         buffer.pts = pts
-        buffer.dts = pts + 1
-        buffer.duration = 33333
-        buffer.offset = 0
-        map_info = MagicMock()
-        map_info.data = data
-        buffer.map.return_value = (True, map_info)
+        buffer.get_size.return_value = 1234
         return buffer
 
-    def test_skips_when_no_pending_timing(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
-        injector, mock_gst, mock_libgst = self._create_injector(mock_gst, mock_libgst)
-
-        buffer = MagicMock()
-        buffer.pts = 999
+    def _post_encode(self, injector, buffer):
         info = MagicMock()
         info.get_buffer.return_value = buffer
+        return injector.on_post_encode(MagicMock(), info)
+
+    def test_skips_when_no_pending_timing(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
+        injector, mock_gst, mock_libgst = self._create_injector(mock_gst, mock_libgst)
 
-        result = injector.on_post_encode(MagicMock(), info)
+        buffer = self._make_buffer(999)
+        result = self._post_encode(injector, buffer)
 
         self.assertEqual(result, mock_gst.PadProbeReturn.OK)
-        buffer.map.assert_not_called()
+        buffer.copy_region.assert_not_called()
+        mock_ref.assert_not_called()
 
-    def test_creates_combined_buffer_with_sei_prepended(
+    def test_prepends_sei_memory_to_shallow_copy(
         self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref
     ):
         injector, mock_gst, mock_libgst = self._create_injector(mock_gst, mock_libgst)
-
         injector._pending[5000] = 123456789
 
-        original_data = b"\x00\x00\x00\x01\x65" + b"\xab" * 20
-        buffer = self._make_buffer_with_data(5000, original_data, mock_gst)
-        info = MagicMock()
-        info.get_buffer.return_value = buffer
-
         captured_data = []
-        mock_gst.Buffer.new_wrapped.side_effect = lambda data: (captured_data.append(bytes(data)), MagicMock())[1]
+        sei_buf = MagicMock()
+        mock_gst.Buffer.new_wrapped.side_effect = lambda data: (captured_data.append(bytes(data)), sei_buf)[1]
 
-        injector.on_post_encode(MagicMock(), info)
+        buffer = self._make_buffer(5000)
+        self._post_encode(injector, buffer)
 
+        # Only the SEI NAL is allocated, the encoded frame is referenced
         self.assertEqual(len(captured_data), 1)
-        combined = captured_data[0]
-
-        sei_result = parse_sei_nal(combined)
-        self.assertIsNotNone(sei_result)
-        self.assertEqual(sei_result, 123456789)
+        self.assertEqual(parse_sei_nal(captured_data[0]), 123456789)
 
-        self.assertTrue(combined.endswith(original_data))
+        new_buf = buffer.copy_region.return_value
+        new_buf.prepend_memory.assert_called_once_with(sei_buf.get_memory.return_value)
+        sei_buf.get_memory.assert_called_once_with(0)
 
-    def test_consumes_pending_entry(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
+    def test_never_maps_encoded_frame(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
         injector, mock_gst, mock_libgst = self._create_injector(mock_gst, mock_libgst)
         injector._pending[5000] = 100
 
-        buffer = self._make_buffer_with_data(5000, b"\x00" * 10, mock_gst)
-        info = MagicMock()
-        info.get_buffer.return_value = buffer
-        mock_gst.Buffer.new_wrapped.return_value = MagicMock()
-
-        injector.on_post_encode(MagicMock(), info)
+        buffer = self._make_buffer(5000)
+        self._post_encode(injector, buffer)
 
-        self.assertNotIn(5000, injector._pending)
+        buffer.map.assert_not_called()
 
-    def test_copies_buffer_metadata(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
+    def test_copies_whole_buffer_with_metadata(
+        self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref
+    ):
         injector, mock_gst, mock_libgst = self._create_injector(mock_gst, mock_libgst)
         injector._pending[5000] = 100
 
-        buffer = self._make_buffer_with_data(5000, b"\x00" * 10, mock_gst)
-        info = MagicMock()
-        info.get_buffer.return_value = buffer
-
-        new_buf = MagicMock()
-        mock_gst.Buffer.new_wrapped.return_value = new_buf
-
-        injector.on_post_encode(MagicMock(), info)
+        buffer = self._make_buffer(5000)
+        self._post_encode(injector, buffer)
 
-        self.assertEqual(new_buf.pts, buffer.pts)
-        self.assertEqual(new_buf.dts, buffer.dts)
-        self.assertEqual(new_buf.duration, buffer.duration)
-        self.assertEqual(new_buf.offset, buffer.offset)
+        flags, offset, size = buffer.copy_region.call_args[0]
+        self.assertEqual(
+            flags,
+            mock_gst.BufferCopyFlags.FLAGS
+            | mock_gst.BufferCopyFlags.TIMESTAMPS
+            | mock_gst.BufferCopyFlags.META
+            | mock_gst.BufferCopyFlags.MEMORY,
+        )
+        self.assertEqual((offset, size), (0, 1234))
 
-    def test_handles_map_failure(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
+    def test_consumes_pending_entry(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
         injector, mock_gst, mock_libgst = self._create_injector(mock_gst, mock_libgst)
         injector._pending[5000] = 100
 
-        buffer = MagicMock()
-        buffer.pts = 5000
-        buffer.map.return_value = (False, None)
-        info = MagicMock()
-        info.get_buffer.return_value = buffer
-
-        result = injector.on_post_encode(MagicMock(), info)
+        self._post_encode(injector, self._make_buffer(5000))
 
-        self.assertEqual(result, mock_gst.PadProbeReturn.OK)
+        self.assertNotIn(5000, injector._pending)
 
-    def test_unmaps_buffer_after_read(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
+    def test_handles_copy_failure(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
         injector, mock_gst, mock_libgst = self._create_injector(mock_gst, mock_libgst)
         injector._pending[5000] = 100
 
-        buffer = self._make_buffer_with_data(5000, b"\x00" * 10, mock_gst)
-        map_info = buffer.map.return_value[1]
-        info = MagicMock()
-        info.get_buffer.return_value = buffer
-        mock_gst.Buffer.new_wrapped.return_value = MagicMock()
-
-        injector.on_post_encode(MagicMock(), info)
+        buffer = self._make_buffer(5000)
+        buffer.copy_region.return_value = None
+        result = self._post_encode(injector, buffer)
 
-        buffer.unmap.assert_called_once_with(map_info)
+        self.assertEqual(result, mock_gst.PadProbeReturn.OK)
+        mock_ref.assert_not_called()
 
     def test_refs_new_buffer_and_unrefs_old(self, mock_gst, mock_libgst, mock_ctypes, mock_c_ptr, mock_ref, mock_unref):
         injector, mock_gst, mock_libgst = self._create_injector(mock_gst, mock_libgst)
         injector._pending[5000] = 100
 
-        buffer = self._make_buffer_with_data(5000, b"\x00" * 10, mock_gst)
-        info = MagicMock()
-        info.get_buffer.return_value = buffer
-        mock_gst.Buffer.new_wrapped.return_value = MagicMock()
-
-        injector.on_post_encode(MagicMock(), info)
+        self._post_encode(injector, self._make_buffer(5000))
 
         mock_ref.assert_called_once()
         mock_unref.assert_called_once()
@@ -0,0 +1,203 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from v3xctrl_gst.SegmentWriter import SegmentWriter
+from v3xctrl_helper import KeyframeIndex
+
+
+class TestSegmentWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "stream.ts")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _read(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_writes_single_file(self):
+        writer = SegmentWriter()
+        writer.start(self.path)
+        writer.push(b"key", True)
+        writer.push(b"delta", False)
+        writer.stop()
+
+        self.assertEqual(self._read(self.path), b"keydelta")
+        self.assertEqual(writer.get_stats()["recording_bytes_written"], 8)
+        self.assertEqual(writer.get_stats()["recording_bytes_pending"], 0)
+
+    def test_starts_with_keyframe(self):
+        writer = SegmentWriter()
+        writer.start(self.path)
+        writer.push(b"delta", False)
+        writer.push(b"key", True)
+        writer.stop()
+
+        self.assertEqual(self._read(self.path), b"key")
+
+    def test_header_written_first(self):
+        writer = SegmentWriter()
+        writer.set_header(b"pat")
+        writer.start(self.path)
+        writer.push(b"key", True)
+        writer.stop()
+
+        self.assertEqual(self._read(self.path), b"patkey")
+
+    def test_not_recording_without_preroll_discards(self):
+        writer = SegmentWriter()
+        writer.push(b"key", True)
+        writer.start(self.path)
+        writer.push(b"later", True)
+        writer.stop()
+
+        self.assertEqual(self._read(self.path), b"later")
+
+    def test_preroll_included(self):
+        writer = SegmentWriter(preroll=5.0)
+        writer.push(b"delta0", False)
+        writer.push(b"key1", True)
+        writer.push(b"delta1", False)
+
+        self.assertEqual(writer.get_stats()["recording_preroll_bytes"], 16)
+
+        writer.start(self.path)
+        writer.push(b"delta2", False)
+        writer.stop()
+
+        self.assertEqual(self._read(self.path), b"key1delta1delta2")
+
+    def test_preroll_trimmed_by_age(self):
+        writer = SegmentWriter(preroll=1.0)
+
+        with patch("v3xctrl_gst.SegmentWriter.time.monotonic", return_value=100.0):
+            writer.push(b"old", True)
+        with patch("v3xctrl_gst.SegmentWriter.time.monotonic", return_value=102.0):
+            writer.push(b"new", True)
+
+        self.assertEqual(writer.get_stats()["recording_preroll_bytes"], 3)
+
+    def test_segments_by_size(self):
+        writer = SegmentWriter(segment_size=4)
+        writer.set_header(b"H")
+        writer.start(self.path)
+        writer.push(b"k1", True)
+        writer.push(b"d1", False)
+        writer.push(b"d2", False)
+        writer.push(b"k2", True)
+        writer.push(b"d3", False)
+        writer.stop()
+
+        first = os.path.join(self.tmp.name, "stream-000.ts")
+        second = os.path.join(self.tmp.name, "stream-001.ts")
+        self.assertEqual(self._read(first), b"Hk1d1d2")
+        self.assertEqual(self._read(second), b"Hk2d3")
+        self.assertEqual(writer.get_stats()["recording_segments"], 2)
+
+    def test_segments_by_duration(self):
+        writer = SegmentWriter(segment_duration=1.0)
+        writer.start(self.path)
+
+        with patch("v3xctrl_gst.SegmentWriter.time.monotonic", return_value=100.0):
+            writer.push(b"k1", True)
+        with patch("v3xctrl_gst.SegmentWriter.time.monotonic", return_value=100.5):
+            writer.push(b"k2", True)
+        with patch("v3xctrl_gst.SegmentWriter.time.monotonic", return_value=101.0):
+            writer.push(b"k3", True)
+        writer.stop()
+
+        self.assertEqual(self._read(os.path.join(self.tmp.name, "stream-000.ts")), b"k1k2")
+        self.assertEqual(self._read(os.path.join(self.tmp.name, "stream-001.ts")), b"k3")
+
+    def test_drops_until_keyframe_when_full(self):
+        writer = SegmentWriter(max_pending=10)
+        writer._recording = True  # Queue without a writer thread draining it
+
+        writer.push(b"k" * 6, True)
+        writer.push(b"d" * 6, False)
+        writer._pending = 0
+        writer.push(b"d" * 2, False)
+        writer.push(b"k" * 2, True)
+
+        self.assertEqual([chunk[1] for chunk in writer._queue], [b"k" * 6, b"k" * 2])
+        self.assertEqual(writer.get_stats()["recording_bytes_dropped"], 8)
+
+    def test_flushes_after_interval(self):
+        writer = SegmentWriter(write_size=1024, flush_interval=0.05)
+        writer.start(self.path)
+        writer.push(b"key", True)
+
+        deadline = time.monotonic() + 2
+        while writer.get_stats()["recording_bytes_written"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(writer.get_stats()["recording_bytes_written"], 3)
+        self.assertGreaterEqual(writer.get_stats()["recording_write_latency_max_ms"], 0.0)
+        writer.stop()
+
+    def test_open_failure_counts_error(self):
+        writer = SegmentWriter()
+        writer.start(os.path.join(self.tmp.name, "missing", "stream.ts"))
+        writer.push(b"key", True)
+        writer.stop()
+
+        stats = writer.get_stats()
+        self.assertEqual(stats["recording_write_errors"], 1)
+        self.assertEqual(stats["recording_bytes_pending"], 0)
+
+    def test_restart_after_stop(self):
+        writer = SegmentWriter()
+        writer.start(self.path)
+        writer.push(b"one", True)
+        writer.stop()
+
+        second = os.path.join(self.tmp.name, "second.ts")
+        writer.start(second)
+        writer.push(b"two", True)
+        writer.stop()
+
+        self.assertEqual(self._read(second), b"two")
+
+    def test_writes_keyframe_index(self):
+        writer = SegmentWriter()
+        writer.set_header(b"HDR")
+        writer.start(self.path)
+        writer.push(b"key1", True, pts=1000, capture_timestamp_us=5000)
+        writer.push(b"delta", False, pts=2000)
+        writer.push(b"key2", True, pts=3000)
+        writer.stop()
+
+        with KeyframeIndex.for_stream(self.path) as index:
+            self.assertEqual(len(index), 2)
+            self.assertEqual(index.stream_header_size, 3)
+            self.assertEqual(index[0].offset, 3)
+            self.assertEqual(index[0].pts, 1000)
+            self.assertEqual(index[0].timestamp_us, 5000)
+            self.assertTrue(index[0].sei_timestamp)
+            self.assertEqual(index[1].offset, 12)
+            self.assertEqual(index[1].pts, 3000)
+            self.assertFalse(index[1].sei_timestamp)
+
+        data = self._read(self.path)
+        self.assertEqual(data[12:16], b"key2")
+
+    def test_index_per_segment(self):
+        writer = SegmentWriter(segment_size=1)
+        writer.start(self.path)
+        writer.push(b"k1", True, pts=1)
+        writer.push(b"k2", True, pts=2)
+        writer.stop()
+
+        with KeyframeIndex.for_stream(os.path.join(self.tmp.name, "stream-001.ts")) as index:
+            self.assertEqual(len(index), 1)
+            self.assertEqual(index[0].offset, 0)
+            self.assertEqual(index[0].pts, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
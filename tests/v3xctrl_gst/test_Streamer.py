@@ -1,6 +1,8 @@
+import io
 import unittest
 from unittest.mock import MagicMock, patch
 
+from v3xctrl_gst.Encoders import V4L2EncoderBuilder, X264EncoderBuilder
 from v3xctrl_gst.Streamer import Streamer
 
 
@@ -93,6 +95,21 @@ class TestNetworkUnreachableSuppression(unittest.TestCase):
         self.assertIsNone(streamer._udpsink_recovery_timeout_id)
         mock_logger.info.assert_called_once_with("Network recovered")
 
+    def test_pacer_errors_are_coalesced(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(mock_gst, mock_cs)
+
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            for _ in range(3):
+                streamer._on_pacer_error(OSError(101, "Network is unreachable"))
+
+            mock_glib.idle_add.assert_called_once_with(streamer._on_pacer_error_idle)
+            self.assertFalse(streamer._on_pacer_error_idle())
+            self.assertTrue(streamer._udpsink_network_down)
+
+            streamer._on_pacer_error(OSError(101, "Network is unreachable"))
+
+        self.assertEqual(mock_glib.idle_add.call_count, 2)
+
     def test_new_warning_after_recovery_logs_again(self, mock_gst: MagicMock, mock_cs: MagicMock):
         streamer = self._create_streamer(mock_gst, mock_cs)
         message = self._make_udpsink_warning(mock_gst)
@@ -262,5 +279,529 @@ class TestGracefulShutdown(unittest.TestCase):
         mock_exit.assert_called_once_with(1)
 
 
+@patch("v3xctrl_gst.Streamer.ControlServer")
+@patch("v3xctrl_gst.Streamer.Gst")
+class TestPropertyApplication(unittest.TestCase):
+    def _create_streamer(self, element: MagicMock) -> Streamer:
+        # Run main loop callbacks inline
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            mock_glib.idle_add.side_effect = lambda callback, *args: callback(*args)
+            mock_glib.timeout_add.side_effect = lambda interval, callback, *args: callback(*args)
+            streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001)
+
+        streamer.pipeline = MagicMock()
+        streamer.pipeline.get_by_name.return_value = element
+        return streamer
+
+    def test_set_property_waits_for_result(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        element = MagicMock()
+        element.get_property.return_value = 0.5
+        streamer = self._create_streamer(element)
+
+        self.assertTrue(streamer.set_property("camera", "brightness", 0.5))
+        element.set_property.assert_called_once_with("brightness", 0.5)
+
+    def test_set_property_fails_when_value_does_not_stick(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        element = MagicMock()
+        element.get_property.return_value = 0.0
+        streamer = self._create_streamer(element)
+
+        self.assertFalse(streamer.set_property("camera", "brightness", 0.5, max_retries=2))
+        self.assertEqual(element.set_property.call_count, 2)
+
+    def test_apply_property_reports_status(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        element = MagicMock()
+        element.get_property.return_value = 3
+        streamer = self._create_streamer(element)
+
+        request_id = streamer.apply_property("camera", "af-mode", 3)
+
+        self.assertEqual(streamer.get_apply_status(request_id)["status"], "applied")
+
+
+@patch("v3xctrl_gst.Streamer.ControlServer")
+@patch("v3xctrl_gst.Streamer.Gst")
+class TestAdaptiveBitrate(unittest.TestCase):
+    def _create_streamer(self) -> Streamer:
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001, settings={"adaptive_bitrate": True})
+        streamer.bitrate_controller = MagicMock()
+        return streamer
+
+    def test_overrun_is_reported(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+
+        with patch("v3xctrl_gst.Streamer.GLib"):
+            streamer._on_udp_queue_overrun(None)
+
+        streamer.bitrate_controller.on_overrun.assert_called_once()
+
+    def test_feedback_is_handled_on_main_loop(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            streamer.on_network_feedback(120.0, 1.5)
+
+        mock_glib.idle_add.assert_called_once_with(streamer.bitrate_controller.on_feedback, 120.0, 1.5)
+
+    def test_feedback_ignored_without_controller(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001)
+
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            streamer.on_network_feedback(120.0, 1.5)
+
+        mock_glib.idle_add.assert_not_called()
+
+    def test_apply_bitrate_sets_encoder_controls(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        encoder = MagicMock()
+        streamer.pipeline = MagicMock()
+        streamer.pipeline.get_by_name.return_value = encoder
+
+        with patch("v3xctrl_gst.Encoders.V4L2EncoderBuilder.Gst") as mock_encoder_gst:
+            streamer._apply_bitrate(1200000)
+
+        mock_encoder_gst.Structure.from_string.assert_called_with("controls,video_bitrate=1200000")
+        encoder.set_property.assert_called_once()
+
+
+@patch("v3xctrl_gst.Streamer.ControlServer")
+@patch("v3xctrl_gst.Streamer.Gst")
+class TestEncoderBackend(unittest.TestCase):
+    def test_v4l2_is_default(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001)
+
+        self.assertIsInstance(streamer.encoder_builder, V4L2EncoderBuilder)
+
+    def test_software_encoder_gets_runtime_changes(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001, settings={"encoder": "x264"})
+        encoder = MagicMock()
+        streamer.pipeline = MagicMock()
+        streamer.pipeline.get_by_name.return_value = encoder
+
+        streamer._apply_bitrate(1200000)
+        streamer._apply_qp(28, 51)
+
+        self.assertIsInstance(streamer.encoder_builder, X264EncoderBuilder)
+        encoder.set_property.assert_any_call("bitrate", 1200)
+        encoder.set_property.assert_any_call("qp-min", 28)
+        encoder.set_property.assert_any_call("qp-max", 51)
+
+    def test_intra_refresh(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001, settings={"intra_refresh": True})
+
+        self.assertTrue(streamer.encoder_builder.intra_refresh)
+
+    def test_intra_refresh_falls_back_without_encoder_support(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        with patch("v3xctrl_gst.Streamer.logger") as mock_logger:
+            streamer = Streamer(
+                host="127.0.0.1",
+                port=5000,
+                bind_port=5001,
+                settings={"encoder": "openh264", "intra_refresh": True},
+            )
+
+        self.assertFalse(streamer.encoder_builder.intra_refresh)
+        mock_logger.warning.assert_called_once()
+
+    def test_qp_control_disabled_without_runtime_qp(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        with patch("v3xctrl_gst.Streamer.logger") as mock_logger:
+            streamer = Streamer(
+                host="127.0.0.1",
+                port=5000,
+                bind_port=5001,
+                settings={"encoder": "x264", "qp_control": True, "enable_i_frame_adjust": True},
+            )
+
+        self.assertFalse(streamer.settings["qp_control"])
+        self.assertFalse(streamer.settings["enable_i_frame_adjust"])
+        mock_logger.warning.assert_called_once()
+
+    def test_unknown_encoder_raises(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        with self.assertRaises(ValueError):
+            Streamer(host="127.0.0.1", port=5000, bind_port=5001, settings={"encoder": "nvenc"})
+
+
+@patch("v3xctrl_gst.Streamer.ControlServer")
+@patch("v3xctrl_gst.Streamer.Gst")
+class TestQPControl(unittest.TestCase):
+    def _create_streamer(self, mock_gst: MagicMock) -> Streamer:
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001, settings={"qp_control": True})
+        streamer.qp_manager = MagicMock()
+        streamer.qp_controller = MagicMock()
+        streamer.qp_controller.current_qp_min = 24
+        streamer.timer = MagicMock()
+        mock_gst.SECOND = 1_000_000_000
+        return streamer
+
+    def _buffer_info(self, size: int, keyframe: bool) -> MagicMock:
+        buffer = MagicMock()
+        buffer.pts = 0
+        buffer.get_size.return_value = size
+        buffer.has_flags.return_value = not keyframe
+        info = MagicMock()
+        info.get_buffer.return_value = buffer
+        return info
+
+    def test_every_frame_is_reported(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(mock_gst)
+
+        streamer._on_encoder_buffer(None, self._buffer_info(20000, True))
+        streamer._on_encoder_buffer(None, self._buffer_info(3000, False))
+
+        streamer.qp_controller.on_frame.assert_any_call(20000, True)
+        streamer.qp_controller.on_frame.assert_any_call(3000, False)
+
+    def test_i_frame_adjust_is_disabled(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        with patch("v3xctrl_gst.Streamer.logger") as mock_logger:
+            streamer = Streamer(
+                host="127.0.0.1",
+                port=5000,
+                bind_port=5001,
+                settings={"qp_control": True, "enable_i_frame_adjust": True},
+            )
+
+        self.assertFalse(streamer.settings["enable_i_frame_adjust"])
+        mock_logger.warning.assert_called_once()
+
+        streamer.qp_manager = MagicMock()
+        streamer.qp_controller = MagicMock()
+        streamer.timer = MagicMock()
+        streamer._on_encoder_buffer(None, self._buffer_info(20000, True))
+
+        streamer.qp_manager.on_keyframe.assert_not_called()
+        streamer.qp_controller.on_frame.assert_called_once_with(20000, True)
+
+    def test_stats_report_controller_qp(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(mock_gst)
+        streamer.recording_manager = MagicMock()
+        streamer.qp_controller.qp_max = 34
+        streamer.qp_controller.get_stats.return_value = {}
+
+        stats = streamer.get_stats()
+
+        self.assertEqual(stats["qp_min"], 24)
+        self.assertEqual(stats["qp_max"], 34)
+
+    def test_frame_trace(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(mock_gst)
+        streamer._frame_trace = io.StringIO()
+
+        streamer._on_encoder_buffer(None, self._buffer_info(20000, True))
+        streamer._on_encoder_buffer(None, self._buffer_info(3000, False))
+
+        self.assertEqual(streamer._frame_trace.getvalue(), "1,20000,24\n0,3000,24\n")
+
+    def test_bitrate_change_updates_target(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(mock_gst)
+        streamer.pipeline = MagicMock()
+
+        streamer._apply_bitrate(1200000)
+
+        streamer.qp_controller.set_target.assert_called_once_with(150000)
+
+    def test_apply_qp_sets_encoder_controls(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(mock_gst)
+        encoder = MagicMock()
+        streamer.pipeline = MagicMock()
+        streamer.pipeline.get_by_name.return_value = encoder
+
+        with patch("v3xctrl_gst.Encoders.V4L2EncoderBuilder.Gst") as mock_encoder_gst:
+            streamer._apply_qp(28, 51)
+
+        mock_encoder_gst.Structure.from_string.assert_called_with(
+            "controls,h264_minimum_qp_value=28,h264_maximum_qp_value=51"
+        )
+        encoder.set_property.assert_called_once()
+
+
+@patch("v3xctrl_gst.Streamer.ControlServer")
+@patch("v3xctrl_gst.Streamer.Gst")
+class TestPacing(unittest.TestCase):
+    def _buffer(self, data: bytes) -> MagicMock:
+        buffer = MagicMock()
+        buffer.get_size.return_value = len(data)
+        buffer.extract_dup.return_value = data
+        return buffer
+
+    def test_sample_is_submitted_as_frame(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001, settings={"pacing": True})
+        streamer.packet_pacer = MagicMock()
+        buffers = [self._buffer(b"a"), self._buffer(b"bb")]
+        buffer_list = MagicMock()
+        buffer_list.length.return_value = 2
+        buffer_list.get.side_effect = buffers
+        sample = MagicMock()
+        sample.get_buffer_list.return_value = buffer_list
+        sink = MagicMock()
+        sink.emit.return_value = sample
+
+        result = streamer._on_pacer_sample(sink)
+
+        self.assertEqual(result, mock_gst.FlowReturn.OK)
+        streamer.packet_pacer.submit.assert_called_once_with([b"a", b"bb"])
+
+    def test_single_buffer_sample(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001, settings={"pacing": True})
+        streamer.packet_pacer = MagicMock()
+        sample = MagicMock()
+        sample.get_buffer_list.return_value = None
+        sample.get_buffer.return_value = self._buffer(b"abc")
+        sink = MagicMock()
+        sink.emit.return_value = sample
+
+        streamer._on_pacer_sample(sink)
+
+        streamer.packet_pacer.submit.assert_called_once_with([b"abc"])
+
+    def test_stats_include_pacing(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001, settings={"pacing": True})
+        streamer.recording_manager = MagicMock()
+        streamer.qp_manager = MagicMock()
+        streamer.packet_pacer = MagicMock()
+        streamer.packet_pacer.get_stats.return_value = {"pacing_frames": 3}
+
+        self.assertEqual(streamer.get_stats()["pacing_frames"], 3)
+
+
+@patch("v3xctrl_gst.Streamer.ControlServer")
+@patch("v3xctrl_gst.Streamer.Gst")
+class TestTimingStats(unittest.TestCase):
+    def _create_streamer(self) -> Streamer:
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001)
+        streamer.recording_manager = MagicMock()
+        streamer.qp_manager = MagicMock()
+        return streamer
+
+    def test_stats_exclude_timing_when_disabled(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+
+        self.assertNotIn("timing_frames", streamer.get_stats())
+
+    def test_stats_include_timing_percentiles(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        streamer.enable_timing()
+
+        stats = streamer.get_stats()
+
+        self.assertEqual(stats["timing_frames"], 0)
+        self.assertIn("timing_encode_p95_ms", stats)
+        self.assertIn("timing_total_p99_ms", stats)
+
+
+@patch("v3xctrl_gst.Streamer.ControlServer")
+@patch("v3xctrl_gst.Streamer.Gst")
+class TestKeyframeRequests(unittest.TestCase):
+    def _create_streamer(self) -> Streamer:
+        streamer = Streamer(host="127.0.0.1", port=5000, bind_port=5001)
+        streamer.pipeline = MagicMock()
+        return streamer
+
+    def test_first_request_is_forced_immediately(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            self.assertTrue(streamer.request_keyframe())
+
+        mock_glib.idle_add.assert_called_once_with(streamer._force_keyframe)
+
+    def test_requests_are_coalesced_while_pending(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            streamer.request_keyframe()
+            self.assertFalse(streamer.request_keyframe())
+
+        self.assertEqual(mock_glib.idle_add.call_count, 1)
+        self.assertEqual(streamer.keyframe_requests_coalesced, 1)
+
+    def test_request_within_interval_is_deferred(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        streamer.settings["keyframe_min_interval"] = 2.0
+
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            streamer.request_keyframe()
+            streamer._force_keyframe()
+            streamer.request_keyframe()
+
+        delay, callback = mock_glib.timeout_add.call_args[0]
+        self.assertGreater(delay, 1900)
+        self.assertLessEqual(delay, 2000)
+        self.assertEqual(callback, streamer._force_keyframe)
+
+    def test_force_keyframe_sends_upstream_event(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        encoder = streamer.pipeline.get_by_name.return_value
+        encoder.get_static_pad.return_value.send_event.return_value = True
+
+        self.assertFalse(streamer._force_keyframe())
+
+        mock_gst.Structure.new_from_string.assert_called_once_with("GstForceKeyUnit, all-headers=(boolean)true")
+        mock_gst.Event.new_custom.assert_called_once_with(
+            mock_gst.EventType.CUSTOM_UPSTREAM, mock_gst.Structure.new_from_string.return_value
+        )
+        encoder.get_static_pad.assert_called_once_with("src")
+        self.assertEqual(streamer.keyframes_forced, 1)
+
+    def test_start_recording_without_preroll_requests_keyframe(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        streamer.recording_manager = MagicMock()
+        streamer.recording_manager.preroll = 0
+
+        with patch.object(streamer, "request_keyframe") as request_keyframe:
+            self.assertTrue(streamer.start_recording())
+
+        request_keyframe.assert_called_once()
+
+    def test_start_recording_with_preroll_keeps_gop(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        streamer.recording_manager = MagicMock()
+        streamer.recording_manager.preroll = 5.0
+
+        with patch.object(streamer, "request_keyframe") as request_keyframe:
+            streamer.start_recording()
+
+        request_keyframe.assert_not_called()
+
+
+@patch("v3xctrl_gst.Streamer.ControlServer")
+@patch("v3xctrl_gst.Streamer.Gst")
+class TestReconfigure(unittest.TestCase):
+    def _create_streamer(self, restart: bool = False, resize: bool = True) -> Streamer:
+        streamer = Streamer(
+            host="127.0.0.1", port=5000, bind_port=5001, settings={"width": 1280, "height": 720, "framerate": 30}
+        )
+        self.elements = {"input_caps": MagicMock(), "encoder": MagicMock()}
+        streamer.get_element = self.elements.get  # type: ignore[method-assign]
+        streamer.source_builder = MagicMock()
+        streamer.source_builder.RESTART_ON_RECONFIGURE = restart
+        streamer.source_builder.SUPPORTS_RESIZE = resize
+        streamer._source = MagicMock()
+        streamer._source.sync_state_with_parent.return_value = True
+        return streamer
+
+    def test_updates_caps_and_settings(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+
+        self.assertTrue(streamer._apply_video_format(640, 480, None))
+
+        self.assertEqual((streamer.settings["width"], streamer.settings["height"]), (640, 480))
+        mock_gst.Caps.from_string.assert_called_with(
+            "video/x-raw,width=640,height=480,framerate=30/1,format=NV12,interlace-mode=progressive"
+        )
+        self.elements["input_caps"].set_property.assert_called_once_with("caps", mock_gst.Caps.from_string.return_value)
+        self.elements["encoder"].get_static_pad.assert_called_once_with("sink")
+        streamer._source.set_state.assert_not_called()
+        self.assertEqual(streamer.reconfigurations, 1)
+
+    def test_unchanged_format_is_noop(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+
+        self.assertTrue(streamer._apply_video_format(1280, None, 30))
+
+        self.elements["input_caps"].set_property.assert_not_called()
+        self.assertEqual(streamer.reconfigurations, 0)
+
+    def test_restarts_source_when_required(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(restart=True)
+
+        self.assertTrue(streamer._apply_video_format(None, None, 60))
+
+        streamer._source.set_state.assert_called_once_with(mock_gst.State.READY)
+        streamer._source.sync_state_with_parent.assert_called_once()
+
+    def test_failed_source_stop_keeps_settings(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(restart=True)
+        streamer._source.set_state.return_value = mock_gst.StateChangeReturn.FAILURE
+
+        self.assertFalse(streamer._apply_video_format(640, 480, None))
+
+        self.assertEqual(streamer.settings["width"], 1280)
+        self.elements["input_caps"].set_property.assert_not_called()
+        encoder_pad = self.elements["encoder"].get_static_pad.return_value
+        encoder_pad.remove_probe.assert_called_once_with(encoder_pad.add_probe.return_value)
+
+    def test_failed_source_restart_restores_previous_format(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(restart=True)
+        streamer._source.sync_state_with_parent.side_effect = [False, True]
+
+        self.assertFalse(streamer._apply_video_format(640, 480, None))
+
+        self.assertEqual((streamer.settings["width"], streamer.settings["height"]), (1280, 720))
+        mock_gst.Caps.from_string.assert_called_with(
+            "video/x-raw,width=1280,height=720,framerate=30/1,format=NV12,interlace-mode=progressive"
+        )
+        self.assertEqual(self.elements["input_caps"].set_property.call_count, 2)
+        self.assertEqual(streamer._source.sync_state_with_parent.call_count, 2)
+        encoder_pad = self.elements["encoder"].get_static_pad.return_value
+        encoder_pad.remove_probe.assert_called_once_with(encoder_pad.add_probe.return_value)
+        self.assertEqual(streamer.reconfigurations, 0)
+
+    def test_resize_rejected_without_source_support(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(resize=False)
+
+        self.assertFalse(streamer._apply_video_format(640, 480, None))
+
+        self.assertEqual(streamer.settings["width"], 1280)
+        self.elements["input_caps"].set_property.assert_not_called()
+        self.elements["encoder"].get_static_pad.assert_not_called()
+
+    def test_framerate_allowed_without_resize_support(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer(resize=False)
+
+        self.assertTrue(streamer._apply_video_format(1280, 720, 60))
+
+        self.assertEqual(streamer.settings["framerate"], 60)
+
+    def test_framerate_updates_controllers(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        streamer.qp_controller = MagicMock()
+        streamer.packet_pacer = MagicMock()
+
+        streamer._apply_video_format(None, None, 50)
+
+        self.assertEqual(streamer.qp_controller.framerate, 50)
+        self.assertEqual(streamer.packet_pacer.frame_interval, 0.02)
+
+    def test_pipeline_not_ready(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        streamer._source = None
+
+        self.assertFalse(streamer._apply_video_format(640, 480, None))
+
+    def test_reconfigure_runs_on_main_loop(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            mock_glib.idle_add.side_effect = lambda callback: callback()
+            self.assertTrue(streamer.reconfigure(framerate=25))
+
+        streamer.recording_manager = MagicMock()
+        streamer.qp_manager = MagicMock()
+        stats = streamer.get_stats()
+        self.assertEqual(stats["framerate"], 25)
+        self.assertEqual(stats["reconfigurations"], 1)
+
+    def test_encoder_caps_event_forces_keyframe(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        info = MagicMock()
+        info.get_event.return_value.type = mock_gst.EventType.CAPS
+
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            result = streamer._on_encoder_caps(None, info)
+
+        self.assertEqual(result, mock_gst.PadProbeReturn.REMOVE)
+        mock_glib.idle_add.assert_called_once_with(streamer._force_keyframe)
+
+    def test_other_events_are_passed(self, mock_gst: MagicMock, mock_cs: MagicMock):
+        streamer = self._create_streamer()
+        info = MagicMock()
+
+        with patch("v3xctrl_gst.Streamer.GLib") as mock_glib:
+            result = streamer._on_encoder_caps(None, info)
+
+        self.assertEqual(result, mock_gst.PadProbeReturn.OK)
+        mock_glib.idle_add.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,101 @@
+import io
+import os
+import tempfile
+import unittest
+
+from v3xctrl_helper.KeyframeIndex import FLAG_SEI_TIMESTAMP, INDEX_SUFFIX, RECORD, KeyframeIndex
+
+
+class TestKeyframeIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.stream_path = os.path.join(self.tmp.name, "stream.ts")
+
+        # Header "HH", then three GOPs of 10 bytes each
+        self.stream = b"HH" + b"A" * 10 + b"B" * 10 + b"C" * 10
+        with open(self.stream_path, "wb") as f:
+            f.write(self.stream)
+
+        self._write_index(
+            [
+                (2, 1000, 1_000_000, FLAG_SEI_TIMESTAMP),
+                (12, 2000, 2_000_000, FLAG_SEI_TIMESTAMP),
+                (22, 3000, 3_000_000, 0),
+            ]
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_index(self, records, extra=b""):
+        with open(self.stream_path + INDEX_SUFFIX, "wb") as f:
+            f.write(KeyframeIndex.pack_header(2))
+            for record in records:
+                f.write(KeyframeIndex.pack_record(*record))
+            f.write(extra)
+
+    def test_records(self):
+        with KeyframeIndex.for_stream(self.stream_path) as index:
+            self.assertEqual(len(index), 3)
+            self.assertEqual(index.stream_header_size, 2)
+            self.assertEqual(index[1].offset, 12)
+            self.assertEqual(index[-1].pts, 3000)
+            self.assertTrue(index[0].sei_timestamp)
+            self.assertFalse(index[2].sei_timestamp)
+
+    def test_out_of_range(self):
+        with KeyframeIndex.for_stream(self.stream_path) as index, self.assertRaises(IndexError):
+            index[3]
+
+    def test_find_pts(self):
+        with KeyframeIndex.for_stream(self.stream_path) as index:
+            self.assertEqual(index.find_pts(500), -1)
+            self.assertEqual(index.find_pts(1000), 0)
+            self.assertEqual(index.find_pts(2999), 1)
+            self.assertEqual(index.find_pts(10000), 2)
+
+    def test_find_time(self):
+        with KeyframeIndex.for_stream(self.stream_path) as index:
+            self.assertEqual(index.find_time(2_500_000), 1)
+
+    def test_extract_clip(self):
+        output = io.BytesIO()
+
+        with KeyframeIndex.for_stream(self.stream_path) as index:
+            written = index.extract_clip(2_100_000, 2_900_000, output)
+
+        self.assertEqual(output.getvalue(), b"HH" + b"B" * 10)
+        self.assertEqual(written, 12)
+
+    def test_extract_clip_to_end(self):
+        output = io.BytesIO()
+
+        with KeyframeIndex.for_stream(self.stream_path) as index:
+            index.extract_clip(1_500_000, 9_000_000, output)
+
+        self.assertEqual(output.getvalue(), b"HH" + b"A" * 10 + b"B" * 10 + b"C" * 10)
+
+    def test_extract_clip_before_first_keyframe(self):
+        output = io.BytesIO()
+
+        with KeyframeIndex.for_stream(self.stream_path) as index:
+            index.extract_clip(0, 500_000, output)
+
+        self.assertEqual(output.getvalue(), b"HH" + b"A" * 10)
+
+    def test_truncated_record_ignored(self):
+        self._write_index([(2, 1000, 1_000_000, 0)], extra=b"\x00" * (RECORD.size - 1))
+
+        with KeyframeIndex.for_stream(self.stream_path) as index:
+            self.assertEqual(len(index), 1)
+
+    def test_invalid_file(self):
+        with open(self.stream_path + INDEX_SUFFIX, "wb") as f:
+            f.write(b"not an index")
+
+        with self.assertRaises(ValueError):
+            KeyframeIndex.for_stream(self.stream_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from v3xctrl_helper.helper import color_to_hex, is_int
+from v3xctrl_helper.helper import color_to_hex, dict_delta, dict_merge, is_int
 
 
 class TestColorToHex(unittest.TestCase):
@@ -55,5 +55,31 @@ class TestIsInt(unittest.TestCase):
         self.assertTrue(is_int("999999999999"))
 
 
+class TestDictDelta(unittest.TestCase):
+    def test_no_changes(self):
+        self.assertEqual(dict_delta({"a": 1, "b": {"c": 2}}, {"a": 1, "b": {"c": 2}}), {})
+
+    def test_changed_and_added_values(self):
+        base = {"a": 1, "b": {"c": 2, "d": 3}}
+        current = {"a": 2, "b": {"c": 2, "d": 4}, "e": 5}
+
+        self.assertEqual(dict_delta(base, current), {"a": 2, "b": {"d": 4}, "e": 5})
+
+    def test_none_value_is_kept(self):
+        self.assertEqual(dict_delta({}, {"a": None}), {"a": None})
+
+    def test_merge_restores_current(self):
+        base = {"a": 1, "b": {"c": 2, "d": 3}}
+        current = {"a": 2, "b": {"c": 2, "d": 4}, "e": 5}
+
+        self.assertEqual(dict_merge(base, dict_delta(base, current)), current)
+
+    def test_merge_does_not_modify_base(self):
+        base = {"b": {"c": 2}}
+        dict_merge(base, {"b": {"c": 3}})
+
+        self.assertEqual(base, {"b": {"c": 2}})
+
+
 if __name__ == "__main__":
     unittest.main()
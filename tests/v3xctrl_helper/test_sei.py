@@ -2,11 +2,15 @@ import struct
 import unittest
 
 from src.v3xctrl_helper.sei import (
+    FRAMING_ANNEX_B,
+    FRAMING_AVC,
     SEI_PAYLOAD_SIZE,
     SEI_TYPE_USER_DATA_UNREGISTERED,
     SEI_UUID,
     START_CODE,
     build_sei_nal,
+    detect_framing,
+    parse_recovery_point,
     parse_sei_nal,
 )
 
@@ -119,3 +123,122 @@ class TestParseSeiNal(unittest.TestCase):
         result = parse_sei_nal(sei)
 
         self.assertEqual(result, ts)
+
+    def test_memoryview(self):
+        sei = build_sei_nal(4242)
+
+        result = parse_sei_nal(memoryview(sei + START_CODE + b"\x65" + b"\x00" * 100))
+
+        self.assertEqual(result, 4242)
+
+    def test_three_byte_start_codes(self):
+        sps = b"\x00\x00\x01\x67" + b"\x42" * 10
+        sei = b"\x00\x00\x01" + build_sei_nal(77)[4:]
+
+        result = parse_sei_nal(START_CODE + b"\x09\xf0" + sps + sei)
+
+        self.assertEqual(result, 77)
+
+    def test_stops_at_first_slice(self):
+        slice_nal = START_CODE + b"\x65" + b"\x11" * 20
+
+        result = parse_sei_nal(slice_nal + build_sei_nal(1000))
+
+        self.assertIsNone(result)
+
+    def test_sei_beyond_scan_limit_is_ignored(self):
+        filler = START_CODE + b"\x0c" + b"\xff" * 1024
+
+        result = parse_sei_nal(filler + build_sei_nal(1000))
+
+        self.assertIsNone(result)
+
+    def test_avc_format(self):
+        sps = b"\x67" + b"\x42" * 10
+        sei = build_sei_nal(555)[4:]
+        slice_nal = b"\x65" + b"\x00" * 100
+        data = b"".join(len(nal).to_bytes(4, "big") + nal for nal in (sps, sei, slice_nal))
+
+        self.assertEqual(parse_sei_nal(data), 555)
+        self.assertEqual(parse_sei_nal(memoryview(data), FRAMING_AVC), 555)
+
+    def test_avc_stops_at_first_slice(self):
+        slice_nal = b"\x41" + b"\x00" * 100
+        sei = build_sei_nal(555)[4:]
+        data = b"".join(len(nal).to_bytes(4, "big") + nal for nal in (slice_nal, sei))
+
+        self.assertIsNone(parse_sei_nal(data, FRAMING_AVC))
+
+    def test_wrong_framing_returns_none(self):
+        sei = build_sei_nal(1000)
+
+        self.assertIsNone(parse_sei_nal(sei, FRAMING_AVC))
+
+
+def build_recovery_point(recovery_frame_count: int) -> bytes:
+    """Recovery point SEI NAL as x264 writes it."""
+    value = recovery_frame_count + 1
+    # ue(v), exact_match_flag=1, broken_link_flag=0, changing_slice_group_idc=0
+    bits = "0" * (value.bit_length() - 1) + format(value, "b") + "1000"
+    bits += "1" + "0" * (-(len(bits) + 1) % 8)
+    payload = int(bits, 2).to_bytes(len(bits) // 8, "big")
+
+    return START_CODE + bytes([0x06, 0x06, len(payload)]) + payload + b"\x80"
+
+
+class TestParseRecoveryPoint(unittest.TestCase):
+    def test_recovery_frame_counts(self):
+        for count in (0, 1, 14, 29, 299):
+            with self.subTest(count=count):
+                self.assertEqual(parse_recovery_point(build_recovery_point(count)), count)
+
+    def test_in_front_of_slice(self):
+        sps = START_CODE + b"\x67\x42\xc0\x1f"
+        data = sps + build_recovery_point(29) + START_CODE + b"\x41" + b"\x00" * 100
+
+        self.assertEqual(parse_recovery_point(memoryview(data), FRAMING_ANNEX_B), 29)
+
+    def test_after_timestamp_sei(self):
+        data = build_sei_nal(1000) + build_recovery_point(14) + START_CODE + b"\x41"
+
+        self.assertEqual(parse_recovery_point(data), 14)
+        self.assertEqual(parse_sei_nal(data), 1000)
+
+    def test_second_message_in_same_nal(self):
+        # User data (type 5) followed by a recovery point in one SEI NAL
+        user_data = bytes([0x05, 0x03]) + b"abc"
+        nal = START_CODE + b"\x06" + user_data + build_recovery_point(29)[5:]
+
+        self.assertEqual(parse_recovery_point(nal + START_CODE + b"\x41"), 29)
+
+    def test_timestamp_sei_is_not_a_recovery_point(self):
+        self.assertIsNone(parse_recovery_point(build_sei_nal(1000) + START_CODE + b"\x65"))
+
+    def test_stops_at_first_slice(self):
+        data = START_CODE + b"\x41" + b"\x00" * 10 + build_recovery_point(29)
+
+        self.assertIsNone(parse_recovery_point(data))
+
+    def test_avc_format(self):
+        sei = build_recovery_point(29)[4:]
+        slice_nal = b"\x41" + b"\x00" * 100
+        data = b"".join(len(nal).to_bytes(4, "big") + nal for nal in (sei, slice_nal))
+
+        self.assertEqual(parse_recovery_point(data, FRAMING_AVC), 29)
+
+    def test_truncated(self):
+        self.assertIsNone(parse_recovery_point(build_recovery_point(29)[:7]))
+
+
+class TestDetectFraming(unittest.TestCase):
+    def test_annex_b(self):
+        self.assertEqual(detect_framing(build_sei_nal(1)), FRAMING_ANNEX_B)
+
+    def test_avc(self):
+        nal = build_sei_nal(1)[4:]
+
+        self.assertEqual(detect_framing(len(nal).to_bytes(4, "big") + nal), FRAMING_AVC)
+
+    def test_unknown(self):
+        self.assertIsNone(detect_framing(b""))
+        self.assertIsNone(detect_framing(b"\xff\xff\xff\xff\x65"))
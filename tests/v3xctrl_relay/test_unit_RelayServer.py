@@ -12,6 +12,7 @@ from v3xctrl_control.message import (
     Message,
     PeerAnnouncement,
 )
+from v3xctrl_control.PathMtuDiscovery import IP_MTU_DISCOVER, IP_PMTUDISC_PROBE
 from v3xctrl_relay.custom_types import PortType, Role, Session
 from v3xctrl_relay.ForwardTarget import TcpTarget
 from v3xctrl_relay.PacketRelay import Mapping
@@ -447,6 +448,32 @@ class TestRelayServerUnitTests(unittest.TestCase):
         )
         return server, mock_udp_socket
 
+    @patch("socket.socket")
+    def test_mtu_probe_is_forwarded_without_fragmentation(self, mock_socket_class):
+        server, mock_udp_socket = self._create_server_with_mock_socket(mock_socket_class)
+        mock_udp_socket.getsockopt.return_value = 1
+        modes = []
+        mock_udp_socket.setsockopt.side_effect = lambda level, option, value: modes.append(value)
+
+        def forward_packet(data, addr):
+            modes.append("forward")
+            return []
+
+        with patch.object(server.relay, "forward_packet", side_effect=forward_packet):
+            self.assertEqual(server._forward_mtu_probe(b"probe", ("192.168.1.100", 54321)), [])
+
+        self.assertEqual(modes, [IP_PMTUDISC_PROBE, "forward", 1])
+
+    @patch("socket.socket")
+    def test_mtu_probe_too_large_is_dropped(self, mock_socket_class):
+        server, mock_udp_socket = self._create_server_with_mock_socket(mock_socket_class)
+        mock_udp_socket.getsockopt.return_value = 1
+
+        with patch.object(server.relay, "forward_packet", side_effect=OSError(90, "Message too long")):
+            self.assertEqual(server._forward_mtu_probe(b"probe", ("192.168.1.100", 54321)), [])
+
+        mock_udp_socket.setsockopt.assert_called_with(socket.IPPROTO_IP, IP_MTU_DISCOVER, 1)
+
     def _parse_connection_test_ack(self, mock_udp_socket) -> ConnectionTestAck:
         ack_bytes = mock_udp_socket.sendto.call_args[0][0]
         msg = Message.from_bytes(ack_bytes)
@@ -666,6 +693,12 @@ class TestRelayServerBytePrefixes(unittest.TestCase):
             f"do not start with expected prefix {RelayServer._CONNECTION_TEST_PREFIX!r}",
         )
 
+    def test_mtu_probe_prefix_matches_serialized_output(self):
+        from v3xctrl_control.message import MtuProbe, MtuProbeAck
+
+        self.assertTrue(MtuProbe(1, bytes(1000)).to_bytes().startswith(RelayServer._MTU_PROBE_PREFIX))
+        self.assertFalse(MtuProbeAck(1).to_bytes().startswith(RelayServer._MTU_PROBE_PREFIX))
+
     def test_prefixes_are_distinct(self):
         self.assertNotEqual(
             RelayServer._PEER_ANNOUNCEMENT_PREFIX,
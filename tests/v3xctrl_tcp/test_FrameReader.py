@@ -0,0 +1,115 @@
+import socket
+import struct
+import threading
+import unittest
+
+from v3xctrl_tcp.FrameReader import FrameReader
+from v3xctrl_tcp.framing import HEADER_FORMAT, MAX_PAYLOAD_SIZE, send_message
+
+
+def _frame(payload: bytes) -> bytes:
+    return struct.pack(HEADER_FORMAT, len(payload)) + payload
+
+
+class TestFrameReader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sender, self.receiver = socket.socketpair()
+        self.reader = FrameReader(self.receiver)
+
+    def tearDown(self) -> None:
+        self.sender.close()
+        self.receiver.close()
+
+    def test_multiple_frames_in_one_read(self) -> None:
+        self.sender.sendall(_frame(b"one") + _frame(b"two") + _frame(b"three"))
+
+        frames = self.reader.read_frames()
+
+        assert frames is not None
+        self.assertEqual([bytes(frame) for frame in frames], [b"one", b"two", b"three"])
+        self.assertEqual(self.reader.reads, 1)
+        self.assertEqual(self.reader.frames, 3)
+
+    def test_frames_are_memoryviews(self) -> None:
+        self.sender.sendall(_frame(b"abc"))
+
+        frames = self.reader.read_frames()
+
+        assert frames is not None
+        self.assertIsInstance(frames[0], memoryview)
+
+    def test_empty_frame(self) -> None:
+        self.sender.sendall(_frame(b"") + _frame(b"x"))
+
+        frames = self.reader.read_frames()
+
+        assert frames is not None
+        self.assertEqual([bytes(frame) for frame in frames], [b"", b"x"])
+
+    def test_incomplete_frame_is_kept(self) -> None:
+        data = _frame(b"first") + _frame(b"second")
+        self.sender.sendall(data[:-3])
+
+        frames = self.reader.read_frames()
+        assert frames is not None
+        self.assertEqual([bytes(frame) for frame in frames], [b"first"])
+
+        self.sender.sendall(data[-3:])
+        frames = self.reader.read_frames()
+        assert frames is not None
+        self.assertEqual([bytes(frame) for frame in frames], [b"second"])
+
+    def test_split_header(self) -> None:
+        data = _frame(b"payload")
+        self.sender.sendall(data[:1])
+        self.assertEqual(self.reader.read_frames(), [])
+
+        self.sender.sendall(data[1:])
+        frames = self.reader.read_frames()
+
+        assert frames is not None
+        self.assertEqual(bytes(frames[0]), b"payload")
+
+    def test_disconnect(self) -> None:
+        self.sender.close()
+
+        self.assertIsNone(self.reader.read_frames())
+
+    def test_max_size_frames_across_buffer_end(self) -> None:
+        reader = FrameReader(self.receiver, buffer_size=MAX_PAYLOAD_SIZE + 2)
+        payloads = [bytes([i]) * MAX_PAYLOAD_SIZE for i in range(3)] + [b"tail"]
+
+        def send() -> None:
+            for payload in payloads:
+                send_message(self.sender, payload)
+            self.sender.close()
+
+        thread = threading.Thread(target=send)
+        thread.start()
+        received = [bytes(frame) for frame in reader]
+        thread.join()
+
+        self.assertEqual(received, payloads)
+
+    def test_iterates_byte_by_byte_stream(self) -> None:
+        data = _frame(b"fragmented") + _frame(b"stream")
+
+        def send() -> None:
+            for byte in data:
+                self.sender.sendall(bytes([byte]))
+            self.sender.close()
+
+        thread = threading.Thread(target=send)
+        thread.start()
+        received = [bytes(frame) for frame in self.reader]
+        thread.join()
+
+        self.assertEqual(received, [b"fragmented", b"stream"])
+
+    def test_buffer_too_small(self) -> None:
+        with self.assertRaises(ValueError):
+            FrameReader(self.receiver, buffer_size=1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+import socket
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from v3xctrl_tcp.FrameReader import FrameReader
+from v3xctrl_tcp.FrameWriter import FrameWriter
+from v3xctrl_tcp.framing import MAX_PAYLOAD_SIZE, send_message
+
+
+class TestFrameWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sender, self.receiver = socket.socketpair()
+        self.writer = FrameWriter(self.sender)
+        self.reader = FrameReader(self.receiver)
+
+    def tearDown(self) -> None:
+        self.sender.close()
+        self.receiver.close()
+
+    def _receive(self, count: int) -> list[bytes]:
+        received: list[bytes] = []
+        while len(received) < count:
+            frames = self.reader.read_frames()
+            assert frames is not None
+            received.extend(bytes(frame) for frame in frames)
+
+        return received
+
+    def test_batch_is_sent_with_one_syscall(self) -> None:
+        sock = MagicMock()
+        sock.sendmsg.side_effect = lambda buffers: sum(len(buffer) for buffer in buffers)
+        writer = FrameWriter(sock)
+
+        for payload in (b"one", b"two", b"three"):
+            self.assertTrue(writer.add(payload))
+        self.assertEqual(writer.pending, 3)
+        self.assertTrue(writer.flush())
+
+        sock.sendmsg.assert_called_once()
+        self.assertEqual(len(sock.sendmsg.call_args[0][0]), 6)
+        self.assertEqual(writer.pending, 0)
+        self.assertEqual(writer.get_stats()["frames_per_batch"], 3.0)
+
+    def test_frames_arrive_in_order(self) -> None:
+        payloads = [b"one", b"", b"three"]
+        for payload in payloads:
+            self.writer.add(payload)
+        self.writer.flush()
+
+        self.assertEqual(self._receive(3), payloads)
+
+    def test_partial_send_sends_remainder(self) -> None:
+        sock = MagicMock()
+        sock.sendmsg.return_value = 3
+        writer = FrameWriter(sock)
+
+        self.assertTrue(writer.send(b"payload"))
+
+        sock.sendall.assert_called_once_with(b"\x00\x07payload"[3:])
+        self.assertEqual(writer.get_stats()["partial_sends"], 1)
+
+    def test_send_error(self) -> None:
+        sock = MagicMock()
+        sock.sendmsg.side_effect = TimeoutError()
+        writer = FrameWriter(sock)
+
+        self.assertFalse(writer.send(b"payload"))
+        self.assertEqual(writer.pending, 0)
+
+    def test_oversized_frame_is_dropped(self) -> None:
+        self.assertFalse(self.writer.add(bytes(MAX_PAYLOAD_SIZE + 1)))
+
+        self.assertEqual(self.writer.pending, 0)
+        self.assertEqual(self.writer.get_stats()["oversized"], 1)
+
+    def test_flush_without_frames(self) -> None:
+        self.assertTrue(self.writer.flush())
+        self.assertEqual(self.writer.get_stats()["batches"], 0)
+
+    def test_batch_full(self) -> None:
+        for _ in range(FrameWriter.MAX_BATCH_FRAMES):
+            self.writer.add(b"x")
+
+        self.assertTrue(self.writer.batch_full)
+
+    def test_forward_from_batches_waiting_datagrams(self) -> None:
+        udp_receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        udp_receiver.bind(("127.0.0.1", 0))
+        udp_sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(udp_receiver.close)
+        self.addCleanup(udp_sender.close)
+
+        payloads = [bytes([i]) * 1200 for i in range(10)]
+        for payload in payloads:
+            udp_sender.sendto(payload, udp_receiver.getsockname())
+
+        self.assertTrue(self.writer.forward_from(udp_receiver))
+
+        self.assertEqual(self._receive(10), payloads)
+        stats = self.writer.get_stats()
+        self.assertEqual(stats["frames"], 10)
+        self.assertEqual(stats["batches"], 1)
+
+    def _udp_pair(self) -> tuple[socket.socket, socket.socket]:
+        udp_receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        udp_receiver.bind(("127.0.0.1", 0))
+        udp_sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(udp_receiver.close)
+        self.addCleanup(udp_sender.close)
+
+        return udp_receiver, udp_sender
+
+    def test_forward_from_schedules_flush_on_engine(self) -> None:
+        udp_receiver, udp_sender = self._udp_pair()
+        engine = MagicMock()
+        writer = FrameWriter(self.sender, engine=engine)
+
+        udp_sender.sendto(b"first", udp_receiver.getsockname())
+        self.assertTrue(writer.forward_from(udp_receiver))
+        udp_sender.sendto(b"second", udp_receiver.getsockname())
+        self.assertTrue(writer.forward_from(udp_receiver))
+
+        engine.call_later.assert_called_once()
+        self.assertEqual(engine.call_later.call_args[0][0], FrameWriter.BATCH_WINDOW)
+        self.assertEqual(writer.pending, 2)
+
+        engine.call_later.call_args[0][1]()
+
+        self.assertEqual(self._receive(2), [b"first", b"second"])
+        self.assertEqual(writer.get_stats()["batches"], 1)
+
+    def test_full_batch_is_sent_right_away(self) -> None:
+        udp_receiver, udp_sender = self._udp_pair()
+        engine = MagicMock()
+        writer = FrameWriter(self.sender, engine=engine)
+
+        udp_sender.sendto(b"first", udp_receiver.getsockname())
+        writer.forward_from(udp_receiver)
+        timer = engine.call_later.return_value
+
+        for _ in range(FrameWriter.MAX_BATCH_FRAMES):
+            writer.add(b"x")
+        udp_sender.sendto(b"last", udp_receiver.getsockname())
+        self.assertTrue(writer.forward_from(udp_receiver))
+
+        timer.cancel.assert_called_once()
+        self.assertEqual(writer.pending, 0)
+
+    def test_failed_timer_flush_reports_error(self) -> None:
+        udp_receiver, udp_sender = self._udp_pair()
+        sock = MagicMock()
+        sock.sendmsg.side_effect = TimeoutError()
+        engine = MagicMock()
+        on_error = MagicMock()
+        writer = FrameWriter(sock, engine=engine, on_error=on_error)
+
+        udp_sender.sendto(b"payload", udp_receiver.getsockname())
+        writer.forward_from(udp_receiver)
+        engine.call_later.call_args[0][1]()
+
+        on_error.assert_called_once()
+
+    def test_discard_cancels_flush(self) -> None:
+        udp_receiver, udp_sender = self._udp_pair()
+        engine = MagicMock()
+        writer = FrameWriter(self.sender, engine=engine)
+
+        udp_sender.sendto(b"payload", udp_receiver.getsockname())
+        writer.forward_from(udp_receiver)
+        writer.discard()
+
+        engine.call_later.return_value.cancel.assert_called_once()
+        self.assertEqual(writer.pending, 0)
+
+    def test_interoperates_with_send_message(self) -> None:
+        def send() -> None:
+            send_message(self.sender, b"single")
+            self.writer.add(bytes(MAX_PAYLOAD_SIZE))
+            self.writer.add(b"batched")
+            self.writer.flush()
+
+        thread = threading.Thread(target=send)
+        thread.start()
+        received = self._receive(3)
+        thread.join()
+
+        self.assertEqual(received, [b"single", bytes(MAX_PAYLOAD_SIZE), b"batched"])
+
+
+if __name__ == "__main__":
+    unittest.main()
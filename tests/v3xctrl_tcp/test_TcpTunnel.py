@@ -1,9 +1,11 @@
 import socket
+import threading
 import time
 import unittest
 
 from v3xctrl_tcp.framing import recv_message, send_message
 from v3xctrl_tcp.TcpTunnel import TcpTunnel
+from v3xctrl_tcp.TunnelEngine import TunnelEngine
 
 
 def _free_port() -> int:
@@ -15,6 +17,11 @@ def _free_port() -> int:
     return port
 
 
+def _thread_names() -> list[str]:
+    """Names of the threads run by tunnels and engines."""
+    return [t.name for t in threading.enumerate() if t.name.startswith(("SharedEngine", "TcpTunnel"))]
+
+
 class _TcpServerHelper:
     """Simple TCP server for testing TcpTunnel connections."""
 
@@ -248,6 +255,99 @@ class TestTcpTunnelReconnect(unittest.TestCase):
             server.close()
 
 
+class TestTcpTunnelRetry(unittest.TestCase):
+    """Test non-blocking connect retry."""
+
+    def test_connects_once_remote_is_up(self) -> None:
+        """Tunnel keeps retrying until the remote side starts listening."""
+        tcp_port = _free_port()
+        tunnel = TcpTunnel(
+            remote_host="127.0.0.1",
+            remote_port=tcp_port,
+            local_component_port=_free_port(),
+            bidirectional=False,
+        )
+        tunnel.start()
+
+        try:
+            time.sleep(0.2)
+            server = _TcpServerHelper(tcp_port)
+            try:
+                client = server.accept()
+                client.close()
+            finally:
+                server.close()
+        finally:
+            tunnel.stop()
+
+
+class TestTcpTunnelSharedEngine(unittest.TestCase):
+    """Test several tunnels on one engine thread."""
+
+    def test_tunnels_share_one_thread(self) -> None:
+        engine = TunnelEngine("SharedEngine")
+        servers = [_TcpServerHelper(_free_port()) for _ in range(2)]
+        tunnels = [
+            TcpTunnel(
+                remote_host="127.0.0.1",
+                remote_port=server.port,
+                local_component_port=_free_port(),
+                bidirectional=False,
+                engine=engine,
+            )
+            for server in servers
+        ]
+        for tunnel in tunnels:
+            tunnel.start()
+
+        udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            clients = [server.accept() for server in servers]
+            self.assertEqual(_thread_names(), ["SharedEngine"])
+
+            for i, (tunnel, client) in enumerate(zip(tunnels, clients, strict=True)):
+                payload = f"tunnel_{i}".encode()
+                udp.sendto(payload, ("127.0.0.1", tunnel.ephemeral_port))
+
+                client.settimeout(2.0)
+                self.assertEqual(recv_message(client), payload)
+
+            # Stopping one tunnel leaves the other running
+            tunnels[0].stop()
+            udp.sendto(b"still_running", ("127.0.0.1", tunnels[1].ephemeral_port))
+            self.assertEqual(recv_message(clients[1]), b"still_running")
+        finally:
+            udp.close()
+            for tunnel in tunnels:
+                tunnel.stop()
+            for server in servers:
+                server.close()
+
+        self.assertEqual(_thread_names(), [])
+
+
+class TestTcpTunnelStats(unittest.TestCase):
+    """Test outbound batching statistics."""
+
+    def test_stats_after_forwarding(self) -> None:
+        server = _TcpServerHelper(_free_port())
+        tunnel = TcpTunnel("127.0.0.1", server.port, _free_port(), bidirectional=False)
+        tunnel.start()
+
+        udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            client = server.accept()
+            client.settimeout(2.0)
+            udp.sendto(b"payload", ("127.0.0.1", tunnel.ephemeral_port))
+            self.assertEqual(recv_message(client), b"payload")
+        finally:
+            udp.close()
+            tunnel.stop()
+            server.close()
+
+        self.assertEqual(tunnel.get_stats()["frames"], 1)
+
+
 class TestTcpTunnelHandshake(unittest.TestCase):
     """Test relay-mode handshake behavior."""
 
@@ -0,0 +1,137 @@
+import selectors
+import socket
+import threading
+import unittest
+
+from v3xctrl_tcp.TunnelEngine import TunnelEngine
+
+
+class TestTunnelEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = TunnelEngine("TestEngine")
+        self.engine.attach()
+
+    def tearDown(self) -> None:
+        self.engine.detach()
+
+    def _run_on_engine(self, callback) -> None:
+        done = threading.Event()
+
+        def run() -> None:
+            callback()
+            done.set()
+
+        self.engine.call_soon(run)
+        self.assertTrue(done.wait(timeout=2.0))
+
+    def test_call_soon_runs_on_engine_thread(self) -> None:
+        threads: list[str] = []
+
+        self._run_on_engine(lambda: threads.append(threading.current_thread().name))
+
+        self.assertEqual(threads, ["TestEngine"])
+
+    def test_call_later_runs_in_order(self) -> None:
+        calls: list[int] = []
+        done = threading.Event()
+
+        def schedule() -> None:
+            self.engine.call_later(0.05, lambda: (calls.append(2), done.set()))
+            self.engine.call_later(0.01, lambda: calls.append(1))
+
+        self.engine.call_soon(schedule)
+
+        self.assertTrue(done.wait(timeout=2.0))
+        self.assertEqual(calls, [1, 2])
+
+    def test_cancelled_timer_does_not_run(self) -> None:
+        calls: list[str] = []
+        done = threading.Event()
+
+        def schedule() -> None:
+            timer = self.engine.call_later(0.01, lambda: calls.append("cancelled"))
+            timer.cancel()
+            self.engine.call_later(0.05, done.set)
+
+        self.engine.call_soon(schedule)
+
+        self.assertTrue(done.wait(timeout=2.0))
+        self.assertEqual(calls, [])
+
+    def test_readable_socket_invokes_callback(self) -> None:
+        sender, receiver = socket.socketpair()
+        self.addCleanup(sender.close)
+        self.addCleanup(receiver.close)
+        received = threading.Event()
+        data: list[bytes] = []
+
+        def on_readable(events: int) -> None:
+            self.assertEqual(events, selectors.EVENT_READ)
+            data.append(receiver.recv(100))
+            received.set()
+
+        self._run_on_engine(lambda: self.engine.register(receiver, selectors.EVENT_READ, on_readable))
+        sender.send(b"ping")
+
+        self.assertTrue(received.wait(timeout=2.0))
+        self.assertEqual(data, [b"ping"])
+        self._run_on_engine(lambda: self.engine.unregister(receiver))
+
+    def test_unregister_unknown_socket(self) -> None:
+        sock = socket.socket()
+        self.addCleanup(sock.close)
+
+        self._run_on_engine(lambda: self.engine.unregister(sock))
+
+    def test_failing_callback_does_not_stop_engine(self) -> None:
+        def fail() -> None:
+            raise RuntimeError("broken tunnel")
+
+        with self.assertLogs("v3xctrl_tcp.TunnelEngine", level="ERROR"):
+            self.engine.call_soon(fail)
+            self._run_on_engine(lambda: None)
+
+
+class TestTunnelEngineLifecycle(unittest.TestCase):
+    def test_thread_runs_while_attached(self) -> None:
+        engine = TunnelEngine("LifecycleEngine")
+
+        engine.attach()
+        engine.attach()
+        thread = engine._thread
+        assert thread is not None
+
+        engine.detach()
+        self.assertTrue(thread.is_alive())
+
+        engine.detach()
+        self.assertFalse(thread.is_alive())
+
+    def test_restart_after_detach(self) -> None:
+        engine = TunnelEngine()
+        engine.attach()
+        engine.detach()
+
+        engine.attach()
+        done = threading.Event()
+        engine.call_soon(done.set)
+
+        self.assertTrue(done.wait(timeout=2.0))
+        engine.detach()
+
+    def test_callback_queued_before_last_detach_runs(self) -> None:
+        engine = TunnelEngine()
+        engine.attach()
+        done = threading.Event()
+
+        engine.call_soon(done.set)
+        engine.detach()
+
+        self.assertTrue(done.is_set())
+
+    def test_detach_without_attach(self) -> None:
+        TunnelEngine().detach()
+
+
+if __name__ == "__main__":
+    unittest.main()
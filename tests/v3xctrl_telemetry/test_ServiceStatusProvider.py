@@ -0,0 +1,139 @@
+"""Tests for the batched, cached service status provider."""
+
+import subprocess
+import unittest
+from unittest.mock import MagicMock, patch
+
+from v3xctrl_telemetry.ServiceStatusProvider import ServiceStatus, ServiceStatusProvider
+
+
+def systemctl_output(*states: str) -> str:
+    return "\n\n".join(f"Type=simple\nActiveState={state}\nResult=success" for state in states) + "\n"
+
+
+class TestServiceStatusProvider(unittest.TestCase):
+    def setUp(self):
+        self.patcher = patch("v3xctrl_telemetry.ServiceStatusProvider.subprocess.check_output")
+        self.mock_check_output = self.patcher.start()
+
+        self.provider = ServiceStatusProvider(["a.service", "b.service"], max_age=60)
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_get_all_parses_blocks_in_order(self):
+        self.mock_check_output.return_value = systemctl_output("active", "failed")
+
+        statuses = self.provider.get_all()
+
+        assert statuses == [
+            ServiceStatus("a.service", "simple", "active", "success"),
+            ServiceStatus("b.service", "simple", "failed", "success"),
+        ]
+        assert statuses[0].active is True
+        assert statuses[1].active is False
+
+    def test_results_are_cached(self):
+        self.mock_check_output.return_value = systemctl_output("active", "active")
+
+        self.provider.get_all()
+        self.provider.get("a.service")
+        self.provider.get_all()
+
+        self.mock_check_output.assert_called_once()
+
+    def test_invalidate_forces_query(self):
+        self.mock_check_output.return_value = systemctl_output("active", "active")
+
+        self.provider.get_all()
+        self.provider.invalidate()
+        self.provider.get_all()
+
+        assert self.mock_check_output.call_count == 2
+
+    def test_stale_results_are_refreshed(self):
+        self.mock_check_output.return_value = systemctl_output("active", "active")
+        provider = ServiceStatusProvider(["a.service", "b.service"], max_age=0)
+
+        with patch("v3xctrl_telemetry.ServiceStatusProvider.time.monotonic", side_effect=[0.0, 1.0, 1.0]):
+            provider.get_all()
+            provider.get_all()
+
+        assert self.mock_check_output.call_count == 2
+
+    def test_untracked_service_queried_directly(self):
+        self.mock_check_output.return_value = systemctl_output("inactive")
+
+        status = self.provider.get("other.service")
+
+        assert status.state == "inactive"
+        assert self.mock_check_output.call_args[0][0][2] == "other.service"
+
+    def test_query_failure_reports_unknown(self):
+        self.mock_check_output.side_effect = subprocess.CalledProcessError(1, "systemctl")
+
+        assert self.provider.refresh() is False
+        assert self.provider.get_all() == [ServiceStatus.unknown("a.service"), ServiceStatus.unknown("b.service")]
+
+    def test_unexpected_block_count_reports_unknown(self):
+        self.mock_check_output.return_value = systemctl_output("active")
+
+        assert self.provider.refresh() is False
+
+    def test_refresh_uses_cache(self):
+        self.mock_check_output.return_value = systemctl_output("active", "active")
+
+        assert self.provider.refresh() is True
+        assert self.provider.refresh() is True
+        self.provider.get_all()
+
+        self.mock_check_output.assert_called_once()
+
+    def test_forced_refresh_queries(self):
+        self.mock_check_output.return_value = systemctl_output("active", "active")
+        self.provider.refresh()
+
+        self.mock_check_output.side_effect = subprocess.CalledProcessError(1, "systemctl")
+
+        assert self.provider.refresh(force=True) is False
+        assert self.provider.refresh() is False
+        assert self.mock_check_output.call_count == 2
+
+    def test_listener_notified_on_change_only(self):
+        listener = MagicMock()
+        self.provider.add_listener(listener)
+
+        self.mock_check_output.return_value = systemctl_output("active", "inactive")
+        self.provider.refresh()
+        assert listener.call_count == 2
+
+        listener.reset_mock()
+        self.provider.refresh(force=True)
+        listener.assert_not_called()
+
+        self.mock_check_output.return_value = systemctl_output("active", "active")
+        self.provider.refresh(force=True)
+        listener.assert_called_once_with(
+            ServiceStatus("b.service", "simple", "active", "success"),
+            ServiceStatus("b.service", "simple", "inactive", "success"),
+        )
+
+    def test_listener_receives_cached_statuses(self):
+        self.mock_check_output.return_value = systemctl_output("active", "failed")
+        self.provider.refresh()
+
+        listener = MagicMock()
+        self.provider.add_listener(listener)
+
+        assert listener.call_count == 2
+        listener.assert_any_call(ServiceStatus("a.service", "simple", "active", "success"), None)
+
+    def test_failing_listener_does_not_break_refresh(self):
+        self.provider.add_listener(MagicMock(side_effect=ValueError("boom")))
+        self.mock_check_output.return_value = systemctl_output("active", "active")
+
+        assert self.provider.refresh() is True
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,8 +12,8 @@ class TestServiceTelemetry(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.subprocess_patcher = patch("v3xctrl_telemetry.ServiceTelemetry.subprocess")
-        self.mock_subprocess = self.subprocess_patcher.start()
+        self.subprocess_patcher = patch("v3xctrl_telemetry.ServiceStatusProvider.subprocess.check_output")
+        self.mock_check_output = self.subprocess_patcher.start()
 
     def tearDown(self):
         """Clean up patches."""
@@ -28,29 +28,12 @@ class TestServiceTelemetry(unittest.TestCase):
         assert telemetry._state.reverse_shell is False
         assert telemetry._state.debug is False
 
-    def test_is_active_service_running(self):
-        """Test _is_active returns True when service is active."""
-        self.mock_subprocess.call.return_value = 0  # systemctl returns 0 for active
-
-        telemetry = ServiceTelemetry()
-        result = telemetry._is_active("test.service")
-
-        assert result is True
-        self.mock_subprocess.call.assert_called_once()
-
-    def test_is_active_service_not_running(self):
-        """Test _is_active returns False when service is inactive."""
-        self.mock_subprocess.call.return_value = 3  # systemctl returns non-zero for inactive
-
-        telemetry = ServiceTelemetry()
-        result = telemetry._is_active("test.service")
-
-        assert result is False
+    def _systemctl_output(self, *states):
+        return "\n\n".join(f"Type=simple\nActiveState={state}\nResult=success" for state in states) + "\n"
 
     def test_update_checks_all_services(self):
         """Test update() checks status of all services in dataclass."""
-        # Mock first service active, second and third inactive
-        self.mock_subprocess.call.side_effect = [0, 3, 3]
+        self.mock_check_output.return_value = self._systemctl_output("active", "inactive", "failed")
 
         telemetry = ServiceTelemetry()
         telemetry.update()
@@ -59,23 +42,30 @@ class TestServiceTelemetry(unittest.TestCase):
         assert telemetry._state.reverse_shell is False
         assert telemetry._state.debug is False
 
-        # Should have been called three times (once for each service)
-        assert self.mock_subprocess.call.call_count == 3
-
-    def test_update_converts_underscores_to_hyphens(self):
-        """Test update() correctly converts field names to service names."""
-        self.mock_subprocess.call.return_value = 0
+    def test_update_queries_all_services_at_once(self):
+        """Test update() queries all services with a single systemctl call."""
+        self.mock_check_output.return_value = self._systemctl_output("active", "active", "active")
 
         telemetry = ServiceTelemetry()
         telemetry.update()
 
-        # Check that service names were converted correctly
-        calls = self.mock_subprocess.call.call_args_list
-        called_services = [call[0][0][3] for call in calls]  # Index 3 is the service name
+        self.mock_check_output.assert_called_once()
+        command = self.mock_check_output.call_args[0][0]
+        assert command[:2] == ["systemctl", "show"]
+        assert command[2:5] == [
+            "v3xctrl-video.service",
+            "v3xctrl-reverse-shell.service",
+            "v3xctrl-debug.service",
+        ]
 
-        assert "v3xctrl-video.service" in called_services
-        assert "v3xctrl-reverse-shell.service" in called_services
-        assert "v3xctrl-debug.service" in called_services
+    def test_update_raises_when_systemctl_fails(self):
+        """Test update() raises when systemd can not be queried."""
+        self.mock_check_output.side_effect = FileNotFoundError("systemctl")
+
+        telemetry = ServiceTelemetry()
+
+        with self.assertRaises(RuntimeError):
+            telemetry.update()
 
     def test_get_state_returns_services_object(self):
         """Test get_state() returns the services dataclass."""
@@ -88,7 +78,7 @@ class TestServiceTelemetry(unittest.TestCase):
 
     def test_get_byte_no_services(self):
         """Test get_byte() returns 0x00 when no services active."""
-        self.mock_subprocess.call.side_effect = [3, 3, 3]  # All services inactive
+        self.mock_check_output.return_value = self._systemctl_output("inactive", "inactive", "inactive")
 
         telemetry = ServiceTelemetry()
         telemetry.update()
@@ -97,7 +87,7 @@ class TestServiceTelemetry(unittest.TestCase):
 
     def test_get_byte_video_only(self):
         """Test get_byte() with only v3xctrl_video active (bit 0)."""
-        self.mock_subprocess.call.side_effect = [0, 3, 3]  # video active, reverse_shell inactive, debug inactive
+        self.mock_check_output.return_value = self._systemctl_output("active", "inactive", "inactive")
 
         telemetry = ServiceTelemetry()
         telemetry.update()
@@ -106,7 +96,7 @@ class TestServiceTelemetry(unittest.TestCase):
 
     def test_get_byte_reverse_shell_only(self):
         """Test get_byte() with only v3xctrl_reverse_shell active (bit 1)."""
-        self.mock_subprocess.call.side_effect = [3, 0, 3]  # video inactive, reverse_shell active, debug inactive
+        self.mock_check_output.return_value = self._systemctl_output("inactive", "active", "inactive")
 
         telemetry = ServiceTelemetry()
         telemetry.update()
@@ -115,7 +105,7 @@ class TestServiceTelemetry(unittest.TestCase):
 
     def test_get_byte_debug_only(self):
         """Test get_byte() with only v3xctrl_debug active (bit 2)."""
-        self.mock_subprocess.call.side_effect = [3, 3, 0]  # video inactive, reverse_shell inactive, debug active
+        self.mock_check_output.return_value = self._systemctl_output("inactive", "inactive", "active")
 
         telemetry = ServiceTelemetry()
         telemetry.update()
@@ -124,13 +114,27 @@ class TestServiceTelemetry(unittest.TestCase):
 
     def test_get_byte_all_services(self):
         """Test get_byte() with all services active."""
-        self.mock_subprocess.call.side_effect = [0, 0, 0]  # All active
+        self.mock_check_output.return_value = self._systemctl_output("active", "active", "active")
 
         telemetry = ServiceTelemetry()
         telemetry.update()
 
         assert telemetry.get_byte() == 0x07  # 0000 0111
 
+    def test_flags_follow_status_changes(self):
+        """Test flags are updated from the provider's change notifications."""
+        self.mock_check_output.return_value = self._systemctl_output("active", "inactive", "inactive")
+
+        telemetry = ServiceTelemetry()
+        telemetry.update()
+        assert telemetry._state.video is True
+
+        self.mock_check_output.return_value = self._systemctl_output("failed", "inactive", "active")
+        telemetry._provider.refresh(force=True)
+
+        assert telemetry._state.video is False
+        assert telemetry._state.debug is True
+
 
 if __name__ == "__main__":
     unittest.main()
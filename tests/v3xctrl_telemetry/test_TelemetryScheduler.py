@@ -0,0 +1,105 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from v3xctrl_telemetry.TelemetryScheduler import SourceStats, TelemetryScheduler
+
+
+class TestTelemetryScheduler(unittest.TestCase):
+    def setUp(self):
+        self.on_update = MagicMock()
+        self.scheduler = TelemetryScheduler(self.on_update)
+
+    def tearDown(self):
+        self.scheduler.stop(timeout=1)
+
+    def test_sources_run_at_own_rate(self):
+        fast = MagicMock(return_value=True)
+        slow = MagicMock(return_value=True)
+        self.scheduler.add("fast", fast, 0.01)
+        self.scheduler.add("slow", slow, 1)
+
+        self.scheduler.start()
+        time.sleep(0.1)
+        self.scheduler.stop(timeout=1)
+
+        self.assertGreater(fast.call_count, 5)
+        self.assertEqual(slow.call_count, 1)
+
+    def test_slow_source_does_not_block_others(self):
+        blocker = threading.Event()
+        fast = MagicMock(return_value=True)
+        self.scheduler.add("slow", blocker.wait, 1)
+        self.scheduler.add("fast", fast, 0.01)
+
+        self.scheduler.start()
+        time.sleep(0.1)
+        self.assertGreater(fast.call_count, 5)
+
+        blocker.set()
+
+    def test_publishes_updates(self):
+        published = threading.Event()
+        self.on_update.side_effect = lambda name: published.set()
+        self.scheduler.add("gps", MagicMock(return_value=True), 1)
+
+        self.scheduler.start()
+
+        self.assertTrue(published.wait(1))
+        self.on_update.assert_called_with("gps")
+
+    def test_failures_are_counted(self):
+        self.scheduler.add("raises", MagicMock(side_effect=Exception("fail")), 1)
+        self.scheduler.add("fails", MagicMock(return_value=False), 1)
+        self.scheduler.add("ok", MagicMock(return_value=None), 1)
+
+        self.scheduler.start()
+        time.sleep(0.05)
+        stats = self.scheduler.get_stats()
+
+        self.assertEqual(stats["raises"].failures, 1)
+        self.assertEqual(stats["fails"].failures, 1)
+        self.assertEqual(stats["ok"].failures, 0)
+        self.assertEqual(stats["ok"].updates, 1)
+        self.on_update.assert_called_once_with("ok")
+
+    def test_latency_and_timeouts(self):
+        self.scheduler.add("slow", lambda: time.sleep(0.03), 1, timeout=0.01)
+
+        self.scheduler.start()
+        time.sleep(0.01)
+        self.assertTrue(self.scheduler.get_stats()["slow"].stalled)
+
+        time.sleep(0.05)
+        stats = self.scheduler.get_stats()["slow"]
+        self.assertFalse(stats.stalled)
+        self.assertEqual(stats.timeouts, 1)
+        self.assertGreaterEqual(stats.last_latency_ms, 30)
+        self.assertEqual(stats.max_latency_ms, stats.last_latency_ms)
+        self.assertEqual(stats.avg_latency_ms, stats.last_latency_ms)
+
+    def test_source_without_updates_becomes_stale(self):
+        self.scheduler.add("failing", MagicMock(return_value=False), 0.01, timeout=0.02)
+        self.scheduler.add("ok", MagicMock(return_value=True), 0.01, timeout=0.02)
+
+        self.assertEqual(self.scheduler.stale_sources(), set())
+        self.scheduler.start()
+        time.sleep(0.1)
+
+        self.assertEqual(self.scheduler.stale_sources(), {"failing"})
+        self.assertTrue(self.scheduler.get_stats()["failing"].stale)
+        self.assertFalse(self.scheduler.get_stats()["ok"].stale)
+
+    def test_add_while_running_raises(self):
+        self.scheduler.start()
+        with self.assertRaises(RuntimeError):
+            self.scheduler.add("late", MagicMock(), 1)
+
+    def test_empty_stats(self):
+        self.scheduler.add("idle", MagicMock(), 1)
+        self.assertEqual(self.scheduler.get_stats(), {"idle": SourceStats()})
+
+
+if __name__ == "__main__":
+    unittest.main()
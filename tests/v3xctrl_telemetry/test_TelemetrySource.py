@@ -37,7 +37,7 @@ class TestTelemetrySourceProtocol(unittest.TestCase):
         self.smbus_patcher = patch("v3xctrl_telemetry.INA.SMBus")
         self.mock_smbus = self.smbus_patcher.start()
 
-        self.subprocess_patcher = patch("v3xctrl_telemetry.ServiceTelemetry.subprocess")
+        self.subprocess_patcher = patch("v3xctrl_telemetry.ServiceStatusProvider.subprocess")
         self.mock_subprocess_service = self.subprocess_patcher.start()
 
         self.vcgencmd_patcher = patch("v3xctrl_telemetry.VideoCoreTelemetry.subprocess")
@@ -91,7 +91,7 @@ class TestGetStateMethods(unittest.TestCase):
         self.smbus_patcher = patch("v3xctrl_telemetry.INA.SMBus")
         self.mock_smbus = self.smbus_patcher.start()
 
-        self.subprocess_patcher = patch("v3xctrl_telemetry.ServiceTelemetry.subprocess")
+        self.subprocess_patcher = patch("v3xctrl_telemetry.ServiceStatusProvider.subprocess")
         self.mock_subprocess_service = self.subprocess_patcher.start()
 
         self.vcgencmd_patcher = patch("v3xctrl_telemetry.VideoCoreTelemetry.subprocess")
@@ -1,6 +1,8 @@
 """Tests for VideoCore telemetry."""
 
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 from v3xctrl_telemetry.dataclasses import ThrottleFlags, VideoCoreFlags
@@ -15,9 +17,17 @@ class TestVideoCoreTelemetry(unittest.TestCase):
         self.subprocess_patcher = patch("v3xctrl_telemetry.VideoCoreTelemetry.subprocess")
         self.mock_subprocess = self.subprocess_patcher.start()
 
+        # Force the vcgencmd fallback unless a test provides a sysfs file
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.throttled_path = Path(self.tmpdir.name) / "get_throttled"
+        self.path_patcher = patch.object(VideoCoreTelemetry, "THROTTLED_PATH", self.throttled_path)
+        self.path_patcher.start()
+
     def tearDown(self):
         """Clean up patches."""
+        self.path_patcher.stop()
         self.subprocess_patcher.stop()
+        self.tmpdir.cleanup()
 
     def test_initialization(self):
         """Test VideoCoreTelemetry initializes with VideoCoreFlags dataclass."""
@@ -265,6 +275,32 @@ class TestVideoCoreTelemetry(unittest.TestCase):
             timeout=1.0,
         )
 
+    def test_update_reads_sysfs(self):
+        """Test update() prefers the firmware sysfs file over vcgencmd."""
+        self.throttled_path.write_text("50005\n")
+
+        telemetry = VideoCoreTelemetry()
+        telemetry.update()
+
+        assert telemetry._state.current.undervolt is True
+        assert telemetry._state.current.throttled is True
+        assert telemetry._state.history.undervolt is True
+        assert telemetry._state.history.throttled is True
+        self.mock_subprocess.check_output.assert_not_called()
+
+    def test_update_falls_back_to_vcgencmd_once(self):
+        """Test a missing sysfs file falls back to vcgencmd and is not retried."""
+        self.mock_subprocess.check_output.return_value = "throttled=0x1"
+
+        telemetry = VideoCoreTelemetry()
+        telemetry.update()
+
+        self.throttled_path.write_text("0\n")
+        telemetry.update()
+
+        assert telemetry._state.current.undervolt is True
+        assert self.mock_subprocess.check_output.call_count == 2
+
 
 if __name__ == "__main__":
     unittest.main()
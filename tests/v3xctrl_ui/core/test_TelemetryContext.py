@@ -4,9 +4,11 @@ import threading
 import time
 import unittest
 
+from v3xctrl_control.message import Telemetry
 from v3xctrl_ui.core.dataclasses import (
     BatteryData,
     GstFlags,
+    LinkData,
     ServiceFlags,
     SignalData,
     ThrottleFlags,
@@ -260,6 +262,49 @@ class TestTelemetryContext(unittest.TestCase):
         self.assertEqual(battery.current, "500mA")
         self.assertTrue(battery.warning)
 
+    def test_update_and_get_link(self):
+        """Test updating and getting link statistics of both directions."""
+        self.context.update_uplink(LinkData(loss=1.5, reorder=0.5, duplicates=2, burst=3))
+        self.context.update_downlink(LinkData(loss=4.0))
+
+        uplink = self.context.get_uplink()
+        self.assertEqual(uplink, LinkData(loss=1.5, reorder=0.5, duplicates=2, burst=3))
+        self.assertEqual(self.context.get_downlink().loss, 4.0)
+
+        self.context.reset()
+        self.assertEqual(self.context.get_uplink(), LinkData())
+        self.assertEqual(self.context.get_downlink(), LinkData())
+
+    def test_reconstruct_full_telemetry(self):
+        """Test that messages without keyframe information are taken as they are."""
+        values = {"svc": 1}
+        self.assertEqual(self.context.reconstruct_telemetry(Telemetry(values)), values)
+
+    def test_reconstruct_delta_on_keyframe(self):
+        """Test that deltas are applied on top of their keyframe."""
+        self.context.reconstruct_telemetry(Telemetry({"svc": 1, "bat": {"vol": 3700, "wrn": False}}, k=3))
+
+        values = self.context.reconstruct_telemetry(Telemetry({"bat": {"vol": 3600}}, b=3))
+        self.assertEqual(values, {"svc": 1, "bat": {"vol": 3600, "wrn": False}})
+
+        # Deltas are relative to the keyframe, not to the previous delta
+        values = self.context.reconstruct_telemetry(Telemetry({"svc": 3}, b=3))
+        self.assertEqual(values, {"svc": 3, "bat": {"vol": 3700, "wrn": False}})
+
+    def test_reconstruct_delta_unknown_keyframe(self):
+        """Test that deltas on an unknown keyframe can not be reconstructed."""
+        self.assertIsNone(self.context.reconstruct_telemetry(Telemetry({"svc": 3}, b=0)))
+
+        self.context.reconstruct_telemetry(Telemetry({"svc": 1}, k=1))
+        self.assertIsNone(self.context.reconstruct_telemetry(Telemetry({"svc": 3}, b=0)))
+
+    def test_reset_forgets_keyframe(self):
+        """Test that a reset requires a new keyframe."""
+        self.context.reconstruct_telemetry(Telemetry({"svc": 1}, k=1))
+        self.context.reset()
+
+        self.assertIsNone(self.context.reconstruct_telemetry(Telemetry({"svc": 3}, b=1)))
+
     def test_reset(self):
         """Test resetting all telemetry data."""
         # Set some values
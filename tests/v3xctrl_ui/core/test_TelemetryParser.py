@@ -218,6 +218,38 @@ class TestParseTelemetry(unittest.TestCase):
 
         self.assertEqual(data.battery_current, "0mA")
 
+    def test_parse_telemetry_link_stats(self):
+        telemetry = Telemetry(
+            {
+                "sig": {"rsrq": -10, "rsrp": -90},
+                "cell": {"band": 3, "id": 0x0100},
+                "bat": {"vol": 3800, "avg": 3750, "pct": 75, "wrn": False},
+                "net": {"loss": 2.5, "reo": 0.4, "dup": 1, "bst": 3},
+            }
+        )
+
+        data = parse_telemetry(telemetry)
+
+        self.assertEqual(data.uplink.loss, 2.5)
+        self.assertEqual(data.uplink.reorder, 0.4)
+        self.assertEqual(data.uplink.duplicates, 1)
+        self.assertEqual(data.uplink.burst, 3)
+
+    def test_parse_telemetry_link_stats_missing(self):
+        """Older streamers do not report link statistics."""
+        telemetry = Telemetry(
+            {
+                "sig": {"rsrq": -10, "rsrp": -90},
+                "cell": {"band": 3, "id": 0x0100},
+                "bat": {"vol": 3800, "avg": 3750, "pct": 75, "wrn": False},
+            }
+        )
+
+        data = parse_telemetry(telemetry)
+
+        self.assertEqual(data.uplink.loss, 0.0)
+        self.assertEqual(data.uplink.burst, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from v3xctrl_control import SequenceStats
 from v3xctrl_ui.network.NetworkController import NetworkController
 from v3xctrl_ui.network.video.ClockOffset import ClockOffset
 
@@ -267,6 +268,52 @@ class TestNetworkController(unittest.TestCase):
         call_args = mock_server.send.call_args[0]
         self.assertEqual(call_args[0].__class__.__name__, "Latency")
 
+    def test_send_latency_check_reports_loss(self):
+        """Test send_latency_check reports the receive loss as network feedback."""
+        nm = NetworkController(self.settings, self.handlers, self.clock_offset)
+
+        mock_server = MagicMock()
+        mock_server.get_sequence_stats.return_value = SequenceStats(expected=100, lost=3)
+        nm.server = mock_server
+        nm.server_error = None
+
+        nm.send_latency_check()
+
+        self.assertEqual(mock_server.send.call_args[0][0].loss, 3.0)
+
+    def test_send_latency_check_reports_rtt_and_video_loss(self):
+        """Test send_latency_check reports the last RTT and the video loss."""
+        nm = NetworkController(self.settings, self.handlers, self.clock_offset)
+
+        mock_server = MagicMock()
+        mock_server.get_sequence_stats.return_value = SequenceStats()
+        nm.server = mock_server
+        nm.server_error = None
+        nm.video_receiver = MagicMock()
+        nm.video_receiver.get_video_loss.return_value = 4.0
+        nm.record_rtt(35.04)
+
+        nm.send_latency_check()
+
+        message = mock_server.send.call_args[0][0]
+        self.assertEqual(message.rtt, 35.0)
+        self.assertEqual(message.video_loss, 4.0)
+
+    def test_send_latency_check_without_measurements(self):
+        """Test send_latency_check leaves RTT and video loss out until known."""
+        nm = NetworkController(self.settings, self.handlers, self.clock_offset)
+
+        mock_server = MagicMock()
+        mock_server.get_sequence_stats.return_value = SequenceStats()
+        nm.server = mock_server
+        nm.server_error = None
+
+        nm.send_latency_check()
+
+        message = mock_server.send.call_args[0][0]
+        self.assertIsNone(message.rtt)
+        self.assertIsNone(message.video_loss)
+
     def test_send_latency_check_no_server(self):
         """Test send_latency_check when no server is available."""
         nm = NetworkController(self.settings, self.handlers, self.clock_offset)
@@ -185,6 +185,64 @@ class TestNetworkCoordinator(unittest.TestCase):
 
         mock_nm.send_latency_check.assert_called_once()
 
+    def test_keyframe_request_wired_to_osd(self):
+        """Test that the OSD asks the coordinator for telemetry keyframes."""
+        self.assertEqual(self.mock_osd.on_keyframe_request, self.coordinator.request_telemetry_keyframe)
+
+    def test_request_telemetry_keyframe(self):
+        """Test requesting a telemetry keyframe sends a command."""
+        mock_nm = MagicMock()
+        mock_nm.relay_spectator_mode = False
+        self.coordinator.network_controller = mock_nm
+
+        self.coordinator.request_telemetry_keyframe()
+
+        mock_nm.server.send_command.assert_called_once()
+        command = mock_nm.server.send_command.call_args[0][0]
+        self.assertEqual(command.get_command(), "telemetry")
+        self.assertEqual(command.get_parameters(), {"action": "keyframe"})
+
+    def test_request_telemetry_keyframe_spectator_mode(self):
+        """Test that no keyframe is requested in spectator mode."""
+        mock_nm = MagicMock()
+        mock_nm.relay_spectator_mode = True
+        self.coordinator.network_controller = mock_nm
+
+        self.coordinator.request_telemetry_keyframe()
+
+        mock_nm.server.send_command.assert_not_called()
+
+    def test_request_video_keyframe(self):
+        mock_nm = MagicMock()
+        mock_nm.relay_spectator_mode = False
+        mock_nm.video_receiver.take_keyframe_request.return_value = True
+        self.coordinator.network_controller = mock_nm
+
+        self.coordinator.request_video_keyframe_if_needed()
+
+        command = mock_nm.server.send_command.call_args[0][0]
+        self.assertEqual(command.get_command(), "video")
+        self.assertEqual(command.get_parameters(), {"action": "keyframe"})
+
+    def test_request_video_keyframe_not_needed(self):
+        mock_nm = MagicMock()
+        mock_nm.video_receiver.take_keyframe_request.return_value = False
+        self.coordinator.network_controller = mock_nm
+
+        self.coordinator.request_video_keyframe_if_needed()
+
+        mock_nm.server.send_command.assert_not_called()
+
+    def test_request_video_keyframe_spectator_mode(self):
+        mock_nm = MagicMock()
+        mock_nm.relay_spectator_mode = True
+        mock_nm.video_receiver.take_keyframe_request.return_value = True
+        self.coordinator.network_controller = mock_nm
+
+        self.coordinator.request_video_keyframe_if_needed()
+
+        mock_nm.server.send_command.assert_not_called()
+
     def test_update_ttl(self):
         """Test updating UDP TTL."""
         mock_nm = MagicMock()
@@ -339,6 +397,27 @@ class TestNetworkCoordinator(unittest.TestCase):
         self.assertEqual(self.mock_osd.connect_handler.call_count, 2)  # Called by both CONNECTED and SPECTATING
         self.mock_osd.disconnect_handler.assert_called_once()
 
+    def test_latency_response_records_rtt(self):
+        """The RTT of a latency response is kept for the next check."""
+        handlers = self.coordinator._create_handlers()
+        latency_handler = handlers["messages"][1][1]
+        self.coordinator.network_controller = MagicMock()
+
+        with patch("v3xctrl_ui.network.NetworkCoordinator.time.time", return_value=100.05):
+            latency_handler(Latency(st=100.02, timestamp=100.0), "address")
+
+        rtt_ms = self.coordinator.network_controller.record_rtt.call_args[0][0]
+        self.assertAlmostEqual(rtt_ms, 50.0, places=3)
+
+    def test_latency_request_does_not_record_rtt(self):
+        handlers = self.coordinator._create_handlers()
+        latency_handler = handlers["messages"][1][1]
+        self.coordinator.network_controller = MagicMock()
+
+        latency_handler(Latency(timestamp=100.0), "address")
+
+        self.coordinator.network_controller.record_rtt.assert_not_called()
+
     def test_connection_change_callback(self):
         """Test that connection change callback is invoked."""
         mock_callback = MagicMock()
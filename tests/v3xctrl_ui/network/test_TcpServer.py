@@ -3,6 +3,7 @@ import time
 import unittest
 
 from v3xctrl_tcp.framing import recv_message, send_message
+from v3xctrl_tcp.TunnelEngine import TunnelEngine
 from v3xctrl_ui.network.TcpServer import TcpServer
 
 
@@ -247,6 +248,22 @@ class TestTcpServerLifecycle(unittest.TestCase):
         _wait_for_tcp(video_port)
         server.stop()
 
+    def test_stop_closes_listeners_on_shared_engine(self) -> None:
+        """Listeners are closed when stop() returns, even if the engine keeps running."""
+        engine = TunnelEngine("shared")
+        engine.attach()
+        self.addCleanup(engine.detach)
+
+        video_port = _free_port()
+        control_port = _free_port()
+        server = TcpServer(video_port, control_port, engine)
+        server.start()
+        _wait_for_tcp(video_port)
+        server.stop()
+
+        with self.assertRaises(ConnectionRefusedError):
+            socket.create_connection(("127.0.0.1", video_port), timeout=1.0)
+
     def test_stop_before_start(self) -> None:
         """Stopping a server that was never started does not crash."""
         server = TcpServer(_free_port(), _free_port())
@@ -528,5 +528,87 @@ class TestGetFrameTimingTracking(unittest.TestCase):
         self.assertEqual(receiver.rendered_frame_count, 0)
 
 
+class TestKeyframeRequest(unittest.TestCase):
+    def test_no_request_by_default(self):
+        receiver = MockReceiver(5600, Mock())
+
+        self.assertFalse(receiver.take_keyframe_request())
+
+    def test_request_is_taken_once(self):
+        receiver = MockReceiver(5600, Mock())
+
+        receiver._request_keyframe("decode error")
+
+        self.assertTrue(receiver.take_keyframe_request())
+        self.assertFalse(receiver.take_keyframe_request())
+        self.assertEqual(receiver.keyframe_requests, 1)
+
+    def test_requests_are_rate_limited(self):
+        receiver = MockReceiver(5600, Mock())
+
+        with patch("v3xctrl_ui.network.video.Receiver.time.monotonic", side_effect=[10.0, 10.5, 11.1]):
+            receiver._request_keyframe("a")
+            receiver.take_keyframe_request()
+            receiver._request_keyframe("b")
+            self.assertFalse(receiver.take_keyframe_request())
+            receiver._request_keyframe("c")
+            self.assertTrue(receiver.take_keyframe_request())
+
+        self.assertEqual(receiver.keyframe_requests, 2)
+
+
+class TestRecoveryPoints(unittest.TestCase):
+    def _receiver(self, now: float = 100.0) -> MockReceiver:
+        receiver = MockReceiver(5600, Mock())
+        with patch("v3xctrl_ui.network.video.Receiver.time.monotonic", return_value=now):
+            # 15 frame refresh cycle at 30 fps, allows one second to recover
+            receiver._on_recovery_point(14)
+        return receiver
+
+    def _request_at(self, receiver: MockReceiver, now: float) -> bool:
+        with patch("v3xctrl_ui.network.video.Receiver.time.monotonic", return_value=now):
+            receiver._request_keyframe("packets lost")
+        return receiver.take_keyframe_request()
+
+    def test_not_intra_refresh_by_default(self):
+        self.assertFalse(MockReceiver(5600, Mock()).intra_refresh)
+
+    def test_recovery_point_enables_intra_refresh(self):
+        receiver = self._receiver(now=time.monotonic())
+
+        self.assertTrue(receiver.intra_refresh)
+        self.assertEqual(receiver.recovery_points, 1)
+
+    def test_loss_within_cycle_does_not_request_keyframe(self):
+        receiver = self._receiver()
+
+        self.assertFalse(self._request_at(receiver, 100.2))
+        self.assertFalse(self._request_at(receiver, 101.0))
+        self.assertEqual(receiver.keyframe_requests_avoided, 2)
+        self.assertEqual(receiver.keyframe_requests, 0)
+
+    def test_stream_still_broken_after_cycle_requests_keyframe(self):
+        receiver = self._receiver()
+
+        self._request_at(receiver, 100.2)
+
+        self.assertTrue(self._request_at(receiver, 101.5))
+
+    def test_recovery_after_cycle_clears_damage(self):
+        receiver = self._receiver()
+        self._request_at(receiver, 100.2)
+
+        with patch("v3xctrl_ui.network.video.Receiver.time.monotonic", return_value=101.3):
+            receiver._on_recovery_point(14)
+
+        # New loss, starts a new recovery window
+        self.assertFalse(self._request_at(receiver, 101.5))
+
+    def test_keyframes_requested_again_once_recovery_points_stop(self):
+        receiver = self._receiver()
+
+        self.assertTrue(self._request_at(receiver, 100.0 + receiver.RECOVERY_POINT_TIMEOUT + 1))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
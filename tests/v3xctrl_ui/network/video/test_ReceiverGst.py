@@ -57,7 +57,14 @@ def _make_receiver(**overrides) -> ReceiverGst:
         "_receive_durations": {},
         "_timing_receive_samples": [],
         "_sei_timestamps": {},
+        "_sei_framing": None,
         "_timing_e2e_samples": [],
+        "timing_enabled": True,
+        "target_fps": 30,
+        "_last_recovery_point": None,
+        "_recovery_cycle": 0.0,
+        "_broken_since": None,
+        "recovery_points": 0,
         "_clock_offset": None,
         "timing_decode_samples": deque(maxlen=100),
         "timing_buffer_samples": deque(maxlen=100),
@@ -408,6 +415,29 @@ class TestOnSeiExtractProbe(unittest.TestCase):
 
         self.assertNotIn(5000, receiver._sei_timestamps)
 
+    def test_parses_mapped_memory_and_caches_framing(self):
+        receiver = _make_receiver(_sei_timestamps={})
+
+        from v3xctrl_helper.sei import FRAMING_ANNEX_B, build_sei_nal
+
+        buffer = MagicMock()
+        buffer.pts = 5000
+        map_info = MagicMock()
+        map_info.data = memoryview(build_sei_nal(42) + b"\x00\x00\x00\x01\x65" + b"\x00" * 50)
+        buffer.map.return_value = (True, map_info)
+
+        info = MagicMock()
+        info.get_buffer.return_value = buffer
+
+        with patch("v3xctrl_ui.network.video.ReceiverGst.detect_framing", return_value=FRAMING_ANNEX_B) as detect:
+            receiver._on_sei_extract_probe(MagicMock(), info)
+            receiver._on_sei_extract_probe(MagicMock(), info)
+
+        detect.assert_called_once()
+        self.assertEqual(receiver._sei_framing, FRAMING_ANNEX_B)
+        self.assertEqual(receiver._sei_timestamps[5000], 42)
+        self.assertEqual(buffer.unmap.call_count, 2)
+
     def test_clears_dict_when_exceeding_limit(self):
         sei_timestamps = {i: i for i in range(301)}
         receiver = _make_receiver(_sei_timestamps=sei_timestamps)
@@ -446,6 +476,39 @@ class TestOnSeiExtractProbe(unittest.TestCase):
         self.assertEqual(result, _gst_mock.PadProbeReturn.OK)
         self.assertNotIn(5000, receiver._sei_timestamps)
 
+    def _probe(self, receiver: ReceiverGst, data: bytes) -> None:
+        buffer = MagicMock()
+        buffer.pts = 5000
+        map_info = MagicMock()
+        map_info.data = data
+        buffer.map.return_value = (True, map_info)
+
+        info = MagicMock()
+        info.get_buffer.return_value = buffer
+
+        receiver._on_sei_extract_probe(MagicMock(), info)
+
+    def test_recovery_point_is_reported(self):
+        receiver = _make_receiver()
+
+        # Recovery point SEI, recovery_frame_cnt=14
+        recovery_point = b"\x00\x00\x00\x01\x06\x06\x02\x1f\x10\x80"
+        self._probe(receiver, recovery_point + b"\x00\x00\x00\x01\x41" + b"\x00" * 50)
+
+        self.assertEqual(receiver.recovery_points, 1)
+        self.assertAlmostEqual(receiver._recovery_cycle, 1.0)
+        self.assertTrue(receiver.intra_refresh)
+
+    def test_timestamps_only_parsed_with_timing(self):
+        receiver = _make_receiver(timing_enabled=False)
+
+        from v3xctrl_helper.sei import build_sei_nal
+
+        self._probe(receiver, build_sei_nal(42))
+
+        self.assertEqual(receiver._sei_timestamps, {})
+        self.assertEqual(receiver.recovery_points, 0)
+
 
 class TestOnFrameDisplayed(unittest.TestCase):
     def test_calculates_e2e_with_valid_offset(self):
@@ -537,5 +600,85 @@ class TestCleanup(unittest.TestCase):
         self.assertIsNone(receiver.pipeline)
 
 
+class TestKeyframeRequests(unittest.TestCase):
+    def _make(self, lost=0) -> ReceiverGst:
+        receiver = _make_receiver(jitterbuffer=MagicMock(), _packets_lost=lost)
+        receiver._request_keyframe = MagicMock()
+        return receiver
+
+    def _set_lost(self, receiver: ReceiverGst, lost: int) -> None:
+        receiver.jitterbuffer.get_property.return_value.get_uint64.return_value = (True, lost)
+
+    def test_packet_loss_requests_keyframe(self):
+        receiver = self._make(lost=3)
+        self._set_lost(receiver, 5)
+
+        receiver._check_packet_loss()
+
+        receiver._request_keyframe.assert_called_once()
+        self.assertEqual(receiver._packets_lost, 5)
+
+    def test_no_new_loss(self):
+        receiver = self._make(lost=5)
+        self._set_lost(receiver, 5)
+
+        receiver._check_packet_loss()
+
+        receiver._request_keyframe.assert_not_called()
+
+    def test_no_jitterbuffer(self):
+        receiver = self._make()
+        receiver.jitterbuffer = None
+
+        receiver._check_packet_loss()
+
+        receiver._request_keyframe.assert_not_called()
+
+    def _set_counters(self, receiver: ReceiverGst, lost: int, pushed: int) -> None:
+        counters = {"num-lost": lost, "num-pushed": pushed}
+        receiver.jitterbuffer.get_property.return_value.get_uint64.side_effect = lambda name: (True, counters[name])
+
+    def test_video_loss_since_last_report(self):
+        receiver = self._make()
+        receiver._loss_report = (0, 0)
+
+        self._set_counters(receiver, 5, 95)
+        self.assertEqual(receiver.get_video_loss(), 5.0)
+
+        self._set_counters(receiver, 5, 195)
+        self.assertEqual(receiver.get_video_loss(), 0.0)
+
+    def test_video_loss_without_packets(self):
+        receiver = self._make()
+        receiver._loss_report = (5, 95)
+        self._set_counters(receiver, 5, 95)
+
+        self.assertIsNone(receiver.get_video_loss())
+
+    def test_video_loss_without_jitterbuffer(self):
+        receiver = self._make()
+        receiver.jitterbuffer = None
+
+        self.assertIsNone(receiver.get_video_loss())
+
+    def test_decoder_warning_requests_keyframe(self):
+        receiver = self._make()
+        message = MagicMock()
+        message.src.get_name.return_value = "decoder"
+
+        receiver._on_warning(MagicMock(), message)
+
+        receiver._request_keyframe.assert_called_once_with("decode error")
+
+    def test_other_warnings_are_ignored(self):
+        receiver = self._make()
+        message = MagicMock()
+        message.src.get_name.return_value = "udpsrc"
+
+        receiver._on_warning(MagicMock(), message)
+
+        receiver._request_keyframe.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -279,9 +279,32 @@ class TestReceiverPyAVPacketDropping(unittest.TestCase):
         self.assertTrue(result)
 
 
+class TestReceiverPyAVRecoveryPoint(unittest.TestCase):
+    def setUp(self):
+        self.receiver = ReceiverPyAV(5600, Mock())
+
+    def test_recovery_point_is_reported(self):
+        # Recovery point SEI (recovery_frame_cnt=14) in front of a slice
+        packet = av.Packet(b"\x00\x00\x00\x01\x06\x06\x02\x1f\x10\x80\x00\x00\x00\x01\x41" + b"\x00" * 50)
+
+        self.receiver._check_recovery_point(packet)
+
+        self.assertEqual(self.receiver.recovery_points, 1)
+        self.assertTrue(self.receiver.intra_refresh)
+
+    def test_plain_frame_is_ignored(self):
+        packet = av.Packet(b"\x00\x00\x00\x01\x65" + b"\x00" * 50)
+
+        self.receiver._check_recovery_point(packet)
+
+        self.assertEqual(self.receiver.recovery_points, 0)
+
+
 class TestReceiverPyAVMainLoop(unittest.TestCase):
     def setUp(self):
         self.receiver = ReceiverPyAV(5600, Mock())
+        # Packets are mocks, recovery point parsing is tested separately
+        self.receiver._check_recovery_point = Mock()
         self.receiver.running = threading.Event()
         self.receiver.running.set()
 
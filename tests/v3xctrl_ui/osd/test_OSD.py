@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pygame
 
+from v3xctrl_control import SequenceStats
 from v3xctrl_control.message import Latency, Telemetry
 from v3xctrl_helper import SlidingWindowAverage
 from v3xctrl_ui.core.Settings import Settings
@@ -83,6 +84,31 @@ class TestOSD(unittest.TestCase):
         self.assertEqual(signal.cell, "240:2")
         self.assertEqual(battery.percent, "75%")
 
+    def test_telemetry_update_applies_delta(self):
+        keyframe = {
+            "sig": {"rsrq": -9, "rsrp": -95},
+            "cell": {"band": 3, "id": 0x0000F002},
+            "bat": {"vol": 3800, "avg": 3750, "pct": 75, "wrn": False},
+        }
+        self.osd._telemetry_update(Telemetry(keyframe, k=0))
+        self.osd._telemetry_update(Telemetry({"bat": {"pct": 70}}, b=0))
+
+        self.assertEqual(self.telemetry_context.get_battery().percent, "70%")
+        self.assertEqual(self.telemetry_context.get_signal().band, "BAND 3")
+
+    def test_telemetry_update_requests_missing_keyframe_once(self):
+        self.osd.on_keyframe_request = MagicMock()
+
+        self.osd._telemetry_update(Telemetry({"bat": {"pct": 70}}, b=5))
+        self.osd._telemetry_update(Telemetry({"bat": {"pct": 60}}, b=5))
+
+        self.osd.on_keyframe_request.assert_called_once()
+        self.assertEqual(self.telemetry_context.get_battery().percent, "0%")
+
+        self.osd.reset()
+        self.osd._telemetry_update(Telemetry({"bat": {"pct": 60}}, b=5))
+        self.assertEqual(self.osd.on_keyframe_request.call_count, 2)
+
     @patch("v3xctrl_ui.osd.OSD.pygame.display.get_window_size", return_value=(800, 600))
     def test_render_executes(self, mock_get_size):
         self.osd.render(
@@ -194,6 +220,30 @@ class TestOSD(unittest.TestCase):
         self.assertEqual(len(self.osd._latency_samples), 1)
         self.assertEqual(self.osd.debug_latency, "green")
 
+    def test_update_link_stats_sets_loss(self):
+        self.osd.widgets_debug["debug_loss"].set_value = MagicMock()
+        self.osd.update_link_stats(SequenceStats(expected=100, lost=3))
+
+        self.assertEqual(self.telemetry_context.get_downlink().loss, 3.0)
+        self.assertEqual(self.osd.debug_loss, "yellow")
+        self.osd.widgets_debug["debug_loss"].set_value.assert_called_with(3)
+
+    def test_loss_shows_worst_direction(self):
+        self.osd.update_link_stats(SequenceStats(expected=100, lost=0))
+        self.assertEqual(self.osd.debug_loss, "green")
+
+        telemetry = Telemetry(
+            {
+                "sig": {"rsrq": -10, "rsrp": -90},
+                "cell": {"band": 3, "id": 0x0100},
+                "bat": {"vol": 3800, "avg": 3750, "pct": 75, "wrn": False},
+                "net": {"loss": 12.0, "reo": 0.0, "dup": 0, "bst": 4},
+            }
+        )
+        self.osd._telemetry_update(telemetry)
+
+        self.assertEqual(self.osd.debug_loss, "red")
+
 
 if __name__ == "__main__":
     pygame.init()
@@ -132,12 +132,13 @@ class TestWidgetFactory(unittest.TestCase):
         widgets = create_debug_widgets(100, 50)
 
         self.assertIsInstance(widgets, dict)
-        self.assertEqual(len(widgets), 5)
+        self.assertEqual(len(widgets), 6)
         self.assertIn("debug_fps_loop", widgets)
         self.assertIn("debug_fps_video", widgets)
         self.assertIn("debug_data", widgets)
         self.assertIn("debug_latency", widgets)
         self.assertIn("debug_buffer", widgets)
+        self.assertIn("debug_loss", widgets)
 
     def test_create_debug_widgets_creates_fps_widgets(self):
         fps_width = 120
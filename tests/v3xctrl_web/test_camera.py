@@ -75,6 +75,7 @@ class TestCameraSetting:
             assert data["setting"] == "brightness"
             assert data["value"] == 75
             assert data["output"] == "OK"
+            assert mock_output.call_args[0][0][:4] == ["v3xctrl-video-control", "apply", "camera", "brightness"]
 
     def test_put_setting_missing_value(self, client):
         response = client.put("/camera/settings/brightness", json={})
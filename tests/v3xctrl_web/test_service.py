@@ -1,11 +1,23 @@
 import subprocess
 from unittest.mock import patch
 
+import pytest
+
+from v3xctrl_web.routes.service import SERVICES, status_provider
+
+STATUS_OUTPUT = "Type=simple\nActiveState=active\nResult=success"
+PROVIDER_CHECK_OUTPUT = "v3xctrl_telemetry.ServiceStatusProvider.subprocess.check_output"
+
+
+@pytest.fixture(autouse=True)
+def fresh_status():
+    status_provider.invalidate()
+
 
 class TestListServices:
     def test_all_services_listed(self, client):
-        with patch("v3xctrl_web.routes.service.subprocess.check_output") as mock_output:
-            mock_output.return_value = b"Type=simple\nActiveState=active\nResult=success"
+        with patch(PROVIDER_CHECK_OUTPUT) as mock_output:
+            mock_output.return_value = "\n\n".join([STATUS_OUTPUT] * 10)
 
             response = client.get("/service/")
 
@@ -16,8 +28,28 @@ class TestListServices:
                 assert service["state"] == "active"
                 assert service["result"] == "success"
 
+    def test_single_systemctl_call(self, client):
+        with patch(PROVIDER_CHECK_OUTPUT) as mock_output:
+            mock_output.return_value = "\n\n".join([STATUS_OUTPUT] * 10)
+
+            client.get("/service/")
+
+            mock_output.assert_called_once()
+            command = mock_output.call_args[0][0]
+            assert command[:2] == ["systemctl", "show"]
+            assert command[2:12] == SERVICES
+
+    def test_listing_is_cached(self, client):
+        with patch(PROVIDER_CHECK_OUTPUT) as mock_output:
+            mock_output.return_value = "\n\n".join([STATUS_OUTPUT] * 10)
+
+            client.get("/service/")
+            client.get("/service/")
+
+            mock_output.assert_called_once()
+
     def test_service_error_graceful_fallback(self, client):
-        with patch("v3xctrl_web.routes.service.subprocess.check_output") as mock_output:
+        with patch(PROVIDER_CHECK_OUTPUT) as mock_output:
             mock_output.side_effect = subprocess.CalledProcessError(1, "systemctl")
 
             response = client.get("/service/")
@@ -30,27 +62,24 @@ class TestListServices:
                 assert service["result"] == "error"
 
     def test_mixed_service_states(self, client):
-        call_count = 0
+        inactive = "Type=simple\nActiveState=inactive\nResult=success"
+        with patch(PROVIDER_CHECK_OUTPUT) as mock_output:
+            mock_output.return_value = "\n\n".join([STATUS_OUTPUT] + [inactive] * 9)
 
-        def side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return b"Type=simple\nActiveState=active\nResult=success"
-            raise subprocess.CalledProcessError(1, "systemctl")
-
-        with patch("v3xctrl_web.routes.service.subprocess.check_output", side_effect=side_effect):
             response = client.get("/service/")
 
             services = response.get_json()["data"]["services"]
+            assert services[0]["name"] == SERVICES[0]
             assert services[0]["state"] == "active"
-            assert services[1]["state"] == "unknown"
+            assert services[1]["state"] == "inactive"
 
 
 class TestGetService:
     def test_success(self, client):
-        with patch("v3xctrl_web.routes.service.subprocess.check_output") as mock_output:
-            mock_output.return_value = b"Type=oneshot\nActiveState=inactive\nResult=success"
+        with patch(PROVIDER_CHECK_OUTPUT) as mock_output:
+            mock_output.return_value = "\n\n".join(
+                ["Type=oneshot\nActiveState=inactive\nResult=success"] + [STATUS_OUTPUT] * 9
+            )
 
             response = client.get("/service/v3xctrl-setup-env")
 
@@ -61,7 +90,7 @@ class TestGetService:
             assert data["result"] == "success"
 
     def test_subprocess_error(self, client):
-        with patch("v3xctrl_web.routes.service.subprocess.check_output") as mock_output:
+        with patch(PROVIDER_CHECK_OUTPUT) as mock_output:
             mock_output.side_effect = subprocess.CalledProcessError(1, "systemctl")
 
             response = client.get("/service/nonexistent")
@@ -87,6 +116,16 @@ class TestStartService:
                 text=True,
             )
 
+    def test_invalidates_status(self, client):
+        with patch(PROVIDER_CHECK_OUTPUT) as mock_output, patch("v3xctrl_web.routes.service.subprocess.run"):
+            mock_output.return_value = "\n\n".join([STATUS_OUTPUT] * 10)
+
+            client.get("/service/")
+            client.post("/service/v3xctrl-video/start")
+            client.get("/service/")
+
+            assert mock_output.call_count == 2
+
     def test_failure(self, client):
         with patch("v3xctrl_web.routes.service.subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, "systemctl", stderr="unit not found")